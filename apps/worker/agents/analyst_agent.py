@@ -5,24 +5,51 @@ Performance Optimized:
 - 2 LLM calls only (OpenAI + Gemini) instead of 8
 - Single unified schema
 - Cross-check for critical fields
+- Section-aware prompt (boilerplate/duplicate removal, per-label token budgets)
 """
 
 import asyncio
+import json
 import logging
+import time
 import traceback
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 
+from redis import Redis
+
 from config import get_settings, AnalysisMode
-from schemas.resume_schema import RESUME_JSON_SCHEMA, RESUME_SCHEMA_PROMPT
+from schemas.resume_schema import RESUME_JSON_SCHEMA, RESUME_SCHEMA_PROMPT, build_field_subset_schema
 from schemas.canonical_labels import CanonicalLabel
 from utils.section_separator import get_section_separator, SemanticIR
+from utils.section_prompt_builder import get_section_prompt_builder, PROMPT_BUILDER_VERSION
+from utils.prompt_layout import build_cacheable_messages
 from services.llm_manager import get_llm_manager, LLMProvider, LLMResponse
+from services.analysis_cache import get_analysis_cache, build_cache_key, compute_prompt_version
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# 응답 형식 지침 (정적 프리픽스 마지막 파트)
+RESUME_OUTPUT_INSTRUCTIONS = """Return a single JSON object with all extracted fields. If a field is not found, omit it.
+IMPORTANT: Generate a high-quality 'match_reason' (Aha Moment) that explains why this candidate is a strong hire for their target roles.
+Return valid JSON only."""
+
+# 필드 단위 재추출 지침 (정적 프리픽스)
+TARGETED_EXTRACTION_INSTRUCTIONS = """You are an expert Resume Parser. A previous extraction missed or was unsure about some fields.
+Extract ONLY the requested fields from the given resume sections. Copy values exactly as written in the resume.
+If a field is not present in the sections, omit it. Do not guess.
+Return valid JSON only."""
+
+# 재추출 필드 → 문맥으로 보낼 섹션 라벨 (재추출 대상은 AnalystAgent.CRITICAL_FIELDS뿐)
+ESCALATION_SECTION_LABELS: Dict[str, List[str]] = {
+    "name": [CanonicalLabel.PROFILE],
+    "phone": [CanonicalLabel.PROFILE],
+    "email": [CanonicalLabel.PROFILE],
+}
+
 
 @dataclass
 class Warning:
@@ -64,6 +91,112 @@ class AnalysisResult:
             "error": self.error
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AnalysisResult":
+        """to_dict() 결과에서 복원 (분석 캐시용)"""
+        return cls(
+            success=data.get("success", False),
+            data=data.get("data"),
+            confidence_score=data.get("confidence_score", 0.0),
+            field_confidence=data.get("field_confidence") or {},
+            warnings=[Warning(**w) for w in data.get("warnings") or []],
+            processing_time_ms=data.get("processing_time_ms", 0),
+            mode=AnalysisMode(data.get("mode", AnalysisMode.PHASE_1.value)),
+            error=data.get("error"),
+        )
+
+
+class HedgeDelayEstimator:
+    """
+    헤지 지연 시간 추정 (최근 1차 호출 지연 시간의 분위수)
+
+    표본이 MIN_SAMPLES 미만이면 max_delay를 그대로 사용하고,
+    이후에는 분위수를 [min_delay, max_delay] 범위로 제한합니다.
+
+    fork된 RQ work-horse는 Job이 끝나면 사라지므로 표본은 Redis 리스트
+    (프로바이더/모델별 최근 WINDOW개)에 저장해 모든 워커 프로세스가 함께 사용합니다.
+    Redis를 쓸 수 없으면 프로세스 메모리의 표본만 사용합니다.
+    Redis 호출은 동기이므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+    """
+
+    WINDOW = 200
+    MIN_SAMPLES = 20
+    # Redis 표본 재조회 / 오류 후 재시도 간격 (초)
+    REFRESH_SECONDS = 30.0
+    KEY_PREFIX = "rai:hedge_latency:"
+
+    def __init__(
+        self,
+        max_delay: float,
+        min_delay: float,
+        percentile: float,
+        redis_url: Optional[str] = None,
+        key: str = "default",
+    ):
+        self.max_delay = max_delay
+        self.min_delay = min(min_delay, max_delay)
+        self.percentile = percentile
+        self.key = self.KEY_PREFIX + key
+        self._samples: deque = deque(maxlen=self.WINDOW)
+        self._redis_url = redis_url if isinstance(redis_url, str) else None
+        self._redis: Optional[Redis] = None
+        self._refreshed_at: Optional[float] = None
+        self._retry_at = 0.0
+
+    def _get_redis(self) -> Optional[Redis]:
+        if not self._redis_url or time.monotonic() < self._retry_at:
+            return None
+        if self._redis is None:
+            try:
+                self._redis = Redis.from_url(self._redis_url, socket_connect_timeout=2, socket_timeout=2)
+            except Exception as e:
+                logger.warning(f"[HedgeDelayEstimator] Redis unavailable, using local samples: {e}")
+                self._redis_url = None
+        return self._redis
+
+    def _redis_failed(self, action: str, error: Exception):
+        logger.warning(f"[HedgeDelayEstimator] Redis {action} failed, using local samples: {error}")
+        self._retry_at = time.monotonic() + self.REFRESH_SECONDS
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            pipe = redis.pipeline()
+            pipe.lpush(self.key, f"{seconds:.3f}")
+            pipe.ltrim(self.key, 0, self.WINDOW - 1)
+            pipe.execute()
+        except Exception as e:
+            self._redis_failed("record", e)
+
+    def _refresh(self):
+        """REFRESH_SECONDS마다 Redis의 공유 표본으로 교체"""
+        now = time.monotonic()
+        if self._refreshed_at is not None and now - self._refreshed_at < self.REFRESH_SECONDS:
+            return
+        redis = self._get_redis()
+        if redis is None:
+            return
+        self._refreshed_at = now
+        try:
+            values = redis.lrange(self.key, 0, self.WINDOW - 1)
+        except Exception as e:
+            self._redis_failed("load", e)
+            return
+        if values:
+            # LPUSH 순서(최신 먼저) → 오래된 것부터
+            self._samples = deque((float(v) for v in reversed(values)), maxlen=self.WINDOW)
+
+    def delay(self) -> float:
+        self._refresh()
+        if len(self._samples) < self.MIN_SAMPLES:
+            return self.max_delay
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+        return max(self.min_delay, min(self.max_delay, ordered[index]))
+
 
 class AnalystAgent:
     """
@@ -76,7 +209,14 @@ class AnalystAgent:
 
     # Critical fields for cross-check
     CRITICAL_FIELDS = ["name", "phone", "email"]
+
+    # Fields delivered early while the primary response is still streaming
+    EARLY_FIELDS = ["name", "phone", "email", "exp_years", "last_company"]
     
+    # Targeted escalation: context/output caps for field-level re-extraction
+    TARGETED_CONTEXT_MAX_CHARS = 4000
+    TARGETED_MAX_TOKENS = 512
+
     # Default confidence threshold (can be overridden by settings)
     DEFAULT_CONFIDENCE_THRESHOLD = 0.85
 
@@ -94,10 +234,32 @@ class AnalystAgent:
             if hasattr(settings, 'LLM_CONFIDENCE_THRESHOLD')
             else self.DEFAULT_CONFIDENCE_THRESHOLD
         )
+        # Feature flag for content-addressed analysis cache
+        self.use_analysis_cache = settings.USE_ANALYSIS_CACHE if hasattr(settings, 'USE_ANALYSIS_CACHE') else True
+        # Feature flag for section-aware prompt (boilerplate/duplicate removal + per-label token budgets)
+        self.use_section_prompt = settings.USE_SECTION_PROMPT if hasattr(settings, 'USE_SECTION_PROMPT') else True
+        self.prompt_builder = get_section_prompt_builder() if self.use_section_prompt else None
+        # Feature flag for streaming primary call (early critical fields)
+        self.use_streaming = settings.USE_STREAMING_ANALYSIS if hasattr(settings, 'USE_STREAMING_ANALYSIS') else True
+        # Feature flag for hedged primary call (progressive mode tail latency)
+        self.use_hedging = settings.USE_HEDGED_ANALYSIS if hasattr(settings, 'USE_HEDGED_ANALYSIS') else True
+        self.hedge_delay = HedgeDelayEstimator(
+            max_delay=getattr(settings, 'LLM_HEDGE_DELAY_SECONDS', 20.0),
+            min_delay=getattr(settings, 'LLM_HEDGE_MIN_DELAY_SECONDS', 3.0),
+            percentile=getattr(settings, 'LLM_HEDGE_PERCENTILE', 0.95),
+            redis_url=getattr(settings, 'REDIS_URL', None),
+            key=f"openai:{getattr(self.llm_manager, 'models', {}).get(LLMProvider.OPENAI, 'default')}",
+        )
         # Monitoring counters (for logging)
         self._single_model_count = 0
         self._multi_model_count = 0
         self._parallel_call_count = 0
+        self._hedge_stats = {"hedged": 0, "primary_won": 0, "secondary_won": 0}
+        # Feature flag for targeted escalation (field-level re-extraction instead of full re-analysis)
+        self.use_targeted_escalation = (
+            settings.USE_TARGETED_ESCALATION if hasattr(settings, 'USE_TARGETED_ESCALATION') else True
+        )
+        self._escalation_stats = {"targeted": 0, "full": 0}
     
     @property
     def CONFIDENCE_THRESHOLD(self):
@@ -108,7 +270,8 @@ class AnalystAgent:
         self,
         resume_text: str,
         mode: Optional[AnalysisMode] = None,
-        filename: Optional[str] = None
+        filename: Optional[str] = None,
+        on_early_fields: Optional[Callable[[Dict[str, Any]], Any]] = None
     ) -> AnalysisResult:
         """
         Analyze resume with progressive LLM calling strategy.
@@ -117,6 +280,9 @@ class AnalystAgent:
         - Step 1: Call primary model (GPT-4o) first
         - Step 2: If confidence < 0.85 or critical fields missing → add Gemini
         - Step 3: Phase 2 + still uncertain → add Claude for deep verification
+
+        on_early_fields: GPT-4o 스트리밍 중 EARLY_FIELDS가 완성되면 1회 호출
+        (USE_STREAMING_ANALYSIS, 캐시 히트 시 호출되지 않음)
         """
         start_time = datetime.now()
         analysis_mode = mode or self.mode
@@ -131,8 +297,39 @@ class AnalystAgent:
             ir = self.section_separator.separate(resume_text, filename)
             logger.info(f"[AnalystAgent] IR: {len(ir.blocks)} sections detected")
 
-            # Step 2: Prepare prompt
-            messages = self._create_messages(resume_text, filename)
+            # Step 2: Prepare prompt (섹션 기반 정리 텍스트)
+            prompt_text = resume_text
+            section_prompt = None
+            if self.prompt_builder:
+                section_prompt = self.prompt_builder.build(resume_text, ir)
+                prompt_text = section_prompt.text or resume_text
+                logger.info(
+                    f"[AnalystAgent] Section prompt: {section_prompt.original_tokens} → "
+                    f"{section_prompt.prompt_tokens} tokens ({section_prompt.reduction:.0%} saved, "
+                    f"boilerplate lines: {section_prompt.dropped_lines}, "
+                    f"duplicate sections: {section_prompt.duplicate_sections}, "
+                    f"truncated: {section_prompt.truncated_labels or '-'})"
+                )
+            messages = self._create_messages(prompt_text, filename)
+
+            # Step 3: Content-addressed cache lookup (재업로드/재시도 시 LLM 호출 생략)
+            cache_key = self._get_cache_key(resume_text, analysis_mode) if self.use_analysis_cache else None
+            if cache_key:
+                # 동기 Redis 호출 → 이벤트 루프를 막지 않도록 스레드에서 실행
+                cached = await asyncio.to_thread(get_analysis_cache().get, cache_key)
+                if cached:
+                    cached_result = AnalysisResult.from_dict(cached)
+                    cached_result.processing_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+                    cached_result.warnings.append(Warning(
+                        "optimization", "analysis_cache",
+                        "Cached analysis result reused (identical resume text)",
+                        "info"
+                    ))
+                    logger.info(
+                        f"[AnalystAgent] ✓ Cache hit ({cache_key[:12]}) - "
+                        f"skipping LLM calls ({cached_result.processing_time_ms}ms)"
+                    )
+                    return cached_result
 
             # ─────────────────────────────────────────────────────────────────
             # LLM Calling Strategy Selection
@@ -140,13 +337,15 @@ class AnalystAgent:
             if self.use_parallel_llm:
                 # Parallel mode: GPT-4o + Gemini 동시 호출 (대량 업로드 최적화)
                 logger.info("[AnalystAgent] Using PARALLEL LLM mode (speed optimized)")
-                result = await self._parallel_llm_call(messages, analysis_mode)
+                result = await self._parallel_llm_call(messages, analysis_mode, on_early_fields)
             elif self.use_conditional_llm:
                 # Progressive mode: 조건부 순차 호출 (비용 최적화)
-                result = await self._progressive_llm_call(messages, analysis_mode)
+                result = await self._progressive_llm_call(
+                    messages, analysis_mode, on_early_fields, ir=ir, filename=filename
+                )
             else:
                 # Fallback to original parallel calling
-                result = await self._parallel_llm_call(messages, analysis_mode)
+                result = await self._parallel_llm_call(messages, analysis_mode, on_early_fields)
             
             merged_data, confidence, warnings = result
 
@@ -156,7 +355,14 @@ class AnalystAgent:
             processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
             logger.info(f"[AnalystAgent] Completed in {processing_time}ms. Confidence: {confidence:.2f}")
 
-            return AnalysisResult(
+            if section_prompt and section_prompt.truncated_labels:
+                warnings.append(Warning(
+                    "optimization", "section_prompt",
+                    f"Sections over token budget were shortened: {', '.join(section_prompt.truncated_labels)}",
+                    "info"
+                ))
+
+            result = AnalysisResult(
                 success=True,
                 data=merged_data,
                 confidence_score=confidence,
@@ -165,6 +371,11 @@ class AnalystAgent:
                 mode=analysis_mode
             )
 
+            if cache_key:
+                await asyncio.to_thread(get_analysis_cache().set, cache_key, result.to_dict())
+
+            return result
+
         except Exception as e:
             processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
             logger.error(f"[AnalystAgent] Fatal Error: {e}")
@@ -179,22 +390,32 @@ class AnalystAgent:
     async def _progressive_llm_call(
         self,
         messages: List[Dict[str, str]],
-        analysis_mode: AnalysisMode
+        analysis_mode: AnalysisMode,
+        on_early_fields: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        ir: Optional[SemanticIR] = None,
+        filename: Optional[str] = None
     ) -> tuple[Dict[str, Any], float, List[Warning]]:
         """
         Progressive LLM calling for cost optimization.
         
-        Step 1: GPT-4o alone
+        Step 1: GPT-4o alone (hedged: + Gemini if GPT-4o is slow)
         Step 2: + Gemini if needed
         Step 3: + Claude for Phase 2 deep verification
+
+        ir가 주어지고 USE_TARGETED_ESCALATION이면 Step 2/3는 누락/불확실 필드만
+        관련 섹션으로 재추출합니다 (_targeted_escalation). 실패 시 전체 재분석으로 폴백.
         """
         warnings = []
+        secondary_response: Optional[LLMResponse] = None
         
         # ─────────────────────────────────────────────────────────────────
         # Step 1: Primary model (GPT-4o)
         # ─────────────────────────────────────────────────────────────────
-        logger.info("[AnalystAgent] Step 1: Calling primary model (GPT-4o)")
-        primary_response = await self._call_single_llm(LLMProvider.OPENAI, messages)
+        if self.use_hedging:
+            primary_response, secondary_response = await self._hedged_primary_call(messages, on_early_fields)
+        else:
+            logger.info("[AnalystAgent] Step 1: Calling primary model (GPT-4o)")
+            primary_response = await self._call_single_llm(LLMProvider.OPENAI, messages, on_early_fields)
         
         if not primary_response.success:
             # Fallback: try Gemini as primary
@@ -226,8 +447,21 @@ class AnalystAgent:
         # ─────────────────────────────────────────────────────────────────
         # Step 2: Secondary model (Gemini) for cross-check
         # ─────────────────────────────────────────────────────────────────
-        logger.info("[AnalystAgent] Step 2: Calling secondary model (Gemini) for cross-check")
-        secondary_response = await self._call_single_llm(LLMProvider.GEMINI, messages)
+        if secondary_response is None and self.use_targeted_escalation and ir is not None:
+            targeted = await self._targeted_escalation(primary_response, analysis_mode, ir, filename)
+            if targeted is not None:
+                merged_data, merged_confidence, targeted_warnings = targeted
+                warnings.extend(targeted_warnings)
+                self._multi_model_count += 1
+                self._log_call_ratio()
+                return merged_data, merged_confidence, warnings
+
+        if secondary_response is None:
+            self._escalation_stats["full"] += 1
+            logger.info("[AnalystAgent] Step 2: Calling secondary model (Gemini) for cross-check")
+            secondary_response = await self._call_single_llm(LLMProvider.GEMINI, messages)
+        else:
+            logger.info("[AnalystAgent] Step 2: Reusing hedged secondary response for cross-check")
         
         responses = {LLMProvider.OPENAI: primary_response}
         if secondary_response.success:
@@ -260,6 +494,282 @@ class AnalystAgent:
         self._log_call_ratio()
         return merged_data, merged_confidence, warnings
     
+    async def _targeted_escalation(
+        self,
+        primary_response: LLMResponse,
+        analysis_mode: AnalysisMode,
+        ir: SemanticIR,
+        filename: Optional[str]
+    ) -> Optional[tuple[Dict[str, Any], float, List[Warning]]]:
+        """
+        Targeted escalation (Step 2/3 축소판).
+
+        전체 이력서 대신 누락/불확실 핵심 필드만 축약 스키마 + 관련 섹션 텍스트로
+        Gemini(Phase 2에서 여전히 불확실하면 Claude)에 재요청하고 필드별로 교차 검증합니다.
+
+        Returns:
+            (merged_data, confidence, warnings), 재추출 호출이 모두 실패하면 None (전체 재분석 폴백)
+        """
+        fields = self._fields_to_escalate(primary_response.content or {})
+        providers = [LLMProvider.GEMINI]
+        if analysis_mode == AnalysisMode.PHASE_2:
+            providers.append(LLMProvider.CLAUDE)
+        providers = [p for p in providers if p != primary_response.provider]
+        if not fields or not providers:
+            return None
+
+        context = self._escalation_context(fields, ir)
+        candidates: Dict[LLMProvider, Dict[str, Any]] = {primary_response.provider: primary_response.content}
+        warnings: List[Warning] = []
+        merged_data: Dict[str, Any] = {}
+        confidence = 0.0
+
+        for provider in providers:
+            logger.info(
+                f"[AnalystAgent] Step {len(candidates) + 1}: Targeted re-extraction with "
+                f"{provider.value} - fields={fields}, context={len(context)} chars"
+            )
+            response = await self._call_targeted_llm(provider, fields, context, filename)
+            if not response.success or not isinstance(response.content, dict):
+                logger.warning(f"[AnalystAgent] Targeted {provider.value} call failed: {response.error}")
+                continue
+
+            candidates[provider] = response.content
+            merged_data, confidence, warnings = self._merge_targeted(
+                primary_response.content, candidates, fields
+            )
+            if confidence >= self.confidence_threshold:
+                break
+
+        if len(candidates) == 1:
+            return None
+
+        self._escalation_stats["targeted"] += 1
+        warnings.append(Warning(
+            "optimization", "llm_calls",
+            f"Targeted re-extraction of {', '.join(fields)} "
+            f"({', '.join(p.value for p in candidates if p != primary_response.provider)})",
+            "info"
+        ))
+        logger.info(
+            f"[AnalystAgent] ✓ Targeted escalation - Confidence: {confidence:.2f}, "
+            f"stats={self._escalation_stats}"
+        )
+        return merged_data, confidence, warnings
+
+    def _fields_to_escalate(self, data: Dict[str, Any]) -> List[str]:
+        """누락/무효/불확실(점수 < 1.0) 핵심 필드 목록"""
+        fields = []
+        for field_name in self.CRITICAL_FIELDS:
+            value = data.get(field_name)
+            if not value or not str(value).strip():
+                fields.append(field_name)
+                continue
+            is_valid, field_score = self._validate_field_value(field_name, str(value).strip())
+            if not is_valid or field_score < 1.0:
+                fields.append(field_name)
+        return fields
+
+    def _escalation_context(self, fields: List[str], ir: SemanticIR) -> str:
+        """
+        재추출 필드와 관련된 섹션 텍스트 (없으면 문서 앞부분)
+
+        Returns:
+            "[원본 제목]\n본문" 블록을 이어 붙인 텍스트 (TARGETED_CONTEXT_MAX_CHARS 이내)
+        """
+        labels = {label for f in fields for label in ESCALATION_SECTION_LABELS.get(f, [])}
+        parts = [
+            f"[{block.raw_title or block.normalized_label}]\n{block.text.strip()}"
+            for block in ir.blocks
+            if block.normalized_label in labels and block.text.strip()
+        ]
+        context = "\n\n".join(parts) if parts else ir.raw_text
+        return context[:self.TARGETED_CONTEXT_MAX_CHARS]
+
+    async def _call_targeted_llm(
+        self,
+        provider: LLMProvider,
+        fields: List[str],
+        context: str,
+        filename: Optional[str]
+    ) -> LLMResponse:
+        """지정 필드만 축약 스키마로 추출 (출력 토큰 상한 TARGETED_MAX_TOKENS)"""
+        user_prompt = f"""Fields to extract: {', '.join(fields)}
+
+Filename: {filename or 'Unknown'}
+
+---
+{context}
+---"""
+        messages = build_cacheable_messages([TARGETED_EXTRACTION_INSTRUCTIONS], user_prompt)
+        try:
+            return await self.llm_manager.call_with_structured_output(
+                provider=provider,
+                messages=messages,
+                json_schema=build_field_subset_schema(fields),
+                temperature=0.1,
+                max_tokens=self.TARGETED_MAX_TOKENS
+            )
+        except Exception as e:
+            logger.error(f"[AnalystAgent] Targeted {provider.value} failed: {e}")
+            return LLMResponse(
+                provider=provider,
+                content=None,
+                raw_response="",
+                model="unknown",
+                error=str(e)
+            )
+
+    def _merge_targeted(
+        self,
+        primary_data: Dict[str, Any],
+        candidates: Dict[LLMProvider, Dict[str, Any]],
+        fields: List[str]
+    ) -> tuple[Dict[str, Any], float, List[Warning]]:
+        """
+        재추출 필드 교차 검증 (_merge_responses의 필드 단위 버전)
+
+        - 재추출 대상이 아닌 핵심 필드: 1차 응답에서 이미 검증됨 (1.0)
+        - 재추출 필드: 유효한 값끼리 비교 (일치 1.0 / 다수결 0.85 / 불일치 0.5·0.4 / 단일 0.7)
+          불일치 시 검증 점수가 높은 값 → 1차 응답 값 순으로 채택
+        """
+        merged = dict(primary_data)
+        warnings: List[Warning] = []
+        confidence_sum = 0.0
+        field_count = 0
+
+        for field_name in self.CRITICAL_FIELDS:
+            if field_name not in fields:
+                confidence_sum += 1.0
+                field_count += 1
+                continue
+
+            values = []  # (provider, value, score)
+            for provider, data in candidates.items():
+                value = data.get(field_name)
+                if not value or not str(value).strip():
+                    continue
+                is_valid, field_score = self._validate_field_value(field_name, str(value).strip())
+                if is_valid:
+                    values.append((provider, value, field_score))
+            if not values:
+                continue
+
+            field_count += 1
+            counts: Dict[str, int] = {}
+            for _, value, _ in values:
+                counts[self._normalize(value)] = counts.get(self._normalize(value), 0) + 1
+            # 다수 → 검증 점수 → 1차 응답(candidates 삽입 순서) 우선
+            best = max(values, key=lambda v: (counts[self._normalize(v[1])], v[2]))
+            merged[field_name] = best[1]
+
+            if len(values) == 1:
+                confidence_sum += 0.7
+            elif len(counts) == 1:
+                confidence_sum += 1.0
+            elif len(values) == 3 and len(counts) == 2:
+                confidence_sum += 0.85
+                warnings.append(Warning(
+                    "mismatch_resolved", field_name,
+                    f"다수결 적용: {[p.value for p, v, _ in values if self._normalize(v) != self._normalize(best[1])]} 불일치",
+                    "low"
+                ))
+            else:
+                confidence_sum += 0.5 if len(values) == 2 else 0.4
+                warnings.append(Warning(
+                    "mismatch", field_name,
+                    "Values differ: " + " vs ".join(f"'{v}'" for _, v, _ in values),
+                    "medium" if len(values) == 2 else "high"
+                ))
+
+        confidence = confidence_sum / field_count if field_count else 0.0
+        return merged, confidence, warnings
+
+    @staticmethod
+    def _normalize(value: Any) -> str:
+        return str(value).lower().strip()
+
+    async def _hedged_primary_call(
+        self,
+        messages: List[Dict[str, str]],
+        on_early_fields: Optional[Callable[[Dict[str, Any]], Any]] = None
+    ) -> Tuple[LLMResponse, Optional[LLMResponse]]:
+        """
+        Hedged primary call (GPT-4o → + Gemini after hedge delay).
+
+        GPT-4o가 헤지 지연 시간(최근 지연 시간 p95) 안에 응답하지 않으면 Gemini를 추가로 호출하고,
+        _evaluate_first_response 기준을 먼저 통과한 응답을 채택합니다 (나머지 요청은 취소).
+        둘 다 통과하지 못하면 양쪽 응답을 모두 기다려 Step 2 교차 검증에 재사용합니다.
+        → 1차 호출 지연 상한 ≈ 헤지 지연 + Gemini 지연
+
+        Returns:
+            (primary_response, secondary_response)
+            primary_response: 채택할 응답 (GPT-4o 성공 시 GPT-4o 우선)
+            secondary_response: 함께 완료된 다른 응답 (없으면 None → Step 2에서 호출)
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        # 공유 표본 조회는 동기 Redis 호출 → 스레드에서 실행
+        delay = await asyncio.to_thread(self.hedge_delay.delay)
+
+        logger.info(f"[AnalystAgent] Step 1: Calling primary model (GPT-4o), hedge after {delay:.1f}s")
+        primary_task = asyncio.ensure_future(
+            self._call_single_llm(LLMProvider.OPENAI, messages, on_early_fields)
+        )
+        secondary_task: Optional[asyncio.Future] = None
+
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=delay)
+            if done:
+                primary_response = primary_task.result()
+                if primary_response.success:
+                    await asyncio.to_thread(self.hedge_delay.record, loop.time() - started)
+                return primary_response, None
+
+            logger.info(f"[AnalystAgent] ⏱ GPT-4o slower than {delay:.1f}s - hedging with Gemini")
+            self._hedge_stats["hedged"] += 1
+            secondary_task = asyncio.ensure_future(self._call_single_llm(LLMProvider.GEMINI, messages))
+            tasks = {primary_task: LLMProvider.OPENAI, secondary_task: LLMProvider.GEMINI}
+            responses: Dict[LLMProvider, LLMResponse] = {}
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider = tasks[task]
+                    response = task.result()
+                    responses[provider] = response
+                    if provider == LLMProvider.OPENAI and response.success:
+                        await asyncio.to_thread(self.hedge_delay.record, loop.time() - started)
+
+                    confidence, missing = self._evaluate_first_response(response)
+                    if confidence >= self.confidence_threshold and not missing:
+                        # 나머지 요청 취소 (거버너 슬롯/연결 반환까지 대기)
+                        for other in pending:
+                            other.cancel()
+                        if pending:
+                            await asyncio.wait(pending)
+                        won = "primary_won" if provider == LLMProvider.OPENAI else "secondary_won"
+                        self._hedge_stats[won] += 1
+                        logger.info(
+                            f"[AnalystAgent] ✓ Hedge winner: {provider.value} "
+                            f"({loop.time() - started:.1f}s, stats={self._hedge_stats})"
+                        )
+                        return response, None
+
+            # 둘 다 기준 미달 → GPT-4o 우선, 다른 응답은 Step 2에서 재사용
+            primary_response = responses[LLMProvider.OPENAI]
+            secondary_response = responses[LLMProvider.GEMINI]
+            if not primary_response.success and secondary_response.success:
+                primary_response, secondary_response = secondary_response, None
+            return primary_response, secondary_response
+
+        finally:
+            # 취소/예외로 빠져나가도 진행 중인 요청을 남기지 않음
+            for task in (primary_task, secondary_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
     def _log_call_ratio(self):
         """
         LLM 호출 비율 로깅 (모니터링용)
@@ -277,7 +787,8 @@ class AnalystAgent:
     async def _parallel_llm_call(
         self,
         messages: List[Dict[str, str]],
-        analysis_mode: AnalysisMode
+        analysis_mode: AnalysisMode,
+        on_early_fields: Optional[Callable[[Dict[str, Any]], Any]] = None
     ) -> tuple[Dict[str, Any], float, List[Warning]]:
         """
         Parallel LLM calling for speed optimization.
@@ -286,7 +797,7 @@ class AnalystAgent:
         providers = self._get_providers(analysis_mode)
         logger.info(f"[AnalystAgent] Parallel calling {len(providers)} providers: {[p.value for p in providers]}")
 
-        responses = await self._call_llms_parallel(providers, messages)
+        responses = await self._call_llms_parallel(providers, messages, on_early_fields)
 
         # 통계 로깅
         self._parallel_call_count += 1
@@ -301,12 +812,24 @@ class AnalystAgent:
     async def _call_single_llm(
         self,
         provider: LLMProvider,
-        messages: List[Dict[str, str]]
+        messages: List[Dict[str, str]],
+        on_early_fields: Optional[Callable[[Dict[str, Any]], Any]] = None
     ) -> LLMResponse:
         """
         Call a single LLM provider.
+
+        GPT-4o + on_early_fields → 스트리밍 호출 (핵심 필드 조기 전달)
         """
         try:
+            if on_early_fields and self.use_streaming and provider == LLMProvider.OPENAI:
+                return await self.llm_manager.call_with_structured_output_stream(
+                    provider=provider,
+                    messages=messages,
+                    json_schema=RESUME_JSON_SCHEMA,
+                    early_fields=self.EARLY_FIELDS,
+                    on_early_fields=on_early_fields,
+                    temperature=0.1
+                )
             return await self.llm_manager.call_with_structured_output(
                 provider=provider,
                 messages=messages,
@@ -433,28 +956,53 @@ class AnalystAgent:
         return True, 1.0
 
     def _create_messages(self, text: str, filename: Optional[str]) -> List[Dict[str, str]]:
-        """Create optimized prompt"""
-        system_prompt = f"""You are an expert Resume Parser. Extract ALL information from the resume.
-
-{RESUME_SCHEMA_PROMPT}
+        """
+        Create optimized prompt
 
-Return a single JSON object with all extracted fields. If a field is not found, omit it.
-IMPORTANT: Generate a high-quality 'match_reason' (Aha Moment) that explains why this candidate is a strong hire for their target roles.
-"""
+        지침/스키마/응답 형식은 바이트 고정 system 프리픽스로, 파일명과 본문만 user 메시지로 보내
+        프로바이더 프롬프트 캐시가 모든 이력서에서 적중하도록 합니다 (utils/prompt_layout.py).
+        """
         user_prompt = f"""Extract all information from this resume:
 
 Filename: {filename or 'Unknown'}
 
 ---
 {text}
----
+---"""
+
+        return build_cacheable_messages(
+            [
+                "You are an expert Resume Parser. Extract ALL information from the resume.",
+                RESUME_SCHEMA_PROMPT,
+                RESUME_OUTPUT_INSTRUCTIONS,
+            ],
+            user_prompt,
+        )
 
-Return valid JSON only."""
+    def _get_cache_key(self, text: str, mode: AnalysisMode) -> Optional[str]:
+        """
+        분석 캐시 키 생성
 
-        return [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
+        텍스트 + 프롬프트/스키마 버전(섹션 프롬프트 규칙 포함) + 프로바이더/모델 세트 + 모드 조합.
+        파일명은 프롬프트에 포함되지만 결과에 영향이 미미하므로 키에서 제외
+        (동일 내용의 파일명만 다른 재업로드도 캐시 적중).
+        """
+        try:
+            providers = self._get_providers(mode)
+        except ValueError:
+            return None
+
+        prompt_parts = [
+            self._create_messages("", None)[0]["content"],
+            json.dumps(RESUME_JSON_SCHEMA, sort_keys=True, ensure_ascii=False, default=str),
+        ]
+        if self.prompt_builder:
+            prompt_parts.append(PROMPT_BUILDER_VERSION)
+        prompt_version = compute_prompt_version(*prompt_parts)
+        provider_ids = [
+            f"{p.value}:{self.llm_manager.models.get(p, 'unknown')}" for p in providers
         ]
+        return build_cache_key(text, prompt_version, provider_ids, mode.value)
 
     def _get_providers(self, mode: AnalysisMode) -> List[LLMProvider]:
         """Get providers for analysis based on mode
@@ -485,30 +1033,12 @@ Return valid JSON only."""
     async def _call_llms_parallel(
         self,
         providers: List[LLMProvider],
-        messages: List[Dict[str, str]]
+        messages: List[Dict[str, str]],
+        on_early_fields: Optional[Callable[[Dict[str, Any]], Any]] = None
     ) -> Dict[LLMProvider, LLMResponse]:
         """Call LLMs in parallel"""
-        
-        async def call_single(provider: LLMProvider) -> LLMResponse:
-            try:
-                # Use unified schema
-                return await self.llm_manager.call_with_structured_output(
-                    provider=provider,
-                    messages=messages,
-                    json_schema=RESUME_JSON_SCHEMA,
-                    temperature=0.1
-                )
-            except Exception as e:
-                logger.error(f"[AnalystAgent] {provider.value} failed: {e}")
-                return LLMResponse(
-                    provider=provider,
-                    content=None,
-                    raw_response="",
-                    model="unknown",
-                    error=str(e)
-                )
-
-        tasks = [call_single(p) for p in providers]
+        # Use unified schema (GPT-4o만 스트리밍 - 조기 필드 전달)
+        tasks = [self._call_single_llm(p, messages, on_early_fields) for p in providers]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         responses = {}
@@ -7,14 +7,18 @@ GPT-4o-mini로 빠르게 검증 (악용 방지)
 
 import asyncio
 import logging
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
 from dataclasses import dataclass
 from enum import Enum
 
 from services.llm_manager import get_llm_manager, LLMProvider
+from utils.prompt_layout import build_cacheable_messages
 
 logger = logging.getLogger(__name__)
 
+G = TypeVar("G")
+A = TypeVar("A")
+
 
 class IdentityCheckResult(str, Enum):
     """신원 체크 결과"""
@@ -95,10 +99,11 @@ class IdentityChecker:
             )
 
         try:
-            messages = [
-                {"role": "system", "content": IDENTITY_CHECK_PROMPT},
-                {"role": "user", "content": f"다음 이력서 텍스트를 분석해주세요:\n\n{resume_text[:8000]}"}
-            ]
+            # 정적 지침 → 바이트 고정 system 프리픽스 (프롬프트 캐싱), 본문만 user 메시지
+            messages = build_cacheable_messages(
+                [IDENTITY_CHECK_PROMPT],
+                f"다음 이력서 텍스트를 분석해주세요:\n\n{resume_text[:8000]}"
+            )
 
             response = await self.llm_manager.call_json(
                 provider=LLMProvider.OPENAI,
@@ -151,13 +156,100 @@ class IdentityChecker:
 
     def check_sync(self, resume_text: str) -> IdentityCheckResponse:
         """동기 버전"""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        from utils.async_runtime import run_sync
+
+        return run_sync(self.check(resume_text))
 
-        return loop.run_until_complete(self.check(resume_text))
+
+class EarlyFieldsGate:
+    """
+    조기 필드(Progressive Loading) 보류 게이트
+
+    latency 모드에서는 분석 스트리밍이 신원 확인보다 먼저 끝날 수 있으므로,
+    다중 신원으로 거절될 문서의 필드가 후보자에 기록되지 않도록 신원 확인 통과 전까지
+    받은 필드를 보관했다가 open() 시 한 번에 반영합니다. 거절 시 discard()로 폐기합니다.
+    """
+
+    def __init__(self, publish: Callable[[Dict[str, Any]], Awaitable[None]]):
+        self._publish = publish
+        self._held: Dict[str, Any] = {}
+        self._opened = False
+        self._discarded = False
+
+    async def __call__(self, fields: Dict[str, Any]) -> None:
+        if self._discarded:
+            return
+        if self._opened:
+            await self._publish(fields)
+        else:
+            self._held.update(fields)
+
+    async def open(self) -> None:
+        """신원 확인 통과: 보관한 필드 반영, 이후 필드는 즉시 반영"""
+        self._opened = True
+        held, self._held = self._held, {}
+        if held and not self._discarded:
+            await self._publish(held)
+
+    def discard(self) -> None:
+        """신원 확인 거절: 보관한 필드 폐기, 이후 필드 무시"""
+        self._discarded = True
+        self._held = {}
+
+
+async def run_with_identity_check(
+    check: Callable[[], Awaitable[G]],
+    analyze: Callable[[], Awaitable[A]],
+    is_rejected: Callable[[G], bool],
+    mode: str = "latency",
+    early_fields_gate: Optional[EarlyFieldsGate] = None,
+) -> Tuple[G, Optional[A]]:
+    """
+    신원 확인 + 분석 실행 (IDENTITY_CHECK_MODE)
+
+    - latency: 분석을 먼저 시작하고 신원 확인과 동시에 진행, 거절 시 분석을 취소하고 결과 폐기
+    - cost: 신원 확인 통과 후 분석 시작
+
+    Args:
+        early_fields_gate: 분석의 on_early_fields로 넘긴 게이트 (신원 확인 통과 시 open, 거절 시 discard)
+
+    Returns:
+        (신원 확인 결과, 분석 결과) - 거절 시 분석 결과는 None
+    """
+    if mode == "cost":
+        identity = await check()
+        if is_rejected(identity):
+            if early_fields_gate:
+                early_fields_gate.discard()
+            return identity, None
+        if early_fields_gate:
+            await early_fields_gate.open()
+        return identity, await analyze()
+
+    analysis_task = asyncio.ensure_future(analyze())
+    try:
+        identity = await check()
+    except BaseException:
+        analysis_task.cancel()
+        if early_fields_gate:
+            early_fields_gate.discard()
+        raise
+
+    if is_rejected(identity):
+        if early_fields_gate:
+            early_fields_gate.discard()
+        # 진행 중인 분석 LLM 호출 취소 (이미 끝났으면 결과만 폐기)
+        analysis_task.cancel()
+        try:
+            await analysis_task
+        except asyncio.CancelledError:
+            pass
+        logger.info("[IdentityChecker] Rejected - speculative analysis discarded")
+        return identity, None
+
+    if early_fields_gate:
+        await early_fields_gate.open()
+    return identity, await analysis_task
 
 
 # 싱글톤 인스턴스
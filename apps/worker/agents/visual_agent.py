@@ -345,15 +345,9 @@ class VisualAgent:
         """
         포트폴리오 URL 스크린샷 캡처 (동기 버전)
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        return loop.run_until_complete(
-            self.capture_portfolio_thumbnail(url, width, height)
-        )
+        from utils.async_runtime import run_sync
+
+        return run_sync(self.capture_portfolio_thumbnail(url, width, height))
 
     def resize_image(
         self,
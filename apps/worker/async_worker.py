@@ -0,0 +1,479 @@
+"""
+Async Worker - 한 프로세스에서 여러 이력서를 동시에 처리하는 RQ 호환 워커
+
+기존 RQ Worker는 Job마다 work-horse 프로세스를 fork하고, 각 Job은 실행 시간의
+대부분을 LLM/임베딩 HTTP 응답 대기에 사용합니다. AsyncWorker는 같은 Redis Queue
+(fast/slow/process)에서 Job을 꺼내 하나의 이벤트 루프에서 동시에 실행합니다.
+
+- Queue별 동시 처리 상한 (ASYNC_WORKER_CONCURRENCY, 예: "fast=16,slow=4,process=16")
+- tasks.full_pipeline → tasks.full_pipeline_async (PipelineOrchestrator.run을 직접 await)
+  그 외 Job 함수는 스레드에서 기존 동기 함수를 그대로 실행
+- CPU 바운드 파싱은 ParseService 프로세스 풀에서 실행 (이벤트 루프 블로킹 방지)
+- RQ Retry/on_failure(DLQ) 의미 유지, 지연 재시도(Retry interval)는 내장 스케줄러가 Queue로 복귀
+- RQ Worker로 등록(register_birth/heartbeat)하고 실행 중 Job을 StartedJobRegistry에 기록
+  → 프로세스가 OOM/SIGKILL로 죽으면 heartbeat가 끊긴 Job을 RQ registry 정리가 실패/재시도로 처리
+  성공/실패 기록은 RQ Worker.handle_job_success / handle_job_failure에 위임
+- SIGTERM/SIGINT: 새 Job 수신 중단 → 진행 중 Job 완료 대기(drain)
+  → ASYNC_WORKER_DRAIN_TIMEOUT_SECONDS 초과 시 남은 Job을 취소하고 Queue 앞에 반환
+  (스테이지 체크포인트로 재실행 시 완료된 단계는 스킵됨)
+
+Usage:
+    python run_worker.py --mode async
+    python run_worker.py --mode async fast slow   # 특정 Queue만
+"""
+
+import asyncio
+import logging
+import signal
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from redis import Redis
+from rq import Queue, Worker
+from rq.exceptions import DequeueTimeout
+from rq.executions import Execution
+from rq.job import Job
+from rq.registry import StartedJobRegistry
+from rq.scheduler import RQScheduler
+from rq.timeouts import TimerDeathPenalty
+from rq.utils import now
+from rq.worker import WorkerStatus
+
+from config import get_settings
+from services.parse_service import get_parse_service
+from services.llm_governor import enable_llm_governor
+from utils.libreoffice_pool import enable_libreoffice_pool, shutdown_libreoffice_pool
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# ASYNC_WORKER_CONCURRENCY에 없는 Queue의 동시 처리 수
+DEFAULT_QUEUE_CONCURRENCY = 4
+
+# BLPOP 대기 시간 (초) - 종료 요청 반영 주기
+DEQUEUE_TIMEOUT_SECONDS = 5
+
+# 스케줄된 재시도 Job 확인 주기 (초)
+SCHEDULER_INTERVAL_SECONDS = 1
+
+# RQ 콜백(on_failure 등) 타임아웃 처리 - 콜백은 스레드에서 실행되므로 signal 대신 Timer 사용
+CALLBACK_DEATH_PENALTY = TimerDeathPenalty
+
+# 동기 Job 함수 → 비동기 구현 (같은 인자 사용)
+ASYNC_TASKS: Dict[str, str] = {
+    "tasks.full_pipeline": "tasks.full_pipeline_async",
+}
+
+
+def parse_concurrency(spec: str) -> Dict[str, int]:
+    """
+    "fast=16,slow=4" 형식의 Queue별 동시 처리 수 파싱
+
+    잘못된 항목은 경고 후 무시합니다.
+    """
+    limits: Dict[str, int] = {}
+    for item in (spec or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, value = item.partition("=")
+        try:
+            limit = int(value)
+        except ValueError:
+            logger.warning(f"[AsyncWorker] Invalid concurrency entry ignored: '{item}'")
+            continue
+        if limit > 0:
+            limits[name.strip()] = limit
+    return limits
+
+
+def _resolve_callable(path: str) -> Callable:
+    """'module.func' 문자열을 함수 객체로 변환"""
+    module_name, _, attr = path.rpartition(".")
+    module = __import__(module_name, fromlist=[attr])
+    return getattr(module, attr)
+
+
+class AsyncWorker:
+    """
+    비동기 RQ Job 실행기
+
+    Queue마다 dispatcher 코루틴이 세마포어 슬롯이 빌 때만 Job을 가져오므로
+    Redis에 남은 Job은 다른 워커(기존 RQ Worker 포함)가 가져갈 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        queue_names: List[str],
+        connection: Redis,
+        concurrency: Optional[Dict[str, int]] = None,
+        drain_timeout: Optional[float] = None,
+        burst: bool = False,
+    ):
+        self.connection = connection
+        self.queues = [Queue(name, connection=connection) for name in queue_names]
+        limits = (
+            concurrency if concurrency is not None
+            else parse_concurrency(settings.ASYNC_WORKER_CONCURRENCY)
+        )
+        self.concurrency = {
+            q.name: limits.get(q.name, DEFAULT_QUEUE_CONCURRENCY) for q in self.queues
+        }
+        self.drain_timeout = (
+            drain_timeout if drain_timeout is not None
+            else settings.ASYNC_WORKER_DRAIN_TIMEOUT_SECONDS
+        )
+        self.burst = burst
+
+        # RQ Worker 등록/heartbeat/registry 기록용 (work loop는 사용하지 않음)
+        self.rq_worker = Worker(self.queues, connection=connection)
+        self.heartbeat_ttl = self.rq_worker.job_monitoring_interval + 60
+
+        self._stopping: Optional[asyncio.Event] = None
+        self._in_flight: Dict[asyncio.Task, Tuple[Job, Queue]] = {}
+        # Job ID → RQ Execution (StartedJobRegistry 항목)
+        self._executions: Dict[str, Execution] = {}
+        # RQ Worker는 현재 실행(execution)을 하나만 들고 있으므로 완료 처리를 직렬화
+        self._rq_lock = threading.Lock()
+        self._stats = {"started": 0, "finished": 0, "failed": 0, "retried": 0, "requeued": 0}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """처리 통계"""
+        return dict(self._stats, in_flight=len(self._in_flight))
+
+    # ─────────────────────────────────────────────────
+    # 실행 / 종료
+    # ─────────────────────────────────────────────────
+
+    async def run(self):
+        """모든 Queue dispatcher 실행 → 종료 요청 시 drain 후 반환"""
+        loop = asyncio.get_running_loop()
+        self._stopping = asyncio.Event()
+
+        # 동기 DB/Storage 호출(to_thread)과 BLPOP 대기가 기본 스레드 풀을 고갈시키지 않도록 확장
+        total = sum(self.concurrency.values())
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=total + len(self.queues) + 4, thread_name_prefix="rai-async-worker")
+        )
+        self._install_signal_handlers(loop)
+
+        logger.info(
+            f"[AsyncWorker] Starting {self.rq_worker.name}: concurrency={self.concurrency}, burst={self.burst}"
+        )
+
+        await asyncio.to_thread(self.rq_worker.register_birth)
+        try:
+            heartbeat_task = asyncio.create_task(self._run_heartbeat())
+            scheduler_task = asyncio.create_task(self._run_scheduler())
+            dispatchers = [asyncio.create_task(self._dispatch(queue)) for queue in self.queues]
+
+            await asyncio.gather(*dispatchers)
+            await self._drain()
+
+            for task in (scheduler_task, heartbeat_task):
+                task.cancel()
+            await asyncio.gather(scheduler_task, heartbeat_task, return_exceptions=True)
+        finally:
+            await asyncio.to_thread(self.rq_worker.register_death)
+
+        get_parse_service().shutdown(wait=False)
+
+        logger.info(f"[AsyncWorker] Stopped: {self.stats}")
+
+    def request_stop(self):
+        """새 Job 수신 중단 (진행 중인 Job은 drain)"""
+        if self._stopping is not None and not self._stopping.is_set():
+            logger.info(
+                f"[AsyncWorker] Shutdown requested - draining {len(self._in_flight)} in-flight job(s) "
+                f"(timeout={self.drain_timeout}s)"
+            )
+            self._stopping.set()
+
+    def _install_signal_handlers(self, loop: asyncio.AbstractEventLoop):
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self.request_stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows 또는 메인 스레드가 아닌 경우
+                signal.signal(sig, lambda *_: loop.call_soon_threadsafe(self.request_stop))
+
+    async def _drain(self):
+        """진행 중인 Job 완료 대기, 시간 초과 시 취소 후 Queue에 반환"""
+        if not self._in_flight:
+            return
+
+        tasks = list(self._in_flight)
+        done, pending = await asyncio.wait(tasks, timeout=self.drain_timeout)
+
+        if pending:
+            logger.warning(
+                f"[AsyncWorker] Drain timeout - cancelling {len(pending)} job(s) and returning them to queue"
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    # ─────────────────────────────────────────────────
+    # Dispatcher
+    # ─────────────────────────────────────────────────
+
+    async def _dispatch(self, queue: Queue):
+        """Queue에서 슬롯 수만큼 Job을 가져와 동시 실행"""
+        slots = asyncio.Semaphore(self.concurrency[queue.name])
+
+        while not self._stopping.is_set():
+            # 슬롯 대기 중에도 종료 요청을 확인하도록 짧게 나눠서 대기
+            try:
+                await asyncio.wait_for(slots.acquire(), DEQUEUE_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                continue
+            if self._stopping.is_set():
+                slots.release()
+                break
+
+            try:
+                dequeued = await asyncio.to_thread(self._dequeue, queue)
+            except Exception as e:
+                slots.release()
+                logger.error(f"[AsyncWorker] Dequeue error on '{queue.name}': {e}")
+                await asyncio.sleep(DEQUEUE_TIMEOUT_SECONDS)
+                continue
+
+            if dequeued is None:
+                slots.release()
+                if self.burst:
+                    break
+                continue
+
+            job = dequeued
+            if self._stopping.is_set():
+                # 종료 요청 중에 가져온 Job은 실행하지 않고 반환
+                await asyncio.to_thread(self._requeue, job, queue)
+                slots.release()
+                break
+
+            task = asyncio.create_task(self._execute(job, queue))
+            self._in_flight[task] = (job, queue)
+
+            def _on_done(t: asyncio.Task):
+                self._in_flight.pop(t, None)
+                slots.release()
+
+            task.add_done_callback(_on_done)
+
+        # burst 모드: 이 Queue에서 가져간 Job이 끝날 때까지 대기
+        if self.burst:
+            own = [t for t, (_, q) in self._in_flight.items() if q is queue]
+            if own:
+                await asyncio.wait(own)
+
+    def _dequeue(self, queue: Queue) -> Optional[Job]:
+        """Job 1개 가져오기 (BLPOP, 없으면 None)"""
+        timeout = None if self.burst else DEQUEUE_TIMEOUT_SECONDS
+        try:
+            result = Queue.dequeue_any([queue], timeout, connection=self.connection)
+        except DequeueTimeout:
+            return None
+        return result[0] if result else None
+
+    async def _run_heartbeat(self):
+        """Worker/실행 중 Job heartbeat 갱신 및 주기적 registry 정리"""
+        while True:
+            in_flight = list(self._in_flight.values())
+            try:
+                await asyncio.to_thread(self._heartbeat, in_flight)
+                if self.rq_worker.should_run_maintenance_tasks:
+                    await asyncio.to_thread(self._clean_registries)
+            except Exception as e:
+                logger.warning(f"[AsyncWorker] Heartbeat error: {e}")
+            await asyncio.sleep(self.rq_worker.job_monitoring_interval)
+
+    def _heartbeat(self, in_flight: List[Tuple[Job, Queue]]):
+        """Worker와 실행 중 Job의 StartedJobRegistry 만료 시각 연장"""
+        with self.connection.pipeline() as pipe:
+            self.rq_worker.heartbeat(self.heartbeat_ttl, pipeline=pipe)
+            self.rq_worker.set_state(WorkerStatus.BUSY if in_flight else WorkerStatus.IDLE, pipeline=pipe)
+            for job, queue in in_flight:
+                execution = self._executions.get(job.id)
+                if execution is None:
+                    continue
+                execution.heartbeat(queue.started_job_registry, self.heartbeat_ttl, pipeline=pipe)
+                job.heartbeat(now(), self.heartbeat_ttl, pipeline=pipe, xx=True)
+            pipe.execute()
+
+    def _clean_registries(self):
+        """
+        RQ registry 정리 (heartbeat가 끊긴 Job → 재시도 또는 FailedJobRegistry + on_failure)
+
+        RQ 기본 정리는 on_failure 콜백을 signal 타임아웃으로 감싸 스레드에서 실행할 수 없으므로
+        StartedJobRegistry는 Timer 타임아웃으로 먼저 정리합니다.
+        """
+        for queue in self.queues:
+            StartedJobRegistry(
+                queue.name, connection=self.connection, job_class=queue.job_class,
+                serializer=queue.serializer, death_penalty_class=CALLBACK_DEATH_PENALTY,
+            ).cleanup()
+        with self._rq_lock:
+            self.rq_worker.clean_registries()
+
+    async def _run_scheduler(self):
+        """Retry interval로 스케줄된 Job을 시간이 되면 Queue로 복귀"""
+        scheduler = RQScheduler([q.name for q in self.queues], connection=self.connection)
+
+        def _tick():
+            if scheduler.acquire_locks():
+                scheduler.enqueue_scheduled_jobs()
+
+        try:
+            while True:
+                try:
+                    await asyncio.to_thread(_tick)
+                except Exception as e:
+                    logger.warning(f"[AsyncWorker] Scheduler error: {e}")
+                await asyncio.sleep(SCHEDULER_INTERVAL_SECONDS)
+        finally:
+            try:
+                scheduler.release_locks()
+            except Exception:
+                pass
+
+    # ─────────────────────────────────────────────────
+    # Job 실행
+    # ─────────────────────────────────────────────────
+
+    async def _execute(self, job: Job, queue: Queue):
+        """Job 1개 실행 및 RQ 상태 기록 (성공 / 재시도 / 최종 실패)"""
+        self._stats["started"] += 1
+        logger.info(f"[AsyncWorker] {queue.name}: {job.func_name} ({job.id}) started")
+
+        try:
+            await asyncio.to_thread(self._start_job, job, queue)
+            result = await self._run_job(job)
+
+        except asyncio.CancelledError:
+            # drain 시간 초과 → 다른 워커가 이어서 처리하도록 반환
+            await asyncio.to_thread(self._requeue, job, queue)
+            raise
+
+        except Exception as e:
+            exc_info = sys.exc_info()
+            if isinstance(e, asyncio.TimeoutError):
+                e = TimeoutError(f"Job exceeded timeout ({job.timeout}s)")
+                exc_info = (TimeoutError, e, exc_info[2])
+            await asyncio.to_thread(self._handle_failure, job, queue, exc_info)
+
+        else:
+            self._stats["finished"] += 1
+            await asyncio.to_thread(self._handle_success, job, queue, result)
+            logger.info(f"[AsyncWorker] {queue.name}: {job.func_name} ({job.id}) finished")
+
+    async def _run_job(self, job: Job) -> Any:
+        """비동기 구현이 있으면 await, 없으면 동기 함수를 스레드에서 실행"""
+        timeout = job.timeout if job.timeout and job.timeout > 0 else None
+
+        async_path = ASYNC_TASKS.get(job.func_name)
+        if async_path:
+            func = _resolve_callable(async_path)
+            return await asyncio.wait_for(func(*job.args, **job.kwargs), timeout)
+
+        # 스레드는 강제 종료할 수 없으므로 타임아웃 시 결과만 포기
+        return await asyncio.wait_for(
+            asyncio.to_thread(job.func, *job.args, **job.kwargs), timeout
+        )
+
+    def _start_job(self, job: Job, queue: Queue):
+        """
+        Job 실행 시작 기록 (RQ Worker.prepare_job_execution과 동일한 상태)
+
+        - StartedJobRegistry에 실행(execution) 등록 (heartbeat_ttl 후 만료 → 정리 대상)
+        - Job 상태 STARTED + worker_name/started_at 기록
+        - dequeue 시 옮겨진 intermediate queue에서 제거
+        """
+        with self.connection.pipeline() as pipe:
+            execution = Execution.create(job, self.heartbeat_ttl, pipeline=pipe, worker_name=self.rq_worker.name)
+            job.prepare_for_execution(self.rq_worker.name, pipeline=pipe)
+            pipe.lrem(queue.intermediate_queue_key, 1, job.id)
+            pipe.execute()
+        self._executions[job.id] = execution
+
+    def _handle_success(self, job: Job, queue: Queue, result: Any = None):
+        job.ended_at = now()
+        job._result = result
+        with self._rq_lock:
+            self.rq_worker.execution = self._executions.pop(job.id, None)
+            try:
+                self.rq_worker.handle_job_success(job, queue, queue.started_job_registry)
+            finally:
+                self.rq_worker.execution = None
+
+    def _handle_failure(self, job: Job, queue: Queue, exc_info):
+        exc_type, exc_value, tb = exc_info
+        exc_string = "".join(traceback.format_exception(exc_type, exc_value, tb))
+        job.ended_at = now()
+
+        # RQ Retry 설정이 남아있으면 재시도 (interval이 있으면 ScheduledJobRegistry 경유)
+        if job.should_retry:
+            self._stats["retried"] += 1
+            logger.warning(
+                f"[AsyncWorker] {queue.name}: {job.func_name} ({job.id}) failed, "
+                f"retrying ({job.retries_left} left): {exc_value}"
+            )
+        else:
+            self._stats["failed"] += 1
+            logger.error(f"[AsyncWorker] {queue.name}: {job.func_name} ({job.id}) failed: {exc_value}")
+
+            # on_failure 콜백 (tasks.on_job_failure → DLQ) - 모든 재시도가 실패한 후에만 호출
+            try:
+                job.execute_failure_callback(CALLBACK_DEATH_PENALTY, exc_type, exc_value, tb)
+            except Exception as e:
+                logger.error(f"[AsyncWorker] on_failure callback error ({job.id}): {e}")
+                exc_string = traceback.format_exc()
+
+        # 상태(FAILED)/FailedJobRegistry 기록 또는 job.retry는 RQ Worker에 위임
+        with self._rq_lock:
+            self.rq_worker.execution = self._executions.pop(job.id, None)
+            try:
+                self.rq_worker.handle_job_failure(
+                    job, queue, started_job_registry=queue.started_job_registry, exc_string=exc_string
+                )
+            finally:
+                self.rq_worker.execution = None
+
+    def _requeue(self, job: Job, queue: Queue):
+        """실행하지 못한 Job을 Queue 앞에 반환 (StartedJobRegistry/intermediate queue에서 제거)"""
+        try:
+            execution = self._executions.pop(job.id, None)
+            with self.connection.pipeline() as pipe:
+                if execution is not None:
+                    execution.delete(job, pipe)
+                pipe.lrem(queue.intermediate_queue_key, 1, job.id)
+                pipe.execute()
+            queue.enqueue_job(job, at_front=True)
+            self._stats["requeued"] += 1
+            logger.info(f"[AsyncWorker] {queue.name}: {job.id} returned to queue")
+        except Exception as e:
+            logger.error(f"[AsyncWorker] Failed to requeue {job.id}: {e}")
+
+def run_async_worker(
+    queue_names: List[str],
+    connection: Redis,
+    burst: bool = False,
+):
+    """AsyncWorker 실행 (종료 시까지 블로킹)"""
+    # 장수 프로세스이므로 LibreOffice 상주 인스턴스 사용 (파싱 워커 spawn 전에 허용)
+    enable_libreoffice_pool()
+    # 하나의 루프에서 여러 Job이 LLM을 호출하므로 거버너로 동시성/예산 제어
+    enable_llm_governor()
+    # 파싱 워커 프로세스 선기동 (첫 Job의 파서 import 지연 제거)
+    get_parse_service().warm_up()
+
+    worker = AsyncWorker(queue_names, connection, burst=burst)
+    try:
+        asyncio.run(worker.run())
+    finally:
+        shutdown_libreoffice_pool()
+    return worker
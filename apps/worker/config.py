@@ -22,8 +22,10 @@ class ChunkingConfig:
 
     원본 텍스트:
     - MAX_RAW_FULL_CHARS: raw_full 최대 길이
-    - RAW_SECTION_CHUNK_SIZE: 슬라이딩 윈도우 크기
-    - RAW_SECTION_OVERLAP: 오버랩 크기
+    - RAW_SECTION_CHUNK_SIZE: raw_section 최대 문자 수 (경계 없는 텍스트는 윈도우 크기)
+    - RAW_SECTION_OVERLAP: 경계 없는 텍스트의 윈도우 오버랩
+    - RAW_SECTION_TARGET_TOKENS: raw_section 목표 최대 토큰 수 (섹션/문장 경계 패킹)
+    - RAW_SECTION_OVERLAP_TOKENS: 분할된 섹션 조각 사이 오버랩 최대 토큰 수
     - RAW_SECTION_MIN_LENGTH: 최소 청크 길이
     - RAW_TEXT_MIN_LENGTH: raw 청킹 최소 조건
 
@@ -44,6 +46,8 @@ class ChunkingConfig:
     MAX_RAW_FULL_CHARS: int = 8000
     RAW_SECTION_CHUNK_SIZE: int = 1500
     RAW_SECTION_OVERLAP: int = 300
+    RAW_SECTION_TARGET_TOKENS: int = 2048
+    RAW_SECTION_OVERLAP_TOKENS: int = 64
     RAW_SECTION_MIN_LENGTH: int = 100
     RAW_TEXT_MIN_LENGTH: int = 100
 
@@ -77,6 +81,17 @@ class Settings(BaseSettings):
     SUPABASE_URL: str = ""
     SUPABASE_SERVICE_ROLE_KEY: str = ""  # Service Role Key (서버용)
 
+    # 상태 갱신 write-behind 버퍼 (processing_jobs / candidates)
+    # 비종료 상태는 모아서 전송, 종료 상태(completed/failed 등)는 즉시 플러시
+    USE_STATUS_WRITE_BUFFER: bool = Field(
+        default=True,
+        description="update_job_status / update_candidate_status 비종료 갱신을 병합해 지연 전송"
+    )
+    STATUS_WRITE_INTERVAL_MS: float = Field(
+        default=500.0,
+        description="비종료 상태 갱신 병합 후 전송 주기 (ms)"
+    )
+
     # ─────────────────────────────────────────────────
     # Redis (Job Queue)
     # ─────────────────────────────────────────────────
@@ -95,13 +110,67 @@ class Settings(BaseSettings):
     # Google Gemini
     GOOGLE_AI_API_KEY: str = ""
     GEMINI_MODEL: str = "gemini-2.0-flash"
+    GEMINI_MAX_CONCURRENCY: int = Field(
+        default=8,
+        description="프로세스당 Gemini 동시 요청 상한"
+    )
 
     # Anthropic Claude (Phase 2)
     ANTHROPIC_API_KEY: str = ""
     ANTHROPIC_MODEL: str = "claude-3-5-sonnet-20241022"
 
+    # LLM 호출 거버너 (프로바이더+모델별 AIMD 동시성 + 분당 예산, services/llm_governor.py)
+    # 상태가 프로세스 메모리에만 있으므로 장수 프로세스(FastAPI, async 워커, WORKER_REUSE_PROCESS=true)에서만 사용
+    # fork 모드 RQ Worker는 Job마다 상태가 초기화되므로 거버너 없이 호출
+    USE_LLM_GOVERNOR: bool = Field(
+        default=True,
+        description="모든 LLM 호출을 프로바이더/모델별 거버너 슬롯을 통해 실행"
+    )
+    LLM_MAX_CONCURRENCY: int = Field(
+        default=16,
+        description="프로세스당 프로바이더/모델별 동시 요청 상한 (AIMD 증가 상한)"
+    )
+    LLM_MIN_CONCURRENCY: int = Field(
+        default=1,
+        description="429 연속 발생 시 줄어드는 동시 요청 하한"
+    )
+    LLM_REQUESTS_PER_MINUTE: int = Field(
+        default=0,
+        description="프로바이더/모델별 분당 요청 예산 (0: 응답 헤더 limit 값 사용)"
+    )
+    LLM_TOKENS_PER_MINUTE: int = Field(
+        default=0,
+        description="프로바이더/모델별 분당 토큰 예산 (0: 응답 헤더 limit 값 사용)"
+    )
+    LLM_RATE_LIMIT_COOLDOWN_SECONDS: float = Field(
+        default=2.0,
+        description="429 수신 시 retry-after가 없을 때 신규 요청 차단 시간 (초)"
+    )
+
+    # 프롬프트 캐싱 (선두 system 메시지 = 정적 프리픽스, utils/prompt_layout.py)
+    USE_PROMPT_CACHING: bool = Field(
+        default=True,
+        description="OpenAI prompt_cache_key / Anthropic cache_control / Gemini cached content로 정적 프리픽스 캐싱"
+    )
+    GEMINI_PROMPT_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        description="Gemini cached content 유지 시간 (초)"
+    )
+    GEMINI_PROMPT_CACHE_MIN_CHARS: int = Field(
+        default=2000,
+        description="Gemini cached content를 생성할 정적 프리픽스 최소 길이 (짧으면 캐시 생성 API가 거부)"
+    )
+
     # Embedding
-    EMBEDDING_MODEL: str = "text-embedding-3-small"
+    EMBEDDING_MODEL: str = Field(
+        default="text-embedding-3-small",
+        description="OpenAI 임베딩 모델"
+    )
+    EMBEDDING_DIMENSIONS: int = Field(
+        default=1536,
+        description="임베딩 차원 (text-embedding-3-*는 축소 가능, 예: 512/768). "
+                    "candidate_chunks.embedding vector(N) 및 웹 EMBEDDING_DIMENSIONS와 일치해야 함"
+    )
 
     # ─────────────────────────────────────────────────
     # 보안 (암호화)
@@ -158,6 +227,249 @@ class Settings(BaseSettings):
         description="GPT-4o + Gemini 병렬 호출로 분석 속도 향상"
     )
 
+    # 순차(조건부) 모드의 1차 호출 헤징
+    # GPT-4o가 지연 시간 내 응답하지 않으면 Gemini를 추가 발사하여 먼저 통과한 응답 채택
+    USE_HEDGED_ANALYSIS: bool = Field(
+        default=True,
+        description="1차 분석 호출 지연 시 2차 모델을 동시 호출 (헤지 요청)"
+    )
+    LLM_HEDGE_DELAY_SECONDS: float = Field(
+        default=20.0,
+        description="헤지 지연 시간 상한 (초) - 지연 시간 표본이 부족할 때 그대로 사용"
+    )
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = Field(
+        default=3.0,
+        description="헤지 지연 시간 하한 (초)"
+    )
+    LLM_HEDGE_PERCENTILE: float = Field(
+        default=0.95,
+        description="최근 1차 호출 지연 시간의 이 분위수를 헤지 지연 시간으로 사용 (표본은 Redis에 모델별로 공유)"
+    )
+
+    # 순차(조건부) 모드 2차 호출 범위 축소
+    # 누락/불확실 필드만 축약 스키마 + 관련 섹션 텍스트로 재추출 (전체 문서 재분석 대신)
+    USE_TARGETED_ESCALATION: bool = Field(
+        default=True,
+        description="교차 검증 시 누락/불확실 핵심 필드만 관련 섹션으로 재추출"
+    )
+
+    # ─────────────────────────────────────────────────
+    # LLM 분석 캐시 (Content-addressed)
+    # ─────────────────────────────────────────────────
+    # 동일 텍스트 + 프롬프트 버전 + 프로바이더 세트 + 모드 → 캐시된 분석 결과 재사용
+    USE_ANALYSIS_CACHE: bool = Field(
+        default=True,
+        description="동일 이력서 재분석 시 LLM 호출 대신 캐시 결과 사용"
+    )
+    ANALYSIS_CACHE_TTL_SECONDS: int = Field(
+        default=7 * 24 * 3600,
+        description="분석 캐시 TTL (초)"
+    )
+    ANALYSIS_CACHE_MAX_ENTRIES: int = Field(
+        default=20000,
+        description="분석 캐시 최대 항목 수 (초과 시 LRU 삭제)"
+    )
+    ANALYSIS_CACHE_DIR: str = Field(
+        default="",
+        description="Redis 미사용 시 로컬 파일 캐시 경로 (기본: 시스템 임시 디렉토리)"
+    )
+    ANALYSIS_CACHE_MAX_LOCAL_MB: int = Field(
+        default=256,
+        description="로컬 파일 캐시 최대 용량 (MB)"
+    )
+
+    # ─────────────────────────────────────────────────
+    # 섹션 기반 분석 프롬프트 (SemanticIR)
+    # ─────────────────────────────────────────────────
+    # 보일러플레이트 제거 + 중복 섹션 제거 + 라벨별 토큰 예산 (utils/section_prompt_builder.py)
+    USE_SECTION_PROMPT: bool = Field(
+        default=True,
+        description="원문 전체 대신 SectionSeparator 결과로 정리한 텍스트를 분석 프롬프트에 사용"
+    )
+    # 1차 GPT-4o 호출을 스트리밍으로 받아 name/phone/email/exp_years/last_company를
+    # 먼저 전달 (update_candidate_quick_extracted 조기 갱신)
+    USE_STREAMING_ANALYSIS: bool = Field(
+        default=True,
+        description="분석 LLM 응답을 스트리밍 파싱하여 핵심 필드를 조기 전달"
+    )
+
+    # ─────────────────────────────────────────────────
+    # 신원 확인 (Multi-Identity) 실행 전략
+    # ─────────────────────────────────────────────────
+    # latency: 신원 확인과 AI 분석을 동시에 시작하고 거절 시 분석 결과 폐기
+    #          (99% 이상 통과 → 이력서당 GPT-4o-mini 왕복 1회만큼 지연 감소)
+    # cost:    신원 확인 통과 후 분석 시작 (거절 문서에 분석 비용을 쓰지 않음)
+    IDENTITY_CHECK_MODE: str = Field(
+        default="latency",
+        description="신원 확인 실행 전략 (latency: 분석과 동시 실행, cost: 순차 실행)"
+    )
+    USE_IDENTITY_PREFILTER: bool = Field(
+        default=True,
+        description="PIIStore에서 이름/전화번호/이메일이 각각 1개 이하로만 발견되면 LLM 신원 확인 생략"
+    )
+
+    # ─────────────────────────────────────────────────
+    # 스테이지 체크포인트 (RQ Retry / DLQ 재실행 시 완료 단계 스킵)
+    # ─────────────────────────────────────────────────
+    USE_STAGE_CHECKPOINTS: bool = Field(
+        default=True,
+        description="job_id별 스테이지 결과를 저장하여 재시도 시 완료된 단계 스킵"
+    )
+    # 체크포인트에는 파싱 원문(PII)이 포함되므로 재시도 윈도우 정도로만 유지
+    STAGE_CHECKPOINT_TTL_SECONDS: int = Field(
+        default=6 * 3600,
+        description="스테이지 체크포인트 TTL (초)"
+    )
+    STAGE_CHECKPOINT_DIR: str = Field(
+        default="",
+        description="Redis 미사용 시 로컬 체크포인트 경로 (기본: 시스템 임시 디렉토리)"
+    )
+
+    # ─────────────────────────────────────────────────
+    # 워커 런타임
+    # ─────────────────────────────────────────────────
+    # 프로세스당 1개의 이벤트 루프 유지 (LLM/임베딩 HTTP 커넥션 풀 재사용)
+    USE_PERSISTENT_EVENT_LOOP: bool = Field(
+        default=True,
+        description="RQ Job에서 asyncio.run 대신 영구 이벤트 루프 사용"
+    )
+    # fork 없이 워커 프로세스에서 직접 Job 실행 (작업 간 루프/커넥션 풀 재사용)
+    WORKER_REUSE_PROCESS: bool = Field(
+        default=False,
+        description="Job마다 work-horse를 fork하지 않고 워커 프로세스에서 직접 실행"
+    )
+    # CPU 바운드 파싱을 프로세스 풀에서 실행 (이벤트 루프의 LLM/임베딩 대기 작업 보호)
+    USE_PARSE_PROCESS_POOL: bool = Field(
+        default=True,
+        description="파일 파싱을 ProcessPoolExecutor에서 실행 (False면 스레드 풀)"
+    )
+    PARSE_POOL_WORKERS: int = Field(
+        default=0,
+        description="파싱 프로세스 수 (0이면 min(4, CPU 코어 수))"
+    )
+    PARSE_CONCURRENCY: str = Field(
+        default="hwp=2,pdf=3,docx=2",
+        description="파일 타입별 동시 파싱 수 (type=N 쉼표 구분, OCR PDF가 풀을 독점하지 않도록)"
+    )
+    PARSE_TIMEOUT_SECONDS: str = Field(
+        default="hwp=90,pdf=180,docx=120",
+        description="파일 타입별 파싱 타임아웃 (초, 초과 시 PARSE_TIMEOUT + 멈춘 워커 교체)"
+    )
+    # 스캔 PDF OCR (페이지 단위 래스터화 + 병렬 tesseract)
+    OCR_MAX_WORKERS: int = Field(
+        default=0,
+        description="파싱 1건당 동시 OCR 페이지 수 (0이면 min(4, CPU 코어 수 / 2))"
+    )
+    OCR_MIN_DPI: int = Field(
+        default=150,
+        description="OCR 래스터화 최소 DPI"
+    )
+    OCR_MAX_DPI: int = Field(
+        default=300,
+        description="OCR 래스터화 최대 DPI (A4/Letter 기준)"
+    )
+    OCR_MAX_PAGE_PIXELS: int = Field(
+        default=9_000_000,
+        description="페이지당 최대 픽셀 수 (큰 페이지는 DPI를 낮춤)"
+    )
+    OCR_MEMORY_LIMIT_MB: int = Field(
+        default=128,
+        description="파싱 1건당 동시에 메모리에 올리는 페이지 이미지 총량 (MB)"
+    )
+    # LibreOffice 상주 인스턴스 풀 (HWP/DOC 변환 시 soffice cold start 제거, pyuno 필요)
+    # 장수 프로세스(FastAPI, async 워커, WORKER_REUSE_PROCESS=true)에서만 사용
+    # fork 모드 RQ Worker는 Job마다 cold start (work-horse가 os._exit로 끝나 인스턴스가 정리되지 않음)
+    USE_LIBREOFFICE_POOL: bool = Field(
+        default=True,
+        description="LibreOffice 변환을 상주 headless 인스턴스로 처리 (False면 변환마다 soffice 실행)"
+    )
+    LIBREOFFICE_POOL_SIZE: int = Field(
+        default=1,
+        description="프로세스당 상주 soffice 인스턴스 수 (파싱 프로세스 풀 워커마다 생성)"
+    )
+    LIBREOFFICE_RECYCLE_AFTER: int = Field(
+        default=200,
+        description="인스턴스당 변환 N회 후 재기동 (0이면 재기동 안 함)"
+    )
+    LIBREOFFICE_POOL_MAX_QUEUE: int = Field(
+        default=8,
+        description="인스턴스 대기 요청 상한 (초과 시 즉시 실패)"
+    )
+    LIBREOFFICE_QUEUE_TIMEOUT_SECONDS: int = Field(
+        default=60,
+        description="인스턴스 대기 타임아웃 (초)"
+    )
+    LIBREOFFICE_STARTUP_TIMEOUT_SECONDS: int = Field(
+        default=30,
+        description="soffice 기동 + UNO 연결 대기 시간 (초과 시 cold start 폴백)"
+    )
+    LIBREOFFICE_HEALTH_CHECK_INTERVAL_SECONDS: int = Field(
+        default=30,
+        description="유휴 인스턴스 헬스 체크 주기 (초, 0이면 비활성)"
+    )
+    # 비동기 워커 (run_worker.py --mode async): 한 프로세스에서 여러 이력서 동시 처리
+    ASYNC_WORKER_CONCURRENCY: str = Field(
+        default="fast=16,slow=4,process=16",
+        description="Queue별 동시 처리 Job 수 (queue=N 쉼표 구분)"
+    )
+    ASYNC_WORKER_DRAIN_TIMEOUT_SECONDS: int = Field(
+        default=300,
+        description="SIGTERM 수신 후 진행 중인 Job 완료 대기 시간 (초과 시 Job을 Queue에 반환)"
+    )
+
+    # ─────────────────────────────────────────────────
+    # 임베딩 배처 (동시 실행 중인 이력서들의 임베딩 요청 병합)
+    # ─────────────────────────────────────────────────
+    USE_EMBEDDING_BATCHER: bool = Field(
+        default=True,
+        description="create_embeddings_batch 요청을 프로세스 공유 배처로 병합"
+    )
+    EMBEDDING_BATCH_WINDOW_MS: float = Field(
+        default=10.0,
+        description="요청 병합 대기 시간 (ms)"
+    )
+    EMBEDDING_BATCH_MAX_INPUTS: int = Field(
+        default=512,
+        description="요청당 최대 입력 수 (API 한도 2048)"
+    )
+    EMBEDDING_BATCH_MAX_TOKENS: int = Field(
+        default=100_000,
+        description="요청당 최대 토큰 수 (API 한도 300,000)"
+    )
+    EMBEDDING_TOKENS_PER_MINUTE: int = Field(
+        default=0,
+        description="프로세스당 분당 임베딩 토큰 예산 (0이면 제한 없음)"
+    )
+    EMBEDDING_MAX_CONCURRENT_REQUESTS: int = Field(
+        default=4,
+        description="프로세스당 동시 embeddings.create 요청 수"
+    )
+
+    # ─────────────────────────────────────────────────
+    # 임베딩 캐시 (Content-addressed)
+    # ─────────────────────────────────────────────────
+    # (모델, 차원, sha256(입력)) → 벡터. 재업로드/버전 스태킹/백필 시 동일 청크 재임베딩 방지
+    USE_EMBEDDING_CACHE: bool = Field(
+        default=True,
+        description="동일 텍스트 청크는 embeddings API 대신 캐시된 벡터 사용"
+    )
+    EMBEDDING_CACHE_TTL_SECONDS: int = Field(
+        default=30 * 24 * 3600,
+        description="임베딩 캐시 TTL (초)"
+    )
+    EMBEDDING_CACHE_MAX_ENTRIES: int = Field(
+        default=200_000,
+        description="임베딩 캐시 최대 항목 수 (초과 시 LRU 삭제)"
+    )
+    EMBEDDING_CACHE_DTYPE: str = Field(
+        default="float16",
+        description="캐시 저장 포맷: float16 (1536차원 3KB) | float32 (무손실, 6KB)"
+    )
+    EMBEDDING_CACHE_MAX_LOCAL_MB: int = Field(
+        default=64,
+        description="Redis 미사용 시 프로세스 메모리 캐시 최대 용량 (MB)"
+    )
+
     # ─────────────────────────────────────────────────
     # 로깅 설정
     # ─────────────────────────────────────────────────
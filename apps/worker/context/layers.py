@@ -110,6 +110,11 @@ class PIIStore:
     email: Optional[str] = None
     email_confidence: float = 0.0
 
+    # 텍스트에서 발견된 서로 다른 값의 수 (다중 신원 사전 판정용)
+    name_count: int = 0  # "성명: / 이름: / Name:" 필드 기준
+    phone_count: int = 0
+    email_count: int = 0
+
     # 추가 PII (필요시)
     birth_date: Optional[str] = None
     address: Optional[str] = None
@@ -127,6 +132,10 @@ class PIIStore:
     ENGLISH_NAME_PATTERN = re.compile(r'^[A-Za-z\s\-\.]+$')
     PHONE_PATTERN = re.compile(r'01[0-9][-\s]?\d{3,4}[-\s]?\d{4}')
     EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+    NAME_FIELD_PATTERN = re.compile(
+        r'(?:성\s*명|이\s*름|name)\s*[:：]\s*([가-힣]{2,4}|[A-Za-z]+(?: [A-Za-z]+)?)',
+        re.IGNORECASE,
+    )
 
     def extract_from_text(self, text: str, filename: Optional[str] = None):
         """
@@ -140,6 +149,7 @@ class PIIStore:
         self._extract_name(text, filename)
         self._extract_phone(text)
         self._extract_email(text)
+        self.name_count = len({n.strip().lower() for n in self.NAME_FIELD_PATTERN.findall(text)})
         self.extracted_at = datetime.now()
 
         logger.info(f"[PIIStore] PII 추출 완료 - name: {bool(self.name)}, phone: {bool(self.phone)}, email: {bool(self.email)}")
@@ -179,6 +189,7 @@ class PIIStore:
     def _extract_phone(self, text: str):
         """전화번호 추출"""
         phones = self.PHONE_PATTERN.findall(text)
+        self.phone_count = len({re.sub(r'\D', '', p) for p in phones})
         if phones:
             self.phone = phones[0]
             self.phone_original_format = phones[0]
@@ -188,11 +199,23 @@ class PIIStore:
     def _extract_email(self, text: str):
         """이메일 추출"""
         emails = self.EMAIL_PATTERN.findall(text)
+        self.email_count = len({e.lower() for e in emails})
         if emails:
             self.email = emails[0]
             self.email_confidence = 0.95
             logger.info(f"[PIIStore] 이메일 추출: {self.email}")
 
+    def is_single_identity(self) -> bool:
+        """
+        정규식 결과만으로 1명의 이력서로 볼 수 있는지 (LLM 신원 확인 생략 판정)
+
+        전화번호/이메일 중 하나 이상이 발견되고, 이름 필드/전화번호/이메일이
+        각각 서로 다른 값 1개 이하일 때만 True (판단이 애매하면 False → LLM 확인)
+        """
+        if not (self.phone_count or self.email_count):
+            return False
+        return self.name_count <= 1 and self.phone_count <= 1 and self.email_count <= 1
+
     def mask_pii_for_llm(self, text: str) -> str:
         """
         LLM 전송 전 PII 마스킹
@@ -3,6 +3,7 @@ RAI Worker - FastAPI Entry Point
 파일 처리 파이프라인 서버
 """
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -63,17 +64,17 @@ if SENTRY_DSN:
             None if settings.ENV == "development" else event
         ),
     )
-from agents.router_agent import RouterAgent, FileType, RouterResult
+from agents.router_agent import FileType
 from agents.analyst_agent import AnalystAgent, get_analyst_agent, AnalysisResult
 from agents.privacy_agent import PrivacyAgent, get_privacy_agent, PrivacyResult
-from utils.hwp_parser import HWPParser, ParseMethod
-from utils.pdf_parser import PDFParser
-from utils.docx_parser import DOCXParser
 from services.llm_manager import get_llm_manager
 from services.embedding_service import EmbeddingService, get_embedding_service, EmbeddingResult
 from services.database_service import DatabaseService, get_database_service, SaveResult
 from services.queue_service import get_queue_service, QueuedJob, DLQEntry
 from services.pdf_converter import get_pdf_converter, PDFConversionResult
+from services.parse_service import get_parse_service
+from services.llm_governor import enable_llm_governor
+from utils.libreoffice_pool import enable_libreoffice_pool, shutdown_libreoffice_pool
 from orchestrator.feature_flags import get_feature_flags
 from orchestrator.pipeline_orchestrator import get_pipeline_orchestrator
 
@@ -89,8 +90,17 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행"""
     logger.info(f"RAI Worker starting... (Mode: {settings.ANALYSIS_MODE})")
+    # 장수 프로세스이므로 LibreOffice 상주 인스턴스 사용 (파싱 워커 spawn 전에 허용)
+    enable_libreoffice_pool()
+    enable_llm_governor()
+    # 파싱 워커 프로세스 선기동 (첫 요청의 파서 import 지연 제거)
+    get_parse_service().warm_up()
     yield
     logger.info("RAI Worker shutting down...")
+    get_parse_service().shutdown(wait=False)
+    shutdown_libreoffice_pool()
+    # 버퍼에 남은 비종료 상태 갱신 전송
+    get_database_service().flush_status_writes()
 
 
 app = FastAPI(
@@ -200,13 +210,6 @@ async def verify_api_key(
     )
 
 
-# 에이전트 및 파서 초기화
-router_agent = RouterAgent()
-hwp_parser = HWPParser(hancom_api_key=settings.HANCOM_API_KEY or None)
-pdf_parser = PDFParser()
-docx_parser = DOCXParser()
-
-
 class ParseResponse(BaseModel):
     """파싱 응답 모델"""
     success: bool
@@ -431,6 +434,7 @@ async def debug_status():
         "feature_flags": {
             "use_new_pipeline": feature_flags.use_new_pipeline,
             "use_llm_validation": feature_flags.use_llm_validation,
+            "use_batched_validation": feature_flags.use_batched_validation,
             "use_agent_messaging": feature_flags.use_agent_messaging,
             "use_hallucination_detection": feature_flags.use_hallucination_detection,
             "use_evidence_tracking": feature_flags.use_evidence_tracking,
@@ -464,102 +468,34 @@ async def parse_file(
         file_bytes = await file.read()
         filename = file.filename or "unknown"
 
-        # 1. Router Agent로 파일 분석
-        router_result: RouterResult = router_agent.analyze(file_bytes, filename)
-
-        # 거부된 파일 처리
-        if router_result.is_rejected:
-            logger.warning(f"File rejected: {router_result.reject_reason}")
-            return ParseResponse(
-                success=False,
-                text="",
-                file_type=router_result.file_type.value if router_result.file_type else "unknown",
-                parse_method="rejected",
-                page_count=0,
-                is_encrypted=router_result.is_encrypted,
-                error_message=router_result.reject_reason,
-                warnings=router_result.warnings
-            )
+        # 1-2. 파일 타입 감지 + 파싱 (프로세스 풀에서 실행 → 이벤트 루프 블로킹 없음)
+        parsed = await get_parse_service().parse(file_bytes, filename)
+        warnings = parsed.warnings.copy()
 
-        # 2. 파일 타입에 따른 파싱
-        text = ""
-        parse_method = "unknown"
-        page_count = 0
-        is_encrypted = False
-        error_message = None
-        warnings = router_result.warnings.copy()
-
-        if router_result.file_type in [FileType.HWP, FileType.HWPX]:
-            # HWP/HWPX 파싱
-            result = hwp_parser.parse(file_bytes, filename)
-            text = result.text
-            parse_method = result.method.value
-            page_count = result.page_count
-            is_encrypted = result.is_encrypted
-            error_message = result.error_message
-
-            if result.method == ParseMethod.FAILED:
-                return ParseResponse(
-                    success=False,
-                    text="",
-                    file_type=router_result.file_type.value,
-                    parse_method=parse_method,
-                    page_count=0,
-                    is_encrypted=is_encrypted,
-                    error_message=error_message,
-                    warnings=warnings
-                )
-
-        elif router_result.file_type == FileType.PDF:
-            # PDF 파싱
-            result = pdf_parser.parse(file_bytes)
-            text = result.text
-            parse_method = result.method
-            page_count = result.page_count
-            is_encrypted = result.is_encrypted
-            error_message = result.error_message
-
-            if not result.success:
-                return ParseResponse(
-                    success=False,
-                    text="",
-                    file_type=router_result.file_type.value,
-                    parse_method=parse_method,
-                    page_count=0,
-                    is_encrypted=is_encrypted,
-                    error_message=error_message,
-                    warnings=warnings
-                )
-
-        elif router_result.file_type in [FileType.DOC, FileType.DOCX]:
-            # DOC/DOCX 파싱
-            result = docx_parser.parse(file_bytes, filename)
-            text = result.text
-            parse_method = result.method
-            page_count = result.page_count
-            error_message = result.error_message
-
-            if not result.success:
-                return ParseResponse(
-                    success=False,
-                    text="",
-                    file_type=router_result.file_type.value,
-                    parse_method=parse_method,
-                    page_count=0,
-                    error_message=error_message,
-                    warnings=warnings
-                )
-        else:
+        if not parsed.success:
+            if parsed.error_code == "FILE_REJECTED":
+                logger.warning(f"File rejected: {parsed.error}")
+                parse_method = "rejected"
+            elif parsed.error_code == "UNSUPPORTED_TYPE":
+                parse_method = "unsupported"
+            else:
+                parse_method = parsed.parse_method
             return ParseResponse(
                 success=False,
                 text="",
-                file_type="unknown",
-                parse_method="unsupported",
+                file_type=parsed.file_type or "unknown",
+                parse_method=parse_method,
                 page_count=0,
-                error_message=f"Unsupported file type: {router_result.file_type}",
+                is_encrypted=parsed.is_encrypted,
+                error_message=parsed.error,
                 warnings=warnings
             )
 
+        text = parsed.text
+        parse_method = parsed.parse_method
+        page_count = parsed.page_count
+        is_encrypted = parsed.is_encrypted
+
         # 텍스트 길이 체크
         if len(text.strip()) < settings.MIN_TEXT_LENGTH:
             warnings.append(f"추출된 텍스트가 너무 짧습니다 ({len(text.strip())}자). 스캔 이미지일 수 있습니다.")
@@ -569,7 +505,7 @@ async def parse_file(
         return ParseResponse(
             success=True,
             text=text,
-            file_type=router_result.file_type.value,
+            file_type=parsed.file_type,
             parse_method=parse_method,
             page_count=page_count,
             is_encrypted=is_encrypted,
@@ -706,7 +642,9 @@ async def parse_only_endpoint(
             )
 
         try:
-            file_response = db_service.client.storage.from_("resumes").download(request.file_url)
+            file_response = await asyncio.to_thread(
+                db_service.client.storage.from_("resumes").download, request.file_url
+            )
             if not file_response:
                 return ParseOnlyResponse(
                     success=False,
@@ -726,94 +664,40 @@ async def parse_only_endpoint(
 
         logger.info(f"[ParseOnly] Downloaded {len(file_bytes)} bytes")
 
-        # Step 3: Router Agent로 파일 타입 감지
-        router_result = router_agent.analyze(file_bytes, request.file_name)
-
-        if router_result.is_rejected:
-            logger.warning(f"[ParseOnly] File rejected: {router_result.reject_reason}")
-            return ParseOnlyResponse(
-                success=False,
-                error_code="PARSE_FAILED",
-                error_message=router_result.reject_reason or "지원하지 않는 파일 형식입니다.",
-                is_encrypted=router_result.is_encrypted,
-                warnings=router_result.warnings,
-                duration_ms=int((time.time() - start_time) * 1000)
-            )
+        # Step 3-4: 파일 타입 감지 + 파싱 (프로세스 풀에서 실행 → 이벤트 루프 블로킹 없음)
+        parsed = await get_parse_service().parse(file_bytes, request.file_name)
+        warnings = parsed.warnings
 
-        # Step 4: 파일 타입에 따른 파싱
-        text = ""
-        parse_method = "unknown"
-        page_count = 0
-        is_encrypted = False
-        warnings = router_result.warnings.copy()
-
-        if router_result.file_type in [FileType.HWP, FileType.HWPX]:
-            result = hwp_parser.parse(file_bytes, request.file_name)
-            text = result.text
-            parse_method = result.method.value
-            page_count = result.page_count
-            is_encrypted = result.is_encrypted
-
-            if result.method == ParseMethod.FAILED:
-                error_msg = result.error_message or "HWP 파일을 파싱할 수 없습니다."
-                if is_encrypted:
-                    error_msg = "비밀번호로 보호된 파일입니다. 비밀번호를 해제한 후 다시 업로드해주세요."
-                return ParseOnlyResponse(
-                    success=False,
-                    error_code="ENCRYPTED" if is_encrypted else "PARSE_FAILED",
-                    error_message=error_msg,
-                    is_encrypted=is_encrypted,
-                    file_type=router_result.file_type.value,
-                    warnings=warnings,
-                    duration_ms=int((time.time() - start_time) * 1000)
-                )
-
-        elif router_result.file_type == FileType.PDF:
-            result = pdf_parser.parse(file_bytes)
-            text = result.text
-            parse_method = result.method
-            page_count = result.page_count
-            is_encrypted = result.is_encrypted
-
-            if not result.success:
-                error_msg = result.error_message or "PDF 파일을 파싱할 수 없습니다."
-                if is_encrypted:
-                    error_msg = "비밀번호로 보호된 PDF입니다. 비밀번호를 해제한 후 다시 업로드해주세요."
-                return ParseOnlyResponse(
-                    success=False,
-                    error_code="ENCRYPTED" if is_encrypted else "PARSE_FAILED",
-                    error_message=error_msg,
-                    is_encrypted=is_encrypted,
-                    file_type=router_result.file_type.value,
-                    warnings=warnings,
-                    duration_ms=int((time.time() - start_time) * 1000)
-                )
-
-        elif router_result.file_type in [FileType.DOC, FileType.DOCX]:
-            result = docx_parser.parse(file_bytes, request.file_name)
-            text = result.text
-            parse_method = result.method
-            page_count = result.page_count
-
-            if not result.success:
+        if not parsed.success:
+            logger.warning(f"[ParseOnly] Parse failed ({parsed.error_code}): {parsed.error}")
+            if parsed.error_code in ("FILE_REJECTED", "UNSUPPORTED_TYPE"):
+                # Router 거부 (크기/형식/DRM/페이지 수) - 거부 사유 그대로 전달
                 return ParseOnlyResponse(
                     success=False,
                     error_code="PARSE_FAILED",
-                    error_message=result.error_message or "DOC/DOCX 파일을 파싱할 수 없습니다.",
-                    file_type=router_result.file_type.value,
+                    error_message=parsed.error or "지원하지 않는 파일 형식입니다.",
+                    is_encrypted=parsed.is_encrypted,
                     warnings=warnings,
                     duration_ms=int((time.time() - start_time) * 1000)
                 )
 
-        else:
+            error_msg = parsed.error or "파일을 파싱할 수 없습니다."
+            if parsed.is_encrypted:
+                error_msg = "비밀번호로 보호된 파일입니다. 비밀번호를 해제한 후 다시 업로드해주세요."
             return ParseOnlyResponse(
                 success=False,
-                error_code="PARSE_FAILED",
-                error_message=f"지원하지 않는 파일 형식입니다: {router_result.file_type}",
+                error_code="ENCRYPTED" if parsed.is_encrypted else "PARSE_FAILED",
+                error_message=error_msg,
+                is_encrypted=parsed.is_encrypted,
+                file_type=parsed.file_type,
                 warnings=warnings,
                 duration_ms=int((time.time() - start_time) * 1000)
             )
 
+        text = parsed.text
+        parse_method = parsed.parse_method
+        page_count = parsed.page_count
+
         # Step 5: 텍스트 길이 체크
         text_length = len(text.strip())
         if text_length < settings.MIN_TEXT_LENGTH:
@@ -822,7 +706,7 @@ async def parse_only_endpoint(
                 error_code="TEXT_TOO_SHORT",
                 error_message=f"추출된 텍스트가 너무 짧습니다 ({text_length}자). 스캔 이미지일 수 있습니다.",
                 text_length=text_length,
-                file_type=router_result.file_type.value,
+                file_type=parsed.file_type,
                 parse_method=parse_method,
                 page_count=page_count,
                 warnings=warnings,
@@ -860,11 +744,11 @@ async def parse_only_endpoint(
             success=True,
             text=text,
             text_length=text_length,
-            file_type=router_result.file_type.value,
+            file_type=parsed.file_type,
             parse_method=parse_method,
             page_count=page_count,
             quick_extracted=quick_extracted,
-            is_encrypted=is_encrypted,
+            is_encrypted=parsed.is_encrypted,
             warnings=warnings,
             duration_ms=duration_ms
         )
@@ -1662,50 +1546,26 @@ async def run_pipeline(
         # Step 2: 파일 파싱
         logger.info(f"[Pipeline] Parsing file: {file_name}")
 
-        # 파일 타입 감지
-        router_result = router_agent.analyze(file_bytes, file_name)
-
-        if router_result.is_rejected:
-            raise Exception(f"File rejected: {router_result.reject_reason}")
-
-        # 파서 선택 및 파싱
-        text = ""
-        parse_method = "unknown"
-        page_count = 0
-
-        if router_result.file_type in [FileType.HWP, FileType.HWPX]:
-            result = hwp_parser.parse(file_bytes, file_name)
-            text = result.text
-            parse_method = result.method.value
-            page_count = result.page_count
-            if result.method == ParseMethod.FAILED:
-                raise Exception(f"HWP parsing failed: {result.error_message}")
-
-        elif router_result.file_type == FileType.PDF:
-            result = pdf_parser.parse(file_bytes)
-            text = result.text
-            parse_method = result.method
-            page_count = result.page_count
-            if not result.success:
-                raise Exception(f"PDF parsing failed: {result.error_message}")
-
-        elif router_result.file_type in [FileType.DOC, FileType.DOCX]:
-            result = docx_parser.parse(file_bytes, file_name)
-            text = result.text
-            parse_method = result.method
-            page_count = result.page_count
-            if not result.success:
-                raise Exception(f"DOCX parsing failed: {result.error_message}")
-        else:
-            raise Exception(f"Unsupported file type: {router_result.file_type}")
+        # 파일 타입 감지 + 파싱 (프로세스 풀에서 실행 → 이벤트 루프 블로킹 없음)
+        parsed = await get_parse_service().parse(file_bytes, file_name)
+
+        if not parsed.success:
+            if parsed.error_code == "FILE_REJECTED":
+                raise Exception(f"File rejected: {parsed.error}")
+            raise Exception(f"{parsed.file_type.upper()} parsing failed: {parsed.error}")
+
+        file_type = FileType(parsed.file_type)
+        text = parsed.text
+        parse_method = parsed.parse_method
+        page_count = parsed.page_count
 
         logger.info(f"[Pipeline] Parsed successfully: {len(text)} chars, {page_count} pages")
 
         # Step 2.5: PDF 변환 (원본이 PDF가 아닌 경우)
         # PDF Viewer에서 볼 수 있도록 DOC/DOCX/HWP → PDF 변환
         pdf_storage_path: Optional[str] = None
-        if router_result.file_type != FileType.PDF:
-            logger.info(f"[Pipeline] Converting {router_result.file_type.value} to PDF...")
+        if file_type != FileType.PDF:
+            logger.info(f"[Pipeline] Converting {file_type.value} to PDF...")
             pdf_converter = get_pdf_converter()
             conversion_result = pdf_converter.convert_to_pdf(file_bytes, file_name)
 
@@ -1845,7 +1705,7 @@ async def run_pipeline(
             encrypted_store=encrypted_store,
             hash_store=hash_store,
             source_file=file_url,
-            file_type=router_result.file_type.value if router_result.file_type else "unknown",
+            file_type=file_type.value,
             analysis_mode=analysis_mode.value,
             candidate_id=candidate_id,  # Pass existing candidate_id for update
         )
@@ -2124,6 +1984,7 @@ class FeatureFlagsResponse(BaseModel):
     """Feature Flags 응답 모델"""
     use_new_pipeline: bool
     use_llm_validation: bool
+    use_batched_validation: bool
     use_agent_messaging: bool
     use_hallucination_detection: bool
     use_evidence_tracking: bool
@@ -2144,6 +2005,7 @@ async def get_feature_flags_endpoint(_: bool = Depends(verify_api_key)):
     return FeatureFlagsResponse(
         use_new_pipeline=flags.use_new_pipeline,
         use_llm_validation=flags.use_llm_validation,
+        use_batched_validation=flags.use_batched_validation,
         use_agent_messaging=flags.use_agent_messaging,
         use_hallucination_detection=flags.use_hallucination_detection,
         use_evidence_tracking=flags.use_evidence_tracking,
@@ -2419,6 +2281,52 @@ async def get_recent_metrics(count: int = 10, _: bool = Depends(verify_api_key))
     }
 
 
+@app.get("/metrics/embeddings")
+async def get_embedding_metrics(_: bool = Depends(verify_api_key)):
+    """
+    임베딩 배처 메트릭 (요청 수, 배치 채움률, 분당 토큰 예산 대기 시간)
+
+    Returns:
+        루프별 EmbeddingBatcher 통계
+    """
+    from services.embedding_service import get_embedding_service
+
+    return {
+        "success": True,
+        **get_embedding_service().get_batcher_stats(),
+    }
+
+
+@app.get("/metrics/status-writes")
+async def get_status_write_metrics(_: bool = Depends(verify_api_key)):
+    """
+    상태 갱신 write-behind 버퍼 메트릭 (병합 수, 요청 수, 요청당 행 수, 대기 갱신 수)
+
+    Returns:
+        StatusWriteBuffer 통계
+    """
+    return {
+        "success": True,
+        **get_database_service().get_status_buffer_stats(),
+    }
+
+
+@app.get("/metrics/llm-governor")
+async def get_llm_governor_metrics(_: bool = Depends(verify_api_key)):
+    """
+    LLM 거버너 메트릭 (동시성 한도, 대기열 대기 시간, 429 횟수, 헤더 기반 잔여 한도)
+
+    Returns:
+        프로바이더/모델별 LLMRateGovernor 통계
+    """
+    from services.llm_manager import get_llm_manager
+
+    return {
+        "success": True,
+        **get_llm_manager().get_governor_stats(),
+    }
+
+
 @app.get("/metrics/llm-cost")
 async def get_llm_cost_metrics(
     minutes: int = 1440,  # 기본 24시간
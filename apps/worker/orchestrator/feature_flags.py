@@ -20,6 +20,7 @@ class FeatureFlags:
     환경 변수로 제어:
     - USE_NEW_PIPELINE: 새 PipelineContext 기반 파이프라인 사용
     - USE_LLM_VALIDATION: ValidationAgent에 LLM 기반 검증 사용
+    - USE_BATCHED_VALIDATION: LLM 검증을 필드별 호출 대신 단일 배치 호출로 수행
     - USE_AGENT_MESSAGING: 에이전트 간 메시지 버스 사용
     - USE_HALLUCINATION_DETECTION: 환각 탐지 기능 사용
     - USE_EVIDENCE_TRACKING: 증거 추적 기능 사용
@@ -30,6 +31,7 @@ class FeatureFlags:
 
     # 세부 기능 플래그
     use_llm_validation: bool = False
+    use_batched_validation: bool = True
     use_agent_messaging: bool = False
     use_hallucination_detection: bool = True
     use_evidence_tracking: bool = True
@@ -74,6 +76,7 @@ class FeatureFlags:
         return cls(
             use_new_pipeline=parse_bool("USE_NEW_PIPELINE", False),
             use_llm_validation=parse_bool("USE_LLM_VALIDATION", False),
+            use_batched_validation=parse_bool("USE_BATCHED_VALIDATION", True),
             use_agent_messaging=parse_bool("USE_AGENT_MESSAGING", False),
             use_hallucination_detection=parse_bool("USE_HALLUCINATION_DETECTION", True),
             use_evidence_tracking=parse_bool("USE_EVIDENCE_TRACKING", True),
@@ -128,6 +131,7 @@ class FeatureFlags:
         logger.info(f"[FeatureFlags] Status:")
         logger.info(f"  - use_new_pipeline: {self.use_new_pipeline}")
         logger.info(f"  - use_llm_validation: {self.use_llm_validation}")
+        logger.info(f"  - use_batched_validation: {self.use_batched_validation}")
         logger.info(f"  - use_agent_messaging: {self.use_agent_messaging}")
         logger.info(f"  - use_hallucination_detection: {self.use_hallucination_detection}")
         logger.info(f"  - use_evidence_tracking: {self.use_evidence_tracking}")
@@ -8,7 +8,7 @@ PipelineContext를 사용하여 전체 파이프라인을 관리합니다.
 import logging
 import time
 import asyncio
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Tuple
 from dataclasses import dataclass, field
 
 from context import PipelineContext
@@ -28,6 +28,16 @@ def _get_metrics_collector():
         return None
 
 
+def _get_checkpoint_store():
+    """Lazy import to avoid circular dependencies"""
+    try:
+        from services.checkpoint_store import get_checkpoint_store
+        return get_checkpoint_store()
+    except ImportError:
+        logger.warning("CheckpointStore not available")
+        return None
+
+
 @dataclass
 class OrchestratorResult:
     """오케스트레이터 실행 결과"""
@@ -52,6 +62,9 @@ class OrchestratorResult:
     is_update: bool = False
     parent_id: Optional[str] = None
 
+    # 저장 이후 단계용 (포트폴리오 썸네일)
+    portfolio_url: Optional[str] = None
+
     # 디버그 정보
     context_summary: Optional[Dict[str, Any]] = None
 
@@ -84,7 +97,7 @@ class PipelineOrchestrator:
     1. 파일 다운로드 (Storage에서)
     2. 파일 파싱 (PDF/HWP/DOCX)
     3. PII 추출 (정규식 전용)
-    4. 신원 확인 (Multi-Identity 체크)
+    4. 신원 확인 (Multi-Identity 체크, PIIStore 사전 판정 / 분석과 동시 실행)
     5. AI 분석 (GPT + Gemini)
     6. 검증 및 환각 탐지
     7. PII 마스킹 + 암호화
@@ -99,18 +112,10 @@ class PipelineOrchestrator:
     def _init_agents(self):
         """에이전트 및 서비스 초기화"""
         # Lazy import to avoid circular dependencies
-        from agents.router_agent import RouterAgent
-        from utils.hwp_parser import HWPParser
-        from utils.pdf_parser import PDFParser
-        from utils.docx_parser import DOCXParser
-        from config import get_settings
-
-        settings = get_settings()
+        from services.parse_service import get_parse_service
 
-        self.router_agent = RouterAgent()
-        self.hwp_parser = HWPParser(hancom_api_key=settings.HANCOM_API_KEY or None)
-        self.pdf_parser = PDFParser()
-        self.docx_parser = DOCXParser()
+        # Router/파서는 ParseService 워커 프로세스에서 생성 (파싱은 프로세스 풀에서 실행)
+        self.parse_service = get_parse_service()
 
     async def run(
         self,
@@ -148,6 +153,10 @@ class PipelineOrchestrator:
 
         logger.info(f"[Orchestrator] Starting pipeline: {ctx.metadata.pipeline_id}")
 
+        # LLM 거버너 공정 큐: 이 파이프라인의 LLM 호출을 job_id 대기열로 묶음
+        from services.llm_governor import set_llm_job, reset_llm_job
+        llm_job_token = set_llm_job(job_id)
+
         # 메트릭 수집 시작
         metrics_collector = _get_metrics_collector()
         if metrics_collector:
@@ -173,15 +182,13 @@ class PipelineOrchestrator:
             # Stage 3: PII 추출 (정규식 전용)
             await self._stage_pii_extraction(ctx)
 
-            # Stage 4: 신원 확인
-            identity_result = await self._stage_identity_check(ctx)
+            # Stage 4 + 5: 신원 확인 + AI 분석 (IDENTITY_CHECK_MODE에 따라 동시/순차)
+            identity_result, analysis_result = await self._stage_identity_and_analysis(ctx, mode)
             if identity_result.get("should_reject"):
                 return self._create_error_result(
                     ctx, identity_result["error"], "MULTI_IDENTITY", start_time
                 )
 
-            # Stage 5: AI 분석
-            analysis_result = await self._stage_analysis(ctx, mode)
             if not analysis_result["success"]:
                 return self._create_error_result(
                     ctx, analysis_result["error"], "ANALYSIS_FAILED", start_time
@@ -203,7 +210,11 @@ class PipelineOrchestrator:
                     ctx, save_result["error"], "DB_SAVE_FAILED", start_time
                 )
 
-            # 완료
+            # 완료 → 스테이지 체크포인트 삭제
+            checkpoint_store = _get_checkpoint_store()
+            if checkpoint_store:
+                await asyncio.to_thread(checkpoint_store.clear, job_id)
+
             final_result = ctx.finalize()
             processing_time = int((time.time() - start_time) * 1000)
 
@@ -236,6 +247,7 @@ class PipelineOrchestrator:
                 pipeline_id=ctx.metadata.pipeline_id,
                 is_update=save_result.get("is_update", False),
                 parent_id=save_result.get("parent_id"),
+                portfolio_url=self._best_value(ctx, "portfolio_url"),
                 context_summary=ctx.to_dict() if self.feature_flags.debug_pipeline else None,
             )
 
@@ -250,70 +262,55 @@ class PipelineOrchestrator:
                     error_message=str(e)[:200],
                 )
             return self._create_error_result(ctx, str(e), "INTERNAL_ERROR", start_time)
+        finally:
+            reset_llm_job(llm_job_token)
 
     async def _stage_parsing(self, ctx: PipelineContext) -> Dict[str, Any]:
         """Stage 2: 파일 파싱"""
-        from agents.router_agent import FileType
-        from utils.hwp_parser import ParseMethod
-
         stage_start = time.time()
         ctx.start_stage("parsing", "router_agent")
 
+        # 재시도: 체크포인트에 파싱 결과가 있으면 다운로드된 파일 재파싱 스킵
+        checkpoint_store = _get_checkpoint_store()
+        checkpoint = (
+            await asyncio.to_thread(checkpoint_store.load_stage, ctx.metadata.job_id, "parsing")
+            if checkpoint_store else None
+        )
+        if checkpoint:
+            ctx.set_parsed_text(
+                checkpoint["text"],
+                parsing_method=checkpoint["parse_method"],
+                parsing_confidence=checkpoint["parsing_confidence"],
+            )
+            ctx.complete_stage("parsing", {
+                "text_length": len(checkpoint["text"]),
+                "page_count": checkpoint["page_count"],
+                "parse_method": checkpoint["parse_method"],
+                "file_type": checkpoint["file_type"],
+                "from_checkpoint": True,
+            })
+            return {"success": True, "text": checkpoint["text"]}
+
         try:
-            file_bytes = ctx.raw_input.file_bytes
-            filename = ctx.raw_input.filename
+            # Router → 파서 선택 → 파싱 (CPU 바운드 → 프로세스 풀에서 실행)
+            parsed = await self.parse_service.parse(
+                ctx.raw_input.file_bytes, ctx.raw_input.filename
+            )
 
-            # Router Agent로 파일 분석
-            router_result = self.router_agent.analyze(file_bytes, filename)
-
-            if router_result.is_rejected:
-                ctx.fail_stage("parsing", router_result.reject_reason, "FILE_REJECTED")
-                return {"success": False, "error": router_result.reject_reason}
-
-            # 파서 선택 및 파싱
-            text = ""
-            parse_method = "unknown"
-            page_count = 0
-
-            if router_result.file_type in [FileType.HWP, FileType.HWPX]:
-                result = self.hwp_parser.parse(file_bytes, filename)
-                text = result.text
-                parse_method = result.method.value
-                page_count = result.page_count
-
-                if result.method == ParseMethod.FAILED:
-                    ctx.fail_stage("parsing", result.error_message, "HWP_PARSE_FAILED")
-                    return {"success": False, "error": result.error_message}
-
-            elif router_result.file_type == FileType.PDF:
-                result = self.pdf_parser.parse(file_bytes)
-                text = result.text
-                parse_method = result.method
-                page_count = result.page_count
-
-                if not result.success:
-                    ctx.fail_stage("parsing", result.error_message, "PDF_PARSE_FAILED")
-                    return {"success": False, "error": result.error_message}
-
-            elif router_result.file_type in [FileType.DOC, FileType.DOCX]:
-                result = self.docx_parser.parse(file_bytes, filename)
-                text = result.text
-                parse_method = result.method
-                page_count = result.page_count
-
-                if not result.success:
-                    ctx.fail_stage("parsing", result.error_message, "DOCX_PARSE_FAILED")
-                    return {"success": False, "error": result.error_message}
-            else:
-                error = f"Unsupported file type: {router_result.file_type}"
-                ctx.fail_stage("parsing", error, "UNSUPPORTED_TYPE")
-                return {"success": False, "error": error}
+            if not parsed.success:
+                ctx.fail_stage("parsing", parsed.error, parsed.error_code)
+                return {"success": False, "error": parsed.error}
+
+            text = parsed.text
+            parse_method = parsed.parse_method
+            page_count = parsed.page_count
 
             # 텍스트 설정
+            parsing_confidence = 0.9 if page_count > 0 else 0.7
             ctx.set_parsed_text(
                 text,
                 parsing_method=parse_method,
-                parsing_confidence=0.9 if page_count > 0 else 0.7
+                parsing_confidence=parsing_confidence
             )
 
             # 텍스트 길이 체크
@@ -329,9 +326,18 @@ class PipelineOrchestrator:
                 "text_length": len(text),
                 "page_count": page_count,
                 "parse_method": parse_method,
-                "file_type": router_result.file_type.value,
+                "file_type": parsed.file_type,
             })
 
+            if checkpoint_store:
+                await asyncio.to_thread(checkpoint_store.save_stage, ctx.metadata.job_id, "parsing", {
+                    "text": text,
+                    "parse_method": parse_method,
+                    "page_count": page_count,
+                    "file_type": parsed.file_type,
+                    "parsing_confidence": parsing_confidence,
+                })
+
             # 스테이지 메트릭 기록
             stage_duration = int((time.time() - stage_start) * 1000)
             metrics_collector = _get_metrics_collector()
@@ -390,10 +396,55 @@ class PipelineOrchestrator:
             ctx.fail_stage("pii_extraction", str(e))
             return {"success": False, "error": str(e)}
 
+    async def _stage_identity_and_analysis(
+        self, ctx: PipelineContext, mode: str
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Stage 4 + 5: 신원 확인과 AI 분석 실행
+
+        - PIIStore 사전 판정으로 1명이 확실하면 LLM 신원 확인 생략
+        - latency 모드: 분석을 먼저 시작하고 신원 확인과 동시에 진행, 거절 시 분석 취소/폐기
+        - cost 모드: 신원 확인 통과 후 분석 시작
+
+        Returns:
+            (identity_result, analysis_result) - 거절 시 analysis_result는 None
+        """
+        from config import get_settings
+        from agents.identity_checker import EarlyFieldsGate, run_with_identity_check
+        settings = get_settings()
+
+        if settings.USE_IDENTITY_PREFILTER and ctx.pii_store.is_single_identity():
+            ctx.start_stage("identity_check", "identity_checker")
+            ctx.complete_stage("identity_check", {"skipped": True, "reason": "single_identity_prefilter"})
+            logger.info("[Orchestrator] Identity check skipped (single name/phone/email in PIIStore)")
+            return {"success": True, "should_reject": False}, await self._stage_analysis(ctx, mode)
+
+        # 신원 확인 통과 전까지 조기 필드 보류 (거절될 문서가 "parsed"로 노출되지 않도록)
+        early_fields_gate = (
+            EarlyFieldsGate(lambda fields: self._publish_early_fields(ctx, fields))
+            if ctx.metadata.candidate_id else None
+        )
+        return await run_with_identity_check(
+            check=lambda: self._stage_identity_check(ctx),
+            analyze=lambda: self._stage_analysis(ctx, mode, on_early_fields=early_fields_gate),
+            is_rejected=lambda result: bool(result.get("should_reject")),
+            mode=settings.IDENTITY_CHECK_MODE,
+            early_fields_gate=early_fields_gate,
+        )
+
     async def _stage_identity_check(self, ctx: PipelineContext) -> Dict[str, Any]:
         """Stage 4: 신원 확인 (Multi-Identity 체크)"""
         ctx.start_stage("identity_check", "identity_checker")
 
+        checkpoint_store = _get_checkpoint_store()
+        checkpoint = (
+            await asyncio.to_thread(checkpoint_store.load_stage, ctx.metadata.job_id, "identity_check")
+            if checkpoint_store else None
+        )
+        if checkpoint:
+            ctx.complete_stage("identity_check", {**checkpoint, "from_checkpoint": True})
+            return {"success": True, "should_reject": False}
+
         try:
             from agents.identity_checker import get_identity_checker
 
@@ -417,6 +468,11 @@ class PipelineOrchestrator:
                 "confidence": result.confidence,
             })
 
+            if checkpoint_store:
+                await asyncio.to_thread(checkpoint_store.save_stage, ctx.metadata.job_id, "identity_check", {
+                    "person_count": result.person_count,
+                })
+
             return {"success": True, "should_reject": False}
 
         except Exception as e:
@@ -430,26 +486,57 @@ class PipelineOrchestrator:
             ctx.complete_stage("identity_check", {"skipped": True, "error": str(e)})
             return {"success": True, "should_reject": False}
 
-    async def _stage_analysis(self, ctx: PipelineContext, mode: str) -> Dict[str, Any]:
-        """Stage 5: AI 분석"""
+    async def _stage_analysis(
+        self,
+        ctx: PipelineContext,
+        mode: str,
+        on_early_fields: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Stage 5: AI 분석
+
+        Args:
+            on_early_fields: 조기 필드 콜백 (없으면 후보자에 바로 반영, 신원 확인 중에는 EarlyFieldsGate)
+        """
         stage_start = time.time()
         ctx.start_stage("analysis", "analyst_agent")
 
         try:
-            from agents.analyst_agent import get_analyst_agent
+            from agents.analyst_agent import get_analyst_agent, AnalysisResult
             from config import AnalysisMode
 
+            analysis_mode = AnalysisMode.PHASE_2 if mode == "phase_2" else AnalysisMode.PHASE_1
+
+            # 재시도: 체크포인트의 분석 결과 재사용 (LLM 재호출 방지)
+            checkpoint_store = _get_checkpoint_store()
+            checkpoint = (
+                await asyncio.to_thread(checkpoint_store.load_stage, ctx.metadata.job_id, "analysis")
+                if checkpoint_store else None
+            )
+            if checkpoint:
+                result = AnalysisResult.from_dict(checkpoint)
+                self._process_analysis_result(ctx, result)
+                ctx.complete_stage("analysis", {
+                    "confidence_score": result.confidence_score,
+                    "warning_count": len(result.warnings),
+                    "mode": analysis_mode.value,
+                    "from_checkpoint": True,
+                })
+                return {"success": True, "result": result}
+
             # 마스킹된 텍스트 사용 (PII 보호)
             text = ctx.get_text_for_llm()
             filename = ctx.raw_input.filename
 
-            analysis_mode = AnalysisMode.PHASE_2 if mode == "phase_2" else AnalysisMode.PHASE_1
-
             analyst = get_analyst_agent()
             result = await analyst.analyze(
                 resume_text=text,
                 mode=analysis_mode,
-                filename=filename
+                filename=filename,
+                on_early_fields=(
+                    (on_early_fields or (lambda fields: self._publish_early_fields(ctx, fields)))
+                    if ctx.metadata.candidate_id else None
+                ),
             )
 
             if not result.success or not result.data:
@@ -457,6 +544,11 @@ class PipelineOrchestrator:
                 ctx.fail_stage("analysis", error, "ANALYSIS_FAILED")
                 return {"success": False, "error": error}
 
+            if checkpoint_store:
+                await asyncio.to_thread(
+                    checkpoint_store.save_stage, ctx.metadata.job_id, "analysis", result.to_dict()
+                )
+
             # LLM 사용량 기록
             ctx.record_llm_call("analysis", result.processing_time_ms // 100)
 
@@ -493,6 +585,27 @@ class PipelineOrchestrator:
             ctx.fail_stage("analysis", str(e))
             return {"success": False, "error": str(e)}
 
+    async def _publish_early_fields(self, ctx: PipelineContext, fields: Dict[str, Any]):
+        """
+        스트리밍 분석 중 완성된 핵심 필드를 후보자에 먼저 반영 (Progressive Loading)
+
+        마스킹된 텍스트로 분석한 경우 name/phone/email은 PIIStore 원본 값 사용
+        """
+        from services.database_service import get_database_service
+
+        quick_data = dict(fields)
+        pii_values = {"name": ctx.pii_store.name, "phone": ctx.pii_store.phone, "email": ctx.pii_store.email}
+        for key, value in pii_values.items():
+            if value or ctx.pii_store.masked_text:
+                quick_data[key] = value
+        quick_data = {k: v for k, v in quick_data.items() if v not in (None, "")}
+        if quick_data:
+            await asyncio.to_thread(
+                get_database_service().update_candidate_quick_extracted,
+                ctx.metadata.candidate_id,
+                quick_data,
+            )
+
     def _process_analysis_result(self, ctx: PipelineContext, result):
         """분석 결과를 PipelineContext 제안으로 변환"""
         data = result.data
@@ -712,6 +825,23 @@ class PipelineOrchestrator:
         """Stage 8: 임베딩 생성"""
         ctx.start_stage("embedding", "embedding_service")
 
+        checkpoint_store = _get_checkpoint_store()
+        checkpoint = (
+            await asyncio.to_thread(checkpoint_store.load_stage, ctx.metadata.job_id, "embedding")
+            if checkpoint_store else None
+        )
+        if checkpoint:
+            from services.checkpoint_store import chunks_from_payload
+
+            chunks = chunks_from_payload(checkpoint["chunks"])
+            ctx.complete_stage("embedding", {
+                "chunk_count": len(chunks),
+                "total_tokens": checkpoint.get("total_tokens", 0),
+                "chunks": chunks,
+                "from_checkpoint": True,
+            })
+            return {"success": True, "chunk_count": len(chunks), "chunks": chunks}
+
         try:
             from services.embedding_service import get_embedding_service
 
@@ -733,7 +863,18 @@ class PipelineOrchestrator:
                 ctx.complete_stage("embedding", {
                     "chunk_count": len(result.chunks),
                     "total_tokens": result.total_tokens,
+                    "chunks": result.chunks,
+                    "cache_hits": result.cache_hits,
+                    "cache_misses": result.cache_misses,
                 })
+
+                if checkpoint_store:
+                    from services.checkpoint_store import chunks_to_payload
+
+                    await asyncio.to_thread(checkpoint_store.save_stage, ctx.metadata.job_id, "embedding", {
+                        "chunks": chunks_to_payload(result.chunks),
+                        "total_tokens": result.total_tokens,
+                    })
                 return {
                     "success": True,
                     "chunk_count": len(result.chunks),
@@ -789,8 +930,9 @@ class PipelineOrchestrator:
             if ctx.pii_store.email:
                 hash_store["email"] = privacy_agent.hash_for_dedup(ctx.pii_store.email)
 
-            # DB 저장
-            save_result = db_service.save_candidate(
+            # DB 저장 (동기 클라이언트 → 스레드에서 실행, 동시 처리 중인 다른 파이프라인 보호)
+            save_result = await asyncio.to_thread(
+                db_service.save_candidate,
                 user_id=user_id,
                 job_id=job_id,
                 analyzed_data=analyzed_data,
@@ -816,7 +958,8 @@ class PipelineOrchestrator:
             embedding_result = ctx.stage_results.results.get("embedding")
             if embedding_result and embedding_result.output.get("chunks"):
                 chunks = embedding_result.output["chunks"]
-                chunks_saved = db_service.save_chunks_with_embeddings(
+                chunks_saved = await asyncio.to_thread(
+                    db_service.save_chunks_with_embeddings,
                     candidate_id=save_result.candidate_id,
                     chunks=chunks
                 )
@@ -839,6 +982,12 @@ class PipelineOrchestrator:
             ctx.fail_stage("save", str(e))
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def _best_value(ctx: PipelineContext, field_name: str) -> Any:
+        """증거 저장소에서 신뢰도가 가장 높은 값 (CurrentData에 없는 필드용)"""
+        evidence = ctx.evidence_store.get_best(field_name)
+        return evidence.value if evidence else None
+
     def _create_error_result(
         self,
         ctx: PipelineContext,
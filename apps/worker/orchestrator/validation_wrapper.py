@@ -21,12 +21,24 @@ from agents.validation_agent import (
     ValidationResult
 )
 from services.llm_manager import LLMManager, get_llm_manager, LLMProvider, LLMResponse
+from utils.prompt_layout import build_cacheable_messages
 from .feature_flags import get_feature_flags
 
 logger = logging.getLogger(__name__)
 
 
+def _get_metrics_collector():
+    """Lazy import to avoid circular dependencies"""
+    try:
+        from services.metrics_service import get_metrics_collector
+        return get_metrics_collector()
+    except ImportError:
+        logger.warning("MetricsCollector not available")
+        return None
+
+
 # LLM 검증용 프롬프트 템플릿
+# 정적 지침/응답 형식은 system 프리픽스, 문서별 발췌와 값은 user 메시지 (utils/prompt_layout.py)
 VALIDATION_SYSTEM_PROMPT = """당신은 이력서 데이터 검증 전문가입니다.
 주어진 이력서 텍스트와 추출된 데이터를 비교하여 정확성을 검증합니다.
 
@@ -37,28 +49,128 @@ VALIDATION_SYSTEM_PROMPT = """당신은 이력서 데이터 검증 전문가입
 
 응답은 반드시 JSON 형식으로 해주세요."""
 
+VALIDATION_RESPONSE_FORMAT = """## 검증 요청:
+1. 이 데이터가 원본 텍스트에서 추론 가능한지 확인
+2. 데이터의 정확성 평가 (0.0 ~ 1.0)
+3. 문제가 있다면 수정 제안
+
+JSON 응답 형식:
+{
+    "is_valid": true/false,
+    "confidence": 0.0~1.0,
+    "found_in_text": true/false,
+    "reasoning": "검증 이유",
+    "suggested_correction": null 또는 "수정값",
+    "issues": ["문제1", "문제2"]
+}"""
+
 VALIDATION_USER_PROMPT_TEMPLATE = """다음 이력서 텍스트와 추출된 데이터를 검증해주세요.
 
 ## 원본 텍스트 (일부):
 {text_excerpt}
 
 ## 검증할 데이터:
-{field_name}: {field_value}
+{field_name}: {field_value}"""
 
-## 검증 요청:
+# 배치 검증용 프롬프트 (원본 텍스트 발췌를 한 번만 포함)
+BATCH_VALIDATION_RESPONSE_FORMAT = """## 검증 요청 (각 필드마다):
 1. 이 데이터가 원본 텍스트에서 추론 가능한지 확인
 2. 데이터의 정확성 평가 (0.0 ~ 1.0)
 3. 문제가 있다면 수정 제안
 
-JSON 응답 형식:
-{{
+verdicts 배열에 필드마다 하나의 판정을 담아 응답하세요:
+{
+    "verdicts": [
+        {
+            "field_name": "필드명",
+            "is_valid": true/false,
+            "confidence": 0.0~1.0,
+            "found_in_text": true/false,
+            "reasoning": "검증 이유",
+            "suggested_correction": null 또는 수정값,
+            "issues": ["문제1", "문제2"]
+        }
+    ]
+}"""
+
+BATCH_VALIDATION_USER_PROMPT_TEMPLATE = """다음 이력서 텍스트와 추출된 데이터를 필드별로 검증해주세요.
+
+## 원본 텍스트 (일부):
+{text_excerpt}
+
+## 검증할 데이터:
+{fields_block}"""
+
+# 교차 검증용 프롬프트 (CrossValidationEngine)
+CROSS_VALIDATION_SYSTEM_PROMPT = """당신은 이력서 데이터 검증 전문가입니다.
+주어진 원본 텍스트와 추출된 데이터를 비교하여 정확성을 검증합니다.
+
+반드시 JSON 형식으로만 응답하세요."""
+
+CROSS_VALIDATION_RESPONSE_FORMAT = """## 검증 기준:
+1. 추출된 값이 원본 텍스트에 존재하거나 합리적으로 추론 가능한가?
+2. 값의 형식과 내용이 올바른가?
+3. 다른 정보와 일관성이 있는가?
+
+## JSON 응답 형식:
+{
     "is_valid": true/false,
     "confidence": 0.0~1.0,
     "found_in_text": true/false,
-    "reasoning": "검증 이유",
-    "suggested_correction": null 또는 "수정값",
-    "issues": ["문제1", "문제2"]
-}}"""
+    "reasoning": "검증 이유 설명",
+    "suggested_value": null 또는 "수정 제안값 (잘못된 경우에만)"
+}"""
+
+CROSS_VALIDATION_USER_PROMPT_TEMPLATE = """다음 이력서 원본 텍스트에서 추출된 정보가 정확한지 검증해주세요.
+
+## 원본 텍스트:
+{text_excerpt}
+
+## 검증할 데이터:
+필드명: {field_name}
+추출된 값: {field_value}"""
+
+# 배치 판정의 confidence가 이 구간이면 모호한 것으로 보고 필드별 호출로 재검증
+AMBIGUOUS_CONFIDENCE_RANGE = (0.4, 0.7)
+
+
+def build_batch_validation_schema(field_names: List[str]) -> Dict[str, Any]:
+    """
+    배치 검증용 Structured Output 스키마
+
+    suggested_correction은 필드마다 타입이 달라 (숫자/문자열/배열) strict 모드를 쓰지 않습니다.
+    """
+    return {
+        "name": "batch_field_validation",
+        "strict": False,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "verdicts": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "field_name": {"type": "string", "enum": field_names},
+                            "is_valid": {"type": "boolean"},
+                            "confidence": {"type": "number"},
+                            "found_in_text": {"type": "boolean"},
+                            "reasoning": {"type": "string"},
+                            "suggested_correction": {},
+                            "issues": {"type": "array", "items": {"type": "string"}},
+                        },
+                        "required": ["field_name", "is_valid", "confidence", "found_in_text", "reasoning"],
+                    },
+                },
+            },
+            "required": ["verdicts"],
+        },
+    }
+
+
+def _estimate_prompt_tokens(messages: List[Dict[str, str]]) -> int:
+    """프롬프트 토큰 추정 (한글 혼합 텍스트 기준 약 2자/토큰)"""
+    return sum(len(m.get("content", "")) for m in messages) // 2
 
 
 @dataclass
@@ -280,21 +392,49 @@ class ValidationAgentWrapper:
             logger.warning("[ValidationWrapper] No LLM providers available")
             return validations, corrections, []
 
-        # 검증 작업 병렬 실행
-        tasks = []
-        for field_name, field_value in fields_to_validate:
-            tasks.append(
+        provider = available_providers[0]  # 첫 번째 사용 가능한 프로바이더
+        text_excerpt = self._text_excerpt(original_text)
+        start_time = datetime.now()
+
+        results: List[Any] = []
+        fallback_fields = fields_to_validate
+        batched = self.feature_flags.use_batched_validation and len(fields_to_validate) > 1
+
+        # 배치 모드: 한 번의 호출로 전체 필드 검증, 모호한 판정만 필드별 재검증
+        batch_messages = []
+        if batched:
+            batch_messages = self._build_batch_messages(fields_to_validate, text_excerpt)
+            batch_results, fallback_fields = await self._validate_fields_batched(
+                ctx=ctx,
+                fields=fields_to_validate,
+                messages=batch_messages,
+                provider=provider
+            )
+            results.extend(batch_results)
+
+        # 필드별 검증 병렬 실행
+        if fallback_fields:
+            tasks = [
                 self._validate_field_with_llm(
                     ctx=ctx,
                     field_name=field_name,
                     field_value=field_value,
                     original_text=original_text,
-                    provider=available_providers[0]  # 첫 번째 사용 가능한 프로바이더
+                    provider=provider
                 )
-            )
+                for field_name, field_value in fallback_fields
+            ]
+            results.extend(await asyncio.gather(*tasks, return_exceptions=True))
 
-        # 병렬 실행
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if batched:
+            self._record_batch_metrics(
+                ctx=ctx,
+                fields=fields_to_validate,
+                fallback_fields=fallback_fields,
+                batch_messages=batch_messages,
+                text_excerpt=text_excerpt,
+                latency_ms=int((datetime.now() - start_time).total_seconds() * 1000)
+            )
 
         for result in results:
             if isinstance(result, Exception):
@@ -338,27 +478,10 @@ class ValidationAgentWrapper:
         """개별 필드 LLM 검증"""
         start_time = datetime.now()
 
-        # 텍스트 발췌 (너무 긴 경우 제한)
-        text_excerpt = original_text[:2000] if len(original_text) > 2000 else original_text
-
-        # 필드 값 직렬화
-        if isinstance(field_value, (list, dict)):
-            field_value_str = json.dumps(field_value, ensure_ascii=False, indent=2)
-        else:
-            field_value_str = str(field_value)
-
-        # 프롬프트 생성
-        user_prompt = VALIDATION_USER_PROMPT_TEMPLATE.format(
-            text_excerpt=text_excerpt,
-            field_name=field_name,
-            field_value=field_value_str
+        messages = self._build_field_messages(
+            field_name, field_value, self._text_excerpt(original_text)
         )
 
-        messages = [
-            {"role": "system", "content": VALIDATION_SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt}
-        ]
-
         try:
             # LLM 호출
             response = await self.llm_manager.call_json(
@@ -395,6 +518,176 @@ class ValidationAgentWrapper:
             logger.error(f"[ValidationWrapper] LLM validation error for {field_name}: {e}")
             return None
 
+    @staticmethod
+    def _text_excerpt(original_text: str) -> str:
+        """텍스트 발췌 (너무 긴 경우 제한)"""
+        return original_text[:2000] if len(original_text) > 2000 else original_text
+
+    @staticmethod
+    def _serialize_value(field_value: Any) -> str:
+        """필드 값 직렬화"""
+        if isinstance(field_value, (list, dict)):
+            return json.dumps(field_value, ensure_ascii=False, indent=2)
+        return str(field_value)
+
+    def _build_field_messages(
+        self,
+        field_name: str,
+        field_value: Any,
+        text_excerpt: str
+    ) -> List[Dict[str, str]]:
+        """필드별 검증 프롬프트 생성"""
+        user_prompt = VALIDATION_USER_PROMPT_TEMPLATE.format(
+            text_excerpt=text_excerpt,
+            field_name=field_name,
+            field_value=self._serialize_value(field_value)
+        )
+        return build_cacheable_messages(
+            [VALIDATION_SYSTEM_PROMPT, VALIDATION_RESPONSE_FORMAT], user_prompt
+        )
+
+    def _build_batch_messages(
+        self,
+        fields: List[Tuple[str, Any]],
+        text_excerpt: str
+    ) -> List[Dict[str, str]]:
+        """배치 검증 프롬프트 생성"""
+        fields_block = "\n\n".join(
+            f"### {field_name}\n{self._serialize_value(field_value)}"
+            for field_name, field_value in fields
+        )
+        user_prompt = BATCH_VALIDATION_USER_PROMPT_TEMPLATE.format(
+            text_excerpt=text_excerpt,
+            fields_block=fields_block
+        )
+        return build_cacheable_messages(
+            [VALIDATION_SYSTEM_PROMPT, BATCH_VALIDATION_RESPONSE_FORMAT], user_prompt
+        )
+
+    async def _validate_fields_batched(
+        self,
+        ctx: PipelineContext,
+        fields: List[Tuple[str, Any]],
+        messages: List[Dict[str, str]],
+        provider: LLMProvider
+    ) -> Tuple[List[LLMValidationResult], List[Tuple[str, Any]]]:
+        """
+        전체 필드 배치 LLM 검증
+
+        Returns:
+            (확정된 검증 결과, 필드별 재검증이 필요한 필드 목록)
+            배치 호출 자체가 실패하면 전체 필드를 재검증 대상으로 반환합니다.
+        """
+        start_time = datetime.now()
+        field_names = [field_name for field_name, _ in fields]
+
+        try:
+            response = await self.llm_manager.call_with_structured_output(
+                provider=provider,
+                messages=messages,
+                json_schema=build_batch_validation_schema(field_names),
+                temperature=0.1,
+                max_tokens=min(4096, 512 * len(fields))
+            )
+        except Exception as e:
+            logger.error(f"[ValidationWrapper] Batched LLM validation error: {e}")
+            return [], list(fields)
+
+        processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
+        usage = response.usage if isinstance(response.usage, dict) else {}
+        ctx.record_llm_call("validation", usage.get("total_tokens", 0))
+
+        if not response.success or not isinstance(response.content, dict):
+            logger.warning(f"[ValidationWrapper] Batched LLM validation failed: {response.error}")
+            return [], list(fields)
+
+        verdicts = {}
+        for verdict in response.content.get("verdicts") or []:
+            if isinstance(verdict, dict) and verdict.get("field_name") in field_names:
+                verdicts.setdefault(verdict["field_name"], verdict)
+
+        results = []
+        ambiguous = []
+        for field_name, field_value in fields:
+            verdict = verdicts.get(field_name)
+            if self._is_ambiguous_verdict(verdict):
+                ambiguous.append((field_name, field_value))
+                continue
+
+            results.append(LLMValidationResult(
+                field_name=field_name,
+                is_valid=verdict["is_valid"],
+                confidence=float(verdict["confidence"]),
+                found_in_text=verdict.get("found_in_text", False),
+                reasoning=verdict.get("reasoning", ""),
+                suggested_correction=verdict.get("suggested_correction"),
+                issues=verdict.get("issues") or [],
+                llm_provider=provider.value,
+                processing_time_ms=processing_time
+            ))
+
+        if ambiguous:
+            logger.info(
+                f"[ValidationWrapper] Batched verdicts ambiguous, falling back per field: "
+                f"{[field_name for field_name, _ in ambiguous]}"
+            )
+
+        return results, ambiguous
+
+    @staticmethod
+    def _is_ambiguous_verdict(verdict: Optional[Dict[str, Any]]) -> bool:
+        """누락/형식 오류이거나 confidence가 모호 구간인 판정"""
+        if not verdict:
+            return True
+        if not isinstance(verdict.get("is_valid"), bool):
+            return True
+
+        confidence = verdict.get("confidence")
+        if isinstance(confidence, bool) or not isinstance(confidence, (int, float)):
+            return True
+
+        low, high = AMBIGUOUS_CONFIDENCE_RANGE
+        return low <= confidence < high
+
+    def _record_batch_metrics(
+        self,
+        ctx: PipelineContext,
+        fields: List[Tuple[str, Any]],
+        fallback_fields: List[Tuple[str, Any]],
+        batch_messages: List[Dict[str, str]],
+        text_excerpt: str,
+        latency_ms: int
+    ):
+        """필드별 호출 대비 절감량을 MetricsCollector에 기록"""
+        def field_tokens(field_name: str, field_value: Any) -> int:
+            return _estimate_prompt_tokens(
+                self._build_field_messages(field_name, field_value, text_excerpt)
+            )
+
+        per_field_tokens = sum(field_tokens(name, value) for name, value in fields)
+        spent_tokens = _estimate_prompt_tokens(batch_messages) + sum(
+            field_tokens(name, value) for name, value in fallback_fields
+        )
+        llm_calls = 1 + len(fallback_fields)
+        calls_saved = len(fields) - llm_calls
+        tokens_saved = per_field_tokens - spent_tokens
+
+        logger.info(
+            f"[ValidationWrapper] Batched validation: fields={len(fields)}, "
+            f"fallback={len(fallback_fields)}, calls_saved={calls_saved}, "
+            f"tokens_saved~{tokens_saved}, time={latency_ms}ms"
+        )
+
+        metrics_collector = _get_metrics_collector()
+        if metrics_collector:
+            metrics_collector.record_validation_batch(
+                pipeline_id=ctx.metadata.pipeline_id,
+                llm_calls=llm_calls,
+                calls_saved=calls_saved,
+                tokens_saved=tokens_saved,
+                latency_ms=latency_ms,
+            )
+
     def _detect_hallucinations(
         self,
         ctx: PipelineContext,
@@ -725,41 +1018,19 @@ class CrossValidationEngine:
         else:
             field_value_str = str(field_value)
 
-        system_prompt = """당신은 이력서 데이터 검증 전문가입니다.
-주어진 원본 텍스트와 추출된 데이터를 비교하여 정확성을 검증합니다.
-
-반드시 JSON 형식으로만 응답하세요."""
-
-        user_prompt = f"""다음 이력서 원본 텍스트에서 추출된 정보가 정확한지 검증해주세요.
-
-## 원본 텍스트:
-{text_excerpt}
-
-## 검증할 데이터:
-필드명: {field_name}
-추출된 값: {field_value_str}
-
-## 검증 기준:
-1. 추출된 값이 원본 텍스트에 존재하거나 합리적으로 추론 가능한가?
-2. 값의 형식과 내용이 올바른가?
-3. 다른 정보와 일관성이 있는가?
-
-## JSON 응답 형식:
-{{
-    "is_valid": true/false,
-    "confidence": 0.0~1.0,
-    "found_in_text": true/false,
-    "reasoning": "검증 이유 설명",
-    "suggested_value": null 또는 "수정 제안값 (잘못된 경우에만)"
-}}"""
+        messages = build_cacheable_messages(
+            [CROSS_VALIDATION_SYSTEM_PROMPT, CROSS_VALIDATION_RESPONSE_FORMAT],
+            CROSS_VALIDATION_USER_PROMPT_TEMPLATE.format(
+                text_excerpt=text_excerpt,
+                field_name=field_name,
+                field_value=field_value_str
+            )
+        )
 
         try:
             response = await self.llm_manager.call_json(
                 provider=provider,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+                messages=messages,
                 temperature=0.1,
                 max_tokens=512
             )
@@ -11,10 +11,15 @@ Usage:
     python run_worker.py --mode fast        # fast Queue 전용 (PDF/DOCX)
     python run_worker.py --mode slow        # slow Queue 전용 (HWP/HWPX)
     python run_worker.py --burst            # 남은 작업만 처리 후 종료
+    python run_worker.py --no-fork          # fork 없이 실행 (이벤트 루프/커넥션 풀 재사용)
+    python run_worker.py --mode async       # 한 프로세스에서 여러 Job 동시 처리 (asyncio)
 
 환경 변수:
     REDIS_URL: Redis 연결 URL (기본: redis://localhost:6379)
-    WORKER_MODE: 워커 모드 (all, fast, slow)
+    WORKER_MODE: 워커 모드 (all, fast, slow, legacy, async)
+    WORKER_REUSE_PROCESS: true면 --no-fork와 동일
+    ASYNC_WORKER_CONCURRENCY: async 모드 Queue별 동시 처리 수 (예: fast=16,slow=4,process=16)
+    ASYNC_WORKER_DRAIN_TIMEOUT_SECONDS: async 모드 종료 시 진행 중 Job 대기 시간
 """
 
 import os
@@ -25,6 +30,8 @@ from redis import Redis
 from rq import Queue, SimpleWorker, Worker
 
 from config import get_settings
+from services.llm_governor import enable_llm_governor
+from utils.libreoffice_pool import enable_libreoffice_pool
 
 # 로깅 설정
 logging.basicConfig(
@@ -41,17 +48,25 @@ WORKER_MODE_QUEUES = {
     "fast": ["fast", "process"],      # PDF/DOCX 전용
     "slow": ["slow", "process"],      # HWP/HWPX 전용
     "legacy": ["parse", "process"],   # 기존 호환
+    "async": ["fast", "slow", "process"],  # 비동기 동시 처리 (async_worker.py)
 }
 
 
-def run_worker(queues: list[str] = None, burst: bool = False, mode: str = None):
+def run_worker(
+    queues: list[str] = None,
+    burst: bool = False,
+    mode: str = None,
+    no_fork: bool = None,
+):
     """
     RQ Worker 실행
 
     Args:
         queues: 처리할 Queue 이름 리스트
         burst: True면 남은 작업만 처리 후 종료
-        mode: 워커 모드 (all, fast, slow, legacy)
+        mode: 워커 모드 (all, fast, slow, legacy, async)
+        no_fork: True면 Job마다 fork하지 않고 워커 프로세스에서 직접 실행
+            (영구 이벤트 루프와 LLM/임베딩 커넥션 풀을 작업 간 재사용)
     """
     redis_url = settings.REDIS_URL
 
@@ -67,12 +82,11 @@ def run_worker(queues: list[str] = None, burst: bool = False, mode: str = None):
         logger.error(f"Failed to connect to Redis: {e}")
         sys.exit(1)
 
+    # 환경 변수에서 모드 확인
+    worker_mode = mode or os.getenv("WORKER_MODE", "all")
+
     # Queue 설정 (우선순위: 명시적 queues > mode > 환경변수 > 기본값)
     if queues is None:
-        # 환경 변수에서 모드 확인
-        env_mode = os.getenv("WORKER_MODE", "all")
-        worker_mode = mode or env_mode
-        
         if worker_mode in WORKER_MODE_QUEUES:
             queues = WORKER_MODE_QUEUES[worker_mode]
             logger.info(f"Worker mode: {worker_mode}")
@@ -80,13 +94,36 @@ def run_worker(queues: list[str] = None, burst: bool = False, mode: str = None):
             queues = WORKER_MODE_QUEUES["all"]
             logger.warning(f"Unknown worker mode '{worker_mode}', using 'all'")
 
+    if worker_mode == "async":
+        # 하나의 이벤트 루프에서 Queue별 상한만큼 Job 동시 실행 (SIGTERM 시 drain)
+        from async_worker import run_async_worker
+
+        logger.info(f"Starting async worker for queues: {queues}")
+        logger.info(f"Burst mode: {burst}")
+        run_async_worker(queues, redis_conn, burst=burst)
+        return
+
     queue_list = [Queue(name, connection=redis_conn) for name in queues]
 
+    if no_fork is None:
+        no_fork = settings.WORKER_REUSE_PROCESS
+
     # Windows doesn't support os.fork(), use SimpleWorker instead
     if platform.system() == "Windows":
         logger.info("Using SimpleWorker (Windows mode)")
+        enable_libreoffice_pool()
+        enable_llm_governor()
+        worker = SimpleWorker(queue_list, connection=redis_conn)
+    elif no_fork:
+        # fork된 work-horse는 Job 종료와 함께 사라지므로 이벤트 루프/커넥션 풀도 매번 버려짐
+        logger.info("Using SimpleWorker (no-fork mode: event loop & connection pools reused across jobs)")
+        # 워커 프로세스가 Job 사이에 살아 있으므로 LibreOffice 상주 인스턴스 / LLM 거버너 상태 유지
+        enable_libreoffice_pool()
+        enable_llm_governor()
         worker = SimpleWorker(queue_list, connection=redis_conn)
     else:
+        # fork 모드: work-horse가 os._exit로 끝나 상주 인스턴스를 정리할 수 없으므로 풀 미사용,
+        # 거버너 상태도 Job마다 초기화되므로 미사용
         worker = Worker(queue_list, connection=redis_conn)
 
     logger.info(f"Starting worker for queues: {queues}")
@@ -112,9 +149,15 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         "--mode",
-        choices=["all", "fast", "slow", "legacy"],
+        choices=["all", "fast", "slow", "legacy", "async"],
+        default=None,
+        help="Worker mode: all (default), fast (PDF/DOCX), slow (HWP), legacy, async (concurrent jobs in one process)"
+    )
+    parser.add_argument(
+        "--no-fork",
+        action="store_true",
         default=None,
-        help="Worker mode: all (default), fast (PDF/DOCX), slow (HWP), legacy"
+        help="Run jobs in the worker process (reuse event loop and HTTP connection pools)"
     )
 
     args = parser.parse_args()
@@ -122,5 +165,5 @@ if __name__ == "__main__":
     # 명령줄에서 queue 이름들을 받음
     queues = args.queues if args.queues else None
 
-    run_worker(queues=queues, burst=args.burst, mode=args.mode)
+    run_worker(queues=queues, burst=args.burst, mode=args.mode, no_fork=args.no_fork)
 
@@ -74,11 +74,11 @@ CANONICAL_LABEL_MAP: Dict[str, List[str]] = {
     ],
     CanonicalLabel.SUMMARY: [
         # Korean
-        "자기소개", "자기 소개", "소개", "요약", "한줄소개",
+        "자기소개", "자기 소개", "자기소개서", "자기 소개서", "소개", "요약", "한줄소개",
         "지원동기", "경력요약", "경력 요약",
         # English
         "summary", "about me", "introduction", "overview", "objective",
-        "professional summary",
+        "professional summary", "cover letter",
     ],
     CanonicalLabel.STRENGTHS: [
         # Korean
@@ -8,7 +8,7 @@ Multi-Agent Architecture:
 - Summary Schema: Analysis & Summary (SummaryAgent)
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 1. Profile Schema (Basic Info)
@@ -247,6 +247,28 @@ RESUME_JSON_SCHEMA: Dict[str, Any] = {
     }
 }
 
+def build_field_subset_schema(fields: List[str]) -> Dict[str, Any]:
+    """
+    지정 필드만 담은 축약 스키마 (필드 단위 재추출용)
+
+    RESUME_JSON_SCHEMA의 필드 정의를 그대로 재사용하며, 알 수 없는 필드는 문자열로 둡니다.
+    """
+    properties = RESUME_JSON_SCHEMA["schema"]["properties"]
+    return {
+        "name": "field_reextraction",
+        "description": "Re-extract only the requested fields from resume sections",
+        "strict": False,
+        "schema": {
+            "type": "object",
+            "properties": {
+                field_name: properties.get(field_name, {"type": "string"})
+                for field_name in fields
+            },
+            "additionalProperties": False
+        }
+    }
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Common Prompt - 상세한 추출 가이드
 # ─────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,208 @@
+"""
+Backfill Script: 기존 후보자의 중복 체크 해시 컬럼 채우기
+
+마이그레이션 20260202000000_duplicate_hash_columns.sql 이후 실행:
+- name_phone_hash: 이름 + 전화번호 앞4자리 (phone_encrypted 복호화, 실패 시 phone_masked 앞4자리)
+- name_birth_hash: 이름 + 생년
+
+해시 계산은 저장 경로와 동일하게 DatabaseService._create_name_phone_hash /
+_create_name_birth_hash를 사용합니다. id 기준 keyset 페이지네이션이므로
+중단 후 --after-id로 이어서 실행할 수 있습니다.
+
+사용법:
+    python scripts/backfill_duplicate_hashes.py [--dry-run] [--user-id UUID] [--batch-size 500]
+
+Options:
+    --dry-run: 실제 저장 없이 시뮬레이션
+    --user-id: 특정 사용자의 후보자만 처리
+    --batch-size: 페이지 크기 (기본: 500)
+    --after-id: 이 id 이후부터 처리 (재개용)
+    --all: 이미 해시가 있는 행도 다시 계산
+"""
+
+import argparse
+import logging
+import sys
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# 상위 디렉토리를 path에 추가
+worker_dir = str(__file__).replace('\\', '/').rsplit('/scripts/', 1)[0]
+sys.path.insert(0, worker_dir)
+
+# .env 파일 로드 (config import 전에 반드시 실행)
+from dotenv import load_dotenv
+env_path = Path(worker_dir) / '.env'
+root_env = Path(worker_dir).parent.parent / '.env.local'
+
+if env_path.exists():
+    load_dotenv(env_path, override=True)
+    print(f"Loaded env from: {env_path}")
+elif root_env.exists():
+    load_dotenv(root_env, override=True)
+    print(f"Loaded env from: {root_env}")
+else:
+    print(f"Warning: No .env file found at {env_path} or {root_env}")
+
+# 환경변수 매핑 (NEXT_PUBLIC_* → worker용 변수)
+if not os.getenv('SUPABASE_URL') and os.getenv('NEXT_PUBLIC_SUPABASE_URL'):
+    os.environ['SUPABASE_URL'] = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
+
+# 환경변수 확인
+if not os.getenv('SUPABASE_URL'):
+    print("Error: SUPABASE_URL not set. Please check .env file.")
+    sys.exit(1)
+
+from supabase import create_client
+from config import Settings
+from agents.privacy_agent import get_privacy_agent
+from services.database_service import DatabaseService, PHONE_PREFIX_PATTERN
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# dotenv 로드 후 새로운 Settings 인스턴스 생성
+settings = Settings()
+
+
+class DuplicateHashBackfill:
+    """name_phone_hash / name_birth_hash 백필"""
+
+    def __init__(self, dry_run: bool = False):
+        self.dry_run = dry_run
+        self.supabase = create_client(
+            settings.SUPABASE_URL,
+            settings.SUPABASE_SERVICE_ROLE_KEY
+        )
+        # 해시 함수만 사용 (클라이언트 생성 없이)
+        self.hasher = DatabaseService.__new__(DatabaseService)
+        self.privacy_agent = get_privacy_agent()
+
+        self.stats = {
+            "scanned": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "no_hash": 0,
+            "masked_phone_fallback": 0,
+            "failed": 0,
+        }
+
+    def _resolve_phone(self, row: Dict[str, Any]) -> Optional[str]:
+        """원본 전화번호 (복호화) 또는 마스킹 값의 앞4자리로 만든 대체 번호"""
+        if row.get("phone_encrypted"):
+            phone = self.privacy_agent.decrypt(row["phone_encrypted"])
+            if phone:
+                return phone
+
+        # 010-1234-**** → 앞4자리만 해시에 쓰이므로 나머지는 임의 숫자로 채움
+        match = PHONE_PREFIX_PATTERN.search(row.get("phone_masked") or "")
+        if match:
+            self.stats["masked_phone_fallback"] += 1
+            return f"010{match.group(1)}0000"
+        return None
+
+    def compute_hashes(self, row: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        name = row.get("name")
+        return {
+            "name_phone_hash": self.hasher._create_name_phone_hash(name, self._resolve_phone(row)),
+            "name_birth_hash": self.hasher._create_name_birth_hash(name, row.get("birth_year")),
+        }
+
+    def process_row(self, row: Dict[str, Any]) -> None:
+        hashes = self.compute_hashes(row)
+        changes = {
+            key: value for key, value in hashes.items()
+            if value is not None and value != row.get(key)
+        }
+
+        if not any(hashes.values()):
+            self.stats["no_hash"] += 1
+            return
+        if not changes:
+            self.stats["unchanged"] += 1
+            return
+
+        if self.dry_run:
+            self.stats["updated"] += 1
+            return
+
+        try:
+            self.supabase.table("candidates").update(changes).eq("id", row["id"]).execute()
+            self.stats["updated"] += 1
+        except Exception as e:
+            logger.error(f"업데이트 실패: {row['id']} - {e}")
+            self.stats["failed"] += 1
+
+    def run(
+        self,
+        user_id: Optional[str] = None,
+        batch_size: int = 500,
+        after_id: Optional[str] = None,
+        include_existing: bool = False,
+    ):
+        logger.info("=" * 60)
+        logger.info("중복 체크 해시 백필 시작")
+        logger.info(f"  Dry Run: {self.dry_run}")
+        logger.info(f"  User ID: {user_id or 'All'}")
+        logger.info(f"  Batch Size: {batch_size}")
+        logger.info("=" * 60)
+
+        last_id = after_id
+        while True:
+            query = self.supabase.table("candidates").select(
+                "id, name, birth_year, phone_encrypted, phone_masked, name_phone_hash, name_birth_hash"
+            )
+            if user_id:
+                query = query.eq("user_id", user_id)
+            if not include_existing:
+                query = query.or_("name_phone_hash.is.null,name_birth_hash.is.null")
+            if last_id:
+                query = query.gt("id", last_id)
+
+            rows = query.order("id").limit(batch_size).execute().data or []
+            if not rows:
+                break
+
+            for row in rows:
+                self.stats["scanned"] += 1
+                self.process_row(row)
+
+            last_id = rows[-1]["id"]
+            logger.info(f"  진행: {self.stats['scanned']}건 (last_id={last_id})")
+
+        logger.info("\n" + "=" * 60)
+        logger.info("백필 완료")
+        logger.info(f"  조회: {self.stats['scanned']}")
+        logger.info(f"  업데이트: {self.stats['updated']}")
+        logger.info(f"  변경 없음: {self.stats['unchanged']}")
+        logger.info(f"  해시 계산 불가: {self.stats['no_hash']}")
+        logger.info(f"  마스킹 번호 사용: {self.stats['masked_phone_fallback']}")
+        logger.info(f"  실패: {self.stats['failed']}")
+        logger.info("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기존 후보자 중복 체크 해시 백필")
+    parser.add_argument("--dry-run", action="store_true", help="실제 저장 없이 시뮬레이션")
+    parser.add_argument("--user-id", type=str, help="특정 사용자의 후보자만 처리")
+    parser.add_argument("--batch-size", type=int, default=500, help="페이지 크기")
+    parser.add_argument("--after-id", type=str, help="이 id 이후부터 처리 (재개용)")
+    parser.add_argument("--all", action="store_true", help="이미 해시가 있는 행도 다시 계산")
+
+    args = parser.parse_args()
+
+    DuplicateHashBackfill(dry_run=args.dry_run).run(
+        user_id=args.user_id,
+        batch_size=args.batch_size,
+        after_id=args.after_id,
+        include_existing=args.all,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -62,6 +62,7 @@ from services.embedding_service import get_embedding_service, ChunkType
 from utils.hwp_parser import HWPParser
 from utils.pdf_parser import PDFParser
 from utils.docx_parser import DOCXParser
+from utils.vector_codec import EmbeddingVector, to_pgvector
 
 # 로깅 설정
 logging.basicConfig(
@@ -284,7 +285,7 @@ class BackfillProcessor:
 
         return None
 
-    async def _create_embedding_with_retry(self, text: str) -> Optional[List[float]]:
+    async def _create_embedding_with_retry(self, text: str) -> Optional[EmbeddingVector]:
         """개별 텍스트에 대한 임베딩 생성 (재시도 포함)"""
         async def _create():
             return await self.embedding_service.create_embedding(text)
@@ -357,7 +358,7 @@ class BackfillProcessor:
                 logger.info(f"    청크 {i} 개별 재시도 시작...")
                 retry_embedding = await self._create_embedding_with_retry(texts[i])
 
-                if retry_embedding:
+                if retry_embedding is not None:
                     raw_chunks[i].embedding = retry_embedding
                     successful_embeddings += 1
                     self.stats["retry_success"] += 1
@@ -368,6 +369,11 @@ class BackfillProcessor:
 
         logger.info(f"  임베딩 생성: {successful_embeddings}/{len(raw_chunks)}")
 
+        embedding_meta = self.embedding_service.embedding_metadata()
+        for chunk in raw_chunks:
+            if chunk.embedding is not None:
+                chunk.metadata.update(embedding_meta)
+
         if self.dry_run:
             logger.info(f"  [DRY-RUN] 저장 스킵")
             self.stats["processed"] += 1
@@ -386,7 +392,7 @@ class BackfillProcessor:
                     "candidate_id": candidate_id,
                     "chunk_type": chunk.chunk_type.value,
                     "content": chunk.content,
-                    "embedding": chunk.embedding,
+                    "embedding": to_pgvector(chunk.embedding),
                     "metadata": chunk.metadata,
                 }
 
@@ -0,0 +1,120 @@
+"""
+Benchmark Script: 임베딩 표현 (List[float] vs float32 배열)
+
+이력서 1건의 청크 임베딩을 기존 방식(List[float] + JSON float 배열로 PostgREST 전송)과
+현재 방식(float32 배열 + pgvector 텍스트 리터럴)으로 비교합니다.
+
+- 메모리: 청크 임베딩 보관에 할당된 바이트 (tracemalloc)
+- 요청 크기: candidate_chunks insert 본문(JSON) 바이트
+- 직렬화 시간: --repeat 회 반복 중 최소값
+
+사용법:
+    python scripts/benchmark_embedding_payload.py [--chunks 20] [--dimensions 1536] [--repeat 5]
+
+Options:
+    --chunks: 이력서당 청크 수 (기본: 20)
+    --dimensions: 임베딩 차원 (기본: 1536)
+    --repeat: 반복 횟수 (기본: 5)
+"""
+
+import argparse
+import base64
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+import numpy as np
+
+# 상위 디렉토리를 path에 추가
+worker_dir = str(__file__).replace('\\', '/').rsplit('/scripts/', 1)[0]
+sys.path.insert(0, worker_dir)
+
+from utils.vector_codec import as_float32, to_pgvector  # noqa: E402
+
+
+def synthetic_responses(chunks: int, dimensions: int) -> List[str]:
+    """encoding_format="base64" 응답의 embedding 필드"""
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((chunks, dimensions)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return [base64.b64encode(v.tobytes()).decode("ascii") for v in vectors]
+
+
+def measure_memory(build: Callable[[], Any]) -> Tuple[int, Any]:
+    """build()가 만든 객체가 유지하는 할당 바이트"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def measure_time(func: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def build_records(embeddings: List[Any]) -> List[dict]:
+    return [
+        {
+            "candidate_id": "00000000-0000-0000-0000-000000000000",
+            "chunk_type": "raw_section",
+            "chunk_index": i,
+            "content": "",
+            "metadata": {},
+            "embedding": embedding,
+        }
+        for i, embedding in enumerate(embeddings)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding memory and payload size")
+    parser.add_argument("--chunks", type=int, default=20)
+    parser.add_argument("--dimensions", type=int, default=1536)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    responses = synthetic_responses(args.chunks, args.dimensions)
+
+    # 기존: SDK 기본 디코딩 결과 (Python float 리스트)
+    legacy_bytes, legacy = measure_memory(
+        lambda: [np.frombuffer(base64.b64decode(r), dtype="<f4").tolist() for r in responses]
+    )
+    current_bytes, current = measure_memory(lambda: [as_float32(r) for r in responses])
+
+    legacy_time, legacy_body = measure_time(lambda: json.dumps(build_records(legacy)), args.repeat)
+    current_time, current_body = measure_time(
+        lambda: json.dumps(build_records([to_pgvector(v) for v in current])), args.repeat
+    )
+
+    # 동일한 float32 값이 저장되는지 확인
+    for literal, vector in zip(json.loads(current_body), current):
+        assert np.array_equal(np.array(json.loads(literal["embedding"]), dtype=np.float32), vector)
+
+    print(f"chunks={args.chunks} dimensions={args.dimensions}")
+    print(f"{'':<24} {'List[float]':>14} {'float32':>14} {'ratio':>8}")
+    print("-" * 64)
+    print(
+        f"{'memory (KB)':<24} {legacy_bytes / 1024:>14.1f} {current_bytes / 1024:>14.1f} "
+        f"{current_bytes / legacy_bytes:>8.2f}"
+    )
+    print(
+        f"{'insert payload (KB)':<24} {len(legacy_body) / 1024:>14.1f} {len(current_body) / 1024:>14.1f} "
+        f"{len(current_body) / len(legacy_body):>8.2f}"
+    )
+    print(
+        f"{'serialize (ms)':<24} {legacy_time * 1000:>14.2f} {current_time * 1000:>14.2f} "
+        f"{current_time / legacy_time:>8.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Benchmark Script: HWP 본문 텍스트 추출 (레거시 vs 레코드 기반)
+
+레거시 방식(2바이트 단위 struct.unpack 루프, 레코드 헤더/바이너리까지 텍스트로 해석)과
+현재 HWPParser._decompress_hwp_body (HWPTAG_PARA_TEXT 레코드만 구간 단위 디코딩)를
+같은 섹션 스트림에 대해 비교합니다.
+
+- 속도: 파일별 추출 시간 (압축 해제 포함, --repeat 회 반복 중 최소값)
+- 품질: 추출 문자 수 / 토큰 수 (tiktoken 설치 시) → 쓰레기 문자로 인한 토큰 증가량
+
+사용법:
+    python scripts/benchmark_hwp_parser.py path/to/hwp_dir [more.hwp ...] [--repeat 5]
+    python scripts/benchmark_hwp_parser.py --synthetic 20      # 코퍼스가 없을 때 합성 섹션 사용
+
+Options:
+    paths: HWP 파일 또는 디렉토리 (하위 디렉토리의 *.hwp 포함)
+    --repeat: 반복 횟수 (기본: 5)
+    --synthetic N: 합성 HWP 섹션 N개로 측정
+"""
+
+import argparse
+import io
+import random
+import struct
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# 상위 디렉토리를 path에 추가
+worker_dir = str(__file__).replace('\\', '/').rsplit('/scripts/', 1)[0]
+sys.path.insert(0, worker_dir)
+
+from utils.hwp_parser import HWPParser, HWPTAG_PARA_TEXT  # noqa: E402
+
+try:
+    import olefile
+except ImportError:
+    olefile = None
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _encoding = None
+
+
+# ─────────────────────────────────────────────────
+# 레거시 구현 (비교 기준, 변경 전 HWPParser._decompress_hwp_body)
+# ─────────────────────────────────────────────────
+
+def legacy_decompress_hwp_body(data: bytes) -> str:
+    try:
+        decompressed = zlib.decompress(data, -15)
+    except zlib.error:
+        decompressed = data
+
+    text_parts = []
+    i = 0
+
+    while i < len(decompressed) - 1:
+        try:
+            char_code = struct.unpack('<H', decompressed[i:i+2])[0]
+
+            if char_code < 32 and char_code not in [9, 10, 13]:
+                i += 2
+                continue
+
+            if char_code == 10 or char_code == 13:
+                text_parts.append('\n')
+            elif char_code == 9:
+                text_parts.append('\t')
+            elif 32 <= char_code < 0xD800 or 0xE000 <= char_code < 0xFFFF:
+                text_parts.append(chr(char_code))
+            i += 2
+
+        except struct.error:
+            i += 1
+
+    return ''.join(text_parts)
+
+
+# ─────────────────────────────────────────────────
+# 입력 준비
+# ─────────────────────────────────────────────────
+
+def load_sections(path: Path) -> List[bytes]:
+    """HWP 파일에서 BodyText 섹션 스트림(압축 상태 그대로) 읽기"""
+    if olefile is None:
+        raise ImportError("olefile is required to read HWP files")
+
+    ole = olefile.OleFileIO(str(path))
+    try:
+        return [
+            ole.openstream('/'.join(entry)).read()
+            for entry in ole.listdir()
+            if entry[0] == 'BodyText'
+        ]
+    finally:
+        ole.close()
+
+
+def _record(tag_id: int, payload: bytes, level: int = 0) -> bytes:
+    if len(payload) >= 0xFFF:
+        return struct.pack('<I', tag_id | (level << 10) | (0xFFF << 20)) + struct.pack('<I', len(payload)) + payload
+    return struct.pack('<I', tag_id | (level << 10) | (len(payload) << 20)) + payload
+
+
+def synthetic_section(paragraphs: int, seed: int) -> bytes:
+    """이력서 형태의 합성 섹션 스트림 (문단 헤더/글자 모양/표 컨트롤 포함, 압축)"""
+    rng = random.Random(seed)
+    words = ["경력", "프로젝트", "백엔드", "개발", "Python", "Django", "AWS", "리드", "2019.03", "~", "현재",
+             "주식회사", "데이터", "플랫폼", "설계", "운영", "성과", "30%", "개선", "팀장"]
+    chunks = []
+    for _ in range(paragraphs):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(4, 30)))
+        body = text.encode('utf-16-le')
+        if rng.random() < 0.3:
+            # 탭 인라인 컨트롤 / 표 확장 컨트롤 삽입
+            code = rng.choice([9, 11])
+            body += struct.pack('<H', code) + bytes(rng.getrandbits(8) for _ in range(12)) + struct.pack('<H', code)
+            body += "셀 내용".encode('utf-16-le')
+        body += struct.pack('<H', 13)
+
+        chunks.append(_record(0x010 + 50, bytes(rng.getrandbits(8) for _ in range(22))))   # PARA_HEADER
+        chunks.append(_record(HWPTAG_PARA_TEXT, body, level=1))
+        chunks.append(_record(0x010 + 52, bytes(rng.getrandbits(8) for _ in range(8)), level=1))   # PARA_CHAR_SHAPE
+        chunks.append(_record(0x010 + 53, bytes(rng.getrandbits(8) for _ in range(36)), level=1))  # PARA_LINE_SEG
+
+    compressor = zlib.compressobj(wbits=-15)
+    raw = b''.join(chunks)
+    return compressor.compress(raw) + compressor.flush()
+
+
+# ─────────────────────────────────────────────────
+# 측정
+# ─────────────────────────────────────────────────
+
+def measure(func: Callable[[bytes], str], sections: List[bytes], repeat: int) -> Tuple[float, str]:
+    best = float("inf")
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = "\n".join(func(section) for section in sections)
+        best = min(best, time.perf_counter() - start)
+    return best, text
+
+
+def count_tokens(text: str) -> int:
+    return len(_encoding.encode(text, disallowed_special=())) if _encoding else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HWP body text extraction")
+    parser.add_argument("paths", nargs="*", help="HWP files or directories")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per file (min time is reported)")
+    parser.add_argument("--synthetic", type=int, default=0, help="Use N synthetic sections instead of files")
+    args = parser.parse_args()
+
+    corpus: List[Tuple[str, List[bytes]]] = []
+    for raw_path in args.paths:
+        path = Path(raw_path)
+        files = sorted(path.rglob("*.hwp")) if path.is_dir() else [path]
+        for file in files:
+            try:
+                corpus.append((file.name, load_sections(file)))
+            except Exception as e:
+                print(f"skip {file}: {e}")
+
+    for i in range(args.synthetic):
+        corpus.append((f"synthetic-{i}", [synthetic_section(400, seed=i * 10 + s) for s in range(3)]))
+
+    if not corpus:
+        parser.error("no HWP files found (pass paths or --synthetic N)")
+
+    hwp_parser = HWPParser()
+    new_func = hwp_parser._decompress_hwp_body
+
+    totals = {"legacy": 0.0, "new": 0.0, "legacy_chars": 0, "new_chars": 0, "legacy_tokens": 0, "new_tokens": 0}
+
+    print(f"{'file':<32} {'legacy ms':>10} {'new ms':>8} {'speedup':>8} {'legacy chars':>13} {'new chars':>10}")
+    for name, sections in corpus:
+        legacy_time, legacy_text = measure(legacy_decompress_hwp_body, sections, args.repeat)
+        new_time, new_text = measure(new_func, sections, args.repeat)
+
+        totals["legacy"] += legacy_time
+        totals["new"] += new_time
+        totals["legacy_chars"] += len(legacy_text)
+        totals["new_chars"] += len(new_text)
+        totals["legacy_tokens"] += count_tokens(legacy_text)
+        totals["new_tokens"] += count_tokens(new_text)
+
+        print(
+            f"{name[:32]:<32} {legacy_time * 1000:>10.2f} {new_time * 1000:>8.2f} "
+            f"{legacy_time / max(new_time, 1e-9):>7.1f}x {len(legacy_text):>13,} {len(new_text):>10,}"
+        )
+
+    print("-" * 86)
+    print(
+        f"{'TOTAL (' + str(len(corpus)) + ' files)':<32} {totals['legacy'] * 1000:>10.2f} {totals['new'] * 1000:>8.2f} "
+        f"{totals['legacy'] / max(totals['new'], 1e-9):>7.1f}x {totals['legacy_chars']:>13,} {totals['new_chars']:>10,}"
+    )
+    if _encoding:
+        saved = totals["legacy_tokens"] - totals["new_tokens"]
+        print(
+            f"tokens (cl100k): legacy={totals['legacy_tokens']:,} new={totals['new_tokens']:,} "
+            f"saved={saved:,} ({saved / max(totals['legacy_tokens'], 1):.1%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Report Script: raw_section 청킹 비교 (고정 문자 윈도우 vs 섹션/문장 경계)
+
+같은 이력서 텍스트에 대해 기존 슬라이딩 윈도우(1500/2000자, 300/500자 오버랩)와
+현재 EmbeddingService._build_raw_text_chunks (SemanticChunker)를 비교합니다.
+
+- 청크 수 / 임베딩 토큰 수 (EmbeddingService._count_tokens: tiktoken, 미설치 시 추정)
+- 중복 문자 비율: 청크 문자 합계 / 원문 문자 수 - 1
+- 경계 절단 비율: 줄/문장 중간에서 끝나는 청크 비율
+
+사용법:
+    python scripts/compare_raw_chunking.py path/to/texts [more.txt ...]
+    python scripts/compare_raw_chunking.py --synthetic 30      # 코퍼스가 없을 때 합성 이력서 사용
+
+Options:
+    paths: 파싱된 이력서 텍스트 파일(.txt) 또는 디렉토리
+    --synthetic N: 합성 이력서 N개 (한글/영문 혼합)
+    --target-tokens: RAW_SECTION_TARGET_TOKENS 재정의 (tiktoken 없이 추정 토큰으로 측정할 때 비교용)
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# 상위 디렉토리를 path에 추가
+worker_dir = str(__file__).replace('\\', '/').rsplit('/scripts/', 1)[0]
+sys.path.insert(0, worker_dir)
+
+from config import chunking_config  # noqa: E402
+from services.embedding_service import ChunkType, EmbeddingService, TIKTOKEN_AVAILABLE  # noqa: E402
+
+
+# ─────────────────────────────────────────────────
+# 기존 구현 (비교 기준, 변경 전 raw_section 슬라이딩 윈도우)
+# ─────────────────────────────────────────────────
+
+def legacy_raw_sections(service: EmbeddingService, raw_text: str) -> List[Tuple[int, int]]:
+    cfg = chunking_config
+    if not raw_text or len(raw_text.strip()) < cfg.RAW_TEXT_MIN_LENGTH:
+        return []
+
+    if service._is_korean_dominant(raw_text):
+        chunk_size, overlap = cfg.KOREAN_CHUNK_SIZE, cfg.KOREAN_OVERLAP
+    else:
+        chunk_size, overlap = cfg.RAW_SECTION_CHUNK_SIZE, cfg.RAW_SECTION_OVERLAP
+
+    spans = []
+    if len(raw_text) > chunk_size:
+        for start in range(0, len(raw_text), chunk_size - overlap):
+            section = raw_text[start:start + chunk_size]
+            if len(section.strip()) >= cfg.RAW_SECTION_MIN_LENGTH:
+                spans.append((start, min(start + chunk_size, len(raw_text))))
+    return spans
+
+
+def semantic_raw_sections(service: EmbeddingService, raw_text: str) -> List[Tuple[int, int]]:
+    return [
+        (c.metadata["start_pos"], c.metadata["end_pos"])
+        for c in service._build_raw_text_chunks(raw_text)
+        if c.chunk_type == ChunkType.RAW_SECTION
+    ]
+
+
+# ─────────────────────────────────────────────────
+# 코퍼스
+# ─────────────────────────────────────────────────
+
+_KO_SENTENCES = [
+    "대규모 트래픽을 처리하는 결제 시스템의 백엔드 아키텍처를 설계하고 운영했습니다.",
+    "Kafka 기반 이벤트 파이프라인을 도입하여 주문 처리 지연을 40% 단축했습니다.",
+    "신규 입사자 온보딩 문서를 정비하고 코드 리뷰 문화를 정착시켰습니다.",
+    "Kubernetes 클러스터로 서비스를 이전하면서 배포 시간을 30분에서 5분으로 줄였습니다.",
+    "데이터 분석팀과 협업하여 추천 모델의 A/B 테스트 플랫폼을 구축했습니다.",
+    "레거시 모놀리식 서비스를 도메인 단위 마이크로서비스로 분리했습니다.",
+    "장애 대응 프로세스를 수립하고 온콜 로테이션을 운영했습니다.",
+]
+_EN_SENTENCES = [
+    "Designed and operated the backend architecture of a high-traffic payment system.",
+    "Introduced a Kafka-based event pipeline that cut order processing latency by 40%.",
+    "Rebuilt the onboarding documentation and established a code review culture.",
+    "Migrated services to Kubernetes, reducing deployment time from 30 to 5 minutes.",
+    "Built an A/B testing platform for recommendation models with the data team.",
+    "Split a legacy monolith into domain-oriented microservices.",
+]
+
+
+def synthetic_resume(seed: int) -> str:
+    rng = random.Random(seed)
+    korean = seed % 3 != 0
+    sentences = _KO_SENTENCES if korean else _EN_SENTENCES
+    headers = (
+        ["인적사항", "경력사항", "프로젝트", "기술스택", "학력사항", "자기소개"]
+        if korean else
+        ["PROFILE", "EXPERIENCE", "PROJECTS", "SKILLS", "EDUCATION", "SUMMARY"]
+    )
+
+    parts = ["홍길동\n010-1234-5678\nhong@example.com" if korean else "John Doe\njohn@example.com"]
+    for header in headers:
+        parts.append(f"\n■ {header}" if korean else f"\n{header}")
+        if header in ("경력사항", "EXPERIENCE", "프로젝트", "PROJECTS"):
+            for i in range(rng.randint(3, 7)):
+                parts.append(f"{'회사' if korean else 'Company'} {i + 1} (2018.03 - 2021.0{i + 1})")
+                for _ in range(rng.randint(4, 10)):
+                    parts.append(f"- {rng.choice(sentences)}")
+        elif header in ("자기소개", "SUMMARY"):
+            parts.append(" ".join(rng.choice(sentences) for _ in range(rng.randint(6, 14))))
+        elif header in ("기술스택", "SKILLS"):
+            parts.append("Python, Go, Kafka, Kubernetes, PostgreSQL, Redis, AWS")
+        else:
+            parts.append(f"{'서울대학교 컴퓨터공학과' if korean else 'Seoul National University, CS'} (2010 - 2014)")
+    return "\n".join(parts)
+
+
+def load_corpus(paths: List[str]) -> List[str]:
+    texts = []
+    for raw in paths:
+        path = Path(raw)
+        files = sorted(path.rglob("*.txt")) if path.is_dir() else [path]
+        for file in files:
+            texts.append(file.read_text(encoding="utf-8", errors="ignore"))
+    return texts
+
+
+# ─────────────────────────────────────────────────
+# 측정
+# ─────────────────────────────────────────────────
+
+def _cut_mid_boundary(text: str, end: int) -> bool:
+    if end >= len(text):
+        return False
+    return not (text[end] in "\n" or text[end - 1] in ".!?。\n" or text[end:end + 1].isspace())
+
+
+def measure(
+    service: EmbeddingService,
+    texts: List[str],
+    chunker: Callable[[EmbeddingService, str], List[Tuple[int, int]]],
+) -> Dict[str, float]:
+    chunks = tokens = chars = source_chars = cuts = 0
+    for text in texts:
+        spans = chunker(service, text)
+        if not spans:
+            continue
+        source_chars += len(text)
+        for start, end in spans:
+            chunks += 1
+            chars += end - start
+            tokens += service._count_tokens(text[start:end])
+            cuts += _cut_mid_boundary(text, end)
+    return {
+        "chunks": chunks,
+        "tokens": tokens,
+        "duplicate_ratio": (chars / source_chars - 1) if source_chars else 0.0,
+        "cut_ratio": cuts / chunks if chunks else 0.0,
+        "avg_tokens": tokens / chunks if chunks else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare raw_section chunking strategies")
+    parser.add_argument("paths", nargs="*", help="텍스트 파일 또는 디렉토리")
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 이력서 수")
+    parser.add_argument("--target-tokens", type=int, help="RAW_SECTION_TARGET_TOKENS 재정의")
+    args = parser.parse_args()
+
+    texts = load_corpus(args.paths)
+    texts += [synthetic_resume(i) for i in range(args.synthetic)]
+    if not texts:
+        parser.error("paths 또는 --synthetic N 을 지정하세요")
+
+    if args.target_tokens:
+        chunking_config.RAW_SECTION_TARGET_TOKENS = args.target_tokens
+
+    service = EmbeddingService()
+    legacy = measure(service, texts, legacy_raw_sections)
+    semantic = measure(service, texts, semantic_raw_sections)
+
+    print(f"documents={len(texts)} tokenizer={'tiktoken' if service._encoding else 'estimate'}"
+          f" (tiktoken installed: {TIKTOKEN_AVAILABLE})"
+          f" target_tokens={chunking_config.RAW_SECTION_TARGET_TOKENS}")
+    print(f"{'':<22} {'window':>12} {'semantic':>12} {'change':>9}")
+    print("-" * 58)
+    for key, label in (
+        ("chunks", "raw_section chunks"),
+        ("tokens", "embedded tokens"),
+        ("avg_tokens", "avg tokens/chunk"),
+    ):
+        before, after = legacy[key], semantic[key]
+        change = f"{(after / before - 1) * 100:+.1f}%" if before else "-"
+        print(f"{label:<22} {before:>12.0f} {after:>12.0f} {change:>9}")
+    for key, label in (("duplicate_ratio", "duplicated text"), ("cut_ratio", "cut mid-line/sentence")):
+        print(f"{label:<22} {legacy[key]:>11.1%} {semantic[key]:>11.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+Migration Script: candidate_chunks 재임베딩 (모델 / 차원 변경)
+
+EMBEDDING_MODEL / EMBEDDING_DIMENSIONS 변경 후 기존 청크를 현재 설정으로 다시 임베딩합니다.
+backfill_raw_chunks.py와 같은 임베딩 경로(EmbeddingService.create_embeddings_batch:
+캐시 + 배처 + 재시도)를 사용하며, 청크 metadata의 embedding_model / embedding_dimensions가
+현재 설정과 다른 행(또는 기록이 없는 행)만 처리합니다.
+
+차원 변경 절차:
+    1. 유지보수 마이그레이션으로 candidate_chunks.embedding 및 검색 RPC 파라미터를
+       vector(N)으로 변경 (인덱스 재생성 포함)
+    2. 워커 EMBEDDING_DIMENSIONS, 웹 EMBEDDING_DIMENSIONS를 N으로 설정
+    3. 이 스크립트 실행
+
+id 기준 keyset 페이지네이션이며, 페이지마다 진행 상태(--state-file)를 기록하므로
+중단 후 --resume으로 이어서 실행할 수 있습니다. 임베딩 실패 행은 metadata가 갱신되지 않으므로
+--resume 없이 다시 실행하면 재처리됩니다.
+
+사용법:
+    python scripts/reembed_chunks.py [--dry-run] [--user-id UUID] [--batch-size 200]
+    python scripts/reembed_chunks.py --resume
+
+Options:
+    --dry-run: 실제 저장 없이 대상 수만 집계
+    --user-id: 특정 사용자의 후보자 청크만 처리
+    --batch-size: 페이지 크기 (기본: 200)
+    --limit: 처리할 최대 청크 수
+    --state-file: 진행 상태 파일 (기본: scripts/.reembed_chunks_state.json)
+    --resume: 상태 파일의 last_id 이후부터 처리
+    --all: 이미 현재 설정으로 임베딩된 청크도 다시 처리
+"""
+
+import asyncio
+import argparse
+import json
+import logging
+import sys
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 상위 디렉토리를 path에 추가
+worker_dir = str(__file__).replace('\\', '/').rsplit('/scripts/', 1)[0]
+sys.path.insert(0, worker_dir)
+
+# .env 파일 로드 (config import 전에 반드시 실행)
+from dotenv import load_dotenv
+env_path = Path(worker_dir) / '.env'
+root_env = Path(worker_dir).parent.parent / '.env.local'
+
+if env_path.exists():
+    load_dotenv(env_path, override=True)
+    print(f"Loaded env from: {env_path}")
+elif root_env.exists():
+    load_dotenv(root_env, override=True)
+    print(f"Loaded env from: {root_env}")
+else:
+    print(f"Warning: No .env file found at {env_path} or {root_env}")
+
+# 환경변수 매핑 (NEXT_PUBLIC_* → worker용 변수)
+if not os.getenv('SUPABASE_URL') and os.getenv('NEXT_PUBLIC_SUPABASE_URL'):
+    os.environ['SUPABASE_URL'] = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
+
+# 환경변수 확인
+if not os.getenv('SUPABASE_URL'):
+    print("Error: SUPABASE_URL not set. Please check .env file.")
+    sys.exit(1)
+
+from supabase import create_client
+from config import Settings
+from services.embedding_service import get_embedding_service
+from utils.vector_codec import to_pgvector
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# dotenv 로드 후 새로운 Settings 인스턴스 생성
+settings = Settings()
+
+DEFAULT_STATE_FILE = Path(worker_dir) / "scripts" / ".reembed_chunks_state.json"
+
+
+class ChunkReembedder:
+    """candidate_chunks 재임베딩 처리"""
+
+    def __init__(self, dry_run: bool = False, state_file: Path = DEFAULT_STATE_FILE):
+        self.dry_run = dry_run
+        self.state_file = state_file
+        self.supabase = create_client(
+            settings.SUPABASE_URL,
+            settings.SUPABASE_SERVICE_ROLE_KEY
+        )
+        self.embedding_service = get_embedding_service()
+        self.target = self.embedding_service.embedding_metadata()
+        self.include_current = False
+
+        self.stats = {
+            "scanned": 0,
+            "up_to_date": 0,
+            "reembedded": 0,
+            "failed": 0,
+            "cache_hits": 0,
+        }
+
+    # ─────────────────────────────────────────────────
+    # 진행 상태
+    # ─────────────────────────────────────────────────
+
+    def load_state(self) -> Optional[str]:
+        """상태 파일의 last_id (대상 모델/차원이 다르면 무시)"""
+        if not self.state_file.exists():
+            return None
+
+        state = json.loads(self.state_file.read_text())
+        if state.get("target") != self.target:
+            logger.warning(f"상태 파일의 대상 설정이 다름 ({state.get('target')}) - 처음부터 실행")
+            return None
+        return state.get("last_id")
+
+    def save_state(self, last_id: str):
+        if self.dry_run:
+            return
+        self.state_file.write_text(json.dumps({
+            "target": self.target,
+            "last_id": last_id,
+            "stats": self.stats,
+        }, ensure_ascii=False, indent=2))
+
+    # ─────────────────────────────────────────────────
+    # 처리
+    # ─────────────────────────────────────────────────
+
+    def needs_reembedding(self, row: Dict[str, Any]) -> bool:
+        if self.include_current:
+            return True
+        metadata = row.get("metadata") or {}
+        return any(metadata.get(key) != value for key, value in self.target.items())
+
+    def fetch_page(self, after_id: Optional[str], batch_size: int, user_id: Optional[str]):
+        columns = "id, candidate_id, chunk_type, chunk_index, content, metadata"
+        if user_id:
+            query = self.supabase.table("candidate_chunks").select(f"{columns}, candidates!inner(user_id)")
+            query = query.eq("candidates.user_id", user_id)
+        else:
+            query = self.supabase.table("candidate_chunks").select(columns)
+        if after_id:
+            query = query.gt("id", after_id)
+
+        rows = query.order("id").limit(batch_size).execute().data or []
+        for row in rows:
+            row.pop("candidates", None)
+        return rows
+
+    async def process_page(self, rows: List[Dict[str, Any]]):
+        targets = [row for row in rows if self.needs_reembedding(row)]
+        self.stats["up_to_date"] += len(rows) - len(targets)
+        if not targets:
+            return
+
+        if self.dry_run:
+            self.stats["reembedded"] += len(targets)
+            return
+
+        cache_stats: Dict[str, int] = {}
+        embeddings = await self.embedding_service.create_embeddings_batch(
+            [row["content"] for row in targets], stats=cache_stats
+        )
+        self.stats["cache_hits"] += cache_stats.get("cache_hits", 0)
+
+        records = []
+        for row, embedding in zip(targets, embeddings):
+            if embedding is None:
+                self.stats["failed"] += 1
+                continue
+            records.append({
+                **row,
+                "embedding": to_pgvector(embedding),
+                "metadata": {**(row.get("metadata") or {}), **self.target},
+            })
+
+        if not records:
+            return
+
+        try:
+            # id 충돌 → 제공한 컬럼만 갱신 (1페이지 1요청)
+            self.supabase.table("candidate_chunks").upsert(records, on_conflict="id").execute()
+            self.stats["reembedded"] += len(records)
+        except Exception as e:
+            logger.error(f"  저장 실패 ({len(records)}개): {e}")
+            self.stats["failed"] += len(records)
+
+    async def run(
+        self,
+        user_id: Optional[str] = None,
+        batch_size: int = 200,
+        limit: Optional[int] = None,
+        resume: bool = False,
+        include_current: bool = False,
+    ):
+        logger.info("=" * 60)
+        logger.info("청크 재임베딩 시작")
+        logger.info(f"  Dry Run: {self.dry_run}")
+        logger.info(f"  Target: {self.target['embedding_model']} ({self.target['embedding_dimensions']}차원)")
+        logger.info(f"  User ID: {user_id or 'All'}")
+        logger.info(f"  Batch Size: {batch_size}")
+        logger.info("=" * 60)
+
+        if not self.embedding_service.client and not self.dry_run:
+            logger.error("OpenAI 클라이언트 미초기화 - OPENAI_API_KEY를 확인하세요.")
+            return
+
+        self.include_current = include_current
+        last_id = self.load_state() if resume else None
+        if last_id:
+            logger.info(f"  재개: last_id={last_id}")
+
+        while limit is None or self.stats["scanned"] < limit:
+            page_size = batch_size if limit is None else min(batch_size, limit - self.stats["scanned"])
+            rows = self.fetch_page(last_id, page_size, user_id)
+            if not rows:
+                break
+
+            self.stats["scanned"] += len(rows)
+            await self.process_page(rows)
+
+            last_id = rows[-1]["id"]
+            self.save_state(last_id)
+            logger.info(
+                f"  진행: {self.stats['scanned']}건 조회, {self.stats['reembedded']}건 재임베딩 "
+                f"(last_id={last_id})"
+            )
+
+        logger.info("\n" + "=" * 60)
+        logger.info("재임베딩 완료")
+        logger.info(f"  조회: {self.stats['scanned']}")
+        logger.info(f"  재임베딩: {self.stats['reembedded']}")
+        logger.info(f"  최신 상태: {self.stats['up_to_date']}")
+        logger.info(f"  실패: {self.stats['failed']}")
+        logger.info(f"  캐시 적중: {self.stats['cache_hits']}")
+        logger.info("=" * 60)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="candidate_chunks 재임베딩 (모델/차원 변경)")
+    parser.add_argument("--dry-run", action="store_true", help="실제 저장 없이 대상 수만 집계")
+    parser.add_argument("--user-id", type=str, help="특정 사용자의 후보자 청크만 처리")
+    parser.add_argument("--batch-size", type=int, default=200, help="페이지 크기")
+    parser.add_argument("--limit", type=int, help="처리할 최대 청크 수")
+    parser.add_argument("--state-file", type=Path, default=DEFAULT_STATE_FILE, help="진행 상태 파일")
+    parser.add_argument("--resume", action="store_true", help="상태 파일의 last_id 이후부터 처리")
+    parser.add_argument("--all", action="store_true", help="현재 설정으로 임베딩된 청크도 다시 처리")
+
+    args = parser.parse_args()
+
+    reembedder = ChunkReembedder(dry_run=args.dry_run, state_file=args.state_file)
+    await reembedder.run(
+        user_id=args.user_id,
+        batch_size=args.batch_size,
+        limit=args.limit,
+        resume=args.resume,
+        include_current=args.all,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
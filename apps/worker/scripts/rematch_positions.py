@@ -0,0 +1,116 @@
+"""
+Maintenance Script: Position 전체 재매칭
+
+이력서 저장 시에는 새 후보자만 채점하는 증분 매칭
+(save_candidate_position_matches)을 사용합니다. 아래 경우에는 이 스크립트로
+활성 Position을 전체 후보자와 다시 매칭합니다.
+- 매칭 점수 공식 / 동의어 사전 변경
+- 후보자 대량 백필 / 임베딩 재생성 후
+- 증분 매칭이 실패한 기간의 보정
+
+사용법:
+    python scripts/rematch_positions.py --user-id UUID [--min-score 0.3] [--limit 100]
+    python scripts/rematch_positions.py --all-users [--dry-run]
+
+Options:
+    --user-id: 특정 사용자의 활성 Position만 재매칭
+    --all-users: 활성 Position이 있는 모든 사용자
+    --min-score: 최소 매칭 점수 (기본: 0.3)
+    --limit: Position별 최대 매칭 후보자 수 (기본: 100)
+    --dry-run: 대상 사용자/Position 수만 출력
+"""
+
+import argparse
+import logging
+import sys
+import os
+from pathlib import Path
+from typing import List
+
+# 상위 디렉토리를 path에 추가
+worker_dir = str(__file__).replace('\\', '/').rsplit('/scripts/', 1)[0]
+sys.path.insert(0, worker_dir)
+
+# .env 파일 로드 (config import 전에 반드시 실행)
+from dotenv import load_dotenv
+env_path = Path(worker_dir) / '.env'
+root_env = Path(worker_dir).parent.parent / '.env.local'
+
+if env_path.exists():
+    load_dotenv(env_path, override=True)
+    print(f"Loaded env from: {env_path}")
+elif root_env.exists():
+    load_dotenv(root_env, override=True)
+    print(f"Loaded env from: {root_env}")
+else:
+    print(f"Warning: No .env file found at {env_path} or {root_env}")
+
+# 환경변수 매핑 (NEXT_PUBLIC_* → worker용 변수)
+if not os.getenv('SUPABASE_URL') and os.getenv('NEXT_PUBLIC_SUPABASE_URL'):
+    os.environ['SUPABASE_URL'] = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
+
+# 환경변수 확인
+if not os.getenv('SUPABASE_URL'):
+    print("Error: SUPABASE_URL not set. Please check .env file.")
+    sys.exit(1)
+
+from services.database_service import get_database_service
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def get_users_with_open_positions(db_service) -> List[str]:
+    """활성 Position이 있는 사용자 ID 목록"""
+    result = db_service.client.table("positions").select("user_id").eq("status", "open").execute()
+    return sorted({row["user_id"] for row in result.data or []})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="활성 Position 전체 재매칭 (유지보수)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--user-id", type=str, help="특정 사용자의 Position만 재매칭")
+    target.add_argument("--all-users", action="store_true", help="활성 Position이 있는 모든 사용자")
+    parser.add_argument("--min-score", type=float, default=0.3, help="최소 매칭 점수")
+    parser.add_argument("--limit", type=int, default=100, help="Position별 최대 매칭 후보자 수")
+    parser.add_argument("--dry-run", action="store_true", help="대상만 출력")
+
+    args = parser.parse_args()
+
+    db_service = get_database_service()
+    if not db_service.client:
+        print("Error: Supabase client not initialized. Check SUPABASE_SERVICE_ROLE_KEY.")
+        sys.exit(1)
+
+    user_ids = [args.user_id] if args.user_id else get_users_with_open_positions(db_service)
+    logger.info(f"재매칭 대상 사용자: {len(user_ids)}명")
+
+    if args.dry_run:
+        for user_id in user_ids:
+            logger.info(f"  [DRY-RUN] {user_id}")
+        return
+
+    failed = 0
+    for user_id in user_ids:
+        result = db_service.rematch_all_positions(
+            user_id=user_id,
+            min_score=args.min_score,
+            limit=args.limit,
+        )
+        if not result["success"]:
+            failed += 1
+            logger.error(f"  {user_id}: 실패 - {result['error']}")
+        else:
+            logger.info(
+                f"  {user_id}: {result['matched_positions']}/{result['total_positions']} positions"
+            )
+
+    logger.info(f"재매칭 완료 (실패: {failed}명)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""
+Analysis Cache - Content-addressed LLM 분석 결과 캐시
+
+동일한 이력서(재업로드, DLQ 재시도, RQ Retry, 대량 재임포트)에 대해
+GPT-4o/Gemini 호출을 반복하지 않도록 AnalystAgent 결과를 캐싱합니다.
+
+캐시 키:
+    sha256(LLM 입력 텍스트 + 프롬프트/스키마 버전 + 프로바이더/모델 세트 + AnalysisMode)
+
+저장소:
+- Redis (기본): SETEX + 정렬 셋 인덱스로 TTL / 최대 항목 수 기반 eviction
+- 로컬 파일 (fallback): Redis 미사용 시 JSON 파일, TTL / 최대 용량 기반 eviction
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from redis import Redis
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Redis 키
+CACHE_KEY_PREFIX = "rai:analysis_cache:"
+CACHE_INDEX_KEY = "rai:analysis_cache:index"
+
+# 캐시 포맷 버전 (저장 구조 변경 시 증가)
+CACHE_FORMAT_VERSION = "1"
+
+
+def compute_prompt_version(*parts: str) -> str:
+    """
+    프롬프트/스키마 버전 해시 계산
+
+    시스템 프롬프트나 JSON 스키마가 바뀌면 버전이 달라져
+    기존 캐시가 자연스럽게 무효화됩니다.
+    """
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\x00")
+    return hasher.hexdigest()[:16]
+
+
+def build_cache_key(
+    text: str,
+    prompt_version: str,
+    providers: Iterable[str],
+    mode: str,
+) -> str:
+    """
+    분석 캐시 키 생성
+
+    Args:
+        text: LLM에 전달되는 텍스트 (get_text_for_llm() 결과)
+        prompt_version: compute_prompt_version() 결과
+        providers: 프로바이더/모델 식별자 목록 (순서 무관)
+        mode: AnalysisMode 값
+
+    Returns:
+        sha256 hex digest
+    """
+    hasher = hashlib.sha256()
+    hasher.update(f"v{CACHE_FORMAT_VERSION}\x00".encode("utf-8"))
+    hasher.update(f"{prompt_version}\x00".encode("utf-8"))
+    hasher.update(f"{','.join(sorted(providers))}\x00".encode("utf-8"))
+    hasher.update(f"{mode}\x00".encode("utf-8"))
+    hasher.update(text.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class AnalysisCache:
+    """
+    LLM 분석 결과 캐시
+
+    Redis를 우선 사용하고, 연결이 불가능하면 로컬 파일 캐시로 대체합니다.
+    캐시 오류는 분석 흐름을 막지 않도록 모두 로깅 후 무시합니다.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        local_dir: Optional[str] = None,
+        max_local_mb: Optional[int] = None,
+    ):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.ANALYSIS_CACHE_TTL_SECONDS
+        self.max_entries = max_entries if max_entries is not None else settings.ANALYSIS_CACHE_MAX_ENTRIES
+        self.max_local_bytes = (
+            max_local_mb if max_local_mb is not None else settings.ANALYSIS_CACHE_MAX_LOCAL_MB
+        ) * 1024 * 1024
+        self.local_dir = Path(
+            local_dir
+            or settings.ANALYSIS_CACHE_DIR
+            or os.path.join(tempfile.gettempdir(), "rai_analysis_cache")
+        )
+
+        self.redis: Optional[Redis] = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._init_redis(settings.REDIS_URL if redis_url is None else redis_url)
+
+    def _init_redis(self, redis_url: str):
+        """Redis 연결 초기화 (실패 시 로컬 파일 캐시 사용)"""
+        if not redis_url:
+            logger.info("[AnalysisCache] REDIS_URL not configured - using local file cache")
+            return
+
+        try:
+            self.redis = Redis.from_url(redis_url, socket_connect_timeout=2, socket_timeout=2)
+            self.redis.ping()
+            logger.info("[AnalysisCache] Redis cache initialized")
+        except Exception as e:
+            logger.warning(f"[AnalysisCache] Redis unavailable, using local file cache: {e}")
+            self.redis = None
+
+    @property
+    def backend(self) -> str:
+        """현재 사용 중인 저장소"""
+        return "redis" if self.redis is not None else "local"
+
+    # ─────────────────────────────────────────────────
+    # Public API
+    # ─────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시 조회
+
+        Returns:
+            저장된 AnalysisResult.to_dict() 형태의 dict 또는 None
+        """
+        try:
+            if self.redis is not None:
+                payload = self._redis_get(key)
+            else:
+                payload = self._local_get(key)
+        except Exception as e:
+            logger.warning(f"[AnalysisCache] get failed: {e}")
+            payload = None
+
+        with self._lock:
+            if payload is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return payload
+
+    def set(self, key: str, value: Dict[str, Any]) -> bool:
+        """
+        캐시 저장
+
+        Args:
+            key: build_cache_key() 결과
+            value: AnalysisResult.to_dict() 결과
+
+        Returns:
+            저장 성공 여부
+        """
+        try:
+            raw = json.dumps(value, ensure_ascii=False, default=str)
+            if self.redis is not None:
+                self._redis_set(key, raw)
+            else:
+                self._local_set(key, raw)
+            return True
+        except Exception as e:
+            logger.warning(f"[AnalysisCache] set failed: {e}")
+            return False
+
+    def invalidate(self, key: str) -> None:
+        """캐시 항목 삭제"""
+        try:
+            if self.redis is not None:
+                pipe = self.redis.pipeline()
+                pipe.delete(CACHE_KEY_PREFIX + key)
+                pipe.zrem(CACHE_INDEX_KEY, key)
+                pipe.execute()
+            else:
+                self._local_path(key).unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(f"[AnalysisCache] invalidate failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중률 통계"""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "backend": self.backend,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 4) if total else 0.0,
+            }
+
+    # ─────────────────────────────────────────────────
+    # Redis backend
+    # ─────────────────────────────────────────────────
+
+    def _redis_get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = self.redis.get(CACHE_KEY_PREFIX + key)
+        if raw is None:
+            # TTL 만료된 항목은 인덱스에서도 정리
+            self.redis.zrem(CACHE_INDEX_KEY, key)
+            return None
+
+        # LRU: 접근 시각 갱신
+        self.redis.zadd(CACHE_INDEX_KEY, {key: time.time()})
+        return json.loads(raw)
+
+    def _redis_set(self, key: str, raw: str) -> None:
+        pipe = self.redis.pipeline()
+        pipe.setex(CACHE_KEY_PREFIX + key, self.ttl_seconds, raw)
+        pipe.zadd(CACHE_INDEX_KEY, {key: time.time()})
+        pipe.zcard(CACHE_INDEX_KEY)
+        size = pipe.execute()[-1]
+
+        overflow = size - self.max_entries
+        if overflow > 0:
+            evicted = self.redis.zpopmin(CACHE_INDEX_KEY, overflow)
+            if evicted:
+                keys = [k.decode() if isinstance(k, bytes) else k for k, _ in evicted]
+                self.redis.delete(*[CACHE_KEY_PREFIX + k for k in keys])
+                logger.debug(f"[AnalysisCache] Evicted {len(evicted)} entries (max={self.max_entries})")
+
+    # ─────────────────────────────────────────────────
+    # Local file backend
+    # ─────────────────────────────────────────────────
+
+    def _local_path(self, key: str) -> Path:
+        return self.local_dir / f"{key}.json"
+
+    def _local_get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._local_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+
+        # LRU: 접근 시각 갱신 (eviction은 mtime 기준)
+        os.utime(path, (time.time(), time.time()))
+        return entry.get("value")
+
+    def _local_set(self, key: str, raw: str) -> None:
+        self.local_dir.mkdir(parents=True, exist_ok=True)
+        path = self._local_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+
+        entry = f'{{"stored_at": {time.time()}, "value": {raw}}}'
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(entry)
+        # 원자적 교체 (동시 워커 간 부분 쓰기 방지)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._evict_local()
+
+    def _evict_local(self) -> None:
+        """로컬 캐시 용량/항목 수 초과 시 오래된 항목부터 삭제"""
+        entries = []
+        total_bytes = 0
+        now = time.time()
+        for path in self.local_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            # 만료된 항목은 바로 삭제 (mtime은 마지막 접근 시각이므로 보수적으로 판단)
+            if now - stat.st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_bytes += stat.st_size
+
+        if total_bytes <= self.max_local_bytes and len(entries) <= self.max_entries:
+            return
+
+        entries.sort(key=lambda e: e[0])
+        evicted = 0
+        for _, size, path in entries:
+            if total_bytes <= self.max_local_bytes and len(entries) - evicted <= self.max_entries:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+            evicted += 1
+
+        if evicted:
+            logger.debug(f"[AnalysisCache] Evicted {evicted} local entries")
+
+
+# 싱글톤 인스턴스
+_analysis_cache: Optional[AnalysisCache] = None
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """AnalysisCache 싱글톤 인스턴스 반환"""
+    global _analysis_cache
+    if _analysis_cache is None:
+        _analysis_cache = AnalysisCache()
+    return _analysis_cache
@@ -0,0 +1,233 @@
+"""
+Checkpoint Store - 작업(job_id)별 스테이지 결과 영속화
+
+RQ Retry / DLQ 재실행 시 이미 완료된 스테이지(파싱, 신원 확인, AI 분석, 임베딩)를
+다시 수행하지 않도록 스테이지 출력을 job_id 단위로 저장합니다.
+DB 저장 단계에서 실패한 작업은 재시도 시 DB 왕복 1회만 다시 수행합니다.
+
+저장소:
+- Redis (기본): rai:checkpoint:{job_id} 해시 (필드 = 스테이지명), TTL 적용
+- 로컬 파일 (fallback): {dir}/{job_id}/{stage}.json, TTL 적용
+
+주의: 체크포인트에는 파싱 원문(PII 포함)이 들어가므로 TTL을 짧게 유지하고,
+작업 완료 시 clear()로 즉시 삭제합니다.
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from redis import Redis
+
+from config import get_settings
+from utils.vector_codec import as_float32, to_base64
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Redis 키
+CHECKPOINT_KEY_PREFIX = "rai:checkpoint:"
+
+# 체크포인트 대상 스테이지
+STAGE_PARSING = "parsing"
+STAGE_IDENTITY_CHECK = "identity_check"
+STAGE_ANALYSIS = "analysis"
+STAGE_EMBEDDING = "embedding"
+
+# job_id를 파일 경로로 사용할 때 허용 문자
+_SAFE_ID_PATTERN = re.compile(r"[^A-Za-z0-9_\-]")
+
+
+class CheckpointStore:
+    """
+    스테이지 체크포인트 저장소
+
+    Redis를 우선 사용하고, 연결이 불가능하면 로컬 파일로 대체합니다.
+    저장/조회 오류는 파이프라인을 막지 않도록 로깅 후 무시합니다.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+        local_dir: Optional[str] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.enabled = settings.USE_STAGE_CHECKPOINTS if enabled is None else enabled
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.STAGE_CHECKPOINT_TTL_SECONDS
+        self.local_dir = Path(
+            local_dir
+            or settings.STAGE_CHECKPOINT_DIR
+            or os.path.join(tempfile.gettempdir(), "rai_checkpoints")
+        )
+        self.redis: Optional[Redis] = None
+
+        if self.enabled:
+            self._init_redis(settings.REDIS_URL if redis_url is None else redis_url)
+
+    def _init_redis(self, redis_url: str):
+        """Redis 연결 초기화 (실패 시 로컬 파일 사용)"""
+        if not redis_url:
+            logger.info("[CheckpointStore] REDIS_URL not configured - using local file store")
+            return
+
+        try:
+            self.redis = Redis.from_url(redis_url, socket_connect_timeout=2, socket_timeout=5)
+            self.redis.ping()
+            logger.info("[CheckpointStore] Redis checkpoint store initialized")
+        except Exception as e:
+            logger.warning(f"[CheckpointStore] Redis unavailable, using local file store: {e}")
+            self.redis = None
+
+    @property
+    def backend(self) -> str:
+        """현재 사용 중인 저장소"""
+        return "redis" if self.redis is not None else "local"
+
+    # ─────────────────────────────────────────────────
+    # Public API
+    # ─────────────────────────────────────────────────
+
+    def save_stage(self, job_id: Optional[str], stage: str, payload: Dict[str, Any]) -> bool:
+        """
+        스테이지 결과 저장
+
+        Args:
+            job_id: processing_jobs ID
+            stage: 스테이지명 (STAGE_* 상수)
+            payload: JSON 직렬화 가능한 스테이지 출력
+
+        Returns:
+            저장 성공 여부
+        """
+        if not self.enabled or not job_id:
+            return False
+
+        try:
+            raw = json.dumps(
+                {"stored_at": time.time(), "payload": payload},
+                ensure_ascii=False,
+                default=str,
+            )
+            if self.redis is not None:
+                key = CHECKPOINT_KEY_PREFIX + job_id
+                pipe = self.redis.pipeline()
+                pipe.hset(key, stage, raw)
+                pipe.expire(key, self.ttl_seconds)
+                pipe.execute()
+            else:
+                job_dir = self._job_dir(job_id)
+                job_dir.mkdir(parents=True, exist_ok=True)
+                path = job_dir / f"{stage}.json"
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(raw)
+                os.replace(tmp_path, path)
+
+            logger.debug(f"[CheckpointStore] Saved {stage} for job {job_id}")
+            return True
+        except Exception as e:
+            logger.warning(f"[CheckpointStore] save failed ({job_id}/{stage}): {e}")
+            return False
+
+    def load_stage(self, job_id: Optional[str], stage: str) -> Optional[Dict[str, Any]]:
+        """
+        스테이지 결과 조회
+
+        Returns:
+            저장된 payload 또는 None (없음/만료/비활성화)
+        """
+        if not self.enabled or not job_id:
+            return None
+
+        try:
+            if self.redis is not None:
+                raw = self.redis.hget(CHECKPOINT_KEY_PREFIX + job_id, stage)
+            else:
+                path = self._job_dir(job_id) / f"{stage}.json"
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        raw = f.read()
+                except FileNotFoundError:
+                    raw = None
+
+            if raw is None:
+                return None
+
+            entry = json.loads(raw)
+            if time.time() - entry.get("stored_at", 0) > self.ttl_seconds:
+                return None
+
+            logger.info(f"[CheckpointStore] Resuming job {job_id}: '{stage}' restored from checkpoint")
+            return entry.get("payload")
+        except Exception as e:
+            logger.warning(f"[CheckpointStore] load failed ({job_id}/{stage}): {e}")
+            return None
+
+    def clear(self, job_id: Optional[str]) -> None:
+        """작업 완료 시 체크포인트 삭제"""
+        if not self.enabled or not job_id:
+            return
+
+        try:
+            if self.redis is not None:
+                self.redis.delete(CHECKPOINT_KEY_PREFIX + job_id)
+            else:
+                shutil.rmtree(self._job_dir(job_id), ignore_errors=True)
+        except Exception as e:
+            logger.warning(f"[CheckpointStore] clear failed ({job_id}): {e}")
+
+    def _job_dir(self, job_id: str) -> Path:
+        return self.local_dir / _SAFE_ID_PATTERN.sub("_", job_id)
+
+
+# ─────────────────────────────────────────────────
+# 직렬화 헬퍼
+# ─────────────────────────────────────────────────
+
+def chunks_to_payload(chunks: List[Any]) -> List[Dict[str, Any]]:
+    """Chunk 리스트 → 체크포인트 payload (임베딩 벡터는 float32 base64)"""
+    return [
+        {
+            "chunk_type": chunk.chunk_type.value,
+            "chunk_index": chunk.chunk_index,
+            "content": chunk.content,
+            "metadata": chunk.metadata,
+            "embedding": to_base64(chunk.embedding),
+        }
+        for chunk in chunks
+    ]
+
+
+def chunks_from_payload(items: List[Dict[str, Any]]) -> List[Any]:
+    """체크포인트 payload → Chunk 리스트"""
+    from services.embedding_service import Chunk, ChunkType
+
+    return [
+        Chunk(
+            chunk_type=ChunkType(item["chunk_type"]),
+            chunk_index=item["chunk_index"],
+            content=item["content"],
+            metadata=item.get("metadata") or {},
+            embedding=as_float32(item.get("embedding")),
+        )
+        for item in items
+    ]
+
+
+# 싱글톤 인스턴스
+_checkpoint_store: Optional[CheckpointStore] = None
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """CheckpointStore 싱글톤 인스턴스 반환"""
+    global _checkpoint_store
+    if _checkpoint_store is None:
+        _checkpoint_store = CheckpointStore()
+    return _checkpoint_store
@@ -20,6 +20,8 @@ from contextlib import contextmanager
 from supabase import create_client, Client
 
 from config import get_settings
+from utils.vector_codec import to_pgvector
+from services.status_write_buffer import StatusWriteBuffer
 
 # 전화번호 패턴 (중복 체크용) - 루프 외부에서 컴파일
 PHONE_PREFIX_PATTERN = re.compile(r'010[- ]?(\d{4})')
@@ -28,6 +30,10 @@ PHONE_DIGITS_PATTERN = re.compile(r'\D')
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# 종료 상태 (write-behind 버퍼를 즉시 플러시)
+JOB_TERMINAL_STATUSES = {"completed", "failed", "rejected", "dlq"}
+CANDIDATE_TERMINAL_STATUSES = {"completed", "failed", "rejected"}
+
 
 class DuplicateMatchType(str, Enum):
     """중복 매칭 타입 (Waterfall 순서)"""
@@ -38,6 +44,15 @@ class DuplicateMatchType(str, Enum):
     NONE = "none"                       # 매칭 없음
 
 
+# 매칭 타입별 신뢰도
+DUPLICATE_MATCH_CONFIDENCE = {
+    DuplicateMatchType.PHONE_HASH: 1.0,          # 전화번호 해시는 확실
+    DuplicateMatchType.EMAIL_HASH: 0.95,         # 이메일도 거의 확실
+    DuplicateMatchType.NAME_PHONE_PREFIX: 0.85,
+    DuplicateMatchType.NAME_BIRTH: 0.7,          # 동명이인 가능성
+}
+
+
 @dataclass
 class DuplicateCheckResult:
     """중복 체크 결과"""
@@ -155,6 +170,39 @@ class DatabaseService:
                 settings.SUPABASE_URL,
                 settings.SUPABASE_SERVICE_ROLE_KEY
             )
+        # 상태 갱신 write-behind 버퍼
+        self.status_buffer: Optional[StatusWriteBuffer] = None
+        if self.client and getattr(settings, "USE_STATUS_WRITE_BUFFER", True):
+            self.status_buffer = StatusWriteBuffer(
+                self._write_status_rows,
+                interval_ms=getattr(settings, "STATUS_WRITE_INTERVAL_MS", 500.0),
+            )
+
+    def _write_status_rows(self, table: str, data: Dict[str, Any], row_ids: List[str]) -> None:
+        """버퍼 플러시: payload가 같은 행들을 한 번의 update로 전송"""
+        query = self.client.table(table).update(data)
+        if len(row_ids) == 1:
+            query = query.eq("id", row_ids[0])
+        else:
+            query = query.in_("id", row_ids)
+        query.execute()
+
+    def flush_status_writes(self) -> None:
+        """
+        대기 중인 상태 갱신 즉시 전송
+
+        status를 직접 쓰는 메서드는 먼저 호출해 버퍼의 이전 상태가 나중에 덮어쓰지 않도록 합니다.
+        """
+        status_buffer = getattr(self, "status_buffer", None)
+        if status_buffer:
+            status_buffer.flush()
+
+    def get_status_buffer_stats(self) -> Dict[str, Any]:
+        """write-behind 버퍼 통계 (비활성 시 enabled=False)"""
+        status_buffer = getattr(self, "status_buffer", None)
+        if not status_buffer:
+            return {"enabled": False}
+        return {"enabled": True, **status_buffer.get_stats()}
 
     def _normalize_phone(self, phone: Optional[str]) -> Optional[str]:
         """전화번호 정규화 (숫자만 추출)"""
@@ -215,6 +263,9 @@ class DatabaseService:
         3순위: 이름 + 전화번호 앞4자리 매칭
         4순위: 이름 + 생년 매칭
 
+        find_duplicate_candidate RPC가 4개 티어를 우선순위대로 한 번에 조회합니다.
+        3/4순위는 저장 시 함께 기록되는 name_phone_hash / name_birth_hash 컬럼을 사용합니다.
+
         Args:
             user_id: 사용자 ID (같은 사용자 내에서만 중복 체크)
             phone_hash: 전화번호 SHA-256 해시
@@ -234,100 +285,36 @@ class DatabaseService:
             )
 
         try:
-            # 1순위: 전화번호 해시
-            if phone_hash:
-                result = self.client.table("candidates").select(
-                    "id, name, is_latest"
-                ).eq("user_id", user_id).eq("phone_hash", phone_hash).eq(
-                    "is_latest", True
-                ).execute()
-
-                if result.data and len(result.data) > 0:
-                    existing = result.data[0]
-                    logger.info(f"Duplicate found by phone_hash: {existing['id']}")
-                    return DuplicateCheckResult(
-                        is_duplicate=True,
-                        match_type=DuplicateMatchType.PHONE_HASH,
-                        existing_candidate_id=existing['id'],
-                        existing_candidate_name=existing.get('name'),
-                        confidence=1.0  # 전화번호 해시는 확실
-                    )
-
-            # 2순위: 이메일 해시
-            if email_hash:
-                result = self.client.table("candidates").select(
-                    "id, name, is_latest"
-                ).eq("user_id", user_id).eq("email_hash", email_hash).eq(
-                    "is_latest", True
-                ).execute()
-
-                if result.data and len(result.data) > 0:
-                    existing = result.data[0]
-                    logger.info(f"Duplicate found by email_hash: {existing['id']}")
-                    return DuplicateCheckResult(
-                        is_duplicate=True,
-                        match_type=DuplicateMatchType.EMAIL_HASH,
-                        existing_candidate_id=existing['id'],
-                        existing_candidate_name=existing.get('name'),
-                        confidence=0.95  # 이메일도 거의 확실
-                    )
-
-            # 3순위: 이름 + 전화번호 앞4자리
+            # 1~4순위를 RPC 1회로 조회 (각 티어는 (user_id, hash) 부분 인덱스 조회)
             name_phone_hash = self._create_name_phone_hash(name, phone)
-            if name_phone_hash:
-                # 같은 조합 검색을 위해 모든 후보자 조회 후 비교
-                # (DB에 name_phone_hash 컬럼이 없으므로 런타임 비교)
-                result = self.client.table("candidates").select(
-                    "id, name, phone_masked, is_latest"
-                ).eq("user_id", user_id).eq("is_latest", True).execute()
+            name_birth_hash = self._create_name_birth_hash(name, birth_year)
 
-                if result.data:
-                    for candidate in result.data:
-                        # 마스킹된 전화번호에서 앞부분 추출 (010-1234-****)
-                        masked_phone = candidate.get('phone_masked', '')
-                        cand_name = candidate.get('name', '')
-                        # 전화번호 앞 4자리 추출 (마스킹 패턴: 010-1234-****)
-                        if masked_phone and len(masked_phone) >= 8:
-                            # 010-1234 형태에서 1234 추출 (컴파일된 패턴 사용)
-                            match = PHONE_PREFIX_PATTERN.search(masked_phone)
-                            if match:
-                                cand_prefix = match.group(1)
-                                my_prefix = self._get_phone_prefix(phone)
-                                # 이름 비교 (정규화)
-                                if (cand_prefix == my_prefix and
-                                    cand_name and name and
-                                    ''.join(cand_name.split()).lower() == ''.join(name.split()).lower()):
-                                    logger.info(f"Duplicate found by name+phone prefix: {candidate['id']}")
-                                    return DuplicateCheckResult(
-                                        is_duplicate=True,
-                                        match_type=DuplicateMatchType.NAME_PHONE_PREFIX,
-                                        existing_candidate_id=candidate['id'],
-                                        existing_candidate_name=cand_name,
-                                        confidence=0.85
-                                    )
-
-            # 4순위: 이름 + 생년
-            if name and birth_year:
-                # 이름과 생년이 같은 후보자 검색
-                normalized_name = ''.join(name.split()).lower()
-                result = self.client.table("candidates").select(
-                    "id, name, birth_year, is_latest"
-                ).eq("user_id", user_id).eq("birth_year", birth_year).eq(
-                    "is_latest", True
-                ).execute()
+            if not any([phone_hash, email_hash, name_phone_hash, name_birth_hash]):
+                return DuplicateCheckResult(
+                    is_duplicate=False,
+                    match_type=DuplicateMatchType.NONE,
+                    confidence=0.0
+                )
 
-                if result.data:
-                    for candidate in result.data:
-                        cand_name = candidate.get('name', '')
-                        if cand_name and ''.join(cand_name.split()).lower() == normalized_name:
-                            logger.info(f"Duplicate found by name+birth_year: {candidate['id']}")
-                            return DuplicateCheckResult(
-                                is_duplicate=True,
-                                match_type=DuplicateMatchType.NAME_BIRTH,
-                                existing_candidate_id=candidate['id'],
-                                existing_candidate_name=cand_name,
-                                confidence=0.7  # 동명이인 가능성
-                            )
+            result = self.client.rpc("find_duplicate_candidate", {
+                "p_user_id": user_id,
+                "p_phone_hash": phone_hash,
+                "p_email_hash": email_hash,
+                "p_name_phone_hash": name_phone_hash,
+                "p_name_birth_hash": name_birth_hash,
+            }).execute()
+
+            if result.data:
+                existing = result.data[0]
+                match_type = DuplicateMatchType(existing["match_type"])
+                logger.info(f"Duplicate found by {match_type.value}: {existing['candidate_id']}")
+                return DuplicateCheckResult(
+                    is_duplicate=True,
+                    match_type=match_type,
+                    existing_candidate_id=existing["candidate_id"],
+                    existing_candidate_name=existing.get("candidate_name"),
+                    confidence=DUPLICATE_MATCH_CONFIDENCE[match_type]
+                )
 
             # 중복 없음
             return DuplicateCheckResult(
@@ -452,6 +439,9 @@ class DatabaseService:
                 error="Supabase client not initialized"
             )
 
+        # 버퍼에 남은 이전 상태가 저장 결과를 덮어쓰지 않도록 먼저 전송
+        self.flush_status_writes()
+
         # 트랜잭션 컨텍스트 생성
         ctx = SaveContext(self.client)
 
@@ -512,6 +502,8 @@ class DatabaseService:
                 # 해시 (중복 체크용)
                 "phone_hash": hash_store.get("phone"),
                 "email_hash": hash_store.get("email"),
+                "name_phone_hash": self._create_name_phone_hash(orig.get("name"), orig.get("phone")),
+                "name_birth_hash": self._create_name_birth_hash(orig.get("name"), orig.get("birth_year")),
                 # 경력 정보
                 "exp_years": analyzed_data.get("exp_years", 0),
                 "last_company": analyzed_data.get("last_company"),
@@ -687,9 +679,9 @@ class DatabaseService:
                     "metadata": chunk.metadata if hasattr(chunk, 'metadata') else {},
                 }
 
-                # 임베딩이 있으면 추가
+                # 임베딩이 있으면 추가 (float32 배열 → pgvector 텍스트 리터럴)
                 if hasattr(chunk, 'embedding') and chunk.embedding is not None:
-                    chunk_record["embedding"] = chunk.embedding
+                    chunk_record["embedding"] = to_pgvector(chunk.embedding)
 
                 chunk_records.append(chunk_record)
 
@@ -733,8 +725,10 @@ class DatabaseService:
         """
         processing_jobs 상태 업데이트
 
+        USE_STATUS_WRITE_BUFFER: 비종료 상태는 병합 후 지연 전송, 종료 상태는 즉시 플러시
+
         Returns:
-            성공 여부
+            성공 여부 (비종료 상태 버퍼링 시 항상 True)
         """
         if not self.client:
             return False
@@ -755,6 +749,13 @@ class DatabaseService:
             if error_message:
                 update_data["error_message"] = error_message
 
+            status_buffer = getattr(self, "status_buffer", None)
+            if status_buffer:
+                return status_buffer.put(
+                    "processing_jobs", job_id, update_data,
+                    terminal=status in JOB_TERMINAL_STATUSES,
+                )
+
             self.client.table("processing_jobs").update(update_data).eq("id", job_id).execute()
             return True
 
@@ -776,8 +777,10 @@ class DatabaseService:
             status: 새로운 상태 (processing, parsed, analyzed, completed, failed)
             quick_extracted: 빠른 추출 데이터 (parsed 단계에서 설정)
 
+        USE_STATUS_WRITE_BUFFER: 비종료 상태는 병합 후 지연 전송, 종료 상태는 즉시 플러시
+
         Returns:
-            성공 여부
+            성공 여부 (비종료 상태 버퍼링 시 항상 True)
         """
         if not self.client:
             return False
@@ -794,9 +797,17 @@ class DatabaseService:
             elif status in ["analyzed", "completed"]:
                 update_data["analysis_completed_at"] = "now()"
 
-            self.client.table("candidates").update(update_data).eq("id", candidate_id).execute()
+            status_buffer = getattr(self, "status_buffer", None)
+            if status_buffer:
+                success = status_buffer.put(
+                    "candidates", candidate_id, update_data,
+                    terminal=status in CANDIDATE_TERMINAL_STATUSES,
+                )
+            else:
+                self.client.table("candidates").update(update_data).eq("id", candidate_id).execute()
+                success = True
             logger.info(f"[DB] Candidate {candidate_id} status updated to: {status}")
-            return True
+            return success
 
         except Exception as e:
             logger.error(f"Failed to update candidate status: {e}")
@@ -1159,6 +1170,7 @@ class DatabaseService:
         candidate_id: str,
         user_id: str,
         min_score: float = 0.3,
+        limit: int = 100,
     ) -> Dict[str, Any]:
         """
         새로 등록된 후보자를 기존의 모든 활성 Position과 매칭
@@ -1166,10 +1178,15 @@ class DatabaseService:
         후보자 이력서 분석 완료 후 호출되어, 기존에 등록된 JD들과
         자동으로 매칭 점수를 계산하고 저장합니다.
 
+        save_candidate_position_matches RPC 1회로 이 후보자만 채점하고
+        해당 후보자의 매칭 행만 upsert합니다 (Position별 상위 limit명 유지).
+        전체 후보자 재매칭은 rematch_all_positions()를 사용합니다.
+
         Args:
             candidate_id: 새로 등록된 후보자 ID
             user_id: 사용자 ID
             min_score: 최소 매칭 점수 (기본값: 0.3)
+            limit: Position별 최대 매칭 후보자 수
 
         Returns:
             {
@@ -1187,6 +1204,76 @@ class DatabaseService:
                 "error": "Supabase client not initialized"
             }
 
+        try:
+            result = self.client.rpc(
+                "save_candidate_position_matches",
+                {
+                    "p_candidate_id": candidate_id,
+                    "p_user_id": user_id,
+                    "p_limit": limit,
+                    "p_min_score": min_score
+                }
+            ).execute()
+
+            row = result.data[0] if result.data else {}
+            total_positions = row.get("total_positions") or 0
+            matched_positions = row.get("matched_positions") or 0
+
+            logger.info(
+                f"[AutoMatch] Completed for candidate {candidate_id}: "
+                f"{matched_positions}/{total_positions} positions matched"
+            )
+
+            return {
+                "success": True,
+                "matched_positions": matched_positions,
+                "total_positions": total_positions,
+                "error": None
+            }
+
+        except Exception as e:
+            logger.error(f"[AutoMatch] Failed: {e}", exc_info=True)
+            return {
+                "success": False,
+                "matched_positions": 0,
+                "total_positions": 0,
+                "error": str(e)
+            }
+
+    def rematch_all_positions(
+        self,
+        user_id: str,
+        min_score: float = 0.3,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """
+        사용자의 모든 활성 Position을 전체 후보자와 재매칭 (유지보수 작업)
+
+        Position마다 save_position_matches RPC를 호출하여 사용자 전체 후보자를
+        다시 채점합니다 (O(positions × candidates)). 매칭 공식 변경, 대량 백필 후
+        scripts/rematch_positions.py에서 명시적으로 실행합니다.
+
+        Args:
+            user_id: 사용자 ID
+            min_score: 최소 매칭 점수 (기본값: 0.3)
+            limit: Position별 최대 매칭 후보자 수
+
+        Returns:
+            {
+                "success": bool,
+                "matched_positions": int,  # 재매칭된 Position 수
+                "total_positions": int,    # 전체 활성 Position 수
+                "error": Optional[str]
+            }
+        """
+        if not self.client:
+            return {
+                "success": False,
+                "matched_positions": 0,
+                "total_positions": 0,
+                "error": "Supabase client not initialized"
+            }
+
         try:
             # Step 1: 해당 사용자의 활성 Position 목록 조회
             positions_result = self.client.table("positions").select(
@@ -1194,7 +1281,7 @@ class DatabaseService:
             ).eq("user_id", user_id).eq("status", "open").execute()
 
             if not positions_result.data:
-                logger.info(f"[AutoMatch] No active positions found for user {user_id}")
+                logger.info(f"[Rematch] No active positions found for user {user_id}")
                 return {
                     "success": True,
                     "matched_positions": 0,
@@ -1216,7 +1303,7 @@ class DatabaseService:
                         {
                             "p_position_id": position_id,
                             "p_user_id": user_id,
-                            "p_limit": 100,  # 상위 100명까지
+                            "p_limit": limit,
                             "p_min_score": min_score
                         }
                     ).execute()
@@ -1224,19 +1311,19 @@ class DatabaseService:
                     if result.data is not None:
                         matched_positions += 1
                         logger.info(
-                            f"[AutoMatch] Position {position_id} re-matched: "
+                            f"[Rematch] Position {position_id} re-matched: "
                             f"{result.data} candidates"
                         )
                 except Exception as pos_error:
                     logger.warning(
-                        f"[AutoMatch] Failed to match position {position_id}: {pos_error}"
+                        f"[Rematch] Failed to match position {position_id}: {pos_error}"
                     )
                     # 개별 Position 실패는 전체 실패로 처리하지 않음
                     continue
 
             logger.info(
-                f"[AutoMatch] Completed for candidate {candidate_id}: "
-                f"{matched_positions}/{total_positions} positions matched"
+                f"[Rematch] Completed for user {user_id}: "
+                f"{matched_positions}/{total_positions} positions re-matched"
             )
 
             return {
@@ -1247,7 +1334,7 @@ class DatabaseService:
             }
 
         except Exception as e:
-            logger.error(f"[AutoMatch] Failed: {e}", exc_info=True)
+            logger.error(f"[Rematch] Failed: {e}", exc_info=True)
             return {
                 "success": False,
                 "matched_positions": 0,
@@ -1283,6 +1370,8 @@ class DatabaseService:
             logger.error("Supabase client not initialized")
             return False
 
+        self.flush_status_writes()
+
         try:
             from datetime import datetime
 
@@ -1339,6 +1428,8 @@ class DatabaseService:
             logger.error("Supabase client not initialized")
             return False
 
+        self.flush_status_writes()
+
         try:
             from datetime import datetime
 
@@ -1461,6 +1552,8 @@ class DatabaseService:
         if not self.client:
             return False
 
+        self.flush_status_writes()
+
         try:
             from datetime import datetime
 
@@ -1502,6 +1595,8 @@ class DatabaseService:
         if not self.client or not parent_id:
             return False
 
+        self.flush_status_writes()
+
         try:
             # 1. 이전 버전 is_latest=True로 복원
             restore_result = self.client.table("candidates").update({
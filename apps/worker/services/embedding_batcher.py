@@ -0,0 +1,204 @@
+"""
+Embedding Micro-Batcher - 여러 이력서의 임베딩 요청 병합
+
+비동기 워커/멀티 Job 실행 시 후보자마다 작은 embeddings.create 요청이 동시에 나가
+레이트 리밋에 걸립니다. 짧은 윈도우(기본 10ms) 동안 동시 호출자들의 청크를 모아
+모델의 입력 수/토큰 한도까지 채운 요청으로 보내고 결과를 호출자별로 돌려줍니다.
+
+- 토큰 기반 패킹 (EmbeddingService._count_tokens, tiktoken)
+- 분당 토큰 예산 (60초 슬라이딩 윈도우, 초과 시 대기)
+- 배치 채움률 / 병합 호출자 수 / 예산 대기 시간 메트릭
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# OpenAI embeddings API 한도 (text-embedding-3-*)
+MAX_INPUTS_PER_REQUEST = 2048
+MAX_TOKENS_PER_INPUT = 8191
+MAX_TOKENS_PER_REQUEST = 300_000
+
+TOKEN_BUDGET_WINDOW_SECONDS = 60.0
+
+
+@dataclass
+class _PendingItem:
+    text: str
+    tokens: int
+    future: asyncio.Future
+
+
+class EmbeddingBatcher:
+    """
+    프로세스(이벤트 루프) 공유 임베딩 배처
+
+    embed()를 동시에 호출한 요청들은 window_ms 동안 모인 뒤
+    max_batch_inputs / max_batch_tokens 단위로 묶여 전송됩니다.
+    요청 실패 시 해당 배치의 항목은 None으로 반환됩니다 (호출 측 개별 재시도).
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[str]], Awaitable[Optional[List[Optional[List[float]]]]]],
+        count_tokens: Callable[[str], int],
+        window_ms: float = 10.0,
+        max_batch_inputs: int = MAX_INPUTS_PER_REQUEST,
+        max_batch_tokens: int = MAX_TOKENS_PER_REQUEST,
+        tokens_per_minute: int = 0,
+        max_concurrent_requests: int = 4,
+    ):
+        self._send_batch = send_batch
+        self._count_tokens = count_tokens
+        self.window = window_ms / 1000
+        self.max_batch_inputs = min(max_batch_inputs, MAX_INPUTS_PER_REQUEST)
+        self.max_batch_tokens = min(max_batch_tokens, MAX_TOKENS_PER_REQUEST)
+        self.tokens_per_minute = tokens_per_minute
+
+        self._pending: List[_PendingItem] = []
+        self._pending_tokens = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._request_semaphore = asyncio.Semaphore(max(1, max_concurrent_requests))
+        self._budget_lock = asyncio.Lock()
+        self._token_log: Deque[Tuple[float, int]] = deque()
+        self._tasks: set = set()
+
+        self.stats: Dict[str, Any] = {
+            "requests": 0,
+            "inputs": 0,
+            "tokens": 0,
+            "callers": 0,
+            "failed_requests": 0,
+            "budget_wait_seconds": 0.0,
+            "token_fill_sum": 0.0,
+            "input_fill_sum": 0.0,
+        }
+
+    # ─────────────────────────────────────────────────
+    # 호출자 API
+    # ─────────────────────────────────────────────────
+
+    async def embed(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """텍스트 목록 임베딩 (다른 호출자와 병합되어 전송)"""
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._add(_PendingItem(text=text, tokens=self._count_tokens(text), future=future))
+            futures.append(future)
+
+        self.stats["callers"] += 1
+        return list(await asyncio.gather(*futures))
+
+    def _add(self, item: _PendingItem):
+        # 현재 버퍼에 넣으면 한도를 넘는 경우 먼저 비움
+        if self._pending and (
+            len(self._pending) >= self.max_batch_inputs
+            or self._pending_tokens + item.tokens > self.max_batch_tokens
+        ):
+            self._flush()
+
+        self._pending.append(item)
+        self._pending_tokens += item.tokens
+
+        if len(self._pending) >= self.max_batch_inputs or self._pending_tokens >= self.max_batch_tokens:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.window, self._flush)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, tokens = self._pending, self._pending_tokens
+        self._pending, self._pending_tokens = [], 0
+
+        task = asyncio.get_running_loop().create_task(self._send(batch, tokens))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # ─────────────────────────────────────────────────
+    # 전송
+    # ─────────────────────────────────────────────────
+
+    async def _send(self, batch: List[_PendingItem], tokens: int):
+        try:
+            await self._reserve_budget(tokens)
+            async with self._request_semaphore:
+                vectors = await self._send_batch([item.text for item in batch])
+        except Exception as e:
+            logger.error(f"[EmbeddingBatcher] 배치 전송 실패: {type(e).__name__}: {e}")
+            vectors = None
+
+        self.stats["requests"] += 1
+        self.stats["inputs"] += len(batch)
+        self.stats["tokens"] += tokens
+        self.stats["token_fill_sum"] += tokens / self.max_batch_tokens
+        self.stats["input_fill_sum"] += len(batch) / self.max_batch_inputs
+        if vectors is None:
+            self.stats["failed_requests"] += 1
+            vectors = [None] * len(batch)
+
+        for item, vector in zip(batch, vectors):
+            if not item.future.done():
+                item.future.set_result(vector)
+
+    async def _reserve_budget(self, tokens: int):
+        """분당 토큰 예산 확보 (60초 슬라이딩 윈도우)"""
+        if self.tokens_per_minute <= 0:
+            return
+
+        async with self._budget_lock:
+            waited = 0.0
+            while True:
+                now = time.monotonic()
+                while self._token_log and now - self._token_log[0][0] >= TOKEN_BUDGET_WINDOW_SECONDS:
+                    self._token_log.popleft()
+
+                used = sum(t for _, t in self._token_log)
+                # 단일 배치가 예산보다 크면 윈도우가 빌 때까지만 대기
+                if not self._token_log or used + tokens <= self.tokens_per_minute:
+                    self._token_log.append((now, tokens))
+                    break
+
+                wait = TOKEN_BUDGET_WINDOW_SECONDS - (now - self._token_log[0][0])
+                await asyncio.sleep(max(wait, 0.01))
+                waited += max(wait, 0.01)
+
+            if waited:
+                self.stats["budget_wait_seconds"] += waited
+                logger.info(f"[EmbeddingBatcher] 분당 토큰 예산 대기 {waited:.2f}초")
+
+    async def flush(self):
+        """대기 중인 요청을 즉시 전송하고 완료를 기다림"""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        requests = self.stats["requests"]
+        return {
+            "requests": requests,
+            "inputs": self.stats["inputs"],
+            "tokens": self.stats["tokens"],
+            "callers": self.stats["callers"],
+            "failed_requests": self.stats["failed_requests"],
+            "budget_wait_seconds": round(self.stats["budget_wait_seconds"], 3),
+            "avg_inputs_per_request": round(self.stats["inputs"] / requests, 2) if requests else 0.0,
+            "avg_token_fill_ratio": round(self.stats["token_fill_sum"] / requests, 4) if requests else 0.0,
+            "avg_input_fill_ratio": round(self.stats["input_fill_sum"] / requests, 4) if requests else 0.0,
+            "max_batch_inputs": self.max_batch_inputs,
+            "max_batch_tokens": self.max_batch_tokens,
+            "tokens_per_minute": self.tokens_per_minute,
+        }
@@ -0,0 +1,266 @@
+"""
+Embedding Cache - Content-addressed 임베딩 캐시
+
+스킬/학력 청크, 원본 텍스트 슬라이딩 윈도우 등은 재업로드, 버전 스태킹,
+백필 시 바이트 단위로 동일한 경우가 많습니다. 같은 입력을 다시 임베딩하지 않도록
+벡터를 캐싱합니다.
+
+캐시 키:
+    sha256(모델 + 차원 + 입력 텍스트)
+
+저장 포맷:
+    float16 (기본, 1536차원 = 3KB) 또는 float32 raw bytes (little-endian)
+
+저장소:
+- Redis (기본): SETEX + 정렬 셋 인덱스로 TTL / 최대 항목 수 기반 LRU eviction
+- 프로세스 메모리 (fallback): Redis 미사용 시 바이트 상한 LRU
+"""
+
+import hashlib
+import logging
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+from redis import Redis
+
+from config import get_settings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Redis 키
+CACHE_KEY_PREFIX = "rai:embedding_cache:"
+CACHE_INDEX_KEY = "rai:embedding_cache:index"
+
+# 캐시 포맷 버전 (저장 구조 변경 시 증가)
+CACHE_FORMAT_VERSION = "1"
+
+_STRUCT_CODES = {"float16": "e", "float32": "f"}
+
+
+def build_embedding_key(model: str, dimensions: int, text: str) -> str:
+    """임베딩 캐시 키 (모델/차원이 다르면 다른 키)"""
+    hasher = hashlib.sha256()
+    hasher.update(f"v{CACHE_FORMAT_VERSION}\x00{model}\x00{dimensions}\x00".encode("utf-8"))
+    hasher.update(text.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def encode_vector(vector: Sequence[float], dtype: str = "float16") -> bytes:
+    """벡터 → little-endian raw bytes"""
+    if np is not None:
+        return np.asarray(vector, dtype=f"<{'f2' if dtype == 'float16' else 'f4'}").tobytes()
+    return struct.pack(f"<{len(vector)}{_STRUCT_CODES[dtype]}", *vector)
+
+
+def decode_vector(raw: bytes, dtype: str = "float16"):
+    """raw bytes → float32 배열 (numpy 미설치 시 float 리스트)"""
+    if np is not None:
+        return np.frombuffer(raw, dtype=f"<{'f2' if dtype == 'float16' else 'f4'}").astype(np.float32)
+    itemsize = 2 if dtype == "float16" else 4
+    return list(struct.unpack(f"<{len(raw) // itemsize}{_STRUCT_CODES[dtype]}", raw))
+
+
+class EmbeddingCache:
+    """
+    임베딩 벡터 캐시
+
+    Redis를 우선 사용하고, 연결이 불가능하면 프로세스 메모리 LRU로 대체합니다.
+    캐시 오류는 임베딩 흐름을 막지 않도록 모두 로깅 후 무시합니다 (miss로 처리).
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        dtype: Optional[str] = None,
+        max_local_mb: Optional[int] = None,
+    ):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.EMBEDDING_CACHE_TTL_SECONDS
+        self.max_entries = max_entries if max_entries is not None else settings.EMBEDDING_CACHE_MAX_ENTRIES
+        self.dtype = dtype or settings.EMBEDDING_CACHE_DTYPE
+        if self.dtype not in _STRUCT_CODES:
+            logger.warning(f"[EmbeddingCache] Unknown dtype {self.dtype!r}, using float16")
+            self.dtype = "float16"
+        self.max_local_bytes = (
+            max_local_mb if max_local_mb is not None else settings.EMBEDDING_CACHE_MAX_LOCAL_MB
+        ) * 1024 * 1024
+
+        self.redis: Optional[Redis] = None
+        self._lock = threading.Lock()
+        self._local: "OrderedDict[str, bytes]" = OrderedDict()
+        self._local_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+        self._init_redis(settings.REDIS_URL if redis_url is None else redis_url)
+
+    def _init_redis(self, redis_url: str):
+        """Redis 연결 초기화 (실패 시 메모리 캐시 사용)"""
+        if not redis_url:
+            logger.info("[EmbeddingCache] REDIS_URL not configured - using in-memory cache")
+            return
+
+        try:
+            self.redis = Redis.from_url(redis_url, socket_connect_timeout=2, socket_timeout=2)
+            self.redis.ping()
+            logger.info("[EmbeddingCache] Redis cache initialized")
+        except Exception as e:
+            logger.warning(f"[EmbeddingCache] Redis unavailable, using in-memory cache: {e}")
+            self.redis = None
+
+    @property
+    def backend(self) -> str:
+        """현재 사용 중인 저장소"""
+        return "redis" if self.redis is not None else "memory"
+
+    # ─────────────────────────────────────────────────
+    # Public API
+    # ─────────────────────────────────────────────────
+
+    def get_many(self, keys: List[str]) -> List[Optional[Sequence[float]]]:
+        """
+        여러 키 조회 (Redis는 파이프라인 1회)
+
+        Returns:
+            키 순서대로 벡터 또는 None
+        """
+        if not keys:
+            return []
+
+        try:
+            if self.redis is not None:
+                raws = self._redis_get_many(keys)
+            else:
+                raws = self._local_get_many(keys)
+            vectors = [decode_vector(raw, self.dtype) if raw is not None else None for raw in raws]
+        except Exception as e:
+            logger.warning(f"[EmbeddingCache] get failed: {e}")
+            vectors = [None] * len(keys)
+
+        hits = sum(1 for v in vectors if v is not None)
+        with self._lock:
+            self._hits += hits
+            self._misses += len(keys) - hits
+        return vectors
+
+    def set_many(self, items: Dict[str, Sequence[float]]) -> bool:
+        """
+        여러 벡터 저장
+
+        Returns:
+            저장 성공 여부
+        """
+        if not items:
+            return True
+
+        try:
+            encoded = {key: encode_vector(vector, self.dtype) for key, vector in items.items()}
+            if self.redis is not None:
+                self._redis_set_many(encoded)
+            else:
+                self._local_set_many(encoded)
+            return True
+        except Exception as e:
+            logger.warning(f"[EmbeddingCache] set failed: {e}")
+            return False
+
+    def get_stats(self) -> Dict[str, object]:
+        """캐시 적중률 통계"""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "backend": self.backend,
+                "dtype": self.dtype,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 4) if total else 0.0,
+                "local_entries": len(self._local),
+                "local_bytes": self._local_bytes,
+            }
+
+    # ─────────────────────────────────────────────────
+    # Redis backend
+    # ─────────────────────────────────────────────────
+
+    def _redis_get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        raws = self.redis.mget([CACHE_KEY_PREFIX + key for key in keys])
+
+        # LRU: 적중 항목 접근 시각 갱신 / TTL 만료된 항목은 인덱스에서 정리
+        now = time.time()
+        hit_keys = {key: now for key, raw in zip(keys, raws) if raw is not None}
+        missed = [key for key, raw in zip(keys, raws) if raw is None]
+        pipe = self.redis.pipeline()
+        if hit_keys:
+            pipe.zadd(CACHE_INDEX_KEY, hit_keys)
+        if missed:
+            pipe.zrem(CACHE_INDEX_KEY, *missed)
+        pipe.execute()
+        return raws
+
+    def _redis_set_many(self, encoded: Dict[str, bytes]) -> None:
+        now = time.time()
+        pipe = self.redis.pipeline()
+        for key, raw in encoded.items():
+            pipe.setex(CACHE_KEY_PREFIX + key, self.ttl_seconds, raw)
+        pipe.zadd(CACHE_INDEX_KEY, {key: now for key in encoded})
+        pipe.zcard(CACHE_INDEX_KEY)
+        size = pipe.execute()[-1]
+
+        overflow = size - self.max_entries
+        if overflow > 0:
+            evicted = self.redis.zpopmin(CACHE_INDEX_KEY, overflow)
+            if evicted:
+                keys = [k.decode() if isinstance(k, bytes) else k for k, _ in evicted]
+                self.redis.delete(*[CACHE_KEY_PREFIX + k for k in keys])
+                logger.debug(f"[EmbeddingCache] Evicted {len(evicted)} entries (max={self.max_entries})")
+
+    # ─────────────────────────────────────────────────
+    # In-memory backend
+    # ─────────────────────────────────────────────────
+
+    def _local_get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        results = []
+        with self._lock:
+            for key in keys:
+                raw = self._local.get(key)
+                if raw is not None:
+                    self._local.move_to_end(key)
+                results.append(raw)
+        return results
+
+    def _local_set_many(self, encoded: Dict[str, bytes]) -> None:
+        with self._lock:
+            for key, raw in encoded.items():
+                previous = self._local.pop(key, None)
+                if previous is not None:
+                    self._local_bytes -= len(previous)
+                self._local[key] = raw
+                self._local_bytes += len(raw)
+
+            while self._local and (
+                self._local_bytes > self.max_local_bytes or len(self._local) > self.max_entries
+            ):
+                _, raw = self._local.popitem(last=False)
+                self._local_bytes -= len(raw)
+
+
+# 싱글톤 인스턴스
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """EmbeddingCache 싱글톤 인스턴스 반환"""
+    global _embedding_cache
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache()
+    return _embedding_cache
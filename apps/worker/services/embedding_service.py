@@ -2,7 +2,7 @@
 Embedding Service - 청킹 + Vector Embedding
 
 이력서 데이터를 의미 단위로 청킹하고 임베딩 생성
-OpenAI text-embedding-3-small 사용
+OpenAI text-embedding-3-small 사용 (모델/차원: config EMBEDDING_MODEL / EMBEDDING_DIMENSIONS)
 
 PRD v0.1 이슈 해결:
 - P0: tiktoken 도입하여 토큰 추정 정확화
@@ -10,11 +10,15 @@ PRD v0.1 이슈 해결:
 - P1: 지수 백오프 재시도 로직
 - P1: 한글 텍스트 최적화 (50% 감지, CHUNK_SIZE=2000, OVERLAP=500)
 - P1: 청킹 파라미터 config.py에서 관리
+- 동시 실행 중인 이력서들의 임베딩 요청을 EmbeddingBatcher로 병합
+- 임베딩은 base64 응답을 디코딩한 float32 배열로 유지 (utils/vector_codec.py)
+- raw_section: 섹션/문장 경계 기반 토큰 패킹 (utils/text_chunker.py)
 """
 
 import asyncio
 import logging
 import traceback
+import weakref
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from enum import Enum
@@ -24,6 +28,10 @@ import random
 from openai import AsyncOpenAI
 
 from config import get_settings, chunking_config
+from services.embedding_batcher import EmbeddingBatcher, MAX_TOKENS_PER_INPUT
+from services.embedding_cache import build_embedding_key, get_embedding_cache
+from utils.text_chunker import SemanticChunker
+from utils.vector_codec import EmbeddingVector, as_float32
 
 # tiktoken import (토큰 수 정확한 계산)
 try:
@@ -57,7 +65,7 @@ class Chunk:
     chunk_index: int          # 같은 타입 내 순서
     content: str              # 청크 내용
     metadata: Dict[str, Any] = field(default_factory=dict)
-    embedding: Optional[List[float]] = None
+    embedding: Optional[EmbeddingVector] = None  # float32 배열
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -81,6 +89,9 @@ class EmbeddingResult:
     embedded_chunks: int = 0
     failed_chunks: int = 0
     warnings: List[str] = field(default_factory=list)
+    # 임베딩 캐시 적중 정보
+    cache_hits: int = 0
+    cache_misses: int = 0
 
     @property
     def is_partial_success(self) -> bool:
@@ -99,6 +110,8 @@ class EmbeddingResult:
             "failed_chunks": self.failed_chunks,
             "is_partial_success": self.is_partial_success,
             "warnings": self.warnings,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
         }
 
 
@@ -116,9 +129,12 @@ class EmbeddingService:
     → 검색 시 청크 타입별 가중치 적용 가능
     """
 
-    # 임베딩 모델
-    EMBEDDING_MODEL = "text-embedding-3-small"
-    EMBEDDING_DIMENSIONS = 1536
+    # 임베딩 모델 (config에서 가져옴)
+    EMBEDDING_MODEL = settings.EMBEDDING_MODEL
+    EMBEDDING_DIMENSIONS = settings.EMBEDDING_DIMENSIONS
+
+    # dimensions 파라미터를 지원하는 모델 (Matryoshka 축소)
+    REDUCIBLE_MODEL_PREFIX = "text-embedding-3"
 
     # 청크 최대 길이 (config에서 가져옴)
     MAX_CHUNK_CHARS = chunking_config.MAX_STRUCTURED_CHUNK_CHARS
@@ -128,6 +144,9 @@ class EmbeddingService:
         logger.info("[EmbeddingService] 초기화 시작")
         self.client = None
         self._encoding = None  # tiktoken 인코더 (lazy init)
+        self._batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, EmbeddingBatcher]" = (
+            weakref.WeakKeyDictionary()
+        )
         openai_key = settings.OPENAI_API_KEY
         if openai_key:
             try:
@@ -150,6 +169,7 @@ class EmbeddingService:
         else:
             logger.warning("[EmbeddingService] ⚠️ tiktoken 미설치 - 토큰 수 추정 모드 사용")
 
+        logger.info(f"[EmbeddingService] 임베딩 모델: {self.EMBEDDING_MODEL} ({self.EMBEDDING_DIMENSIONS}차원)")
         logger.info("=" * 60)
 
     def _count_tokens(self, text: str) -> int:
@@ -242,7 +262,7 @@ class EmbeddingService:
 
         return None
 
-    async def create_embedding(self, text: str) -> Optional[List[float]]:
+    async def create_embedding(self, text: str) -> Optional[EmbeddingVector]:
         """단일 텍스트 임베딩 생성"""
         if not self.client:
             logger.error("[EmbeddingService] ❌ OpenAI 클라이언트 미초기화 - 임베딩 불가")
@@ -254,25 +274,106 @@ class EmbeddingService:
         async def _create():
             response = await self.client.embeddings.create(
                 model=self.EMBEDDING_MODEL,
-                input=text[:8000]  # 토큰 제한
+                input=text[:8000],  # 토큰 제한
+                encoding_format="base64",
+                **self._dimension_params(),
             )
-            return response.data[0].embedding
+            return as_float32(response.data[0].embedding)
 
         result = await self._retry_with_exponential_backoff(_create)
 
         elapsed = (datetime.now() - start_time).total_seconds()
-        if result:
+        if result is not None:
             logger.info(f"[EmbeddingService] ✅ 임베딩 생성 완료 ({elapsed:.2f}초) - 차원: {len(result)}")
         else:
             logger.error(f"[EmbeddingService] ❌ 임베딩 생성 실패 ({elapsed:.2f}초)")
 
         return result
 
+    def _dimension_params(self) -> Dict[str, Any]:
+        """embeddings.create 차원 파라미터 (축소 가능한 모델만)"""
+        if self.EMBEDDING_MODEL.startswith(self.REDUCIBLE_MODEL_PREFIX):
+            return {"dimensions": self.EMBEDDING_DIMENSIONS}
+        return {}
+
+    def embedding_metadata(self) -> Dict[str, Any]:
+        """청크 metadata에 기록할 임베딩 모델/차원 (재임베딩 대상 판별용)"""
+        return {
+            "embedding_model": self.EMBEDDING_MODEL,
+            "embedding_dimensions": self.EMBEDDING_DIMENSIONS,
+        }
+
+    def _truncate_for_embedding(self, text: str) -> str:
+        """입력 길이 제한 (문자 8000 + 모델 입력 토큰 한도)"""
+        text = text[:8000]
+        if self._encoding:
+            tokens = self._encoding.encode(text)
+            if len(tokens) > MAX_TOKENS_PER_INPUT:
+                logger.warning(
+                    f"[EmbeddingService] ⚠️ 입력 truncation: {len(tokens)} → {MAX_TOKENS_PER_INPUT} tokens"
+                )
+                text = self._encoding.decode(tokens[:MAX_TOKENS_PER_INPUT])
+        return text
+
+    async def _request_embeddings(self, inputs: List[str]) -> Optional[List[Optional[EmbeddingVector]]]:
+        """embeddings.create 1회 (재시도 포함), 입력 순서대로 반환. 모든 재시도 실패 시 None"""
+        async def _create_batch():
+            return await self.client.embeddings.create(
+                model=self.EMBEDDING_MODEL,
+                input=inputs,
+                encoding_format="base64",
+                **self._dimension_params(),
+            )
+
+        response = await self._retry_with_exponential_backoff(_create_batch)
+        if not response:
+            return None
+
+        # 인덱스 순서대로 정렬
+        embeddings = [None] * len(inputs)
+        for item in response.data:
+            embeddings[item.index] = as_float32(item.embedding)
+        return embeddings
+
+    def _get_batcher(self) -> EmbeddingBatcher:
+        """현재 이벤트 루프용 배처 (asyncio 객체는 루프에 바인딩되므로 루프별 1개)"""
+        loop = asyncio.get_running_loop()
+        batcher = self._batchers.get(loop)
+        if batcher is None:
+            batcher = EmbeddingBatcher(
+                send_batch=self._request_embeddings,
+                count_tokens=self._count_tokens,
+                window_ms=settings.EMBEDDING_BATCH_WINDOW_MS,
+                max_batch_inputs=settings.EMBEDDING_BATCH_MAX_INPUTS,
+                max_batch_tokens=settings.EMBEDDING_BATCH_MAX_TOKENS,
+                tokens_per_minute=settings.EMBEDDING_TOKENS_PER_MINUTE,
+                max_concurrent_requests=settings.EMBEDDING_MAX_CONCURRENT_REQUESTS,
+            )
+            self._batchers[loop] = batcher
+        return batcher
+
+    def get_batcher_stats(self) -> Dict[str, Any]:
+        """루프별 배처 메트릭 (배치 채움률 등)"""
+        return {
+            "enabled": settings.USE_EMBEDDING_BATCHER,
+            "batchers": [batcher.get_stats() for batcher in list(self._batchers.values())],
+        }
+
     async def create_embeddings_batch(
         self,
-        texts: List[str]
-    ) -> List[Optional[List[float]]]:
-        """배치 임베딩 생성"""
+        texts: List[str],
+        stats: Optional[Dict[str, int]] = None
+    ) -> List[Optional[EmbeddingVector]]:
+        """
+        배치 임베딩 생성
+
+        USE_EMBEDDING_CACHE가 켜져 있으면 캐시 miss인 텍스트만 API로 전송합니다.
+        USE_EMBEDDING_BATCHER가 켜져 있으면 다른 후보자의 요청과 병합되어 전송됩니다.
+
+        Args:
+            texts: 임베딩할 텍스트 목록
+            stats: 전달 시 캐시 적중 수(cache_hits / cache_misses)를 누적
+        """
         if not self.client:
             logger.error("[EmbeddingService] ❌ OpenAI 클라이언트 미초기화 - 배치 임베딩 불가")
             return [None] * len(texts)
@@ -284,33 +385,63 @@ class EmbeddingService:
 
         try:
             # 텍스트 길이 제한
-            truncated = [t[:8000] for t in texts]
-
-            logger.info(f"[EmbeddingService] OpenAI embeddings.create 호출 중...")
-
-            async def _create_batch():
-                return await self.client.embeddings.create(
-                    model=self.EMBEDDING_MODEL,
-                    input=truncated
+            truncated = [self._truncate_for_embedding(t) for t in texts]
+            embeddings: List[Optional[EmbeddingVector]] = [None] * len(truncated)
+
+            # 캐시 조회 (키는 truncation 이후 실제 API 입력 기준)
+            cache = get_embedding_cache() if settings.USE_EMBEDDING_CACHE else None
+            keys: List[str] = []
+            if cache:
+                keys = [
+                    build_embedding_key(self.EMBEDDING_MODEL, self.EMBEDDING_DIMENSIONS, t)
+                    for t in truncated
+                ]
+                # 동기 Redis 호출 → 이벤트 루프를 막지 않도록 스레드에서 실행
+                embeddings = await asyncio.to_thread(cache.get_many, keys)
+
+            # miss 텍스트만 중복 제거 후 전송
+            miss_positions: Dict[str, List[int]] = {}
+            for i, (text, embedding) in enumerate(zip(truncated, embeddings)):
+                if embedding is None:
+                    miss_positions.setdefault(text, []).append(i)
+
+            hits = len(truncated) - sum(len(p) for p in miss_positions.values())
+            if stats is not None:
+                stats["cache_hits"] = stats.get("cache_hits", 0) + hits
+                stats["cache_misses"] = stats.get("cache_misses", 0) + len(truncated) - hits
+            if cache:
+                logger.info(
+                    f"[EmbeddingService] 임베딩 캐시: {hits}/{len(truncated)} hit "
+                    f"→ API 요청 {len(miss_positions)}개"
                 )
 
-            response = await self._retry_with_exponential_backoff(_create_batch)
-
-            if not response:
-                logger.error("[EmbeddingService] ❌ 배치 임베딩 생성 실패 (모든 재시도 실패)")
-                return [None] * len(texts)
+            if miss_positions:
+                miss_texts = list(miss_positions.keys())
+                if settings.USE_EMBEDDING_BATCHER:
+                    fetched = await self._get_batcher().embed(miss_texts)
+                else:
+                    logger.info(f"[EmbeddingService] OpenAI embeddings.create 호출 중...")
+                    fetched = await self._request_embeddings(miss_texts)
+                    if fetched is None:
+                        logger.error("[EmbeddingService] ❌ 배치 임베딩 생성 실패 (모든 재시도 실패)")
+                        fetched = [None] * len(miss_texts)
+
+                to_cache: Dict[str, EmbeddingVector] = {}
+                for text, embedding in zip(miss_texts, fetched):
+                    if embedding is None:
+                        continue
+                    for i in miss_positions[text]:
+                        embeddings[i] = embedding
+                    if cache:
+                        to_cache[keys[miss_positions[text][0]]] = embedding
+                if cache and to_cache:
+                    await asyncio.to_thread(cache.set_many, to_cache)
 
             elapsed = (datetime.now() - start_time).total_seconds()
-            logger.info(f"[EmbeddingService] ✅ 배치 임베딩 생성 완료 ({elapsed:.2f}초)")
-
-            # 인덱스 순서대로 정렬
-            embeddings = [None] * len(texts)
-            for item in response.data:
-                embeddings[item.index] = item.embedding
-                logger.debug(f"[EmbeddingService]   임베딩 {item.index+1}: 차원 {len(item.embedding)}")
-
             success_count = sum(1 for e in embeddings if e is not None)
-            logger.info(f"[EmbeddingService] ✅ 배치 결과: {success_count}/{len(texts)} 성공")
+            logger.info(
+                f"[EmbeddingService] ✅ 배치 결과: {success_count}/{len(texts)} 성공 ({elapsed:.2f}초)"
+            )
 
             return embeddings
 
@@ -370,6 +501,7 @@ class EmbeddingService:
             embedded_count = 0
             failed_count = 0
             warnings = []
+            cache_stats: Dict[str, int] = {}
 
             if generate_embeddings:
                 if not self.client:
@@ -378,7 +510,7 @@ class EmbeddingService:
                 else:
                     logger.info("[EmbeddingService] Step 2: 배치 임베딩 생성")
                     texts = [c.content for c in chunks]
-                    embeddings = await self.create_embeddings_batch(texts)
+                    embeddings = await self.create_embeddings_batch(texts, stats=cache_stats)
 
                     # 배치 결과 확인
                     failed_indices = []
@@ -394,7 +526,7 @@ class EmbeddingService:
                         logger.info(f"[EmbeddingService] Step 2-1: 실패한 {len(failed_indices)}개 청크 개별 재시도")
                         for idx in failed_indices:
                             retry_embedding = await self.create_embedding(chunks[idx].content)
-                            if retry_embedding:
+                            if retry_embedding is not None:
                                 chunks[idx].embedding = retry_embedding
                                 embedded_count += 1
                                 logger.info(f"[EmbeddingService] ✅ 청크 {idx} 재시도 성공")
@@ -404,6 +536,17 @@ class EmbeddingService:
 
                     logger.info(f"[EmbeddingService] ✅ 임베딩 생성 완료: {embedded_count}/{len(chunks)} 성공")
 
+                    embedding_meta = self.embedding_metadata()
+                    for chunk in chunks:
+                        if chunk.embedding is not None:
+                            chunk.metadata.update(embedding_meta)
+                    if cache_stats:
+                        logger.info(
+                            f"[EmbeddingService] 임베딩 캐시 적중률: "
+                            f"{cache_stats['cache_hits']}/{len(texts)} "
+                            f"({cache_stats['cache_hits'] / len(texts):.0%})"
+                        )
+
                     # 부분 실패 경고 추가
                     if failed_count > 0:
                         warning_msg = f"{failed_count}개 청크 임베딩 실패 - 해당 청크는 검색에서 제외됩니다"
@@ -427,6 +570,8 @@ class EmbeddingService:
                 embedded_chunks=embedded_count,
                 failed_chunks=failed_count,
                 warnings=warnings,
+                cache_hits=cache_stats.get("cache_hits", 0),
+                cache_misses=cache_stats.get("cache_misses", 0),
             )
 
         except Exception as e:
@@ -753,7 +898,10 @@ class EmbeddingService:
 
         청킹 전략:
         1. raw_full: 전체 텍스트 (1개, 최대 8000자)
-        2. raw_section: 슬라이딩 윈도우 (N개, 한글 최적화 적용)
+        2. raw_section: 섹션/문장 경계 기반 청크 (N개, SemanticChunker)
+           - 작은 섹션끼리 RAW_SECTION_TARGET_TOKENS까지 패킹
+           - 큰 섹션만 줄/문장 경계로 분할, 조각 사이 최대 RAW_SECTION_OVERLAP_TOKENS 오버랩
+           - 경계가 없는 텍스트는 문자 윈도우 (CHUNK_SIZE, OVERLAP)
 
         P1 이슈 해결:
         - 한글 텍스트 최적화: 한글 50% 이상 → CHUNK_SIZE=2000, OVERLAP=500
@@ -798,8 +946,8 @@ class EmbeddingService:
         ))
 
         # ─────────────────────────────────────────────────
-        # 2. raw_section: 슬라이딩 윈도우 청킹
-        #    - P1 이슈 해결: 한글 최적화
+        # 2. raw_section: 섹션/문장 경계 청킹
+        #    - P1 이슈 해결: 한글 최적화 (최대 문자 수 / 윈도우)
         # ─────────────────────────────────────────────────
 
         # 한글 우세 여부 확인
@@ -813,28 +961,35 @@ class EmbeddingService:
             chunk_size = cfg.RAW_SECTION_CHUNK_SIZE
             overlap = cfg.RAW_SECTION_OVERLAP
 
-        min_chunk_length = cfg.RAW_SECTION_MIN_LENGTH
-
-        # chunk_size 이상일 때만 섹션 분할
+        # chunk_size 이상일 때만 섹션 분할 (이하이면 raw_full로 충분)
         if len(raw_text) > chunk_size:
-            section_index = 0
-            stride = chunk_size - overlap
-
-            for start in range(0, len(raw_text), stride):
-                section = raw_text[start:start + chunk_size]
+            chunker = SemanticChunker(
+                count_tokens=self._count_tokens,
+                target_tokens=cfg.RAW_SECTION_TARGET_TOKENS,
+                max_chars=chunk_size,
+                overlap_tokens=cfg.RAW_SECTION_OVERLAP_TOKENS,
+                min_chars=cfg.RAW_SECTION_MIN_LENGTH,
+                window_overlap_chars=overlap,
+            )
 
+            section_index = 0
+            for text_chunk in chunker.chunk(raw_text):
                 # 최소 길이 체크
-                if len(section.strip()) < min_chunk_length:
+                if len(text_chunk.text.strip()) < cfg.RAW_SECTION_MIN_LENGTH:
                     continue
 
                 chunks.append(Chunk(
                     chunk_type=ChunkType.RAW_SECTION,
                     chunk_index=section_index,
-                    content=section,
+                    content=text_chunk.text,
                     metadata={
-                        "start_pos": start,
-                        "end_pos": min(start + chunk_size, len(raw_text)),
-                        "section_length": len(section),
+                        "start_pos": text_chunk.start_pos,
+                        "end_pos": text_chunk.end_pos,
+                        "section_length": len(text_chunk.text),
+                        "section_labels": text_chunk.section_labels,
+                        "token_count": text_chunk.tokens,
+                        "is_split": text_chunk.is_split,
+                        "overlap_chars": text_chunk.overlap_chars,
                         "is_korean_optimized": is_korean
                     }
                 ))
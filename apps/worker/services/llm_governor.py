@@ -0,0 +1,429 @@
+"""
+LLM Rate Governor - 프로바이더/모델별 동시성 및 레이트 리밋 제어
+
+병렬 분석, CrossValidationEngine, ValidationAgentWrapper가 같은 순간에 LLM을
+동시에 호출하면 429가 발생하고, 느린 재시도나 DLQ로 이어집니다.
+프로바이더+모델마다 거버너 1개를 두고 모든 LLM 호출이 슬롯을 받은 뒤 실행되도록 합니다.
+
+- AIMD 동시성: 성공 시 한도 +1/limit (윈도우당 약 +1), 429 시 한도 절반 + 쿨다운
+- 분당 요청/토큰 예산 (60초 슬라이딩 윈도우, 설정값 또는 응답 헤더의 limit 값)
+- 응답 헤더(x-ratelimit-*, anthropic-ratelimit-*, retry-after)로 남은 한도 추적
+- Job 간 공정 큐: Job별 대기열을 라운드 로빈으로 처리 (한 Job의 대량 호출이 독점하지 않음)
+- 대기 시간 메트릭 (get_stats)
+
+상태(동시성 한도, 예산, 쿨다운)는 프로세스 메모리에만 있으므로 Job 사이에 살아 있는
+장수 프로세스에서만 사용합니다 (enable_llm_governor 호출: FastAPI, async 워커,
+SimpleWorker(WORKER_REUSE_PROCESS)). 기본 RQ Worker는 Job마다 work-horse를 fork하므로
+학습한 한도와 쿨다운이 매 Job 초기화되어 의미가 없고, 이 경우 거버너 없이 호출합니다.
+프로세스(컨테이너) 간 예산 공유는 하지 않습니다.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Deque, Dict, Mapping, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RATE_WINDOW_SECONDS = 60.0
+
+# 장수 프로세스 표시 (fork된 RQ work-horse에서는 False로 남음)
+_process_enabled = False
+
+# 공정 큐 키 (Job ID) - 파이프라인 시작 시 set_llm_job()으로 설정, 하위 태스크에 전파됨
+_current_job: ContextVar[Optional[str]] = ContextVar("llm_governor_job", default=None)
+# 현재 태스크가 보유한 슬롯 (HTTP 응답 훅에서 헤더 반영용)
+_current_slot: ContextVar[Optional["GovernorSlot"]] = ContextVar("llm_governor_slot", default=None)
+
+_HEADERS = {
+    "limit_requests": ("x-ratelimit-limit-requests", "anthropic-ratelimit-requests-limit"),
+    "limit_tokens": ("x-ratelimit-limit-tokens", "anthropic-ratelimit-tokens-limit"),
+    "remaining_requests": ("x-ratelimit-remaining-requests", "anthropic-ratelimit-requests-remaining"),
+    "remaining_tokens": ("x-ratelimit-remaining-tokens", "anthropic-ratelimit-tokens-remaining"),
+    "reset_requests": ("x-ratelimit-reset-requests", "anthropic-ratelimit-requests-reset"),
+    "reset_tokens": ("x-ratelimit-reset-tokens", "anthropic-ratelimit-tokens-reset"),
+}
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def enable_llm_governor() -> None:
+    """
+    현재 프로세스에서 거버너 사용 허용
+
+    Job이 끝나도 살아 있는 장수 프로세스의 진입점에서만 호출합니다
+    (FastAPI lifespan, async 워커, SimpleWorker). fork 모드 RQ Worker에서는 호출하지 않습니다.
+    """
+    global _process_enabled
+    _process_enabled = True
+
+
+def is_llm_governor_enabled() -> bool:
+    """현재 프로세스에서 거버너를 사용할 수 있는지 여부"""
+    return _process_enabled
+
+
+def set_llm_job(job_id: Optional[str]) -> Token:
+    """현재 태스크(및 이후 생성되는 하위 태스크)의 LLM 호출을 job_id 대기열로 묶음"""
+    return _current_job.set(job_id)
+
+
+def reset_llm_job(token: Token) -> None:
+    _current_job.reset(token)
+
+
+async def run_in_llm_job(job_id: Optional[str], awaitable: Awaitable[T]) -> T:
+    """동기 진입점(run_sync)용: awaitable 실행 동안 job_id 대기열 사용"""
+    token = set_llm_job(job_id)
+    try:
+        return await awaitable
+    finally:
+        reset_llm_job(token)
+
+
+def parse_reset_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    리셋 헤더 값 → 남은 초
+
+    OpenAI: "1s", "6m0s", "20ms" / Anthropic: RFC 3339 시각 / retry-after: 초
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max((reset_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _header(headers: Mapping[str, str], key: str) -> Optional[str]:
+    for name in _HEADERS[key]:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+def _header_int(headers: Mapping[str, str], key: str) -> Optional[int]:
+    value = _header(headers, key)
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """retry-after-ms / retry-after 헤더 → 초"""
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    return parse_reset_seconds(headers.get("retry-after"))
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """OpenAI/Anthropic(status_code) 및 Gemini(code)의 429 판별"""
+    return getattr(error, "status_code", None) == 429 or getattr(error, "code", None) == 429
+
+
+def error_headers(error: BaseException) -> Optional[Mapping[str, str]]:
+    response = getattr(error, "response", None)
+    return getattr(response, "headers", None)
+
+
+async def observe_http_response(response) -> None:
+    """
+    httpx response 훅 - 현재 슬롯의 거버너에 레이트 리밋 헤더 반영
+
+    SDK 내부 재시도 응답도 모두 전달되므로 재시도 중 발생한 429도 반영됩니다.
+    """
+    slot = _current_slot.get()
+    if slot is not None:
+        slot.observe(response.status_code, response.headers)
+
+
+def rate_limit_event_hooks() -> Dict[str, Any]:
+    """AsyncOpenAI / AsyncAnthropic http_client용 event_hooks"""
+    return {"response": [observe_http_response]}
+
+
+@dataclass
+class _Waiter:
+    tokens: int
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class GovernorSlot:
+    """거버너에서 받은 실행 슬롯 (호출 1건)"""
+
+    def __init__(self, governor: "LLMRateGovernor", tokens: int, queue_wait: float):
+        self.governor = governor
+        self.tokens = tokens
+        self.queue_wait = queue_wait
+        self.rate_limited = False
+        self.retry_after: Optional[float] = None
+
+    def observe(self, status_code: int, headers: Optional[Mapping[str, str]]) -> None:
+        if headers:
+            self.governor.observe_headers(headers)
+        if status_code == 429:
+            self.mark_rate_limited(headers)
+
+    def mark_rate_limited(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        self.rate_limited = True
+        retry_after = retry_after_seconds(headers)
+        if retry_after is not None:
+            self.retry_after = retry_after
+
+
+class LLMRateGovernor:
+    """
+    프로바이더+모델 단위 거버너 (이벤트 루프별 인스턴스)
+
+    async with governor.slot(tokens) as slot: 안에서 LLM을 호출합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        cooldown_seconds: float = 2.0,
+    ):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.limit = float(self.max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.cooldown_seconds = cooldown_seconds
+
+        # 응답 헤더에서 관측한 값 (설정값이 0이면 예산으로 사용)
+        self.observed: Dict[str, Optional[int]] = {
+            "limit_requests": None,
+            "limit_tokens": None,
+            "remaining_requests": None,
+            "remaining_tokens": None,
+        }
+
+        self._in_flight = 0
+        self._queues: "OrderedDict[Optional[str], Deque[_Waiter]]" = OrderedDict()
+        self._request_log: Deque[float] = deque()
+        self._token_log: Deque[Tuple[float, int]] = deque()
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+        self.stats: Dict[str, Any] = {
+            "requests": 0,
+            "rate_limited": 0,
+            "queued_requests": 0,
+            "queue_wait_seconds": 0.0,
+            "max_queue_wait_seconds": 0.0,
+        }
+
+    # ─────────────────────────────────────────────────
+    # 호출자 API
+    # ─────────────────────────────────────────────────
+
+    @asynccontextmanager
+    async def slot(self, tokens: int) -> AsyncIterator[GovernorSlot]:
+        """슬롯 획득 → 호출 → 반납 (429 여부에 따라 동시성 한도 조정)"""
+        queue_wait = await self._acquire(tokens)
+        slot = GovernorSlot(self, tokens, queue_wait)
+        slot_token = _current_slot.set(slot)
+        try:
+            yield slot
+        except Exception as e:
+            if is_rate_limit_error(e):
+                slot.mark_rate_limited(error_headers(e))
+            raise
+        finally:
+            _current_slot.reset(slot_token)
+            self._release(slot)
+
+    def observe_headers(self, headers: Mapping[str, str]) -> None:
+        """응답 헤더의 한도/잔여량 반영 (잔여 0이면 리셋 시각까지 차단)"""
+        for key in self.observed:
+            value = _header_int(headers, key)
+            if value is not None:
+                self.observed[key] = value
+
+        now = time.monotonic()
+        for remaining_key, reset_key in (("remaining_requests", "reset_requests"), ("remaining_tokens", "reset_tokens")):
+            remaining = _header_int(headers, remaining_key)
+            if remaining is not None and remaining <= 0:
+                reset = parse_reset_seconds(_header(headers, reset_key))
+                self._block(now, reset if reset is not None else self.cooldown_seconds)
+
+    # ─────────────────────────────────────────────────
+    # 슬롯 관리
+    # ─────────────────────────────────────────────────
+
+    async def _acquire(self, tokens: int) -> float:
+        waiter = _Waiter(tokens=tokens, future=asyncio.get_running_loop().create_future(), enqueued_at=time.monotonic())
+        job = _current_job.get()
+        self._queues.setdefault(job, deque()).append(waiter)
+        self._dispatch()
+
+        if not waiter.future.done():
+            self.stats["queued_requests"] += 1
+        try:
+            queue_wait = await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 슬롯 부여 직후 취소 → 반납
+                self._in_flight -= 1
+                self._dispatch()
+            else:
+                self._remove(job, waiter)
+            raise
+
+        self.stats["queue_wait_seconds"] += queue_wait
+        self.stats["max_queue_wait_seconds"] = max(self.stats["max_queue_wait_seconds"], queue_wait)
+        if queue_wait >= 1.0:
+            logger.info(f"[LLMGovernor] {self.name} 대기 {queue_wait:.2f}초 (limit={int(self.limit)})")
+        return queue_wait
+
+    def _release(self, slot: GovernorSlot) -> None:
+        self._in_flight -= 1
+        now = time.monotonic()
+
+        if slot.rate_limited:
+            self.stats["rate_limited"] += 1
+            # 동시에 받은 429들로 연속 감소하지 않도록 쿨다운당 1회만 절반
+            if now - self._last_decrease >= self.cooldown_seconds:
+                self.limit = max(float(self.min_concurrency), self.limit / 2)
+                self._last_decrease = now
+            self._block(now, slot.retry_after if slot.retry_after is not None else self.cooldown_seconds)
+            logger.warning(
+                f"[LLMGovernor] {self.name} 429 → limit={int(self.limit)}, "
+                f"{self._blocked_until - now:.1f}초 대기"
+            )
+        else:
+            self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+
+        self._dispatch()
+
+    def _remove(self, job: Optional[str], waiter: _Waiter) -> None:
+        queue = self._queues.get(job)
+        if queue is None:
+            return
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            return
+        if not queue:
+            del self._queues[job]
+
+    def _dispatch(self) -> None:
+        """대기열 처리: Job 라운드 로빈, 동시성 한도 + 분당 예산 + 차단 시각 확인"""
+        now = time.monotonic()
+        while self._queues and self._in_flight < int(self.limit):
+            job, queue = next(iter(self._queues.items()))
+            waiter = queue[0]
+
+            delay = self._admission_delay(waiter.tokens, now)
+            if delay > 0:
+                self._schedule_wakeup(delay)
+                return
+
+            queue.popleft()
+            del self._queues[job]
+            if queue:
+                self._queues[job] = queue  # 다음 Job에 차례 넘김
+            if waiter.future.done():
+                continue
+
+            self._in_flight += 1
+            self._request_log.append(now)
+            self._token_log.append((now, waiter.tokens))
+            self.stats["requests"] += 1
+            waiter.future.set_result(now - waiter.enqueued_at)
+
+    def _admission_delay(self, tokens: int, now: float) -> float:
+        """지금 보내면 안 되는 경우 대기해야 할 초"""
+        if now < self._blocked_until:
+            return self._blocked_until - now
+
+        while self._request_log and now - self._request_log[0] >= RATE_WINDOW_SECONDS:
+            self._request_log.popleft()
+        while self._token_log and now - self._token_log[0][0] >= RATE_WINDOW_SECONDS:
+            self._token_log.popleft()
+
+        rpm = self.requests_per_minute or self.observed["limit_requests"] or 0
+        if rpm and len(self._request_log) >= rpm:
+            return RATE_WINDOW_SECONDS - (now - self._request_log[0])
+
+        tpm = self.tokens_per_minute or self.observed["limit_tokens"] or 0
+        if tpm and self._token_log:
+            used = sum(t for _, t in self._token_log)
+            # 단일 요청이 예산보다 크면 윈도우가 빌 때까지만 대기
+            if used + tokens > tpm:
+                return RATE_WINDOW_SECONDS - (now - self._token_log[0][0])
+
+        return 0.0
+
+    def _block(self, now: float, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, now + max(seconds, 0.0))
+
+    def _schedule_wakeup(self, delay: float) -> None:
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        self._wakeup = asyncio.get_running_loop().call_later(max(delay, 0.01), self._on_wakeup)
+
+    def _on_wakeup(self) -> None:
+        self._wakeup = None
+        self._dispatch()
+
+    # ─────────────────────────────────────────────────
+    # 메트릭
+    # ─────────────────────────────────────────────────
+
+    def get_stats(self) -> Dict[str, Any]:
+        requests = self.stats["requests"]
+        return {
+            "name": self.name,
+            "limit": int(self.limit),
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "queued": sum(len(q) for q in self._queues.values()),
+            "queued_jobs": len(self._queues),
+            "requests": requests,
+            "rate_limited": self.stats["rate_limited"],
+            "queued_requests": self.stats["queued_requests"],
+            "queue_wait_seconds": round(self.stats["queue_wait_seconds"], 3),
+            "avg_queue_wait_ms": round(self.stats["queue_wait_seconds"] * 1000 / requests, 2) if requests else 0.0,
+            "max_queue_wait_ms": round(self.stats["max_queue_wait_seconds"] * 1000, 2),
+            "requests_per_minute": self.requests_per_minute or self.observed["limit_requests"] or 0,
+            "tokens_per_minute": self.tokens_per_minute or self.observed["limit_tokens"] or 0,
+            "remaining_requests": self.observed["remaining_requests"],
+            "remaining_tokens": self.observed["remaining_tokens"],
+        }
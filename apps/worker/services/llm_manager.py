@@ -7,9 +7,12 @@ Structured Outputs 및 JSON 응답 지원
 
 import json
 import re
+import time
 import asyncio
+import inspect
 import traceback
-from typing import Dict, Any, Optional, List, Type
+from typing import Dict, Any, Optional, List, Type, Callable, Tuple, Union, AsyncIterator
+from contextlib import asynccontextmanager
 from enum import Enum
 from dataclasses import dataclass
 import logging
@@ -21,6 +24,12 @@ from google.genai import types as genai_types
 from anthropic import AsyncAnthropic
 
 from config import get_settings
+from utils.streaming_json import StreamingJSONFieldParser
+from utils.prompt_layout import split_static_prefix, prefix_cache_key
+from services.prompt_cache_registry import PromptCacheRegistry
+from services.llm_governor import (
+    LLMRateGovernor, GovernorSlot, is_llm_governor_enabled, rate_limit_event_hooks
+)
 
 # 로깅 설정 - 상세 출력
 logging.basicConfig(level=logging.DEBUG)
@@ -31,6 +40,9 @@ settings = get_settings()
 LLM_TIMEOUT_SECONDS = 120  # 2분 (이력서 분석은 시간이 걸릴 수 있음)
 LLM_CONNECT_TIMEOUT = 10   # 연결 타임아웃
 
+# 다른 프로세스가 Gemini cached content를 생성 중일 때 캐싱 없이 보내고 다시 조회하기까지의 시간 (초)
+GEMINI_CACHE_CLAIM_WAIT_SECONDS = 10.0
+
 
 class LLMProvider(str, Enum):
     """지원하는 LLM 제공자"""
@@ -63,6 +75,8 @@ class LLMManager:
     - Gemini JSON 모드
     - Claude JSON 응답
     - 자동 재시도 및 폴백
+    - 프로바이더/모델별 동시성·레이트 리밋 거버너 (services/llm_governor.py)
+    - 정적 프리픽스(선두 system 메시지) 프롬프트 캐싱 (utils/prompt_layout.py)
     """
 
     def __init__(self):
@@ -76,9 +90,12 @@ class LLMManager:
         if openai_key:
             try:
                 from httpx import Timeout
+                from openai import DefaultAsyncHttpxClient
                 self.openai_client = AsyncOpenAI(
                     api_key=openai_key,
-                    timeout=Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT)
+                    timeout=Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT),
+                    # 응답 헤더(x-ratelimit-*)를 거버너에 반영
+                    http_client=DefaultAsyncHttpxClient(event_hooks=rate_limit_event_hooks()),
                 )
                 logger.info(f"[LLMManager] ✅ OpenAI 클라이언트 초기화 성공 (key: {openai_key[:8]}..., timeout: {LLM_TIMEOUT_SECONDS}s)")
             except Exception as e:
@@ -88,12 +105,16 @@ class LLMManager:
             logger.warning("[LLMManager] ⚠️ OPENAI_API_KEY 없음")
 
         # Gemini 클라이언트 (새 google-genai 패키지)
+        # 호출은 네이티브 async 클라이언트(client.aio)로 수행 - 스레드풀 미사용, 타임아웃 시 실제 취소
         self.gemini_client: Optional[genai.Client] = None
         gemini_key = settings.GOOGLE_AI_API_KEY
         if gemini_key:
             try:
-                self.gemini_client = genai.Client(api_key=gemini_key)
-                logger.info(f"[LLMManager] ✅ Gemini 클라이언트 초기화 성공 (key: {gemini_key[:8]}...)")
+                self.gemini_client = genai.Client(
+                    api_key=gemini_key,
+                    http_options=genai_types.HttpOptions(timeout=LLM_TIMEOUT_SECONDS * 1000),  # ms
+                )
+                logger.info(f"[LLMManager] ✅ Gemini 클라이언트 초기화 성공 (key: {gemini_key[:8]}..., timeout: {LLM_TIMEOUT_SECONDS}s)")
             except Exception as e:
                 logger.error(f"[LLMManager] ❌ Gemini 클라이언트 초기화 실패: {e}")
                 logger.error(traceback.format_exc())
@@ -106,9 +127,12 @@ class LLMManager:
         if anthropic_key:
             try:
                 from httpx import Timeout
+                from anthropic import DefaultAsyncHttpxClient
                 self.anthropic_client = AsyncAnthropic(
                     api_key=anthropic_key,
-                    timeout=Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT)
+                    timeout=Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT),
+                    # 응답 헤더(anthropic-ratelimit-*)를 거버너에 반영
+                    http_client=DefaultAsyncHttpxClient(event_hooks=rate_limit_event_hooks()),
                 )
                 logger.info(f"[LLMManager] ✅ Claude 클라이언트 초기화 성공 (key: {anthropic_key[:8]}..., timeout: {LLM_TIMEOUT_SECONDS}s)")
             except Exception as e:
@@ -117,6 +141,22 @@ class LLMManager:
         else:
             logger.warning("[LLMManager] ⚠️ ANTHROPIC_API_KEY 없음")
 
+        # Gemini 동시 호출 상한 (이벤트 루프별 세마포어)
+        self.gemini_max_concurrency = settings.GEMINI_MAX_CONCURRENCY
+        self._gemini_semaphore: Optional[asyncio.Semaphore] = None
+        self._gemini_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 프로바이더/모델별 거버너 (이벤트 루프별 인스턴스)
+        self.use_governor = settings.USE_LLM_GOVERNOR
+        self._governors: Dict[Tuple[asyncio.AbstractEventLoop, LLMProvider, str], LLMRateGovernor] = {}
+
+        # 프롬프트 캐싱 - Gemini cached content: (모델, 프리픽스 키) → (캐시 이름 또는 None, 만료 시각)
+        self.use_prompt_caching = settings.USE_PROMPT_CACHING
+        self._gemini_caches: Dict[Tuple[str, str], Tuple[Optional[str], float]] = {}
+        self._gemini_cache_pending: Dict[Tuple[asyncio.AbstractEventLoop, str, str], asyncio.Future] = {}
+        # 캐시 이름은 Redis로 프로세스 간 공유 (fork된 work-horse마다 새로 만들지 않도록)
+        self.gemini_cache_registry = PromptCacheRegistry(settings.REDIS_URL)
+
         # 기본 모델 설정
         self.models = {
             LLMProvider.OPENAI: "gpt-4o",
@@ -180,16 +220,18 @@ class LLMManager:
             logger.info(f"[LLMManager] OpenAI API 호출 시작 - model: {model_name}")
             logger.debug(f"[LLMManager] 메시지 길이: {sum(len(m.get('content', '')) for m in messages)} chars")
 
-            response = await self.openai_client.chat.completions.create(
-                model=model_name,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": json_schema
-                }
-            )
+            async with self._llm_slot(LLMProvider.OPENAI, model_name, messages, max_tokens):
+                response = await self.openai_client.chat.completions.create(
+                    model=model_name,
+                    messages=messages,
+                    **self._openai_cache_kwargs(messages),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": json_schema
+                    }
+                )
 
             elapsed = (datetime.now() - start_time).total_seconds()
             raw_content = response.choices[0].message.content or ""
@@ -204,11 +246,7 @@ class LLMManager:
                 content=parsed_content,
                 raw_response=raw_content,
                 model=model_name,
-                usage={
-                    "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-                    "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-                    "total_tokens": response.usage.total_tokens if response.usage else 0,
-                }
+                usage=self._openai_usage(response.usage)
             )
 
         except json.JSONDecodeError as e:
@@ -234,6 +272,129 @@ class LLMManager:
                 error=str(e)
             )
 
+    async def call_with_structured_output_stream(
+        self,
+        provider: LLMProvider,
+        messages: List[Dict[str, str]],
+        json_schema: Dict[str, Any],
+        early_fields: List[str],
+        on_early_fields: Callable[[Dict[str, Any]], Any],
+        model: Optional[str] = None,
+        temperature: float = 0.1,
+        max_tokens: int = 4096,
+    ) -> LLMResponse:
+        """
+        Structured Output 스트리밍 호출 (OpenAI 전용)
+
+        토큰 스트림을 점진적으로 파싱하여 early_fields가 모두 완성되거나
+        첫 배열/객체 필드(careers 등)가 시작되면 on_early_fields를 1회 호출.
+        최종 결과는 call_with_structured_output과 동일한 LLMResponse.
+
+        Args:
+            early_fields: 먼저 전달할 최상위 필드 (스키마 앞쪽에 위치해야 효과적)
+            on_early_fields: {field: value} 콜백 (sync/async 모두 가능, 예외는 무시)
+        """
+        if provider != LLMProvider.OPENAI or not self.openai_client:
+            # 스트리밍 미지원 → 기존 경로 (조기 필드 없음)
+            return await self.call_with_structured_output(
+                provider=provider,
+                messages=messages,
+                json_schema=json_schema,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+
+        start_time = datetime.now()
+        model_name = model or self.models[provider]
+        parser = StreamingJSONFieldParser()
+        early_sent = False
+        usage = None
+        logger.info(f"[LLMManager] call_with_structured_output_stream 시작 - model: {model_name}")
+
+        try:
+            async with self._llm_slot(provider, model_name, messages, max_tokens):
+                stream = await self.openai_client.chat.completions.create(
+                    model=model_name,
+                    messages=messages,
+                    **self._openai_cache_kwargs(messages),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": json_schema
+                    },
+                    stream=True,
+                    stream_options={"include_usage": True},
+                )
+
+                async for chunk in stream:
+                    if chunk.usage:
+                        usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+
+                    parser.feed(delta)
+                    if early_sent:
+                        continue
+
+                    found = {f: parser.fields[f] for f in early_fields if f in parser.fields}
+                    if len(found) == len(early_fields) or (found and parser.streaming_container):
+                        early_sent = True
+                        elapsed = (datetime.now() - start_time).total_seconds()
+                        logger.info(f"[LLMManager] ⚡ 조기 필드 수신 - {elapsed:.2f}초, {sorted(found)}")
+                        await self._notify_early_fields(on_early_fields, found)
+
+            raw_content = parser.buffer
+            elapsed = (datetime.now() - start_time).total_seconds()
+            logger.info(f"[LLMManager] ✅ OpenAI 스트림 완료 - {elapsed:.2f}초, {len(raw_content)} chars")
+
+            parsed_content = json.loads(raw_content)
+
+            return LLMResponse(
+                provider=provider,
+                content=parsed_content,
+                raw_response=raw_content,
+                model=model_name,
+                usage=self._openai_usage(usage)
+            )
+
+        except json.JSONDecodeError as e:
+            logger.error(f"[LLMManager] ❌ OpenAI 스트림 JSON 파싱 실패: {e}")
+            return LLMResponse(
+                provider=provider,
+                content=None,
+                raw_response=parser.buffer,
+                model=model_name,
+                error=f"JSON parse error: {str(e)}"
+            )
+        except Exception as e:
+            elapsed = (datetime.now() - start_time).total_seconds()
+            logger.error(f"[LLMManager] ❌ OpenAI 스트림 오류 ({elapsed:.2f}초): {type(e).__name__}: {e}")
+            return LLMResponse(
+                provider=provider,
+                content=None,
+                raw_response="",
+                model=model_name,
+                error=str(e)
+            )
+
+    async def _notify_early_fields(
+        self,
+        callback: Callable[[Dict[str, Any]], Any],
+        fields: Dict[str, Any],
+    ) -> None:
+        """조기 필드 콜백 실행 (실패해도 스트림은 계속)"""
+        try:
+            result = callback(fields)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning(f"[LLMManager] 조기 필드 콜백 실패 (무시): {e}")
+
     async def call_json(
         self,
         provider: LLMProvider,
@@ -293,13 +454,15 @@ class LLMManager:
         try:
             model_name = model or self.models[LLMProvider.OPENAI]
 
-            response = await self.openai_client.chat.completions.create(
-                model=model_name,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                response_format={"type": "json_object"}
-            )
+            async with self._llm_slot(LLMProvider.OPENAI, model_name, messages, max_tokens):
+                response = await self.openai_client.chat.completions.create(
+                    model=model_name,
+                    messages=messages,
+                    **self._openai_cache_kwargs(messages),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format={"type": "json_object"}
+                )
 
             raw_content = response.choices[0].message.content or ""
             parsed_content = json.loads(raw_content)
@@ -309,11 +472,7 @@ class LLMManager:
                 content=parsed_content,
                 raw_response=raw_content,
                 model=model_name,
-                usage={
-                    "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-                    "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-                    "total_tokens": response.usage.total_tokens if response.usage else 0,
-                }
+                usage=self._openai_usage(response.usage)
             )
 
         except Exception as e:
@@ -352,35 +511,27 @@ class LLMManager:
             model_name = model or self.models[LLMProvider.GEMINI]
             logger.info(f"[LLMManager] Gemini API 호출 - model: {model_name}")
 
-            # OpenAI 메시지 형식을 Gemini 형식으로 변환
-            prompt = self._convert_messages_to_prompt(messages)
-            logger.debug(f"[LLMManager] Gemini 프롬프트 길이: {len(prompt)} chars")
+            # OpenAI 메시지 형식을 Gemini 형식으로 변환 (정적 프리픽스는 cached content로 분리)
+            prompt, cached_content = await self._gemini_prompt(model_name, messages)
+            logger.debug(f"[LLMManager] Gemini 프롬프트 길이: {len(prompt)} chars (cached: {bool(cached_content)})")
 
             # 새 google-genai API 사용
             config = genai_types.GenerateContentConfig(
                 temperature=temperature,
                 max_output_tokens=max_tokens,
                 response_mime_type="application/json",
+                cached_content=cached_content,
             )
 
             logger.info("[LLMManager] Gemini generate_content 호출 중...")
 
-            # google-genai는 동기 API이므로 asyncio.to_thread 사용 (타임아웃 적용)
             try:
-                response = await asyncio.wait_for(
-                    asyncio.to_thread(
-                        self.gemini_client.models.generate_content,
-                        model=model_name,
-                        contents=prompt,
-                        config=config
-                    ),
-                    timeout=LLM_TIMEOUT_SECONDS
-                )
+                response = await self._gemini_generate(model_name, prompt, config)
             except asyncio.TimeoutError:
                 elapsed = (datetime.now() - start_time).total_seconds()
                 logger.error(
-                    f"[LLMManager] ❌ Gemini API 타임아웃 ({LLM_TIMEOUT_SECONDS}초 초과, 실제 {elapsed:.1f}초)\n"
-                    f"⚠️ 주의: API 요청이 이미 전송되어 과금될 수 있습니다.\n"
+                    f"[LLMManager] ❌ Gemini API 타임아웃 ({LLM_TIMEOUT_SECONDS}초 초과, 실제 {elapsed:.1f}초) - 요청 취소됨\n"
+                    f"⚠️ 주의: 서버가 이미 처리를 시작했다면 과금될 수 있습니다.\n"
                     f"   모델: {model_name}, 프롬프트 길이: {len(prompt)} chars"
                 )
                 return LLMResponse(
@@ -388,7 +539,7 @@ class LLMManager:
                     content=None,
                     raw_response="",
                     model=model_name,
-                    error=f"Gemini API timeout after {LLM_TIMEOUT_SECONDS} seconds (request may still be billed)"
+                    error=f"Gemini API timeout after {LLM_TIMEOUT_SECONDS} seconds (request cancelled)"
                 )
 
             elapsed = (datetime.now() - start_time).total_seconds()
@@ -400,14 +551,8 @@ class LLMManager:
             logger.info(f"[LLMManager] ✅ Gemini JSON 파싱 성공 - 필드 수: {len(parsed_content) if isinstance(parsed_content, dict) else 'N/A'}")
 
             # usage_metadata 접근
-            usage = {}
-            if hasattr(response, 'usage_metadata') and response.usage_metadata:
-                usage = {
-                    "prompt_tokens": getattr(response.usage_metadata, 'prompt_token_count', 0),
-                    "completion_tokens": getattr(response.usage_metadata, 'candidates_token_count', 0),
-                    "total_tokens": getattr(response.usage_metadata, 'total_token_count', 0),
-                }
-                logger.debug(f"[LLMManager] Gemini 토큰 사용: {usage}")
+            usage = self._gemini_usage(getattr(response, 'usage_metadata', None))
+            logger.debug(f"[LLMManager] Gemini 토큰 사용: {usage}")
 
             return LLMResponse(
                 provider=LLMProvider.GEMINI,
@@ -440,6 +585,259 @@ class LLMManager:
                 error=str(e)
             )
 
+    def _get_gemini_semaphore(self) -> asyncio.Semaphore:
+        """
+        현재 이벤트 루프용 Gemini 동시성 세마포어 반환
+
+        asyncio.Semaphore는 처음 대기한 루프에 바인딩되므로,
+        루프가 바뀌면(asyncio.run 반복 등) 새로 생성합니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._gemini_semaphore is None or self._gemini_semaphore_loop is not loop:
+            self._gemini_semaphore = asyncio.Semaphore(self.gemini_max_concurrency)
+            self._gemini_semaphore_loop = loop
+        return self._gemini_semaphore
+
+    def _get_governor(self, provider: LLMProvider, model_name: str) -> LLMRateGovernor:
+        """현재 이벤트 루프의 프로바이더+모델 거버너 반환 (없으면 생성)"""
+        key = (asyncio.get_running_loop(), provider, model_name)
+        governor = self._governors.get(key)
+        if governor is None:
+            governor = LLMRateGovernor(
+                name=f"{provider.value}:{model_name}",
+                max_concurrency=settings.LLM_MAX_CONCURRENCY,
+                min_concurrency=settings.LLM_MIN_CONCURRENCY,
+                requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+                tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+                cooldown_seconds=settings.LLM_RATE_LIMIT_COOLDOWN_SECONDS,
+            )
+            self._governors[key] = governor
+        return governor
+
+    @asynccontextmanager
+    async def _llm_slot(
+        self,
+        provider: LLMProvider,
+        model_name: str,
+        prompt: Union[str, List[Dict[str, str]]],
+        max_tokens: int,
+    ) -> AsyncIterator[Optional[GovernorSlot]]:
+        """
+        LLM 호출 슬롯 (USE_LLM_GOVERNOR, 장수 프로세스에서만)
+
+        분당 토큰 예산용 추정치: 프롬프트 문자 수 / 2 (한글 기준 보수적) + max_tokens
+        """
+        if not self.use_governor or not is_llm_governor_enabled():
+            yield None
+            return
+
+        if isinstance(prompt, str):
+            prompt_chars = len(prompt)
+        else:
+            prompt_chars = sum(len(str(m.get("content", ""))) for m in prompt)
+
+        async with self._get_governor(provider, model_name).slot(prompt_chars // 2 + max_tokens) as slot:
+            yield slot
+
+    def get_governor_stats(self) -> Dict[str, Any]:
+        """거버너별 동시성 한도 / 대기 시간 / 429 메트릭"""
+        return {
+            "enabled": self.use_governor and is_llm_governor_enabled(),
+            "governors": [governor.get_stats() for governor in list(self._governors.values())],
+        }
+
+    # ─────────────────────────────────────────────────
+    # 프롬프트 캐싱 (선두 system 메시지 = 정적 프리픽스)
+    # ─────────────────────────────────────────────────
+
+    def _openai_cache_kwargs(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        OpenAI 자동 프리픽스 캐싱용 인자
+
+        캐싱 자체는 자동이며, 같은 프리픽스의 요청이 같은 캐시 서버로 라우팅되도록
+        prompt_cache_key를 지정합니다 (SDK 버전 무관하게 extra_body로 전달).
+        """
+        if not self.use_prompt_caching:
+            return {}
+        static_prefix, _ = split_static_prefix(messages)
+        if not static_prefix:
+            return {}
+        return {"extra_body": {"prompt_cache_key": prefix_cache_key(static_prefix)}}
+
+    def _claude_system(self, system_message: str) -> Any:
+        """Anthropic system 파라미터 (캐싱 시 cache_control 블록)"""
+        if not system_message:
+            return None
+        if not self.use_prompt_caching:
+            return system_message
+        return [{"type": "text", "text": system_message, "cache_control": {"type": "ephemeral"}}]
+
+    async def _gemini_prompt(
+        self,
+        model_name: str,
+        messages: List[Dict[str, str]],
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Gemini 프롬프트 + cached content 이름
+
+        정적 프리픽스가 cached content로 등록되어 있으면 나머지 메시지만 프롬프트로 보냅니다.
+
+        Returns:
+            (프롬프트, cached_content 이름 또는 None)
+        """
+        static_prefix, rest = split_static_prefix(messages)
+        if self.use_prompt_caching and static_prefix and rest:
+            cache_name = await self._get_gemini_cached_content(model_name, static_prefix)
+            if cache_name:
+                return self._convert_messages_to_prompt(rest), cache_name
+        return self._convert_messages_to_prompt(messages), None
+
+    async def _get_gemini_cached_content(self, model_name: str, static_prefix: str) -> Optional[str]:
+        """
+        정적 프리픽스의 Gemini cached content 이름 반환 (없으면 생성)
+
+        - 생성 실패(최소 토큰 미달, 미지원 모델 등)도 TTL 동안 기억하여 재시도하지 않음
+        - 같은 프리픽스의 동시 첫 요청은 생성 작업 하나를 공유
+        - 다른 프로세스(work-horse)가 만든 캐시는 PromptCacheRegistry(Redis)에서 조회해 재사용
+        """
+        if len(static_prefix) < settings.GEMINI_PROMPT_CACHE_MIN_CHARS:
+            return None
+
+        key = (model_name, prefix_cache_key(static_prefix))
+        entry = self._gemini_caches.get(key)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+
+        pending_key = (asyncio.get_running_loop(),) + key
+        pending = self._gemini_cache_pending.get(pending_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._resolve_gemini_cached_content(model_name, static_prefix))
+            self._gemini_cache_pending[pending_key] = pending
+            pending.add_done_callback(lambda _: self._gemini_cache_pending.pop(pending_key, None))
+
+        cache_name, expires_in = await asyncio.shield(pending)
+        self._gemini_caches[key] = (cache_name, time.monotonic() + expires_in)
+        return cache_name
+
+    async def _resolve_gemini_cached_content(
+        self, model_name: str, static_prefix: str
+    ) -> Tuple[Optional[str], float]:
+        """
+        공유 레지스트리 조회 → 없으면 생성 후 등록
+
+        Returns:
+            (캐시 이름 또는 None, 프로세스 내 기억 시간(초))
+        """
+        ttl = settings.GEMINI_PROMPT_CACHE_TTL_SECONDS
+        # 만료 직전 요청이 사라진 캐시를 참조하지 않도록 여유를 둠
+        expires_in = max(ttl - 60, ttl / 2)
+
+        registry = getattr(self, "gemini_cache_registry", None)
+        shared_key = f"{model_name}:{prefix_cache_key(static_prefix)}"
+        if registry is not None:
+            # 동기 Redis 호출 → 이벤트 루프를 막지 않도록 스레드에서 실행
+            found, cache_name, remaining = await asyncio.to_thread(registry.get, shared_key)
+            if found:
+                return cache_name, remaining
+            if not await asyncio.to_thread(registry.claim, shared_key):
+                # 다른 프로세스가 생성 중 → 이번 요청은 캐싱 없이 보내고 잠시 후 다시 조회
+                return None, GEMINI_CACHE_CLAIM_WAIT_SECONDS
+
+        cache_name = await self._create_gemini_cached_content(model_name, static_prefix)
+        if registry is not None:
+            await asyncio.to_thread(registry.set, shared_key, cache_name, expires_in)
+        return cache_name, expires_in
+
+    async def _create_gemini_cached_content(self, model_name: str, static_prefix: str) -> Optional[str]:
+        """Gemini cached content 생성 (실패 시 None)"""
+        try:
+            cache = await asyncio.wait_for(
+                self.gemini_client.aio.caches.create(
+                    model=model_name,
+                    config=genai_types.CreateCachedContentConfig(
+                        system_instruction=static_prefix,
+                        ttl=f"{settings.GEMINI_PROMPT_CACHE_TTL_SECONDS}s",
+                        display_name=f"prefix-{prefix_cache_key(static_prefix)[:12]}",
+                    ),
+                ),
+                timeout=LLM_TIMEOUT_SECONDS
+            )
+            logger.info(f"[LLMManager] Gemini cached content 생성: {cache.name} ({len(static_prefix)} chars)")
+            return cache.name
+        except Exception as e:
+            logger.warning(f"[LLMManager] Gemini cached content 생성 실패 - 캐싱 없이 호출: {type(e).__name__}: {e}")
+            return None
+
+    @staticmethod
+    def _openai_usage(usage: Any) -> Dict[str, int]:
+        """OpenAI 토큰 사용량 (cached_tokens: 프리픽스 캐시 적중 토큰)"""
+        if not usage:
+            return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "cached_tokens": 0}
+        details = getattr(usage, "prompt_tokens_details", None)
+        return {
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens,
+            "total_tokens": usage.total_tokens,
+            "cached_tokens": getattr(details, "cached_tokens", 0) or 0,
+        }
+
+    @staticmethod
+    def _claude_usage(usage: Any) -> Dict[str, int]:
+        """
+        Anthropic 토큰 사용량
+
+        input_tokens는 캐시 읽기/쓰기 토큰을 제외하므로 합산해 prompt_tokens로 기록합니다.
+        """
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        prompt_tokens = usage.input_tokens + cache_read + cache_write
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": usage.output_tokens,
+            "total_tokens": prompt_tokens + usage.output_tokens,
+            "cached_tokens": cache_read,
+            "cache_write_tokens": cache_write,
+        }
+
+    @staticmethod
+    def _gemini_usage(usage_metadata: Any) -> Dict[str, int]:
+        """Gemini 토큰 사용량 (prompt_token_count는 캐시 토큰 포함)"""
+        if not usage_metadata:
+            return {}
+        return {
+            "prompt_tokens": getattr(usage_metadata, 'prompt_token_count', 0) or 0,
+            "completion_tokens": getattr(usage_metadata, 'candidates_token_count', 0) or 0,
+            "total_tokens": getattr(usage_metadata, 'total_token_count', 0) or 0,
+            "cached_tokens": getattr(usage_metadata, 'cached_content_token_count', 0) or 0,
+        }
+
+    async def _gemini_generate(
+        self,
+        model_name: str,
+        prompt: str,
+        config: "genai_types.GenerateContentConfig",
+    ):
+        """
+        Gemini 네이티브 async 호출 (client.aio)
+
+        - 기본 스레드풀을 점유하지 않음 → 병렬 처리량이 스레드 수와 무관
+        - wait_for 타임아웃 시 코루틴이 취소되어 HTTP 요청도 함께 중단
+        - GEMINI_MAX_CONCURRENCY로 동시 요청 수 제한 (LLM 거버너 슬롯 획득 후)
+
+        Raises:
+            asyncio.TimeoutError: LLM_TIMEOUT_SECONDS 초과 시
+        """
+        max_tokens = getattr(config, "max_output_tokens", None) or 0
+        async with self._llm_slot(LLMProvider.GEMINI, model_name, prompt, max_tokens), self._get_gemini_semaphore():
+            return await asyncio.wait_for(
+                self.gemini_client.aio.models.generate_content(
+                    model=model_name,
+                    contents=prompt,
+                    config=config
+                ),
+                timeout=LLM_TIMEOUT_SECONDS
+            )
+
     async def _call_claude_json(
         self,
         messages: List[Dict[str, str]],
@@ -471,13 +869,14 @@ class LLMManager:
                 else:
                     user_messages.append(msg)
 
-            response = await self.anthropic_client.messages.create(
-                model=model_name,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system_message if system_message else None,
-                messages=user_messages
-            )
+            async with self._llm_slot(LLMProvider.CLAUDE, model_name, messages, max_tokens):
+                response = await self.anthropic_client.messages.create(
+                    model=model_name,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=self._claude_system(system_message),
+                    messages=user_messages
+                )
 
             raw_content = response.content[0].text if response.content else ""
 
@@ -489,11 +888,7 @@ class LLMManager:
                 content=parsed_content,
                 raw_response=raw_content,
                 model=model_name,
-                usage={
-                    "prompt_tokens": response.usage.input_tokens,
-                    "completion_tokens": response.usage.output_tokens,
-                    "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
-                }
+                usage=self._claude_usage(response.usage)
             )
 
         except Exception as e:
@@ -550,12 +945,14 @@ class LLMManager:
         try:
             model_name = model or self.models[LLMProvider.OPENAI]
 
-            response = await self.openai_client.chat.completions.create(
-                model=model_name,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+            async with self._llm_slot(LLMProvider.OPENAI, model_name, messages, max_tokens):
+                response = await self.openai_client.chat.completions.create(
+                    model=model_name,
+                    messages=messages,
+                    **self._openai_cache_kwargs(messages),
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
 
             content = response.choices[0].message.content or ""
 
@@ -564,11 +961,7 @@ class LLMManager:
                 content=content,
                 raw_response=content,
                 model=model_name,
-                usage={
-                    "prompt_tokens": response.usage.prompt_tokens if response.usage else 0,
-                    "completion_tokens": response.usage.completion_tokens if response.usage else 0,
-                    "total_tokens": response.usage.total_tokens if response.usage else 0,
-                }
+                usage=self._openai_usage(response.usage)
             )
         except Exception as e:
             return LLMResponse(
@@ -599,46 +992,33 @@ class LLMManager:
         try:
             model_name = model or self.models[LLMProvider.GEMINI]
 
+            prompt, cached_content = await self._gemini_prompt(model_name, messages)
+
             # 새 google-genai API 사용
             config = genai_types.GenerateContentConfig(
                 temperature=temperature,
                 max_output_tokens=max_tokens,
+                cached_content=cached_content,
             )
-
-            prompt = self._convert_messages_to_prompt(messages)
             try:
-                response = await asyncio.wait_for(
-                    asyncio.to_thread(
-                        self.gemini_client.models.generate_content,
-                        model=model_name,
-                        contents=prompt,
-                        config=config
-                    ),
-                    timeout=LLM_TIMEOUT_SECONDS
-                )
+                response = await self._gemini_generate(model_name, prompt, config)
             except asyncio.TimeoutError:
                 logger.error(
-                    f"[LLMManager] ❌ Gemini Text API 타임아웃 ({LLM_TIMEOUT_SECONDS}초)\n"
-                    f"⚠️ 주의: API 요청이 이미 전송되어 과금될 수 있습니다."
+                    f"[LLMManager] ❌ Gemini Text API 타임아웃 ({LLM_TIMEOUT_SECONDS}초) - 요청 취소됨\n"
+                    f"⚠️ 주의: 서버가 이미 처리를 시작했다면 과금될 수 있습니다."
                 )
                 return LLMResponse(
                     provider=LLMProvider.GEMINI,
                     content=None,
                     raw_response="",
                     model=model_name,
-                    error=f"Gemini API timeout after {LLM_TIMEOUT_SECONDS} seconds (request may still be billed)"
+                    error=f"Gemini API timeout after {LLM_TIMEOUT_SECONDS} seconds (request cancelled)"
                 )
 
             content = response.text
 
             # usage_metadata 접근
-            usage = {}
-            if hasattr(response, 'usage_metadata') and response.usage_metadata:
-                usage = {
-                    "prompt_tokens": getattr(response.usage_metadata, 'prompt_token_count', 0),
-                    "completion_tokens": getattr(response.usage_metadata, 'candidates_token_count', 0),
-                    "total_tokens": getattr(response.usage_metadata, 'total_token_count', 0),
-                }
+            usage = self._gemini_usage(getattr(response, 'usage_metadata', None))
 
             return LLMResponse(
                 provider=LLMProvider.GEMINI,
@@ -685,13 +1065,14 @@ class LLMManager:
                 else:
                     user_messages.append(msg)
 
-            response = await self.anthropic_client.messages.create(
-                model=model_name,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system_message if system_message else None,
-                messages=user_messages
-            )
+            async with self._llm_slot(LLMProvider.CLAUDE, model_name, messages, max_tokens):
+                response = await self.anthropic_client.messages.create(
+                    model=model_name,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=self._claude_system(system_message),
+                    messages=user_messages
+                )
 
             content = response.content[0].text if response.content else ""
 
@@ -700,11 +1081,7 @@ class LLMManager:
                 content=content,
                 raw_response=content,
                 model=model_name,
-                usage={
-                    "prompt_tokens": response.usage.input_tokens,
-                    "completion_tokens": response.usage.output_tokens,
-                    "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
-                }
+                usage=self._claude_usage(response.usage)
             )
         except Exception as e:
             return LLMResponse(
@@ -46,6 +46,12 @@ class PipelineMetrics:
     llm_cost_usd: float = 0.0
     llm_providers_used: List[str] = field(default_factory=list)
 
+    # LLM 검증 (배치 모드)
+    validation_llm_calls: int = 0
+    validation_calls_saved: int = 0
+    validation_tokens_saved: int = 0
+    validation_latency_ms: int = 0
+
     # 결과
     success: bool = False
     error_code: Optional[str] = None
@@ -73,6 +79,10 @@ class PipelineMetrics:
             "llm_tokens_output": self.llm_tokens_output,
             "llm_cost_usd": self.llm_cost_usd,
             "llm_providers_used": self.llm_providers_used,
+            "validation_llm_calls": self.validation_llm_calls,
+            "validation_calls_saved": self.validation_calls_saved,
+            "validation_tokens_saved": self.validation_tokens_saved,
+            "validation_latency_ms": self.validation_latency_ms,
             "success": self.success,
             "error_code": self.error_code,
             "text_length": self.text_length,
@@ -112,6 +122,13 @@ class AggregatedMetrics:
     llm_total_cost_usd: float = 0.0
     llm_calls_by_provider: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
 
+    # LLM 검증 (배치 모드)
+    validation_batches: int = 0
+    validation_total_calls: int = 0
+    validation_calls_saved: int = 0
+    validation_tokens_saved: int = 0
+    validation_latency_sum_ms: int = 0
+
     # 파이프라인 타입별
     requests_by_pipeline_type: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
 
@@ -135,6 +152,11 @@ class AggregatedMetrics:
             return 0.0
         return self.stage_duration_sums.get(stage, 0) / count
 
+    def get_avg_validation_latency_ms(self) -> float:
+        if self.validation_batches == 0:
+            return 0.0
+        return self.validation_latency_sum_ms / self.validation_batches
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "total_requests": self.total_requests,
@@ -154,6 +176,11 @@ class AggregatedMetrics:
             "llm_total_tokens_output": self.llm_total_tokens_output,
             "llm_total_cost_usd": round(self.llm_total_cost_usd, 4),
             "llm_calls_by_provider": dict(self.llm_calls_by_provider),
+            "validation_batches": self.validation_batches,
+            "validation_total_calls": self.validation_total_calls,
+            "validation_calls_saved": self.validation_calls_saved,
+            "validation_tokens_saved": self.validation_tokens_saved,
+            "validation_avg_latency_ms": round(self.get_avg_validation_latency_ms(), 2),
             "requests_by_pipeline_type": dict(self.requests_by_pipeline_type),
             "period_start": self.period_start.isoformat() if self.period_start else None,
             "period_end": self.period_end.isoformat() if self.period_end else None,
@@ -262,6 +289,31 @@ class MetricsCollector:
                 if provider not in metrics.llm_providers_used:
                     metrics.llm_providers_used.append(provider)
 
+    def record_validation_batch(
+        self,
+        pipeline_id: str,
+        llm_calls: int,
+        calls_saved: int,
+        tokens_saved: int,
+        latency_ms: int,
+    ):
+        """
+        배치 LLM 검증 기록
+
+        Args:
+            llm_calls: 실제 검증 호출 수 (배치 1회 + 필드별 폴백)
+            calls_saved: 필드별 호출 대비 절감된 호출 수
+            tokens_saved: 필드별 호출 대비 절감된 프롬프트 토큰 (추정)
+            latency_ms: LLM 검증 전체 소요 시간
+        """
+        with self._lock:
+            if pipeline_id in self._active_pipelines:
+                metrics = self._active_pipelines[pipeline_id]
+                metrics.validation_llm_calls += llm_calls
+                metrics.validation_calls_saved += calls_saved
+                metrics.validation_tokens_saved += tokens_saved
+                metrics.validation_latency_ms += latency_ms
+
     def _calculate_llm_cost(
         self,
         provider: str,
@@ -404,6 +456,14 @@ class MetricsCollector:
                 for provider in metrics.llm_providers_used:
                     aggregated.llm_calls_by_provider[provider] += 1
 
+                # LLM 검증 (배치 모드)
+                if metrics.validation_llm_calls:
+                    aggregated.validation_batches += 1
+                    aggregated.validation_total_calls += metrics.validation_llm_calls
+                    aggregated.validation_calls_saved += metrics.validation_calls_saved
+                    aggregated.validation_tokens_saved += metrics.validation_tokens_saved
+                    aggregated.validation_latency_sum_ms += metrics.validation_latency_ms
+
                 # 파이프라인 타입별
                 aggregated.requests_by_pipeline_type[metrics.pipeline_type] += 1
 
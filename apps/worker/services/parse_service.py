@@ -0,0 +1,438 @@
+"""
+Parse Service - CPU 바운드 파일 파싱을 프로세스 풀로 오프로드
+
+HWP/PDF/DOCX 파싱(olefile, pdfplumber, OCR 등)은 CPU 바운드 동기 코드라
+이벤트 루프에서 직접 실행하면 같은 프로세스에서 대기 중인 LLM/임베딩 호출이
+모두 멈춥니다. 비동기 워커(--mode async)처럼 여러 이력서를 한 프로세스에서
+동시에 처리할 때는 파싱을 별도 프로세스에서 실행해야 합니다.
+
+- 파싱 로직(Router → 파서 선택 → 결과 정규화)은 parse_file_bytes() 하나로 통일
+- 워커 프로세스는 시작 시 파서 인스턴스를 생성해 재사용 (warm worker)
+- 파일 타입별 동시 파싱 상한 / 타임아웃 (PARSE_CONCURRENCY, PARSE_TIMEOUT_SECONDS)
+- 프로세스 풀이 깨지면(BrokenProcessPool) 풀을 재생성하고 이번 요청은 스레드에서 처리
+
+Usage:
+    from services.parse_service import get_parse_service
+
+    parsed = await get_parse_service().parse(file_bytes, filename)
+    if not parsed.success:
+        ...  # parsed.error_code: FILE_REJECTED, HWP_PARSE_FAILED, ...
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, asdict, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# 파일 타입별 동시성/타임아웃 분류
+_EXTENSION_CATEGORIES = {
+    "hwp": "hwp",
+    "hwpx": "hwp",
+    "pdf": "pdf",
+    "doc": "docx",
+    "docx": "docx",
+}
+
+# PARSE_CONCURRENCY / PARSE_TIMEOUT_SECONDS에 없는 분류의 기본값
+DEFAULT_TYPE_CONCURRENCY = 2
+DEFAULT_PARSE_TIMEOUT_SECONDS = 120.0
+
+
+@dataclass
+class ParsedFile:
+    """파일 파싱 결과 (프로세스 간 전달 가능한 순수 데이터)"""
+    success: bool
+    text: str = ""
+    parse_method: str = "unknown"
+    page_count: int = 0
+    file_type: str = ""
+    is_encrypted: bool = False
+    error: Optional[str] = None
+    error_code: Optional[str] = None
+    warnings: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# 워커 프로세스별 파서 인스턴스 (프로세스당 1회 생성)
+_parsers: Optional[Dict[str, Any]] = None
+
+
+def _get_parsers() -> Dict[str, Any]:
+    """현재 프로세스의 Router/파서 인스턴스 반환"""
+    global _parsers
+    if _parsers is None:
+        from agents.router_agent import RouterAgent
+        from utils.hwp_parser import HWPParser
+        from utils.pdf_parser import PDFParser
+        from utils.docx_parser import DOCXParser
+
+        _parsers = {
+            "router": RouterAgent(),
+            "hwp": HWPParser(hancom_api_key=settings.HANCOM_API_KEY or None),
+            "pdf": PDFParser(),
+            "docx": DOCXParser(),
+        }
+    return _parsers
+
+
+def get_file_category(filename: str) -> str:
+    """파일명 확장자로 동시성/타임아웃 분류 (hwp, pdf, docx, other)"""
+    ext = os.path.splitext(filename or "")[1].lower().lstrip(".")
+    return _EXTENSION_CATEGORIES.get(ext, "other")
+
+
+def _parse_type_limits(spec: str, cast: Callable[[str], Any]) -> Dict[str, Any]:
+    """"hwp=2,pdf=4" 형식 설정 파싱 (잘못된 항목은 무시)"""
+    limits: Dict[str, Any] = {}
+    for item in (spec or "").split(","):
+        name, _, value = item.strip().partition("=")
+        if not name or not value:
+            continue
+        try:
+            limits[name.strip()] = cast(value.strip())
+        except ValueError:
+            logger.warning(f"[ParseService] Invalid setting entry ignored: '{item}'")
+    return limits
+
+
+def _timeout_result(category: str, timeout: float) -> ParsedFile:
+    return ParsedFile(
+        success=False,
+        file_type=category,
+        error=f"파일 파싱 시간이 초과되었습니다 ({timeout:.0f}초)",
+        error_code="PARSE_TIMEOUT",
+    )
+
+
+def _init_worker():
+    """프로세스 풀 워커 초기화: 파서 모듈/인스턴스 미리 로드"""
+    try:
+        _get_parsers()
+    except Exception as e:
+        # 초기화 실패 시 첫 파싱 요청에서 다시 시도 (풀 전체가 깨지지 않도록)
+        logger.warning(f"[ParseService] Worker warm-up failed: {e}")
+
+
+def _warm_worker() -> int:
+    return os.getpid()
+
+
+def parse_file_bytes(file_bytes: bytes, filename: str) -> ParsedFile:
+    """
+    파일 타입 판별 후 적절한 파서로 텍스트 추출 (동기)
+
+    프로세스 풀 워커에서 실행되므로 모듈 최상위 함수여야 합니다.
+    예외를 던지지 않고 ParsedFile(success=False)로 반환합니다.
+    """
+    from agents.router_agent import FileType
+    from utils.hwp_parser import ParseMethod
+
+    try:
+        parsers = _get_parsers()
+
+        router_result = parsers["router"].analyze(file_bytes, filename)
+        if router_result.is_rejected:
+            return ParsedFile(
+                success=False,
+                file_type=router_result.file_type.value if router_result.file_type else "",
+                is_encrypted=router_result.is_encrypted,
+                error=router_result.reject_reason,
+                error_code="FILE_REJECTED",
+                warnings=list(router_result.warnings),
+            )
+
+        file_type = router_result.file_type
+        warnings = list(router_result.warnings)
+
+        if file_type in [FileType.HWP, FileType.HWPX]:
+            result = parsers["hwp"].parse(file_bytes, filename)
+            if result.method == ParseMethod.FAILED:
+                return ParsedFile(
+                    success=False,
+                    parse_method=result.method.value,
+                    file_type=file_type.value,
+                    is_encrypted=result.is_encrypted,
+                    error=result.error_message,
+                    error_code="HWP_PARSE_FAILED",
+                    warnings=warnings,
+                )
+            return ParsedFile(
+                success=True,
+                text=result.text,
+                parse_method=result.method.value,
+                page_count=result.page_count,
+                file_type=file_type.value,
+                is_encrypted=result.is_encrypted,
+                warnings=warnings,
+            )
+
+        if file_type == FileType.PDF:
+            result = parsers["pdf"].parse(file_bytes)
+            if not result.success:
+                return ParsedFile(
+                    success=False,
+                    parse_method=result.method,
+                    file_type=file_type.value,
+                    is_encrypted=result.is_encrypted,
+                    error=result.error_message,
+                    error_code="PDF_PARSE_FAILED",
+                    warnings=warnings,
+                )
+            return ParsedFile(
+                success=True,
+                text=result.text,
+                parse_method=result.method,
+                page_count=result.page_count,
+                file_type=file_type.value,
+                is_encrypted=result.is_encrypted,
+                warnings=warnings,
+            )
+
+        if file_type in [FileType.DOC, FileType.DOCX]:
+            result = parsers["docx"].parse(file_bytes, filename)
+            if not result.success:
+                return ParsedFile(
+                    success=False,
+                    parse_method=result.method,
+                    file_type=file_type.value,
+                    error=result.error_message,
+                    error_code="DOCX_PARSE_FAILED",
+                    warnings=warnings,
+                )
+            return ParsedFile(
+                success=True,
+                text=result.text,
+                parse_method=result.method,
+                page_count=result.page_count,
+                file_type=file_type.value,
+                warnings=warnings,
+            )
+
+        return ParsedFile(
+            success=False,
+            file_type=file_type.value if file_type else "",
+            error=f"Unsupported file type: {file_type}",
+            error_code="UNSUPPORTED_TYPE",
+            warnings=warnings,
+        )
+
+    except Exception as e:
+        logger.error(f"[ParseService] Parse error for {filename}: {e}", exc_info=True)
+        return ParsedFile(success=False, error=str(e))
+
+
+class ParseService:
+    """
+    비동기 파싱 서비스
+
+    - USE_PARSE_PROCESS_POOL이 켜져 있으면 ProcessPoolExecutor, 꺼져 있으면 스레드 풀에서 실행
+    - 워커 프로세스는 시작 시 파서 모듈을 미리 로드 (warm_up()으로 전체 워커 선기동 가능)
+    - 파일 타입별 동시 파싱 상한 (PARSE_CONCURRENCY) → OCR이 많은 PDF가 풀을 독점하지 않음
+    - 파일 타입별 타임아웃 (PARSE_TIMEOUT_SECONDS) → 초과 시 PARSE_TIMEOUT 반환,
+      멈춘 워커 프로세스는 같은 풀의 다른 작업이 끝난 뒤 종료하고 새 풀로 교체
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        use_process_pool: Optional[bool] = None,
+        concurrency: Optional[Dict[str, int]] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+    ):
+        self.use_process_pool = (
+            settings.USE_PARSE_PROCESS_POOL if use_process_pool is None else use_process_pool
+        )
+        self.max_workers = max_workers or settings.PARSE_POOL_WORKERS or min(4, os.cpu_count() or 1)
+        self.concurrency = (
+            concurrency if concurrency is not None
+            else _parse_type_limits(settings.PARSE_CONCURRENCY, int)
+        )
+        self.timeouts = (
+            timeouts if timeouts is not None
+            else _parse_type_limits(settings.PARSE_TIMEOUT_SECONDS, float)
+        )
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # 풀별 진행 중 작업 / 타임아웃된 작업 (멈춘 워커 정리용)
+        self._pending: Dict[ProcessPoolExecutor, Set[Future]] = {}
+        self._stuck: Dict[ProcessPoolExecutor, Set[Future]] = {}
+
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ─────────────────────────────────────────────────
+    # 프로세스 풀
+    # ─────────────────────────────────────────────────
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀 반환 (첫 사용 시 생성)"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # 이벤트 루프/Redis 스레드를 가진 프로세스에서 fork하지 않도록 spawn 사용
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_worker,
+                    )
+                    self._pending[self._executor] = set()
+                    logger.info(f"[ParseService] Process pool started (workers={self.max_workers})")
+        return self._executor
+
+    def _reset_executor(self):
+        """깨진 프로세스 풀 폐기 (다음 요청에서 재생성)"""
+        with self._lock:
+            if self._executor is not None:
+                self._pending.pop(self._executor, None)
+                self._stuck.pop(self._executor, None)
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _retire_executor(self, executor: ProcessPoolExecutor, stuck: Future):
+        """
+        타임아웃 작업이 점유한 풀을 교체
+
+        새 요청은 새 풀로 보내고, 기존 풀은 정상 작업이 모두 끝나면 프로세스를 종료합니다.
+        """
+        with self._lock:
+            self._stuck.setdefault(executor, set()).add(stuck)
+            if self._executor is executor:
+                self._executor = None
+        self._terminate_if_idle(executor)
+
+    def _on_future_done(self, executor: ProcessPoolExecutor, future: Future):
+        with self._lock:
+            pending = self._pending.get(executor)
+            if pending is not None:
+                pending.discard(future)
+            stuck = self._stuck.get(executor)
+            if stuck is not None:
+                stuck.discard(future)
+        self._terminate_if_idle(executor)
+
+    def _terminate_if_idle(self, executor: ProcessPoolExecutor):
+        """교체된 풀에 타임아웃 작업만 남았으면 워커 프로세스 강제 종료"""
+        with self._lock:
+            if executor is self._executor or executor not in self._stuck:
+                return
+            pending = self._pending.get(executor, set())
+            stuck = self._stuck[executor]
+            if pending - stuck:
+                return
+            self._pending.pop(executor, None)
+            self._stuck.pop(executor, None)
+
+        # ProcessPoolExecutor는 개별 워커 종료 API가 없어 프로세스를 직접 종료
+        for process in list(getattr(executor, "_processes", {}).values()):
+            if process.is_alive():
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("[ParseService] Retired process pool terminated (stuck parse worker)")
+
+    def warm_up(self):
+        """
+        워커 프로세스를 미리 기동 (파서 모듈 import 비용을 첫 요청에서 제거)
+
+        FastAPI 시작 / 비동기 워커 시작 시 호출합니다. 완료를 기다리지 않습니다.
+        """
+        if not self.use_process_pool:
+            return
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_warm_worker)
+
+    # ─────────────────────────────────────────────────
+    # 파싱
+    # ─────────────────────────────────────────────────
+
+    def _get_semaphore(self, category: str) -> asyncio.Semaphore:
+        """
+        현재 이벤트 루프용 파일 타입별 세마포어 반환
+
+        asyncio.Semaphore는 처음 대기한 루프에 바인딩되므로 루프가 바뀌면 새로 생성합니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphores = {}
+            self._semaphore_loop = loop
+        if category not in self._semaphores:
+            limit = self.concurrency.get(category, DEFAULT_TYPE_CONCURRENCY)
+            self._semaphores[category] = asyncio.Semaphore(max(limit, 1))
+        return self._semaphores[category]
+
+    async def parse(self, file_bytes: bytes, filename: str) -> ParsedFile:
+        """파일 파싱 (이벤트 루프를 블로킹하지 않음)"""
+        category = get_file_category(filename)
+        timeout = self.timeouts.get(category, DEFAULT_PARSE_TIMEOUT_SECONDS)
+
+        async with self._get_semaphore(category):
+            if not self.use_process_pool:
+                return await self._parse_in_thread(file_bytes, filename, timeout)
+
+            executor = self._get_executor()
+            try:
+                future = executor.submit(parse_file_bytes, file_bytes, filename)
+            except (BrokenProcessPool, RuntimeError) as e:
+                # 종료/손상된 풀 → 재생성 후 스레드에서 처리
+                logger.warning(f"[ParseService] Process pool unavailable, falling back to thread: {e}")
+                self._reset_executor()
+                return await self._parse_in_thread(file_bytes, filename, timeout)
+
+            with self._lock:
+                self._pending.setdefault(executor, set()).add(future)
+            future.add_done_callback(lambda f: self._on_future_done(executor, f))
+
+            try:
+                return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"[ParseService] Parse timeout after {timeout}s: {filename}")
+                self._retire_executor(executor, future)
+                return _timeout_result(category, timeout)
+            except BrokenProcessPool as e:
+                # 파서 워커가 비정상 종료(OOM 등) → 풀 재생성, 이번 요청은 스레드에서 처리
+                logger.warning(f"[ParseService] Process pool broken, falling back to thread: {e}")
+                self._reset_executor()
+                return await self._parse_in_thread(file_bytes, filename, timeout)
+
+    async def _parse_in_thread(self, file_bytes: bytes, filename: str, timeout: float) -> ParsedFile:
+        """스레드 풀에서 파싱 (스레드는 강제 종료할 수 없으므로 타임아웃 시 결과만 포기)"""
+        try:
+            return await asyncio.wait_for(
+                asyncio.to_thread(parse_file_bytes, file_bytes, filename), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"[ParseService] Parse timeout after {timeout}s (thread): {filename}")
+            return _timeout_result(get_file_category(filename), timeout)
+
+    def shutdown(self, wait: bool = True):
+        """프로세스 풀 종료"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._pending.pop(self._executor, None)
+                self._executor = None
+
+
+# 싱글톤 인스턴스
+_parse_service: Optional[ParseService] = None
+
+
+def get_parse_service() -> ParseService:
+    """ParseService 싱글톤 인스턴스 반환"""
+    global _parse_service
+    if _parse_service is None:
+        _parse_service = ParseService()
+    return _parse_service
@@ -0,0 +1,107 @@
+"""
+Prompt Cache Registry - 프로세스 간 Gemini cached content 이름 공유
+
+Gemini cached content는 생성 API 호출(과금, TTL 동안 보관)이 필요하므로
+프로세스 메모리에만 이름을 기억하면 fork 모드 RQ Worker에서는 work-horse(Job)마다
+새 캐시를 만들고 한 번도 재사용하지 못합니다.
+
+(모델, 프리픽스 키) → 캐시 이름을 Redis에 TTL과 함께 저장해 모든 워커 프로세스가 공유합니다.
+- 생성 실패("" 저장)도 TTL 동안 공유하여 모든 Job이 재시도하지 않음
+- 생성 권한 claim (SET NX): 여러 프로세스가 동시에 같은 캐시를 만들지 않음
+- Redis가 없거나 오류면 None/True를 반환 → 호출 측이 프로세스 단위 캐싱으로 동작
+
+Redis 호출은 동기이므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+"""
+
+import logging
+import time
+from typing import Optional, Tuple
+
+from redis import Redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "rai:gemini_prompt_cache:"
+CLAIM_PREFIX = "rai:gemini_prompt_cache_claim:"
+
+# 생성 권한 유지 시간 (생성 API 타임아웃 LLM_TIMEOUT_SECONDS보다 길게)
+CLAIM_TTL_SECONDS = 180
+# Redis 오류 후 재시도 간격 (초)
+RETRY_SECONDS = 30.0
+
+
+class PromptCacheRegistry:
+    """
+    Redis 기반 cached content 이름 레지스트리
+
+    Args:
+        redis_url: Redis URL (없으면 비활성)
+        redis: 주입할 Redis 클라이언트 (테스트용)
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, redis: Optional[Redis] = None):
+        self._redis_url = redis_url if isinstance(redis_url, str) else None
+        self._redis = redis
+        self._retry_at = 0.0
+
+    def _get_redis(self) -> Optional[Redis]:
+        if time.monotonic() < self._retry_at:
+            return None
+        if self._redis is None and self._redis_url:
+            try:
+                self._redis = Redis.from_url(self._redis_url, socket_connect_timeout=2, socket_timeout=2)
+            except Exception as e:
+                logger.warning(f"[PromptCacheRegistry] Redis unavailable, using process-local cache: {e}")
+                self._redis_url = None
+        return self._redis
+
+    def _failed(self, action: str, error: Exception):
+        logger.warning(f"[PromptCacheRegistry] Redis {action} failed, using process-local cache: {error}")
+        self._retry_at = time.monotonic() + RETRY_SECONDS
+
+    def get(self, key: str) -> Tuple[bool, Optional[str], float]:
+        """
+        공유된 캐시 이름 조회
+
+        Returns:
+            (등록 여부, 캐시 이름 또는 None(생성 실패 기록), 남은 TTL 초)
+        """
+        redis = self._get_redis()
+        if redis is None:
+            return False, None, 0.0
+        try:
+            pipe = redis.pipeline()
+            pipe.get(KEY_PREFIX + key)
+            pipe.pttl(KEY_PREFIX + key)
+            value, ttl_ms = pipe.execute()
+        except Exception as e:
+            self._failed("get", e)
+            return False, None, 0.0
+        if value is None:
+            return False, None, 0.0
+        name = value.decode() if isinstance(value, bytes) else value
+        return True, name or None, max(ttl_ms or 0, 0) / 1000
+
+    def claim(self, key: str) -> bool:
+        """캐시 생성 권한 획득 (다른 프로세스가 생성 중이면 False, Redis 없으면 True)"""
+        redis = self._get_redis()
+        if redis is None:
+            return True
+        try:
+            return bool(redis.set(CLAIM_PREFIX + key, "1", nx=True, ex=CLAIM_TTL_SECONDS))
+        except Exception as e:
+            self._failed("claim", e)
+            return True
+
+    def set(self, key: str, name: Optional[str], ttl_seconds: float) -> None:
+        """캐시 이름 저장 (None: 생성 실패 기록) 후 생성 권한 반환"""
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            pipe = redis.pipeline()
+            pipe.set(KEY_PREFIX + key, name or "", ex=max(int(ttl_seconds), 1))
+            pipe.delete(CLAIM_PREFIX + key)
+            pipe.execute()
+        except Exception as e:
+            self._failed("set", e)
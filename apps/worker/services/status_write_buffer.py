@@ -0,0 +1,177 @@
+"""
+Status Write Buffer - 상태 갱신 write-behind 버퍼
+
+파이프라인은 이력서 1건당 processing_jobs / candidates 상태를 여러 번 갱신합니다
+(processing → parsed → analyzed → completed). 매 호출이 PostgREST update 왕복(HTTPS)이라
+처리 경로를 막고 Supabase 요청 수를 늘리므로:
+
+- 비종료 상태: 버퍼에 보관, 같은 행의 연속 갱신은 하나로 병합 (나중 값 우선)
+- 백그라운드 스레드가 interval_ms 동안 모은 갱신을 전송
+  (payload가 같은 행들은 update ... in_("id", [...]) 한 번으로 묶음)
+- 종료 상태(completed/failed 등): 호출 스레드에서 즉시 전체 플러시 후 결과 반환
+- 플러시는 하나의 락으로 직렬화되어 늦게 도착한 이전 상태가 종료 상태를 덮어쓰지 않음
+
+호출 측은 동기 함수(RQ 워커, asyncio.to_thread)이므로 스레드 기반으로 동작합니다.
+fork된 자식 프로세스에서는 부모의 대기열/스레드를 버리고 새로 시작합니다.
+fork 모드 RQ work-horse는 os._exit로 끝나 atexit이 실행되지 않으므로, RQ Task 진입점
+(tasks.flush_status_writes_after)이 Job 종료 시마다 flush()를 호출합니다.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (table, payload, row_ids) → 실패 시 예외
+WriteRows = Callable[[str, Dict[str, Any], List[str]], None]
+
+RowKey = Tuple[str, str]
+
+
+class StatusWriteBuffer:
+    """
+    행 단위 상태 갱신 병합 버퍼
+
+    put(terminal=False)은 즉시 True를 반환하고, put(terminal=True)와 flush()는
+    대기 중인 모든 갱신을 전송한 뒤 반환합니다.
+    """
+
+    def __init__(self, write_rows: WriteRows, interval_ms: float = 500.0):
+        self._write_rows = write_rows
+        self.interval = interval_ms / 1000
+        self._reset()
+
+        self.stats: Dict[str, Any] = {
+            "updates": 0,
+            "coalesced": 0,
+            "terminal_flushes": 0,
+            "flushes": 0,
+            "requests": 0,
+            "rows": 0,
+            "failed_requests": 0,
+        }
+        # 장수 프로세스 정상 종료용 (work-horse는 Task 진입점에서 플러시)
+        atexit.register(self.flush)
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._lock = threading.Lock()        # _pending 보호
+        self._flush_lock = threading.Lock()  # 플러시 직렬화 (쓰기 순서 보장)
+        self._wakeup = threading.Event()
+        self._pending: Dict[RowKey, Dict[str, Any]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def _check_fork(self):
+        if os.getpid() != self._pid:
+            # 부모의 대기 갱신은 부모가 전송 (자식에서 중복 전송하지 않음)
+            self._reset()
+
+    def put(self, table: str, row_id: str, data: Dict[str, Any], terminal: bool = False) -> bool:
+        """
+        상태 갱신 등록
+
+        Args:
+            table: 테이블명
+            row_id: 행 ID
+            data: update payload
+            terminal: 종료 상태 여부 (True면 즉시 전체 플러시)
+
+        Returns:
+            비종료: 항상 True (버퍼링), 종료: 해당 행 전송 성공 여부
+        """
+        self._check_fork()
+        key = (table, row_id)
+        with self._lock:
+            self.stats["updates"] += 1
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.stats["coalesced"] += 1
+                pending.update(data)
+            else:
+                self._pending[key] = dict(data)
+            if terminal:
+                self.stats["terminal_flushes"] += 1
+
+        if terminal:
+            return self.flush().get(key, False)
+
+        self._ensure_thread()
+        self._wakeup.set()
+        return True
+
+    def flush(self) -> Dict[RowKey, bool]:
+        """
+        대기 중인 갱신 전체 전송
+
+        Returns:
+            행별 전송 성공 여부 (대기 갱신이 없으면 빈 dict)
+        """
+        self._check_fork()
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return {}
+
+            # 같은 테이블 + 같은 payload → 한 요청
+            groups: Dict[Tuple[str, str], Tuple[Dict[str, Any], List[str]]] = {}
+            for (table, row_id), data in pending.items():
+                signature = (table, json.dumps(data, sort_keys=True, default=str))
+                groups.setdefault(signature, (data, []))[1].append(row_id)
+
+            results: Dict[RowKey, bool] = {}
+            for (table, _), (data, row_ids) in groups.items():
+                success = self._send(table, data, row_ids)
+                for row_id in row_ids:
+                    results[(table, row_id)] = success
+
+            self.stats["flushes"] += 1
+            return results
+
+    def _send(self, table: str, data: Dict[str, Any], row_ids: List[str]) -> bool:
+        self.stats["requests"] += 1
+        self.stats["rows"] += len(row_ids)
+        try:
+            self._write_rows(table, data, row_ids)
+            return True
+        except Exception as e:
+            self.stats["failed_requests"] += 1
+            logger.error(f"[StatusWriteBuffer] Failed to write {table} ({len(row_ids)} rows): {e}")
+            return False
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="status-write-buffer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            # 윈도우 동안 들어온 갱신을 모아서 전송
+            time.sleep(self.interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"[StatusWriteBuffer] Flush failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        requests = self.stats["requests"]
+        updates = self.stats["updates"]
+        return {
+            **self.stats,
+            "pending": len(self._pending),
+            "interval_ms": round(self.interval * 1000, 1),
+            "avg_rows_per_request": round(self.stats["rows"] / requests, 2) if requests else 0.0,
+            "requests_saved": max(0, updates - requests - len(self._pending)),
+        }
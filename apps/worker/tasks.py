@@ -5,9 +5,12 @@ RQ Worker가 실행하는 비동기 작업 정의
 - parse_file: 파일 파싱
 - process_resume: 이력서 분석 + 저장
 - full_pipeline: 전체 파이프라인 (파싱 → 분석 → 저장)
+- full_pipeline_async: 전체 파이프라인 비동기 버전 (async_worker.py에서 동시 실행)
 - on_job_failure: 실패 핸들러 (DLQ로 이동)
 """
 
+import asyncio
+import functools
 import logging
 import time
 import httpx
@@ -20,7 +23,9 @@ from agents.router_agent import RouterAgent, FileType, RouterResult
 from agents.analyst_agent import get_analyst_agent, AnalysisResult
 from agents.privacy_agent import get_privacy_agent, PrivacyResult
 from agents.validation_agent import get_validation_agent, ValidationResult
-from agents.identity_checker import get_identity_checker, IdentityCheckResult
+from agents.identity_checker import (
+    get_identity_checker, run_with_identity_check, IdentityCheckResult, EarlyFieldsGate
+)
 from agents.visual_agent import get_visual_agent
 from utils.hwp_parser import HWPParser, ParseMethod
 from utils.pdf_parser import PDFParser
@@ -31,10 +36,54 @@ from utils.education_parser import determine_graduation_status, determine_degree
 from services.embedding_service import get_embedding_service, EmbeddingResult
 from services.database_service import get_database_service, SaveResult
 from services.storage_service import get_supabase_client, reset_supabase_client
+from utils.async_runtime import run_sync
+from services.llm_governor import run_in_llm_job
+from context.layers import PIIStore
+from services.checkpoint_store import (
+    get_checkpoint_store,
+    chunks_to_payload,
+    chunks_from_payload,
+    STAGE_PARSING,
+    STAGE_IDENTITY_CHECK,
+    STAGE_ANALYSIS,
+    STAGE_EMBEDDING,
+)
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+
+def _flush_status_writes():
+    try:
+        get_database_service().flush_status_writes()
+    except Exception as e:
+        logger.error(f"[Task] Failed to flush buffered status writes: {e}")
+
+
+def flush_status_writes_after(func):
+    """
+    RQ Task 종료 시 버퍼에 남은 비종료 상태 갱신 전송
+
+    fork 모드 RQ Worker의 work-horse는 os._exit로 끝나 atexit이 실행되지 않으므로,
+    Job 함수가 반환/예외로 끝날 때마다 직접 플러시합니다.
+    """
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                await asyncio.to_thread(_flush_status_writes)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _flush_status_writes()
+    return wrapper
+
 # ─────────────────────────────────────────────────
 # PRD Epic 1: 싱글톤 클라이언트 (연결 재사용)
 # ─────────────────────────────────────────────────
@@ -222,6 +271,7 @@ def download_file_from_storage(
     raise DownloadError(error_msg, retries_attempted=max_retries + 1)
 
 
+@flush_status_writes_after
 def parse_file(
     job_id: str,
     user_id: str,
@@ -361,6 +411,7 @@ def parse_file(
         return {"success": False, "error": str(e)}
 
 
+@flush_status_writes_after
 def process_resume(
     job_id: str,
     user_id: str,
@@ -387,12 +438,11 @@ def process_resume(
     Returns:
         dict: 처리 결과
     """
-    import asyncio
-
     logger.info(f"[Task] process_resume started: job={job_id}, mode={mode}")
     start_time = time.time()
 
     db_service = get_database_service()
+    checkpoint_store = get_checkpoint_store()
 
     try:
         # 작업 상태 업데이트
@@ -411,13 +461,58 @@ def process_resume(
             return {"success": False, "error": error_msg}
 
         # ─────────────────────────────────────────────────
-        # Step 0: Multi-Identity 체크 (악용 방지)
+        # Step 0: Multi-Identity 체크 (악용 방지) + Step 1: 분석 (Analyst Agent)
         # PRD: "2명 이상의 정보 감지 시 처리 거절, 크레딧 미차감"
         # ─────────────────────────────────────────────────
-        identity_checker = get_identity_checker()
-        identity_result = asyncio.run(identity_checker.check(text))
+        # 재시도 시 이전 실행에서 통과한 신원 확인은 스킵,
+        # 정규식으로 이름/전화번호/이메일이 각각 1개뿐이면 LLM 신원 확인 생략.
+        # 분석과의 실행 순서는 IDENTITY_CHECK_MODE (latency: 동시, cost: 순차)
+        analysis_mode = AnalysisMode.PHASE_2 if mode == "phase_2" else AnalysisMode.PHASE_1
+        analysis_checkpoint = checkpoint_store.load_stage(job_id, STAGE_ANALYSIS)
+
+        run_identity_check = checkpoint_store.load_stage(job_id, STAGE_IDENTITY_CHECK) is None
+        if run_identity_check and settings.USE_IDENTITY_PREFILTER:
+            pii_store = PIIStore()
+            pii_store.extract_from_text(text, file_name)
+            if pii_store.is_single_identity():
+                logger.info("[Task] Identity check skipped (single name/phone/email)")
+                run_identity_check = False
+
+        async def publish_early_fields(fields: dict) -> None:
+            # Progressive Loading: 스트리밍 중 완성된 핵심 필드를 먼저 UI에 노출
+            quick_data = {k: v for k, v in fields.items() if v not in (None, "")}
+            if quick_data:
+                await asyncio.to_thread(db_service.update_candidate_quick_extracted, candidate_id, quick_data)
+
+        # 신원 확인을 실행하면 통과 전까지 조기 필드 보류 (거절될 문서가 "parsed"로 노출되지 않도록)
+        early_fields_gate = EarlyFieldsGate(publish_early_fields) if run_identity_check else None
+        on_early_fields = early_fields_gate or publish_early_fields
+
+        async def analyze() -> AnalysisResult:
+            # 재시도 시 체크포인트에 저장된 분석 결과 재사용 (LLM 재호출 방지)
+            if analysis_checkpoint:
+                return AnalysisResult.from_dict(analysis_checkpoint)
+            return await get_analyst_agent().analyze(
+                resume_text=text,
+                mode=analysis_mode,
+                filename=file_name,
+                on_early_fields=on_early_fields if candidate_id else None,
+            )
 
-        if identity_result.should_reject:
+        # RQ는 동기 환경 → 프로세스 영구 이벤트 루프에서 실행 (커넥션 풀 재사용)
+        if run_identity_check:
+            identity_checker = get_identity_checker()
+            identity_result, analysis_result = run_sync(run_in_llm_job(job_id, run_with_identity_check(
+                check=lambda: identity_checker.check(text),
+                analyze=analyze,
+                is_rejected=lambda result: result.should_reject,
+                mode=settings.IDENTITY_CHECK_MODE,
+                early_fields_gate=early_fields_gate,
+            )))
+        else:
+            identity_result, analysis_result = None, run_sync(run_in_llm_job(job_id, analyze()))
+
+        if identity_result is not None and identity_result.should_reject:
             error_msg = f"다중 신원 감지: {identity_result.person_count}명의 정보가 포함되어 있습니다. ({identity_result.reason})"
             logger.warning(f"[Task] Multi-identity detected: {error_msg}")
             db_service.update_job_status(
@@ -435,18 +530,14 @@ def process_resume(
                 "person_count": identity_result.person_count
             }
 
-        # 분석 모드
-        analysis_mode = AnalysisMode.PHASE_2 if mode == "phase_2" else AnalysisMode.PHASE_1
+        if identity_result is not None:
+            checkpoint_store.save_stage(job_id, STAGE_IDENTITY_CHECK, {
+                "person_count": identity_result.person_count,
+                "result": identity_result.result.value,
+            })
 
-        # ─────────────────────────────────────────────────
-        # Step 1: 분석 (Analyst Agent)
-        # ─────────────────────────────────────────────────
-        analyst = get_analyst_agent()
-
-        # RQ는 동기 환경이므로 asyncio.run 사용
-        analysis_result: AnalysisResult = asyncio.run(
-            analyst.analyze(resume_text=text, mode=analysis_mode, filename=file_name)
-        )
+        if not analysis_checkpoint and analysis_result.success and analysis_result.data:
+            checkpoint_store.save_stage(job_id, STAGE_ANALYSIS, analysis_result.to_dict())
 
         if not analysis_result.success or not analysis_result.data:
             error_msg = analysis_result.error or "분석 실패"
@@ -601,13 +692,26 @@ def process_resume(
         embeddings_error = None
 
         try:
-            embedding_result: EmbeddingResult = asyncio.run(
-                embedding_service.process_candidate(
-                    data=analyzed_data,
-                    generate_embeddings=True,
-                    raw_text=text  # PRD v0.1: 원본 텍스트 전달
+            embedding_checkpoint = checkpoint_store.load_stage(job_id, STAGE_EMBEDDING)
+            if embedding_checkpoint:
+                embedding_result = EmbeddingResult(
+                    success=True,
+                    chunks=chunks_from_payload(embedding_checkpoint["chunks"]),
+                    total_tokens=embedding_checkpoint.get("total_tokens", 0),
                 )
-            )
+            else:
+                embedding_result: EmbeddingResult = run_sync(
+                    embedding_service.process_candidate(
+                        data=analyzed_data,
+                        generate_embeddings=True,
+                        raw_text=text  # PRD v0.1: 원본 텍스트 전달
+                    )
+                )
+                if embedding_result and embedding_result.success:
+                    checkpoint_store.save_stage(job_id, STAGE_EMBEDDING, {
+                        "chunks": chunks_to_payload(embedding_result.chunks),
+                        "total_tokens": embedding_result.total_tokens,
+                    })
         except Exception as embed_error:
             logger.error(f"[Task] Embedding generation exception: {embed_error}")
             embeddings_failed = True
@@ -697,37 +801,9 @@ def process_resume(
         # Step 5: Visual Agent (포트폴리오 썸네일 캡처)
         # PRD: "Playwright URL 스크린샷 + OpenCV 얼굴 블러"
         # ─────────────────────────────────────────────────
-        portfolio_thumbnail_url = None
-        try:
-            portfolio_url = analyzed_data.get("portfolio_url")
-            if portfolio_url and portfolio_url.startswith(("http://", "https://")):
-                visual_agent = get_visual_agent()
-                thumbnail_result = asyncio.run(
-                    visual_agent.capture_portfolio_thumbnail(portfolio_url)
-                )
-
-                if thumbnail_result.success and thumbnail_result.thumbnail:
-                    # Storage에 썸네일 업로드
-                    uploaded_url = db_service.upload_image_to_storage(
-                        image_bytes=thumbnail_result.thumbnail,
-                        user_id=user_id,
-                        candidate_id=candidate_id,
-                        image_type="portfolio_thumbnail"
-                    )
-                    if uploaded_url:
-                        portfolio_thumbnail_url = uploaded_url
-                        db_service.update_candidate_images(
-                            candidate_id=candidate_id,
-                            portfolio_thumbnail_url=portfolio_thumbnail_url
-                        )
-                        logger.info(f"[Task] Portfolio thumbnail saved: {portfolio_url}")
-                else:
-                    logger.warning(
-                        f"[Task] Portfolio thumbnail failed: {thumbnail_result.error}"
-                    )
-        except Exception as visual_error:
-            # Visual Agent 실패해도 전체 처리는 계속
-            logger.warning(f"[Task] Visual processing skipped: {visual_error}")
+        portfolio_thumbnail_url = run_sync(capture_portfolio_thumbnail(
+            db_service, user_id, candidate_id, analyzed_data.get("portfolio_url")
+        ))
 
         # processing_jobs 상태 업데이트
         db_service.update_job_status(
@@ -739,6 +815,9 @@ def process_resume(
             pii_count=pii_count,
         )
 
+        # 작업 완료 → 체크포인트 삭제 (파싱 원문 등 PII 보관 최소화)
+        checkpoint_store.clear(job_id)
+
         # 크레딧 차감 - REMOVED
         # 크레딧은 presign 단계에서 reserve_credit()으로 이미 차감됨
         # db_service.deduct_credit(user_id, candidate_id)
@@ -803,6 +882,7 @@ def process_resume(
         return {"success": False, "error": str(e)}
 
 
+@flush_status_writes_after
 def full_pipeline(
     job_id: str,
     user_id: str,
@@ -845,16 +925,22 @@ def full_pipeline(
             notify_webhook(job_id, "failed", error=error_msg)
             return {"success": False, "error": error_msg}
 
-        # Step 1: 파일 파싱
-        parse_result = parse_file(
-            job_id=job_id,
-            user_id=user_id,
-            file_path=file_path,
-            file_name=file_name,
-        )
+        # Step 1: 파일 파싱 (재시도 시 체크포인트에서 복원 - 다운로드/파싱 스킵)
+        checkpoint_store = get_checkpoint_store()
+        parse_result = checkpoint_store.load_stage(job_id, STAGE_PARSING)
 
-        if not parse_result.get("success"):
-            return parse_result
+        if not parse_result:
+            parse_result = parse_file(
+                job_id=job_id,
+                user_id=user_id,
+                file_path=file_path,
+                file_name=file_name,
+            )
+
+            if not parse_result.get("success"):
+                return parse_result
+
+            checkpoint_store.save_stage(job_id, STAGE_PARSING, parse_result)
 
         # Step 2: 이력서 처리
         process_result = process_resume(
@@ -888,6 +974,243 @@ def full_pipeline(
         return {"success": False, "error": str(e)}
 
 
+async def capture_portfolio_thumbnail(
+    db_service,
+    user_id: str,
+    candidate_id: str,
+    portfolio_url: Optional[str],
+) -> Optional[str]:
+    """
+    포트폴리오 썸네일 캡처 + Storage 업로드 (Visual Agent)
+
+    PRD: "Playwright URL 스크린샷 + OpenCV 얼굴 블러"
+    실패해도 전체 처리는 계속합니다.
+
+    Returns:
+        업로드된 썸네일 URL (없거나 실패 시 None)
+    """
+    if not portfolio_url or not portfolio_url.startswith(("http://", "https://")):
+        return None
+
+    try:
+        visual_agent = get_visual_agent()
+        thumbnail_result = await visual_agent.capture_portfolio_thumbnail(portfolio_url)
+
+        if not (thumbnail_result.success and thumbnail_result.thumbnail):
+            logger.warning(f"[Task] Portfolio thumbnail failed: {thumbnail_result.error}")
+            return None
+
+        # Storage에 썸네일 업로드
+        uploaded_url = await asyncio.to_thread(
+            db_service.upload_image_to_storage,
+            image_bytes=thumbnail_result.thumbnail,
+            user_id=user_id,
+            candidate_id=candidate_id,
+            image_type="portfolio_thumbnail",
+        )
+        if not uploaded_url:
+            return None
+
+        await asyncio.to_thread(
+            db_service.update_candidate_images,
+            candidate_id=candidate_id,
+            portfolio_thumbnail_url=uploaded_url,
+        )
+        logger.info(f"[Task] Portfolio thumbnail saved: {portfolio_url}")
+        return uploaded_url
+
+    except Exception as visual_error:
+        logger.warning(f"[Task] Visual processing skipped: {visual_error}")
+        return None
+
+
+async def run_post_save_steps(
+    db_service,
+    user_id: str,
+    candidate_id: str,
+    chunks_saved: int,
+    is_update: bool,
+    portfolio_url: Optional[str] = None,
+    skip_credit_deduction: bool = False,
+) -> Optional[str]:
+    """
+    저장 이후 단계 (main.run_new_pipeline과 동일)
+
+    1. 크레딧 차감 (신규 후보자 + skip_credit_deduction=False인 경우)
+    2. 기존 JD와 자동 매칭 (청크가 저장된 경우)
+    3. 포트폴리오 썸네일 캡처
+
+    각 단계의 실패는 로그만 남기고 계속합니다.
+
+    Returns:
+        포트폴리오 썸네일 URL (없으면 None)
+    """
+    if not is_update and not skip_credit_deduction:
+        try:
+            if await asyncio.to_thread(db_service.deduct_credit, user_id=user_id, candidate_id=candidate_id):
+                logger.info(f"[Task] Credit deducted for user {user_id}")
+            else:
+                logger.warning(f"[Task] Failed to deduct credit for user {user_id}")
+        except Exception as credit_error:
+            logger.warning(f"[Task] Credit deduction failed: {credit_error}")
+
+    if chunks_saved > 0:
+        try:
+            match_result = await asyncio.to_thread(
+                db_service.match_candidate_to_existing_positions,
+                candidate_id=candidate_id,
+                user_id=user_id,
+                min_score=0.3,
+            )
+            if match_result["success"]:
+                logger.info(
+                    f"[Task] Auto-match complete: "
+                    f"{match_result['matched_positions']}/{match_result['total_positions']} positions"
+                )
+        except Exception as match_error:
+            logger.warning(f"[Task] Auto-match failed: {match_error}")
+
+    return await capture_portfolio_thumbnail(db_service, user_id, candidate_id, portfolio_url)
+
+
+@flush_status_writes_after
+async def full_pipeline_async(
+    job_id: str,
+    user_id: str,
+    file_path: str,
+    file_name: str,
+    mode: str = "phase_1",
+    candidate_id: Optional[str] = None,
+    skip_credit_deduction: bool = True,
+) -> dict:
+    """
+    전체 파이프라인 작업 - 비동기 버전 (async_worker.py 전용)
+
+    full_pipeline과 같은 Job 인자/결과 형식을 사용하며, USE_NEW_PIPELINE 롤아웃 플래그
+    (should_use_new_pipeline)를 따릅니다.
+    - 새 파이프라인: PipelineOrchestrator.run을 직접 await (한 프로세스에서 여러 이력서 동시 처리)
+      + 저장 이후 단계(run_post_save_steps: 크레딧/자동 매칭/썸네일)
+    - 기존 파이프라인: full_pipeline을 스레드에서 실행
+    동기 DB/Storage/Webhook 호출은 스레드로 넘겨 이벤트 루프를 블로킹하지 않습니다.
+
+    Args:
+        job_id: processing_jobs ID
+        user_id: 사용자 ID
+        file_path: Supabase Storage 경로
+        file_name: 원본 파일명
+        mode: phase_1 또는 phase_2
+        candidate_id: 기존 후보자 ID (presign 단계에서 생성된 경우)
+        skip_credit_deduction: 크레딧 차감 스킵 (기본값: presign 단계 reserve_credit()으로 이미 차감됨)
+
+    Returns:
+        dict: 전체 처리 결과
+    """
+    from orchestrator import get_pipeline_orchestrator, get_feature_flags
+
+    logger.info(f"[Task] full_pipeline_async started: job={job_id}, file={file_name}")
+
+    if not get_feature_flags().should_use_new_pipeline(user_id=user_id, job_id=job_id):
+        logger.info(f"[Task] Using LEGACY pipeline for job {job_id}")
+        return await asyncio.to_thread(
+            full_pipeline,
+            job_id=job_id,
+            user_id=user_id,
+            file_path=file_path,
+            file_name=file_name,
+            mode=mode,
+            candidate_id=candidate_id,
+        )
+
+    db_service = get_database_service()
+
+    async def _fail(error_code: str, error_msg: str) -> dict:
+        await asyncio.to_thread(
+            db_service.update_job_status,
+            job_id,
+            status="failed",
+            error_code=error_code,
+            error_message=error_msg,
+        )
+        # 실패 시 candidate 상태도 업데이트
+        if candidate_id:
+            await asyncio.to_thread(
+                db_service.update_candidate_status,
+                candidate_id=candidate_id,
+                status="failed",
+            )
+        await asyncio.to_thread(notify_webhook, job_id, "failed", error=error_msg)
+        return {"success": False, "error": error_msg, "error_code": error_code}
+
+    try:
+        # 크레딧 확인
+        if not await asyncio.to_thread(db_service.check_credit_available, user_id):
+            return await _fail("INSUFFICIENT_CREDITS", "크레딧이 부족합니다")
+
+        await asyncio.to_thread(db_service.update_job_status, job_id, status="processing")
+
+        # Storage에서 파일 다운로드 (재시도/백오프 포함)
+        try:
+            file_bytes = await asyncio.to_thread(download_file_from_storage, file_path)
+        except DownloadError as e:
+            return await _fail("DOWNLOAD_FAILED", str(e))
+
+        # 파싱 → 분석 → 임베딩 → 저장 (파싱은 ParseService 프로세스 풀에서 실행)
+        orchestrator = get_pipeline_orchestrator()
+        result = await orchestrator.run(
+            file_bytes=file_bytes,
+            filename=file_name,
+            user_id=user_id,
+            job_id=job_id,
+            mode=mode,
+            candidate_id=candidate_id,
+        )
+
+        if not result.success:
+            return await _fail(result.error_code or "INTERNAL_ERROR", result.error or "Pipeline failed")
+
+        portfolio_thumbnail_url = await run_post_save_steps(
+            db_service,
+            user_id=user_id,
+            candidate_id=result.candidate_id,
+            chunks_saved=result.chunks_saved,
+            is_update=result.is_update,
+            portfolio_url=result.portfolio_url,
+            skip_credit_deduction=skip_credit_deduction,
+        )
+
+        await asyncio.to_thread(
+            db_service.update_job_status,
+            job_id=job_id,
+            status="completed",
+            candidate_id=result.candidate_id,
+            confidence_score=result.confidence_score,
+            chunk_count=result.chunks_saved,
+            pii_count=result.pii_count,
+        )
+
+        logger.info(
+            f"[Task] full_pipeline_async completed: candidate={result.candidate_id}, "
+            f"confidence={result.confidence_score:.2f}, time={result.processing_time_ms}ms"
+        )
+
+        await asyncio.to_thread(notify_webhook, job_id, "completed", result={
+            "candidate_id": result.candidate_id,
+            "confidence_score": result.confidence_score,
+            "chunk_count": result.chunks_saved,
+            "pii_count": result.pii_count,
+            "processing_time_ms": result.processing_time_ms,
+            "is_update": result.is_update,
+            "parent_id": result.parent_id,
+            "portfolio_thumbnail_url": portfolio_thumbnail_url,
+        })
+
+        return {**result.to_dict(), "portfolio_thumbnail_url": portfolio_thumbnail_url}
+
+    except Exception as e:
+        logger.error(f"[Task] full_pipeline_async error: {e}", exc_info=True)
+        return await _fail("INTERNAL_ERROR", str(e))
+
+
 def get_file_type_from_name(file_name: str) -> str:
     """
     파일명에서 파일 타입 추출
@@ -59,3 +59,12 @@ def sample_resume_text():
     기술
     Python, JavaScript, TypeScript, React, Node.js
     """
+
+
+@pytest.fixture(autouse=True)
+def reset_embedding_cache():
+    """프로세스 공유 임베딩 캐시가 테스트 간에 벡터를 공유하지 않도록 초기화"""
+    yield
+    module = sys.modules.get("services.embedding_cache")
+    if module is not None:
+        module._embedding_cache = None
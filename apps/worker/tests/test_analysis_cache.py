@@ -0,0 +1,88 @@
+"""
+Unit Tests: Analysis Cache
+
+테스트 대상: services/analysis_cache.py
+- 캐시 키 결정성 (텍스트/프롬프트 버전/프로바이더/모드)
+- 로컬 파일 fallback 저장/조회
+- TTL 만료 및 항목 수 기반 eviction
+"""
+
+import os
+import time
+
+import pytest
+
+from services.analysis_cache import AnalysisCache, build_cache_key, compute_prompt_version
+
+
+class TestBuildCacheKey:
+    """build_cache_key 함수 테스트"""
+
+    def test_same_input_same_key(self):
+        version = compute_prompt_version("system prompt", "{}")
+        key1 = build_cache_key("이력서 텍스트", version, ["openai:gpt-4o", "gemini:flash"], "phase_1")
+        key2 = build_cache_key("이력서 텍스트", version, ["gemini:flash", "openai:gpt-4o"], "phase_1")
+        assert key1 == key2
+
+    def test_key_changes_with_inputs(self):
+        version = compute_prompt_version("system prompt", "{}")
+        base = build_cache_key("텍스트", version, ["openai:gpt-4o"], "phase_1")
+
+        assert base != build_cache_key("텍스트2", version, ["openai:gpt-4o"], "phase_1")
+        assert base != build_cache_key("텍스트", version, ["openai:gpt-4o"], "phase_2")
+        assert base != build_cache_key("텍스트", version, ["openai:gpt-4o-mini"], "phase_1")
+        assert base != build_cache_key(
+            "텍스트", compute_prompt_version("system prompt v2", "{}"), ["openai:gpt-4o"], "phase_1"
+        )
+
+
+class TestLocalBackend:
+    """Redis 없이 로컬 파일 캐시 동작 테스트"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return AnalysisCache(redis_url="", ttl_seconds=60, max_entries=3, local_dir=str(tmp_path))
+
+    def test_backend_is_local_without_redis(self, cache):
+        assert cache.backend == "local"
+
+    def test_set_and_get_roundtrip(self, cache):
+        payload = {"success": True, "data": {"name": "홍길동"}, "confidence_score": 0.9}
+        assert cache.set("abc", payload) is True
+        assert cache.get("abc") == payload
+
+    def test_miss_returns_none_and_counts(self, cache):
+        assert cache.get("missing") is None
+        cache.set("hit", {"success": True})
+        cache.get("hit")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_expired_entry_is_dropped(self, tmp_path):
+        cache = AnalysisCache(redis_url="", ttl_seconds=0, local_dir=str(tmp_path))
+        cache.set("old", {"success": True})
+        time.sleep(0.01)
+        assert cache.get("old") is None
+        assert not (tmp_path / "old.json").exists()
+
+    def test_evicts_least_recently_used(self, cache, tmp_path):
+        # 임의 지정한 접근 시각이 TTL에 걸리지 않도록 TTL 연장
+        cache.ttl_seconds = 10 ** 10
+        for i in range(3):
+            cache.set(f"k{i}", {"i": i})
+            # mtime 해상도 차이를 피하기 위해 명시적으로 접근 시각 지정
+            os.utime(tmp_path / f"k{i}.json", (1000 + i, 1000 + i))
+
+        cache.set("k3", {"i": 3})
+
+        assert cache.get("k0") is None
+        assert cache.get("k3") == {"i": 3}
+        assert len(list(tmp_path.glob("*.json"))) == 3
+
+    def test_invalidate(self, cache):
+        cache.set("abc", {"success": True})
+        cache.invalidate("abc")
+        assert cache.get("abc") is None
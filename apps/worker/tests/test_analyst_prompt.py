@@ -0,0 +1,153 @@
+"""
+Unit Tests: Section-aware Analyst Prompt
+
+테스트 대상: utils/section_prompt_builder.py
+- 보일러플레이트 제거 (페이지 번호, 반복 머리글/바닥글, 개인정보 동의문, 서약 문구)
+- 중복 섹션 제거
+- 라벨별 토큰 예산 (기간 줄 유지, profile 보호)
+- 긴 이력서 프롬프트 토큰 감소
+"""
+
+from utils.section_prompt_builder import OMITTED_MARKER, SectionPromptBuilder
+
+
+def count_tokens(text: str) -> int:
+    return len(text.split())
+
+
+def make_builder(**budgets) -> SectionPromptBuilder:
+    return SectionPromptBuilder(count_tokens=count_tokens, budgets=budgets or None)
+
+
+def long_resume() -> str:
+    lines = ["홍길동", "010-1234-5678", "hong@example.com", "", "경력사항"]
+    for i in range(6):
+        lines.append(f"ABC회사{i} (201{i}.03 - 201{i + 1}.02) 백엔드 개발자")
+        lines += [f"- 주문 시스템 {i}단계 개선 작업과 결제 모듈 {j} 리팩토링을 담당했습니다." for j in range(8)]
+        lines += ["", "홍길동 이력서 - 기밀 문서", f"- {i + 1} -", ""]
+    project = ["프로젝트", "결제 플랫폼 재구축: Kafka 기반 이벤트 파이프라인과 정산 배치를 설계했습니다."]
+    lines += project + [""] + project + [""]
+    lines.append("자기소개서")
+    lines += [f"{i}. 저는 문제를 끝까지 파고드는 개발자이며 새로운 기술을 빠르게 학습합니다." for i in range(40)]
+    lines += [
+        "", "위 기재 사항은 사실과 틀림이 없습니다.", "",
+        "개인정보 수집 및 이용 동의서", "수집 항목: 성명, 연락처, 이메일", "보유 기간: 채용 종료 후 1년",
+    ]
+    return "\n".join(lines)
+
+
+class TestBoilerplate:
+    """보일러플레이트 제거 테스트"""
+
+    def test_page_numbers_and_repeated_footers_removed(self):
+        result = make_builder().build(long_resume())
+
+        assert result.text.count("홍길동 이력서 - 기밀 문서") == 1
+        assert "- 3 -" not in result.text
+        assert result.dropped_lines >= 10
+
+    def test_consent_and_certification_removed(self):
+        result = make_builder().build(long_resume())
+
+        assert "개인정보 수집" not in result.text
+        assert "보유 기간" not in result.text
+        assert "사실과 틀림이 없습니다" not in result.text
+
+    def test_content_lines_differing_by_numbers_kept(self):
+        result = make_builder().build(long_resume())
+
+        for j in range(8):
+            assert f"결제 모듈 {j} 리팩토링" in result.text
+
+    def test_repeated_job_titles_in_career_body_kept(self):
+        lines = ["홍길동", "hong@example.com", "", "경력사항"]
+        for i, company in enumerate(["ABC회사", "DEF회사", "GHI회사"]):
+            lines += [
+                f"{company} (201{i}.03 - 201{i + 1}.02)",
+                "Backend Engineer",
+                f"- 주문 시스템 {i}단계 개선과 결제 모듈 리팩토링을 담당했습니다.",
+                f"- 정산 배치 {i}차 성능 개선을 진행했습니다.",
+                "",
+            ]
+        lines += ["홍길동 이력서 - 기밀 문서", "- 1 -", "", "학력사항", "서울대학교 컴퓨터공학과"]
+        result = make_builder().build("\n".join(lines))
+
+        assert result.text.count("Backend Engineer") == 3
+        assert result.dropped_lines == 1  # 페이지 번호 줄만 제거
+
+    def test_repeated_lines_only_removed_at_page_boundaries(self):
+        pages = [
+            [
+                "회사소개서 양식 v2", "자기소개서", "Backend Engineer",
+                f"{i}번째 항목: 성장 과정과 지원 동기를 기술합니다.", f"{i}번째 항목: 입사 후 포부를 기술합니다.",
+                f"- {i} -",
+            ]
+            for i in range(1, 4)
+        ]
+        result = make_builder().build("\n".join(line for page in pages for line in page))
+
+        assert result.text.count("회사소개서 양식 v2") == 1
+        assert result.text.count("Backend Engineer") == 3
+
+
+class TestDeduplication:
+    """중복 섹션 제거 테스트"""
+
+    def test_repeated_section_dropped(self):
+        result = make_builder().build(long_resume())
+
+        assert result.duplicate_sections == 1
+        assert result.text.count("결제 플랫폼 재구축") == 1
+
+
+class TestBudgets:
+    """라벨별 토큰 예산 테스트"""
+
+    def test_over_budget_section_keeps_title_and_timeline(self):
+        result = make_builder(career=40).build(long_resume())
+
+        assert "career" in result.truncated_labels
+        assert "경력사항" in result.text
+        assert OMITTED_MARKER in result.text
+        # 예산 초과 후에도 기간 줄은 유지
+        for i in range(6):
+            assert f"ABC회사{i} (201{i}.03 - 201{i + 1}.02)" in result.text
+        assert "결제 모듈 7 리팩토링" not in result.text.split("ABC회사5")[1]
+
+    def test_profile_never_truncated(self):
+        result = make_builder(profile=1, career=40).build(long_resume())
+
+        assert result.text.startswith("홍길동\n010-1234-5678\nhong@example.com")
+        assert "profile" not in result.truncated_labels
+
+    def test_numbered_content_lines_not_treated_as_headers(self):
+        # "0. ... 새로운 기술을 ..." 은 SectionSeparator에서 skills 헤더로 감지됨
+        result = make_builder(skills=5).build(long_resume())
+
+        assert "skills" not in result.truncated_labels
+        assert "39. 저는" in result.text
+
+    def test_text_without_headers_not_budgeted(self):
+        text = "\n".join(f"{i}번째 줄에 기록된 업무 경험 설명입니다." for i in range(200))
+        result = make_builder(unknown=10).build(text)
+
+        assert result.truncated_labels == []
+        assert result.text == text
+
+
+class TestReduction:
+    """프롬프트 토큰 감소 테스트"""
+
+    def test_long_resume_prompt_tokens_reduced(self):
+        # 기본 예산 + 기본 토큰 카운터 (tiktoken, 없으면 추정)
+        result = SectionPromptBuilder().build(long_resume())
+
+        assert result.prompt_tokens < result.original_tokens
+        assert result.reduction > 0.2
+        assert "summary" in result.truncated_labels
+
+    def test_empty_text(self):
+        result = make_builder().build("")
+
+        assert result.text == ""
+        assert result.reduction == 0.0
@@ -0,0 +1,73 @@
+"""
+Unit Tests: Async Runtime
+
+테스트 대상: utils/async_runtime.py
+- 여러 호출이 같은 이벤트 루프를 재사용하는지
+- 예외 전파 및 타임아웃 시 코루틴 취소
+"""
+
+import asyncio
+
+import pytest
+
+from utils.async_runtime import AsyncRuntime
+
+
+@pytest.fixture
+def runtime():
+    rt = AsyncRuntime()
+    yield rt
+    rt.shutdown()
+
+
+class TestAsyncRuntime:
+    """AsyncRuntime 동작 테스트"""
+
+    def test_runs_coroutine_and_returns_result(self, runtime):
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        assert runtime.run(add(1, 2)) == 3
+
+    def test_loop_is_reused_across_calls(self, runtime):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = runtime.run(current_loop())
+        second = runtime.run(current_loop())
+        assert first is second
+        assert not first.is_closed()
+
+    def test_exception_is_propagated(self, runtime):
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            runtime.run(fail())
+
+    def test_timeout_cancels_coroutine(self, runtime):
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with pytest.raises(TimeoutError):
+            runtime.run(slow(), timeout=0.05)
+
+        # 취소가 루프 스레드에서 처리될 시간을 줌
+        runtime.run(asyncio.sleep(0.05))
+        assert cancelled == [True]
+
+    def test_shutdown_and_restart(self, runtime):
+        async def ping():
+            return "pong"
+
+        runtime.run(ping())
+        runtime.shutdown()
+        assert not runtime.is_running
+        assert runtime.run(ping()) == "pong"
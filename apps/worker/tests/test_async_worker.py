@@ -0,0 +1,375 @@
+"""
+Unit Tests: Async Worker
+
+테스트 대상: async_worker.py
+- Queue별 동시 처리 수 설정 파싱
+- Queue별 동시 실행 상한
+- 실패 시 RQ Retry / on_failure(DLQ) 처리
+- RQ Worker 등록 / StartedJobRegistry / heartbeat (fakeredis의 실제 RQ 객체)
+- 종료 요청 시 drain 및 시간 초과 Job 반환
+- Task 종료 시 버퍼링된 상태 갱신 플러시
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+from rq import Queue, Retry, Worker
+from rq.job import Callback, JobStatus
+
+import tasks
+from async_worker import AsyncWorker, parse_concurrency
+
+# on_failure 콜백 호출 기록 (RQ Callback은 함수 경로로 저장되므로 모듈 수준 함수 사용)
+_failure_calls = []
+
+
+def record_failure(job, connection, exc_type, exc_value, tb):
+    _failure_calls.append((job.id, exc_type))
+
+
+def _make_job(job_id: str, retries_left=None):
+    job = MagicMock()
+    job.id = job_id
+    job.func_name = "tasks.parse_file"
+    job.timeout = None
+    job.retries_left = retries_left
+    job.result_ttl = None
+    job.failure_ttl = None
+    return job
+
+
+def _make_worker(concurrency, drain_timeout=5, burst=True):
+    worker = AsyncWorker(
+        ["fast"], fakeredis.FakeRedis(), concurrency=concurrency, drain_timeout=drain_timeout, burst=burst
+    )
+    worker._requeued = []
+    worker._start_job = MagicMock()
+    worker._handle_success = MagicMock()
+    worker._handle_failure = MagicMock()
+    worker._requeue = lambda job, queue: worker._requeued.append(job.id)
+    worker._run_scheduler = lambda: asyncio.sleep(0)
+    return worker
+
+
+class TestParseConcurrency:
+    """ASYNC_WORKER_CONCURRENCY 파싱 테스트"""
+
+    def test_parses_queue_limits(self):
+        assert parse_concurrency("fast=16, slow=4,process=8") == {"fast": 16, "slow": 4, "process": 8}
+
+    def test_ignores_invalid_entries(self):
+        assert parse_concurrency("fast=abc,slow=0,,process=2") == {"process": 2}
+
+    def test_unknown_queue_uses_default(self):
+        worker = AsyncWorker(["fast", "parse"], fakeredis.FakeRedis(), concurrency={"fast": 3})
+        assert worker.concurrency["fast"] == 3
+        assert worker.concurrency["parse"] > 0
+
+
+class TestAsyncWorkerExecution:
+    """Job 동시 실행 테스트"""
+
+    def test_respects_per_queue_concurrency(self):
+        worker = _make_worker({"fast": 2})
+        pending = [_make_job(f"job-{i}") for i in range(6)]
+        worker._dequeue = lambda queue: pending.pop(0) if pending else None
+
+        running = 0
+        peak = 0
+
+        async def fake_run(job):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return {"success": True}
+
+        worker._run_job = fake_run
+        asyncio.run(worker.run())
+
+        assert peak == 2
+        assert worker.stats["finished"] == 6
+        assert worker._handle_success.call_count == 6
+
+    def test_exception_goes_to_failure_handler(self):
+        worker = _make_worker({"fast": 1})
+        pending = [_make_job("job-1")]
+        worker._dequeue = lambda queue: pending.pop(0) if pending else None
+
+        async def failing_run(job):
+            raise RuntimeError("boom")
+
+        worker._run_job = failing_run
+        asyncio.run(worker.run())
+
+        worker._handle_failure.assert_called_once()
+        exc_type, exc_value, _ = worker._handle_failure.call_args[0][2]
+        assert exc_type is RuntimeError
+        assert str(exc_value) == "boom"
+
+    def test_drain_timeout_returns_job_to_queue(self):
+        worker = _make_worker({"fast": 2}, drain_timeout=0.05, burst=False)
+        pending = [_make_job("slow-job")]
+
+        def dequeue(queue):
+            if pending:
+                return pending.pop(0)
+            worker._loop.call_soon_threadsafe(worker.request_stop)
+            return None
+
+        worker._dequeue = dequeue
+
+        async def hanging_run(job):
+            await asyncio.sleep(10)
+
+        worker._run_job = hanging_run
+
+        async def main():
+            worker._loop = asyncio.get_running_loop()
+            await worker.run()
+
+        asyncio.run(main())
+
+        assert worker._requeued == ["slow-job"]
+        worker._handle_success.assert_not_called()
+
+
+class TestFailureHandling:
+    """RQ Retry / on_failure 처리 테스트 (fakeredis의 실제 RQ 객체)"""
+
+    @pytest.fixture
+    def env(self):
+        _failure_calls.clear()
+        connection = fakeredis.FakeRedis()
+        worker = AsyncWorker(["fast"], connection, concurrency={"fast": 1}, burst=True)
+        worker._run_scheduler = lambda: asyncio.sleep(0)
+        return worker, Queue("fast", connection=connection)
+
+    def test_success_moves_job_to_finished_registry(self, env):
+        worker, queue = env
+        job = queue.enqueue("operator.add", 1, 2)
+
+        asyncio.run(worker.run())
+
+        job.refresh()
+        assert job.get_status() == JobStatus.FINISHED
+        assert job.return_value() == 3
+        assert job.worker_name == worker.rq_worker.name
+        assert job.id in queue.finished_job_registry.get_job_ids()
+        assert queue.started_job_registry.get_job_ids() == []
+        assert worker.stats["finished"] == 1
+
+    def test_retry_when_retries_left(self, env):
+        worker, queue = env
+        job = queue.enqueue(
+            "operator.truediv", 1, 0, retry=Retry(max=1), on_failure=Callback(record_failure)
+        )
+
+        asyncio.run(worker.run())
+
+        # 1회 재시도 후 최종 실패 - on_failure(DLQ)는 최종 실패에서만 호출
+        job.refresh()
+        assert worker.stats["retried"] == 1
+        assert worker.stats["failed"] == 1
+        assert job.retries_left == 0
+        assert _failure_calls == [(job.id, ZeroDivisionError)]
+
+    def test_final_failure_calls_on_failure_callback(self, env):
+        worker, queue = env
+        job = queue.enqueue("operator.truediv", 1, 0, on_failure=Callback(record_failure))
+
+        asyncio.run(worker.run())
+
+        job.refresh()
+        assert job.get_status() == JobStatus.FAILED
+        assert job.id in queue.failed_job_registry.get_job_ids()
+        assert "ZeroDivisionError" in job.latest_result().exc_string
+        assert queue.started_job_registry.get_job_ids() == []
+        assert _failure_calls == [(job.id, ZeroDivisionError)]
+        assert worker.stats["failed"] == 1
+
+
+class TestRQRegistration:
+    """RQ Worker 등록 / StartedJobRegistry / heartbeat 테스트"""
+
+    @pytest.fixture
+    def env(self):
+        _failure_calls.clear()
+        connection = fakeredis.FakeRedis()
+        worker = AsyncWorker(["fast"], connection, concurrency={"fast": 2}, drain_timeout=0.05, burst=True)
+        worker._run_scheduler = lambda: asyncio.sleep(0)
+        return worker, Queue("fast", connection=connection), connection
+
+    def test_running_job_registered_with_worker(self, env):
+        worker, queue, connection = env
+        job = queue.enqueue("operator.add", 1, 2)
+        seen = {}
+
+        async def observe(running_job):
+            seen["started"] = queue.started_job_registry.get_job_ids()
+            seen["workers"] = [w.name for w in Worker.all(connection=connection)]
+            seen["status"] = running_job.get_status(refresh=True)
+            return 3
+
+        worker._run_job = observe
+        asyncio.run(worker.run())
+
+        assert seen["started"] == [job.id]
+        assert seen["workers"] == [worker.rq_worker.name]
+        assert seen["status"] == JobStatus.STARTED
+        # 종료 시 Worker 등록 해제, intermediate queue 비움
+        assert Worker.all(connection=connection) == []
+        assert connection.llen(queue.intermediate_queue_key) == 0
+
+    def test_heartbeat_extends_started_registry_expiry(self, env):
+        worker, queue, connection = env
+        job = queue.enqueue("operator.add", 1, 2)
+        worker.rq_worker.register_birth()
+        worker._start_job(job, queue)
+        key = worker._executions[job.id].composite_key
+
+        connection.zadd(queue.started_job_registry.key, {key: time.time() + 1})
+        worker._heartbeat([(job, queue)])
+
+        expires_at = connection.zscore(queue.started_job_registry.key, key)
+        assert expires_at >= time.time() + worker.heartbeat_ttl - 5
+
+    def test_killed_worker_job_recovered_by_registry_cleanup(self, env):
+        from rq.exceptions import AbandonedJobError
+
+        worker, queue, connection = env
+        job = queue.enqueue("operator.add", 1, 2, on_failure=Callback(record_failure))
+        worker._start_job(job, queue)
+        key = worker._executions[job.id].composite_key
+
+        # 프로세스가 SIGKILL로 죽어 heartbeat가 끊김 → 만료 후 다른 워커가 (스레드에서) registry 정리
+        connection.zadd(queue.started_job_registry.key, {key: time.time() - 1})
+        other = AsyncWorker(["fast"], connection, concurrency={"fast": 1})
+        asyncio.run(asyncio.to_thread(other._clean_registries))
+
+        job.refresh()
+        assert job.get_status() == JobStatus.FAILED
+        assert job.id in queue.failed_job_registry.get_job_ids()
+        assert _failure_calls == [(job.id, AbandonedJobError)]
+
+    def test_cancelled_job_returned_to_queue(self, env, monkeypatch):
+        monkeypatch.setattr("async_worker.DEQUEUE_TIMEOUT_SECONDS", 1)
+        worker, queue, _ = env
+        job = queue.enqueue("operator.add", 1, 2)
+        worker.burst = False
+
+        async def hanging_run(running_job):
+            asyncio.get_running_loop().call_soon(worker.request_stop)
+            await asyncio.sleep(10)
+
+        worker._run_job = hanging_run
+        asyncio.run(worker.run())
+
+        assert worker.stats["requeued"] == 1
+        assert queue.get_job_ids() == [job.id]
+        assert queue.started_job_registry.get_job_ids() == []
+
+
+class TestFullPipelineAsync:
+    """tasks.full_pipeline_async 라우팅 / 저장 이후 단계 테스트"""
+
+    @pytest.fixture
+    def env(self, monkeypatch):
+        from orchestrator.pipeline_orchestrator import OrchestratorResult
+
+        db = MagicMock()
+        db.check_credit_available.return_value = True
+        db.match_candidate_to_existing_positions.return_value = {
+            "success": True, "matched_positions": 1, "total_positions": 2,
+        }
+        orchestrator = MagicMock()
+        orchestrator.run = MagicMock(side_effect=lambda **kwargs: asyncio.sleep(0, OrchestratorResult(
+            success=True, candidate_id="c1", chunks_saved=3, portfolio_url="https://folio.dev",
+        )))
+        flags = MagicMock()
+        thumbnail = MagicMock(side_effect=lambda *args: asyncio.sleep(0, "thumb.png"))
+
+        monkeypatch.setattr(tasks, "get_database_service", lambda: db)
+        monkeypatch.setattr(tasks, "download_file_from_storage", lambda path: b"pdf")
+        monkeypatch.setattr(tasks, "notify_webhook", MagicMock())
+        monkeypatch.setattr(tasks, "capture_portfolio_thumbnail", thumbnail)
+        monkeypatch.setattr(tasks, "full_pipeline", MagicMock(return_value={"success": True, "legacy": True}))
+        monkeypatch.setattr("orchestrator.get_pipeline_orchestrator", lambda: orchestrator)
+        monkeypatch.setattr("orchestrator.get_feature_flags", lambda: flags)
+        return tasks, db, orchestrator, flags, thumbnail
+
+    def test_legacy_pipeline_when_rollout_flag_off(self, env):
+        tasks, _, orchestrator, flags, _ = env
+        flags.should_use_new_pipeline.return_value = False
+
+        result = asyncio.run(tasks.full_pipeline_async("j1", "u1", "path/a.pdf", "a.pdf"))
+
+        assert result == {"success": True, "legacy": True}
+        tasks.full_pipeline.assert_called_once()
+        orchestrator.run.assert_not_called()
+
+    def test_new_pipeline_runs_post_save_steps(self, env):
+        tasks, db, orchestrator, flags, thumbnail = env
+        flags.should_use_new_pipeline.return_value = True
+
+        result = asyncio.run(tasks.full_pipeline_async(
+            "j1", "u1", "path/a.pdf", "a.pdf", skip_credit_deduction=False
+        ))
+
+        assert result["success"] and result["portfolio_thumbnail_url"] == "thumb.png"
+        orchestrator.run.assert_called_once()
+        db.deduct_credit.assert_called_once_with(user_id="u1", candidate_id="c1")
+        db.match_candidate_to_existing_positions.assert_called_once()
+        thumbnail.assert_called_once_with(db, "u1", "c1", "https://folio.dev")
+
+    def test_reserved_credit_not_deducted_again(self, env):
+        tasks, db, _, flags, _ = env
+        flags.should_use_new_pipeline.return_value = True
+
+        asyncio.run(tasks.full_pipeline_async("j1", "u1", "path/a.pdf", "a.pdf"))
+
+        db.deduct_credit.assert_not_called()
+
+    def test_buffered_status_writes_flushed_after_job(self, env):
+        tasks, db, _, flags, _ = env
+        flags.should_use_new_pipeline.return_value = True
+
+        asyncio.run(tasks.full_pipeline_async("j1", "u1", "path/a.pdf", "a.pdf"))
+
+        db.flush_status_writes.assert_called_once()
+
+
+class TestFlushStatusWritesAfter:
+    """RQ Task 종료 시 상태 갱신 플러시 테스트 (work-horse는 os._exit로 끝나 atexit 미실행)"""
+
+    def test_flushes_when_task_raises(self, monkeypatch):
+        db = MagicMock()
+        monkeypatch.setattr(tasks, "get_database_service", lambda: db)
+
+        @tasks.flush_status_writes_after
+        def task():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            task()
+        db.flush_status_writes.assert_called_once()
+
+    def test_flush_failure_does_not_mask_result(self, monkeypatch):
+        db = MagicMock()
+        db.flush_status_writes.side_effect = RuntimeError("PostgREST 503")
+        monkeypatch.setattr(tasks, "get_database_service", lambda: db)
+
+        @tasks.flush_status_writes_after
+        async def task():
+            return {"success": True}
+
+        assert asyncio.run(task()) == {"success": True}
+        assert asyncio.iscoroutinefunction(task)
+
+    def test_rq_entry_points_wrapped(self):
+        for func in (tasks.parse_file, tasks.process_resume, tasks.full_pipeline, tasks.full_pipeline_async):
+            assert func.__wrapped__.__name__ == func.__name__
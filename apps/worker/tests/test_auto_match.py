@@ -0,0 +1,65 @@
+"""
+Unit Tests: Auto-Matching
+
+테스트 대상: services/database_service.py
+- match_candidate_to_existing_positions: 후보자 1명 증분 매칭 (RPC 1회)
+- rematch_all_positions: Position별 전체 재매칭 (유지보수)
+"""
+
+from unittest.mock import MagicMock
+
+from services.database_service import DatabaseService
+
+
+def _make_service():
+    service = DatabaseService.__new__(DatabaseService)
+    service.client = MagicMock()
+    return service
+
+
+class TestIncrementalMatch:
+    """증분 매칭 테스트"""
+
+    def test_single_rpc_for_new_candidate(self):
+        service = _make_service()
+        service.client.rpc.return_value.execute.return_value.data = [
+            {"total_positions": 12, "matched_positions": 5}
+        ]
+
+        result = service.match_candidate_to_existing_positions("cand-1", "user-1", min_score=0.4)
+
+        assert result == {"success": True, "matched_positions": 5, "total_positions": 12, "error": None}
+        service.client.rpc.assert_called_once_with(
+            "save_candidate_position_matches",
+            {"p_candidate_id": "cand-1", "p_user_id": "user-1", "p_limit": 100, "p_min_score": 0.4},
+        )
+        # Position 목록 조회 / Position별 재매칭 없음
+        service.client.table.assert_not_called()
+
+    def test_rpc_error_is_reported(self):
+        service = _make_service()
+        service.client.rpc.side_effect = RuntimeError("timeout")
+
+        result = service.match_candidate_to_existing_positions("cand-1", "user-1")
+
+        assert result["success"] is False
+        assert result["error"] == "timeout"
+
+
+class TestFullRematch:
+    """전체 재매칭 (유지보수) 테스트"""
+
+    def test_rematches_each_open_position(self):
+        service = _make_service()
+        service.client.table.return_value.select.return_value.eq.return_value.eq.return_value \
+            .execute.return_value.data = [{"id": "pos-1"}, {"id": "pos-2"}]
+        service.client.rpc.return_value.execute.return_value.data = 30
+
+        result = service.rematch_all_positions("user-1", limit=50)
+
+        assert result["success"]
+        assert result["total_positions"] == 2
+        assert result["matched_positions"] == 2
+        called = [call.args for call in service.client.rpc.call_args_list]
+        assert [args[0] for args in called] == ["save_position_matches"] * 2
+        assert called[0][1]["p_limit"] == 50
@@ -0,0 +1,122 @@
+"""
+Unit Tests: Checkpoint Store
+
+테스트 대상: services/checkpoint_store.py
+- 로컬 파일 fallback 저장/조회/삭제
+- TTL 만료
+- Chunk 직렬화 왕복 (임베딩 벡터 보존)
+- 오케스트레이터의 체크포인트 I/O는 이벤트 루프 밖(스레드)에서 실행
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from context import PipelineContext
+from orchestrator import pipeline_orchestrator
+from orchestrator.pipeline_orchestrator import PipelineOrchestrator
+from services.checkpoint_store import (
+    CheckpointStore,
+    chunks_to_payload,
+    chunks_from_payload,
+    STAGE_ANALYSIS,
+    STAGE_PARSING,
+)
+from services.embedding_service import Chunk, ChunkType
+
+
+class TestCheckpointStoreLocal:
+    """Redis 없이 로컬 파일 체크포인트 동작 테스트"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return CheckpointStore(redis_url="", ttl_seconds=60, local_dir=str(tmp_path), enabled=True)
+
+    def test_save_and_load_stage(self, store):
+        payload = {"success": True, "text": "이력서 원문", "page_count": 2}
+        assert store.save_stage("job-1", STAGE_PARSING, payload) is True
+        assert store.load_stage("job-1", STAGE_PARSING) == payload
+
+    def test_stages_are_isolated_per_job(self, store):
+        store.save_stage("job-1", STAGE_ANALYSIS, {"confidence_score": 0.9})
+        assert store.load_stage("job-2", STAGE_ANALYSIS) is None
+        assert store.load_stage("job-1", STAGE_PARSING) is None
+
+    def test_clear_removes_all_stages(self, store):
+        store.save_stage("job-1", STAGE_PARSING, {"text": "a"})
+        store.save_stage("job-1", STAGE_ANALYSIS, {"data": {}})
+        store.clear("job-1")
+        assert store.load_stage("job-1", STAGE_PARSING) is None
+        assert store.load_stage("job-1", STAGE_ANALYSIS) is None
+
+    def test_expired_checkpoint_is_ignored(self, tmp_path):
+        store = CheckpointStore(redis_url="", ttl_seconds=-1, local_dir=str(tmp_path), enabled=True)
+        store.save_stage("job-1", STAGE_PARSING, {"text": "a"})
+        assert store.load_stage("job-1", STAGE_PARSING) is None
+
+    def test_disabled_store_is_noop(self, tmp_path):
+        store = CheckpointStore(redis_url="", local_dir=str(tmp_path), enabled=False)
+        assert store.save_stage("job-1", STAGE_PARSING, {"text": "a"}) is False
+        assert store.load_stage("job-1", STAGE_PARSING) is None
+
+    def test_missing_job_id_is_noop(self, store):
+        assert store.save_stage(None, STAGE_PARSING, {"text": "a"}) is False
+        assert store.load_stage(None, STAGE_PARSING) is None
+
+    def test_unsafe_job_id_stays_inside_dir(self, store, tmp_path):
+        store.save_stage("../escape", STAGE_PARSING, {"text": "a"})
+        assert store.load_stage("../escape", STAGE_PARSING) == {"text": "a"}
+        assert not (tmp_path.parent / "escape").exists()
+
+
+class TestChunkPayload:
+    """Chunk 직렬화 테스트"""
+
+    def test_roundtrip_preserves_embedding(self):
+        chunks = [
+            Chunk(ChunkType.SUMMARY, 0, "요약", {"source": "summary"}, [0.1, 0.2]),
+            Chunk(ChunkType.RAW_SECTION, 1, "원문 섹션", {}, None),
+        ]
+        restored = chunks_from_payload(chunks_to_payload(chunks))
+
+        assert restored[0].chunk_type == ChunkType.SUMMARY
+        assert restored[0].embedding.dtype == np.float32
+        assert restored[0].embedding.tolist() == np.array([0.1, 0.2], dtype=np.float32).tolist()
+        assert restored[0].metadata == {"source": "summary"}
+        assert restored[1].chunk_index == 1
+        assert restored[1].embedding is None
+
+    def test_legacy_float_list_payload_is_loaded(self):
+        payload = [{"chunk_type": "summary", "chunk_index": 0, "content": "요약", "embedding": [0.5, 0.25]}]
+
+        restored = chunks_from_payload(payload)
+
+        assert restored[0].embedding.tolist() == [0.5, 0.25]
+
+
+class TestOrchestratorCheckpointIO:
+    """동기 Redis 체크포인트 호출이 이벤트 루프를 블로킹하지 않는지 테스트"""
+
+    async def test_checkpoint_load_runs_off_event_loop(self, monkeypatch):
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def load_stage(job_id, stage):
+            threads.append(threading.get_ident())
+            return {"person_count": 1}
+
+        store = MagicMock()
+        store.load_stage.side_effect = load_stage
+        monkeypatch.setattr(pipeline_orchestrator, "_get_checkpoint_store", lambda: store)
+
+        ctx = PipelineContext()
+        ctx.metadata.job_id = "job-1"
+        orchestrator = PipelineOrchestrator.__new__(PipelineOrchestrator)
+
+        result = await orchestrator._stage_identity_check(ctx)
+
+        assert result == {"success": True, "should_reject": False}
+        store.load_stage.assert_called_once_with("job-1", "identity_check")
+        assert threads and threads[0] != loop_thread
@@ -180,3 +180,284 @@ class TestCriticalFields:
             mock_settings.return_value = MagicMock(ANALYSIS_MODE=MagicMock(), USE_CONDITIONAL_LLM=True)
             from agents.analyst_agent import AnalystAgent
             assert len(AnalystAgent.CRITICAL_FIELDS) == 3
+
+
+class TestHedgedPrimaryCall:
+    """1차 호출 헤징 테스트 (느린 GPT-4o → Gemini 추가 호출)"""
+
+    GOOD = {"name": "홍길동", "phone": "010-1234-5678", "email": "hong@example.com"}
+
+    @pytest.fixture
+    def analyst_agent(self):
+        with patch('agents.analyst_agent.get_section_separator'), \
+             patch('agents.analyst_agent.get_llm_manager'), \
+             patch('agents.analyst_agent.get_settings') as mock_settings:
+            mock_settings.return_value = MagicMock(ANALYSIS_MODE=MagicMock(), USE_CONDITIONAL_LLM=True)
+            from agents.analyst_agent import AnalystAgent, HedgeDelayEstimator
+            agent = AnalystAgent()
+            agent.confidence_threshold = 0.85
+            agent.hedge_delay = HedgeDelayEstimator(max_delay=0.02, min_delay=0.01, percentile=0.95)
+            return agent
+
+    def script(self, agent, behaviour):
+        """provider 값별 (지연 초, content 또는 None=실패) 동작 지정"""
+        import asyncio
+        from agents.analyst_agent import LLMResponse
+
+        calls = []
+        cancelled = []
+
+        async def call_single_llm(provider, messages, on_early_fields=None):
+            calls.append(provider.value)
+            delay, content = behaviour[provider.value]
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(provider.value)
+                raise
+            return LLMResponse(
+                provider=provider,
+                content=content,
+                raw_response="",
+                model="test",
+                error=None if content is not None else "failed",
+            )
+
+        agent._call_single_llm = call_single_llm
+        return calls, cancelled
+
+    async def test_fast_primary_not_hedged(self, analyst_agent):
+        calls, _ = self.script(analyst_agent, {"openai": (0, self.GOOD), "gemini": (0, self.GOOD)})
+
+        primary, secondary = await analyst_agent._hedged_primary_call([])
+
+        assert primary.provider.value == "openai"
+        assert secondary is None
+        assert calls == ["openai"]
+        assert analyst_agent._hedge_stats["hedged"] == 0
+
+    async def test_slow_primary_loses_to_secondary_and_is_cancelled(self, analyst_agent):
+        calls, cancelled = self.script(analyst_agent, {"openai": (5, self.GOOD), "gemini": (0.01, self.GOOD)})
+
+        primary, secondary = await analyst_agent._hedged_primary_call([])
+
+        assert primary.provider.value == "gemini"
+        assert primary.content == self.GOOD
+        assert secondary is None
+        assert calls == ["openai", "gemini"]
+        assert cancelled == ["openai"]
+        assert analyst_agent._hedge_stats == {"hedged": 1, "primary_won": 0, "secondary_won": 1}
+
+    async def test_failed_secondary_waits_for_primary(self, analyst_agent):
+        _, cancelled = self.script(analyst_agent, {"openai": (0.05, self.GOOD), "gemini": (0, None)})
+
+        primary, _ = await analyst_agent._hedged_primary_call([])
+
+        assert primary.provider.value == "openai"
+        assert cancelled == []
+        assert analyst_agent._hedge_stats["primary_won"] == 1
+
+    async def test_insufficient_responses_reused_for_cross_check(self, analyst_agent):
+        partial = {"name": "홍길동"}
+        calls, _ = self.script(analyst_agent, {"openai": (0.05, partial), "gemini": (0.03, partial)})
+        from agents.analyst_agent import AnalysisMode
+
+        data, _, _ = await analyst_agent._progressive_llm_call([], AnalysisMode.PHASE_1)
+
+        # 헤지로 이미 받은 Gemini 응답을 Step 2에서 재사용 (추가 호출 없음)
+        assert calls == ["openai", "gemini"]
+        assert data["name"] == "홍길동"
+
+    def test_delay_estimator_uses_percentile_after_warmup(self):
+        from agents.analyst_agent import HedgeDelayEstimator
+        estimator = HedgeDelayEstimator(max_delay=20.0, min_delay=3.0, percentile=0.95)
+
+        for seconds in range(1, 20):
+            estimator.record(float(seconds))
+        assert estimator.delay() == 20.0  # 표본 부족
+
+        for seconds in range(20, 101):
+            estimator.record(float(seconds) / 10)
+        assert 3.0 <= estimator.delay() < 20.0
+
+        estimator._samples.clear()
+        for _ in range(50):
+            estimator.record(0.5)
+        assert estimator.delay() == 3.0
+
+    def test_delay_estimator_shares_samples_across_processes(self):
+        from agents.analyst_agent import HedgeDelayEstimator
+
+        class FakeRedis:
+            """LPUSH/LTRIM/LRANGE만 지원하는 Redis 대체"""
+
+            def __init__(self):
+                self.lists = {}
+
+            def pipeline(self):
+                return self
+
+            def lpush(self, key, value):
+                self.lists.setdefault(key, []).insert(0, value.encode())
+
+            def ltrim(self, key, start, end):
+                self.lists[key] = self.lists[key][start:end + 1]
+
+            def lrange(self, key, start, end):
+                return self.lists.get(key, [])[start:end + 1]
+
+            def execute(self):
+                pass
+
+        redis = FakeRedis()
+
+        def make_estimator():
+            # fork된 work-horse마다 새 인스턴스 (프로세스 메모리 표본 없음)
+            estimator = HedgeDelayEstimator(
+                max_delay=20.0, min_delay=3.0, percentile=0.95,
+                redis_url="redis://test", key="openai:gpt-4o",
+            )
+            estimator._redis = redis
+            return estimator
+
+        for seconds in range(1, 101):
+            make_estimator().record(seconds / 10)
+
+        assert len(redis.lists["rai:hedge_latency:openai:gpt-4o"]) == 100
+        assert 3.0 <= make_estimator().delay() < 20.0
+
+        for _ in range(HedgeDelayEstimator.WINDOW):
+            make_estimator().record(30.0)
+        assert len(redis.lists["rai:hedge_latency:openai:gpt-4o"]) == HedgeDelayEstimator.WINDOW
+        assert make_estimator().delay() == 20.0
+
+
+class TestTargetedEscalation:
+    """필드 단위 재추출 테스트 (누락/불확실 필드만 관련 섹션으로 재요청)"""
+
+    PARTIAL = {
+        "name": "홍길동",
+        "phone": "010-1234-5678",
+        "careers": [{"company": "ABC", "position": "개발자"}],
+    }
+
+    @pytest.fixture
+    def analyst_agent(self):
+        with patch('agents.analyst_agent.get_section_separator'), \
+             patch('agents.analyst_agent.get_llm_manager'), \
+             patch('agents.analyst_agent.get_settings') as mock_settings:
+            mock_settings.return_value = MagicMock(ANALYSIS_MODE=MagicMock(), USE_CONDITIONAL_LLM=True)
+            from agents.analyst_agent import AnalystAgent
+            agent = AnalystAgent()
+            agent.confidence_threshold = 0.85
+            agent.use_hedging = False
+            agent.use_targeted_escalation = True
+            return agent
+
+    @pytest.fixture
+    def ir(self):
+        from types import SimpleNamespace
+        from agents.analyst_agent import CanonicalLabel
+        return SimpleNamespace(
+            raw_text="홍길동 010-1234-5678 hong@example.com\n경력\nABC 개발자 (결제 시스템)",
+            blocks=[
+                SimpleNamespace(
+                    raw_title="", normalized_label=CanonicalLabel.PROFILE,
+                    text="홍길동 010-1234-5678 hong@example.com",
+                ),
+                SimpleNamespace(
+                    raw_title="경력", normalized_label=CanonicalLabel.CAREER,
+                    text="ABC 개발자 (결제 시스템)",
+                ),
+            ],
+        )
+
+    def script(self, agent, targeted):
+        """전체 호출(_call_single_llm)과 재추출 호출(llm_manager) 동작 지정"""
+        from unittest.mock import AsyncMock
+        from agents.analyst_agent import LLMResponse
+
+        full_calls = []
+
+        async def call_single_llm(provider, messages, on_early_fields=None):
+            full_calls.append(provider.value)
+            return LLMResponse(provider=provider, content=dict(self.PARTIAL), raw_response="", model="test")
+
+        def targeted_response(provider, messages, json_schema, **kwargs):
+            content = targeted.get(provider.value)
+            return LLMResponse(
+                provider=provider,
+                content=content,
+                raw_response="",
+                model="test",
+                error=None if content is not None else "failed",
+            )
+
+        agent._call_single_llm = call_single_llm
+        agent.llm_manager.call_with_structured_output = AsyncMock(side_effect=targeted_response)
+        return full_calls
+
+    async def test_only_missing_field_re_extracted_from_profile_section(self, analyst_agent, ir):
+        from agents.analyst_agent import AnalysisMode
+        full_calls = self.script(analyst_agent, {"gemini": {"email": "hong@example.com"}})
+
+        data, confidence, warnings = await analyst_agent._progressive_llm_call(
+            [], AnalysisMode.PHASE_1, ir=ir, filename="hong.pdf"
+        )
+
+        assert full_calls == ["openai"]
+        assert data["email"] == "hong@example.com"
+        assert data["careers"] == self.PARTIAL["careers"]
+        assert confidence == pytest.approx((1.0 + 1.0 + 0.7) / 3)
+        assert any(w.type == "optimization" and "email" in w.message for w in warnings)
+
+        kwargs = analyst_agent.llm_manager.call_with_structured_output.call_args.kwargs
+        assert kwargs["max_tokens"] == analyst_agent.TARGETED_MAX_TOKENS
+        user_prompt = kwargs["messages"][-1]["content"]
+        assert "Fields to extract: email" in user_prompt
+        assert "hong@example.com" in user_prompt
+        assert "결제 시스템" not in user_prompt
+        assert analyst_agent._escalation_stats == {"targeted": 1, "full": 0}
+
+    async def test_failed_targeted_call_falls_back_to_full_cross_check(self, analyst_agent, ir):
+        from agents.analyst_agent import AnalysisMode
+        full_calls = self.script(analyst_agent, {"gemini": None})
+
+        await analyst_agent._progressive_llm_call([], AnalysisMode.PHASE_1, ir=ir)
+
+        assert full_calls == ["openai", "gemini"]
+        assert analyst_agent._escalation_stats == {"targeted": 0, "full": 1}
+
+    async def test_phase_2_claude_resolves_remaining_mismatch(self, analyst_agent, ir):
+        from agents.analyst_agent import AnalysisMode
+        # 무효 이름 + '@'만 있는 불확실 이메일 (0.7) → name, email 재추출
+        self.PARTIAL = dict(self.PARTIAL, name="unknown", email="hong@example")
+        full_calls = self.script(analyst_agent, {
+            "gemini": {"name": "홍길동", "email": "gildong@example.com"},
+            "claude": {"name": "홍길동", "email": "gildong@example.com"},
+        })
+
+        data, confidence, warnings = await analyst_agent._progressive_llm_call(
+            [], AnalysisMode.PHASE_2, ir=ir
+        )
+
+        # Gemini만으로는 (0.7 + 1.0 + 0.5) / 3 < 0.85 → Claude까지 재추출 후 다수결
+        assert full_calls == ["openai"]
+        assert analyst_agent.llm_manager.call_with_structured_output.await_count == 2
+        assert data["name"] == "홍길동"
+        assert data["email"] == "gildong@example.com"
+        assert confidence == pytest.approx((1.0 + 1.0 + 0.85) / 3)
+        assert any(w.type == "mismatch_resolved" and w.field == "email" for w in warnings)
+
+    def test_context_falls_back_to_raw_text_without_matching_section(self, analyst_agent):
+        from types import SimpleNamespace
+        ir = SimpleNamespace(raw_text="x" * 10000, blocks=[])
+
+        context = analyst_agent._escalation_context(["email"], ir)
+
+        assert context == "x" * analyst_agent.TARGETED_CONTEXT_MAX_CHARS
+
+    def test_section_labels_cover_exactly_escalatable_fields(self):
+        from agents.analyst_agent import AnalystAgent, ESCALATION_SECTION_LABELS
+
+        assert set(ESCALATION_SECTION_LABELS) == set(AnalystAgent.CRITICAL_FIELDS)
@@ -0,0 +1,99 @@
+"""
+Unit Tests: Duplicate Check
+
+테스트 대상: services/database_service.py (DatabaseService.check_duplicate)
+- 4개 티어를 find_duplicate_candidate RPC 1회로 조회
+- 매칭 타입별 신뢰도
+- 저장 레코드에 name_phone_hash / name_birth_hash 포함
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.database_service import DatabaseService, DuplicateMatchType
+
+
+def _make_service(rpc_data=None):
+    service = DatabaseService.__new__(DatabaseService)
+    service.client = MagicMock()
+    service.client.rpc.return_value.execute.return_value.data = rpc_data or []
+    return service
+
+
+class TestCheckDuplicate:
+    """RPC 기반 중복 체크 테스트"""
+
+    def test_single_rpc_with_all_hashes(self):
+        service = _make_service()
+
+        result = service.check_duplicate(
+            user_id="user-1",
+            phone_hash="ph",
+            email_hash="eh",
+            name="홍 길동",
+            phone="010-1234-5678",
+            birth_year=1990,
+        )
+
+        assert not result.is_duplicate
+        service.client.rpc.assert_called_once()
+        name, params = service.client.rpc.call_args[0]
+        assert name == "find_duplicate_candidate"
+        assert params["p_user_id"] == "user-1"
+        assert params["p_phone_hash"] == "ph"
+        assert params["p_email_hash"] == "eh"
+        assert params["p_name_phone_hash"] == service._create_name_phone_hash("홍길동", "01012349999")
+        assert params["p_name_birth_hash"] == service._create_name_birth_hash("홍길동", 1990)
+        # 전체 테이블 조회 없음
+        service.client.table.assert_not_called()
+
+    @pytest.mark.parametrize("match_type,confidence", [
+        ("phone_hash", 1.0),
+        ("email_hash", 0.95),
+        ("name_phone", 0.85),
+        ("name_birth", 0.7),
+    ])
+    def test_maps_match_type_and_confidence(self, match_type, confidence):
+        service = _make_service([
+            {"candidate_id": "cand-1", "candidate_name": "홍길동", "match_type": match_type}
+        ])
+
+        result = service.check_duplicate(user_id="user-1", phone_hash="ph")
+
+        assert result.is_duplicate
+        assert result.match_type == DuplicateMatchType(match_type)
+        assert result.existing_candidate_id == "cand-1"
+        assert result.existing_candidate_name == "홍길동"
+        assert result.confidence == confidence
+
+    def test_no_keys_skips_rpc(self):
+        service = _make_service()
+
+        result = service.check_duplicate(user_id="user-1", name="홍길동")
+
+        assert result.match_type == DuplicateMatchType.NONE
+        service.client.rpc.assert_not_called()
+
+    def test_rpc_error_returns_error_result(self):
+        service = _make_service()
+        service.client.rpc.side_effect = RuntimeError("connection reset")
+
+        result = service.check_duplicate(user_id="user-1", phone_hash="ph")
+
+        assert result.has_error
+        assert not result.is_duplicate
+
+
+class TestDuplicateHashes:
+    """이름 기반 해시 정규화 테스트"""
+
+    def test_name_phone_hash_uses_prefix_only(self):
+        service = _make_service()
+        assert service._create_name_phone_hash("홍길동", "010-1234-5678") == \
+            service._create_name_phone_hash("홍 길동", "+82 10 1234 0000")
+
+    def test_name_birth_hash_requires_both(self):
+        service = _make_service()
+        assert service._create_name_birth_hash("홍길동", None) is None
+        assert service._create_name_birth_hash(None, 1990) is None
@@ -0,0 +1,109 @@
+"""
+Unit Tests: Embedding Micro-Batcher
+
+테스트 대상: services/embedding_batcher.py
+- 동시 호출자 요청 병합 + 결과 분배
+- 입력 수 / 토큰 한도 기반 패킹
+- 요청 실패 시 해당 배치만 None
+- 분당 토큰 예산
+- 채움률 메트릭
+"""
+
+import asyncio
+
+import pytest
+
+from services import embedding_batcher
+from services.embedding_batcher import EmbeddingBatcher
+
+
+class FakeAPI:
+    """embeddings.create 대체: 텍스트 길이를 벡터로 반환"""
+
+    def __init__(self, fail_on=None):
+        self.requests = []
+        self.fail_on = fail_on
+
+    async def send(self, inputs):
+        self.requests.append(list(inputs))
+        if self.fail_on and self.fail_on in inputs:
+            return None
+        await asyncio.sleep(0)
+        return [[float(len(text))] for text in inputs]
+
+
+def _count_words(text):
+    return len(text.split())
+
+
+class TestCoalescing:
+    """요청 병합 테스트"""
+
+    async def test_concurrent_callers_share_one_request(self):
+        api = FakeAPI()
+        batcher = EmbeddingBatcher(api.send, _count_words, window_ms=5)
+
+        results = await asyncio.gather(
+            batcher.embed(["a", "bb"]),
+            batcher.embed(["ccc"]),
+            batcher.embed(["dddd", "eeeee"]),
+        )
+
+        assert len(api.requests) == 1
+        assert results == [[[1.0], [2.0]], [[3.0]], [[4.0], [5.0]]]
+        stats = batcher.get_stats()
+        assert stats["callers"] == 3
+        assert stats["avg_inputs_per_request"] == 5
+
+    async def test_packs_by_input_limit(self):
+        api = FakeAPI()
+        batcher = EmbeddingBatcher(api.send, _count_words, window_ms=5, max_batch_inputs=2)
+
+        result = await batcher.embed(["a", "b", "c", "d", "e"])
+
+        assert [len(r) for r in api.requests] == [2, 2, 1]
+        assert result == [[1.0]] * 5
+
+    async def test_packs_by_token_limit(self):
+        api = FakeAPI()
+        batcher = EmbeddingBatcher(api.send, _count_words, window_ms=5, max_batch_tokens=4)
+
+        await batcher.embed(["w w w", "w w", "w w", "w"])
+
+        assert api.requests == [["w w w"], ["w w", "w w"], ["w"]]
+        stats = batcher.get_stats()
+        assert stats["tokens"] == 8
+        assert stats["avg_token_fill_ratio"] == pytest.approx((3 + 4 + 1) / 4 / 3, abs=1e-4)
+
+    async def test_failed_request_only_affects_its_batch(self):
+        api = FakeAPI(fail_on="bad")
+        batcher = EmbeddingBatcher(api.send, _count_words, window_ms=5, max_batch_inputs=2)
+
+        result = await batcher.embed(["ok", "bad", "fine"])
+
+        assert result == [None, None, [4.0]]
+        assert batcher.get_stats()["failed_requests"] == 1
+
+
+class TestTokenBudget:
+    """분당 토큰 예산 테스트"""
+
+    async def test_waits_when_budget_exhausted(self, monkeypatch):
+        monkeypatch.setattr(embedding_batcher, "TOKEN_BUDGET_WINDOW_SECONDS", 0.1)
+        api = FakeAPI()
+        batcher = EmbeddingBatcher(
+            api.send, _count_words, window_ms=1, max_batch_tokens=3, tokens_per_minute=3
+        )
+
+        await batcher.embed(["w w w", "w w w"])
+
+        assert len(api.requests) == 2
+        assert batcher.get_stats()["budget_wait_seconds"] > 0
+
+    async def test_unlimited_budget_does_not_wait(self):
+        api = FakeAPI()
+        batcher = EmbeddingBatcher(api.send, _count_words, window_ms=1, max_batch_tokens=3)
+
+        await batcher.embed(["w w w", "w w w"])
+
+        assert batcher.get_stats()["budget_wait_seconds"] == 0
@@ -0,0 +1,126 @@
+"""
+Unit Tests: Embedding Cache
+
+테스트 대상: services/embedding_cache.py
+- 캐시 키 결정성 (모델/차원 분리)
+- float16 / float32 인코딩 왕복
+- 메모리 LRU eviction
+- create_embeddings_batch: 캐시 miss만 API 전송 + 적중 수 보고
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services import embedding_service as embedding_service_module
+from services.embedding_cache import (
+    EmbeddingCache,
+    build_embedding_key,
+    decode_vector,
+    encode_vector,
+)
+from services.embedding_service import EmbeddingService
+
+
+def _memory_cache(**kwargs) -> EmbeddingCache:
+    params = {"redis_url": "", "ttl_seconds": 60, "max_entries": 100, "dtype": "float16", "max_local_mb": 1}
+    params.update(kwargs)
+    return EmbeddingCache(**params)
+
+
+class TestCacheKey:
+    """캐시 키 테스트"""
+
+    def test_key_is_deterministic(self):
+        assert build_embedding_key("m", 1536, "텍스트") == build_embedding_key("m", 1536, "텍스트")
+
+    def test_model_and_dimensions_change_key(self):
+        base = build_embedding_key("text-embedding-3-small", 1536, "텍스트")
+        assert base != build_embedding_key("text-embedding-3-large", 1536, "텍스트")
+        assert base != build_embedding_key("text-embedding-3-small", 512, "텍스트")
+        assert base != build_embedding_key("text-embedding-3-small", 1536, "텍스트2")
+
+
+class TestEncoding:
+    """벡터 인코딩 테스트"""
+
+    def test_float16_roundtrip_is_compact(self):
+        vector = [0.0123, -0.5, 0.25, 1.0]
+        raw = encode_vector(vector, "float16")
+
+        assert len(raw) == 2 * len(vector)
+        assert decode_vector(raw, "float16") == pytest.approx(vector, abs=1e-3)
+
+    def test_float32_roundtrip(self):
+        vector = [0.0123, -0.5, 0.25, 1.0]
+        raw = encode_vector(vector, "float32")
+
+        assert len(raw) == 4 * len(vector)
+        assert decode_vector(raw, "float32") == pytest.approx(vector, abs=1e-7)
+
+
+class TestMemoryCache:
+    """메모리 LRU 테스트"""
+
+    def test_get_many_reports_hits_and_misses(self):
+        cache = _memory_cache()
+        cache.set_many({"a": [1.0, 2.0]})
+
+        result = cache.get_many(["a", "b"])
+
+        assert result[0] == pytest.approx([1.0, 2.0])
+        assert result[1] is None
+        stats = cache.get_stats()
+        assert stats["backend"] == "memory"
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = _memory_cache(max_entries=2)
+        cache.set_many({"a": [1.0], "b": [2.0]})
+        cache.get_many(["a"])  # a 최근 사용
+
+        cache.set_many({"c": [3.0]})
+
+        assert cache.get_many(["a", "b", "c"])[1] is None
+        assert cache.get_stats()["local_entries"] == 2
+
+
+class TestCreateEmbeddingsBatchWithCache:
+    """create_embeddings_batch 캐시 통합 테스트"""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        cache = _memory_cache()
+        monkeypatch.setattr(embedding_service_module, "get_embedding_cache", lambda: cache)
+        service = EmbeddingService()
+        service.client = object()
+        service._request_embeddings = AsyncMock(
+            side_effect=lambda inputs: [[float(len(t))] for t in inputs]
+        )
+        return service
+
+    async def test_only_misses_are_sent(self, service):
+        with patch.object(embedding_service_module.settings, "USE_EMBEDDING_CACHE", True), \
+             patch.object(embedding_service_module.settings, "USE_EMBEDDING_BATCHER", False):
+            await service.create_embeddings_batch(["aa", "bbb"])
+
+            stats = {}
+            result = await service.create_embeddings_batch(["aa", "cccc", "cccc", "bbb"], stats=stats)
+
+        assert service._request_embeddings.await_args_list[-1].args[0] == ["cccc"]
+        assert result == [
+            pytest.approx([2.0]), pytest.approx([4.0]), pytest.approx([4.0]), pytest.approx([3.0])
+        ]
+        assert stats == {"cache_hits": 2, "cache_misses": 2}
+
+    async def test_failed_embeddings_are_not_cached(self, service):
+        service._request_embeddings = AsyncMock(return_value=None)
+
+        with patch.object(embedding_service_module.settings, "USE_EMBEDDING_CACHE", True), \
+             patch.object(embedding_service_module.settings, "USE_EMBEDDING_BATCHER", False):
+            result = await service.create_embeddings_batch(["aa"])
+            stats = {}
+            await service.create_embeddings_batch(["aa"], stats=stats)
+
+        assert result == [None]
+        assert stats["cache_hits"] == 0
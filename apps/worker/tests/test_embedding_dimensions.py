@@ -0,0 +1,77 @@
+"""
+Unit Tests: Embedding Model / Dimensions
+
+테스트 대상: services/embedding_service.py
+- EMBEDDING_MODEL / EMBEDDING_DIMENSIONS 설정 반영
+- dimensions 파라미터 (text-embedding-3-*만)
+- 청크 metadata에 임베딩 모델/차원 기록
+"""
+
+import base64
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from services import embedding_service as embedding_service_module
+from services.embedding_service import EmbeddingService
+
+
+def _response(count, dimensions):
+    data = []
+    for i in range(count):
+        item = MagicMock()
+        item.index = i
+        item.embedding = base64.b64encode(np.full(dimensions, 0.5, dtype=np.float32).tobytes()).decode()
+        data.append(item)
+    response = MagicMock()
+    response.data = data
+    return response
+
+
+@pytest.fixture
+def service():
+    service = EmbeddingService()
+    service.client = MagicMock()
+    return service
+
+
+class TestDimensionParams:
+    """embeddings.create 파라미터 테스트"""
+
+    async def test_reduced_dimensions_are_requested(self, service):
+        service.client.embeddings.create = AsyncMock(return_value=_response(2, 512))
+
+        with patch.object(EmbeddingService, "EMBEDDING_DIMENSIONS", 512):
+            result = await service._request_embeddings(["a", "b"])
+
+        kwargs = service.client.embeddings.create.await_args.kwargs
+        assert kwargs["dimensions"] == 512
+        assert kwargs["encoding_format"] == "base64"
+        assert [v.shape for v in result] == [(512,), (512,)]
+
+    def test_legacy_model_omits_dimensions(self, service):
+        with patch.object(EmbeddingService, "EMBEDDING_MODEL", "text-embedding-ada-002"):
+            assert service._dimension_params() == {}
+
+    def test_defaults_follow_settings(self):
+        settings = embedding_service_module.settings
+        assert EmbeddingService.EMBEDDING_MODEL == settings.EMBEDDING_MODEL
+        assert EmbeddingService.EMBEDDING_DIMENSIONS == settings.EMBEDDING_DIMENSIONS
+
+
+class TestChunkMetadata:
+    """청크 metadata 기록 테스트"""
+
+    async def test_embedded_chunks_record_model_and_dimensions(self, service):
+        service.client.embeddings.create = AsyncMock(side_effect=lambda **kw: _response(len(kw["input"]), 768))
+
+        with patch.object(EmbeddingService, "EMBEDDING_DIMENSIONS", 768), \
+             patch.object(embedding_service_module.settings, "USE_EMBEDDING_CACHE", False), \
+             patch.object(embedding_service_module.settings, "USE_EMBEDDING_BATCHER", False):
+            result = await service.process_candidate({"name": "홍길동", "skills": ["Python", "Go"]})
+
+        assert result.success and result.embedded_chunks == len(result.chunks)
+        for chunk in result.chunks:
+            assert chunk.metadata["embedding_dimensions"] == 768
+            assert chunk.metadata["embedding_model"] == EmbeddingService.EMBEDDING_MODEL
@@ -0,0 +1,141 @@
+"""
+Unit Tests: Gemini 동시성 제한
+
+테스트 대상: services/llm_manager.py (_gemini_generate / _get_gemini_semaphore)
+- 취소된 호출이 GEMINI_MAX_CONCURRENCY 슬롯을 반환
+- 세마포어는 이벤트 루프마다 별도 (루프 간 공유 안 됨)
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.llm_manager import LLMManager
+
+
+def make_manager(max_concurrency: int = 1, started=None, release=None) -> LLMManager:
+    """
+    Gemini 클라이언트를 가짜로 둔 LLMManager
+
+    started: 호출이 시작되면 set (asyncio.Event / threading.Event)
+    release: set될 때까지 응답 지연 (없으면 즉시 응답)
+    """
+    manager = LLMManager.__new__(LLMManager)
+    manager.use_governor = False
+    manager.gemini_max_concurrency = max_concurrency
+    manager._gemini_semaphore = None
+    manager._gemini_semaphore_loop = None
+
+    async def generate_content(model, contents, config):
+        if started is not None:
+            started.set()
+        if isinstance(release, asyncio.Event):
+            await release.wait()
+        elif release is not None:
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+        return contents
+
+    manager.gemini_client = MagicMock()
+    manager.gemini_client.aio.models.generate_content = generate_content
+    return manager
+
+
+def generate(manager: LLMManager, prompt: str):
+    return manager._gemini_generate("gemini-test", prompt, MagicMock(max_output_tokens=10))
+
+
+class TestGeminiCancellation:
+    """취소 시 세마포어 슬롯 반환 테스트"""
+
+    async def test_cancelled_caller_releases_slot(self):
+        started = asyncio.Event()
+        manager = make_manager(max_concurrency=1, started=started, release=asyncio.Event())
+
+        holder = asyncio.create_task(generate(manager, "first"))
+        await started.wait()
+        assert manager._get_gemini_semaphore().locked()
+
+        holder.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await holder
+
+        assert not manager._get_gemini_semaphore().locked()
+
+    async def test_waiter_runs_after_holder_cancelled(self):
+        started = asyncio.Event()
+        manager = make_manager(max_concurrency=1, started=started, release=asyncio.Event())
+
+        holder = asyncio.create_task(generate(manager, "first"))
+        await started.wait()
+
+        # 대기 중인 호출은 응답 지연 없이 완료되도록 클라이언트 교체
+        fast = make_manager()
+        manager.gemini_client = fast.gemini_client
+        waiter = asyncio.create_task(generate(manager, "second"))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        holder.cancel()
+        assert await asyncio.wait_for(waiter, 1) == "second"
+        assert not manager._get_gemini_semaphore().locked()
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        release = asyncio.Event()
+        started = asyncio.Event()
+        manager = make_manager(max_concurrency=1, started=started, release=release)
+
+        holder = asyncio.create_task(generate(manager, "first"))
+        await started.wait()
+        waiter = asyncio.create_task(generate(manager, "second"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        release.set()
+        assert await holder == "first"
+        assert await asyncio.wait_for(generate(manager, "third"), 1) == "third"
+        assert not manager._get_gemini_semaphore().locked()
+
+
+class TestGeminiSemaphorePerLoop:
+    """이벤트 루프별 세마포어 테스트"""
+
+    def test_new_loop_gets_new_semaphore(self):
+        manager = make_manager(max_concurrency=1)
+
+        async def call():
+            result = await generate(manager, "hello")
+            return result, manager._get_gemini_semaphore()
+
+        first, first_semaphore = asyncio.run(call())
+        second, second_semaphore = asyncio.run(call())
+
+        assert first == second == "hello"
+        assert first_semaphore is not second_semaphore
+
+    def test_busy_loop_does_not_block_other_loop(self):
+        started = threading.Event()
+        release = threading.Event()
+        manager = make_manager(max_concurrency=1, started=started, release=release)
+        results = []
+
+        # 다른 스레드의 루프에서 슬롯 1개를 점유
+        other = threading.Thread(target=lambda: results.append(asyncio.run(generate(manager, "other"))))
+        other.start()
+        try:
+            assert started.wait(2)
+
+            async def call():
+                manager.gemini_client = make_manager().gemini_client
+                return await asyncio.wait_for(generate(manager, "main"), 1)
+
+            assert asyncio.run(call()) == "main"
+        finally:
+            release.set()
+            other.join(2)
+
+        assert results == ["other"]
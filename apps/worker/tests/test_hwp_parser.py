@@ -0,0 +1,130 @@
+"""
+Unit Tests: HWP Parser (BodyText 레코드 파싱)
+
+테스트 대상: utils/hwp_parser.py
+- HWPTAG_PARA_TEXT 레코드만 텍스트로 디코딩
+- 인라인/확장 컨트롤 8 WCHAR 영역 건너뛰기
+- 확장 크기 헤더 (Size == 0xFFF)
+- 압축 / 비압축 섹션 스트림
+"""
+
+import struct
+import zlib
+
+import pytest
+
+import utils.hwp_parser as hwp_parser_module
+from utils.hwp_parser import (
+    HWPParser,
+    HWPTAG_PARA_TEXT,
+    decode_para_text,
+    extract_para_text,
+    iter_hwp_records,
+)
+
+HWPTAG_PARA_HEADER = 0x010 + 50
+HWPTAG_CTRL_HEADER = 0x010 + 55
+
+
+def record(tag_id: int, payload: bytes, level: int = 0) -> bytes:
+    """HWP 레코드 생성 (크기 4095 이상이면 확장 크기 헤더 사용)"""
+    if len(payload) >= 0xFFF:
+        header = struct.pack('<I', tag_id | (level << 10) | (0xFFF << 20))
+        return header + struct.pack('<I', len(payload)) + payload
+    return struct.pack('<I', tag_id | (level << 10) | (len(payload) << 20)) + payload
+
+
+def wchars(text: str) -> bytes:
+    return text.encode('utf-16-le')
+
+
+def control(code: int, info: bytes = b'') -> bytes:
+    """8 WCHAR 인라인/확장 컨트롤 (코드 + 12바이트 부가 정보 + 코드)"""
+    info = (info + b'\x00' * 12)[:12]
+    return struct.pack('<H', code) + info + struct.pack('<H', code)
+
+
+class TestDecodeParaText:
+    """PARA_TEXT 페이로드 디코딩 테스트"""
+
+    def test_plain_text(self):
+        assert decode_para_text(wchars("홍길동 이력서")) == "홍길동 이력서"
+
+    def test_paragraph_end_becomes_newline(self):
+        assert decode_para_text(wchars("경력") + struct.pack('<H', 13)) == "경력\n"
+
+    def test_tab_inline_control_skips_extent(self):
+        payload = wchars("이름") + control(9, b'\x01\x00\x02\x00garbage!') + wchars("홍길동")
+        assert decode_para_text(payload) == "이름\t홍길동"
+
+    def test_extended_control_payload_is_not_text(self):
+        # 표 컨트롤: 부가 정보에 'tbl ' ID가 들어있음
+        payload = wchars("A") + control(11, b' lbt' + b'\x41\x00' * 4) + wchars("B")
+        assert decode_para_text(payload) == "AB"
+
+    def test_control_codes_inside_extent_are_ignored(self):
+        # 부가 정보 안에 <32 WCHAR가 있어도 새로운 컨트롤로 해석하지 않음
+        payload = control(2, b'\x0d\x00\x0a\x00\x09\x00') + wchars("본문")
+        assert decode_para_text(payload) == "본문"
+
+    def test_char_controls(self):
+        payload = wchars("a") + struct.pack('<H', 24) + wchars("b") + struct.pack('<H', 30) + wchars("c")
+        assert decode_para_text(payload) == "a-b c"
+
+    def test_truncated_extended_control(self):
+        payload = wchars("끝") + struct.pack('<H', 11) + b'\x00\x00'
+        assert decode_para_text(payload) == "끝"
+
+    def test_regex_fallback_matches_numpy(self, monkeypatch):
+        payload = (
+            wchars("가") + b'\x00\x1f'  # 상위 바이트가 0x1f인 문자 (제어 문자 아님)
+            + control(9) + wchars("탭 뒤") + struct.pack('<H', 13)
+        )
+        expected = decode_para_text(payload)
+        monkeypatch.setattr(hwp_parser_module, "np", None)
+        assert decode_para_text(payload) == expected
+        assert expected == "가ἀ\t탭 뒤\n"
+
+
+class TestRecordStream:
+    """레코드 스트림 파싱 테스트"""
+
+    def _section(self) -> bytes:
+        return b''.join([
+            record(HWPTAG_PARA_HEADER, b'\x05\x00\x00\x80' + b'\x00' * 18),
+            record(HWPTAG_PARA_TEXT, wchars("첫 문단") + struct.pack('<H', 13), level=1),
+            record(HWPTAG_CTRL_HEADER, b' lbt' + b'\x00' * 40, level=1),
+            record(HWPTAG_PARA_HEADER, b'\x00' * 22),
+            record(HWPTAG_PARA_TEXT, wchars("둘째 문단") + struct.pack('<H', 13), level=1),
+        ])
+
+    def test_only_para_text_records_are_decoded(self):
+        assert extract_para_text(self._section()) == "첫 문단\n둘째 문단\n"
+
+    def test_extended_size_header(self):
+        long_text = "가" * 3000  # 6000 바이트 > 0xFFF
+        data = record(HWPTAG_PARA_TEXT, wchars(long_text))
+        records = list(iter_hwp_records(data))
+        assert records == [(HWPTAG_PARA_TEXT, 8, 6000)]
+        assert extract_para_text(data) == long_text
+
+    def test_control_extent_does_not_cross_record_boundary(self):
+        data = (
+            record(HWPTAG_PARA_TEXT, wchars("앞") + struct.pack('<H', 11) + b'\x00\x00')
+            + record(HWPTAG_PARA_TEXT, wchars("다음 문단"))
+        )
+        assert extract_para_text(data) == "앞다음 문단"
+
+    def test_truncated_stream(self):
+        data = self._section()[:-6]
+        assert extract_para_text(data).startswith("첫 문단\n둘째")
+
+    @pytest.mark.parametrize("compressed", [True, False, None])
+    def test_decompress_hwp_body(self, compressed):
+        raw = self._section()
+        if compressed is False:
+            data = raw
+        else:
+            compressor = zlib.compressobj(wbits=-15)
+            data = compressor.compress(raw) + compressor.flush()
+        assert HWPParser()._decompress_hwp_body(data, compressed) == "첫 문단\n둘째 문단\n"
@@ -0,0 +1,227 @@
+"""
+Unit Tests: Identity Check Strategy
+
+테스트 대상:
+- context/layers.py PIIStore.is_single_identity (LLM 신원 확인 생략 사전 판정)
+- agents/identity_checker.py run_with_identity_check (latency: 동시 실행 / cost: 순차 실행)
+- agents/identity_checker.py EarlyFieldsGate (신원 확인 통과 전 조기 필드 보류)
+- orchestrator/pipeline_orchestrator.py _stage_identity_and_analysis
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from agents.identity_checker import EarlyFieldsGate, run_with_identity_check
+from context import PipelineContext
+from context.layers import PIIStore
+from orchestrator.pipeline_orchestrator import PipelineOrchestrator
+
+
+def extract(text: str, filename: str = None) -> PIIStore:
+    store = PIIStore()
+    store.extract_from_text(text, filename)
+    return store
+
+
+class TestSingleIdentityPrefilter:
+    """PIIStore 사전 판정 테스트"""
+
+    def test_single_contact_is_single_identity(self):
+        store = extract("성명: 홍길동\n연락처: 010-1234-5678\n이메일: hong@example.com\n경력사항 ...")
+
+        assert (store.name_count, store.phone_count, store.email_count) == (1, 1, 1)
+        assert store.is_single_identity()
+
+    def test_same_phone_in_different_formats_counted_once(self):
+        store = extract("홍길동 010-1234-5678\n... 연락처 01012345678 / HONG@example.com, hong@example.com")
+
+        assert store.phone_count == 1
+        assert store.email_count == 1
+        assert store.is_single_identity()
+
+    def test_multiple_phones_require_llm_check(self):
+        store = extract("홍길동 010-1234-5678\n...\n김철수 010-9876-5432")
+
+        assert store.phone_count == 2
+        assert not store.is_single_identity()
+
+    def test_multiple_name_fields_require_llm_check(self):
+        store = extract("성명: 홍길동\n010-1234-5678\n...\n성명: 김철수\n")
+
+        assert store.name_count == 2
+        assert not store.is_single_identity()
+
+    def test_no_contact_requires_llm_check(self):
+        store = extract("성명: 홍길동\n경력사항\nABC회사 백엔드 개발")
+
+        assert not store.is_single_identity()
+
+
+class TestRunWithIdentityCheck:
+    """신원 확인 + 분석 실행 전략 테스트"""
+
+    @staticmethod
+    def make_calls(reject: bool, events: list):
+        async def check():
+            events.append("check_start")
+            await asyncio.sleep(0.01)
+            events.append("check_end")
+            return {"should_reject": reject}
+
+        async def analyze():
+            events.append("analysis_start")
+            await asyncio.sleep(0.05)
+            events.append("analysis_end")
+            return {"success": True}
+
+        return check, analyze
+
+    async def test_latency_mode_runs_concurrently(self):
+        events = []
+        check, analyze = self.make_calls(reject=False, events=events)
+
+        identity, analysis = await run_with_identity_check(
+            check, analyze, lambda r: r["should_reject"], mode="latency"
+        )
+
+        assert identity == {"should_reject": False}
+        assert analysis == {"success": True}
+        # 분석이 신원 확인 완료 전에 시작됨
+        assert events.index("analysis_start") < events.index("check_end")
+
+    async def test_latency_mode_discards_analysis_on_reject(self):
+        events = []
+        check, analyze = self.make_calls(reject=True, events=events)
+
+        identity, analysis = await run_with_identity_check(
+            check, analyze, lambda r: r["should_reject"], mode="latency"
+        )
+
+        assert identity == {"should_reject": True}
+        assert analysis is None
+        assert "analysis_end" not in events  # 진행 중인 분석 취소
+
+    async def test_cost_mode_skips_analysis_on_reject(self):
+        events = []
+        check, analyze = self.make_calls(reject=True, events=events)
+
+        _, analysis = await run_with_identity_check(
+            check, analyze, lambda r: r["should_reject"], mode="cost"
+        )
+
+        assert analysis is None
+        assert "analysis_start" not in events
+
+    async def test_cost_mode_runs_sequentially(self):
+        events = []
+        check, analyze = self.make_calls(reject=False, events=events)
+
+        _, analysis = await run_with_identity_check(
+            check, analyze, lambda r: r["should_reject"], mode="cost"
+        )
+
+        assert analysis == {"success": True}
+        assert events == ["check_start", "check_end", "analysis_start", "analysis_end"]
+
+
+
+class TestEarlyFieldsGate:
+    """latency 모드 조기 필드 보류 테스트"""
+
+    @staticmethod
+    def make_calls(reject: bool, gate: EarlyFieldsGate):
+        async def check():
+            await asyncio.sleep(0.03)
+            return {"should_reject": reject}
+
+        async def analyze():
+            # 스트리밍 중 신원 확인보다 먼저 조기 필드 도착
+            await gate({"name": "홍길동", "phone": "010-1234-5678"})
+            await asyncio.sleep(0.05)
+            return {"success": True}
+
+        return check, analyze
+
+    async def test_early_fields_held_until_identity_passes(self):
+        published = []
+
+        async def publish(fields):
+            published.append(dict(fields))
+
+        gate = EarlyFieldsGate(publish)
+        check, analyze = self.make_calls(reject=False, gate=gate)
+
+        task = asyncio.ensure_future(run_with_identity_check(
+            check, analyze, lambda r: r["should_reject"], mode="latency", early_fields_gate=gate
+        ))
+        await asyncio.sleep(0.01)
+        assert published == []  # 신원 확인 중에는 보류
+
+        _, analysis = await task
+        assert analysis == {"success": True}
+        assert published == [{"name": "홍길동", "phone": "010-1234-5678"}]
+
+    async def test_early_fields_discarded_on_reject(self):
+        published = []
+
+        async def publish(fields):
+            published.append(fields)
+
+        gate = EarlyFieldsGate(publish)
+        check, analyze = self.make_calls(reject=True, gate=gate)
+
+        _, analysis = await run_with_identity_check(
+            check, analyze, lambda r: r["should_reject"], mode="latency", early_fields_gate=gate
+        )
+
+        assert analysis is None
+        assert published == []
+        await gate({"email": "hong@example.com"})
+        assert published == []
+
+
+class TestOrchestratorIdentityStage:
+    """오케스트레이터 신원 확인 단계 테스트"""
+
+    @pytest.fixture
+    def orchestrator(self):
+        orchestrator = PipelineOrchestrator.__new__(PipelineOrchestrator)
+        orchestrator._stage_identity_check = AsyncMock(return_value={"success": True, "should_reject": False})
+        orchestrator._stage_analysis = AsyncMock(return_value={"success": True})
+        return orchestrator
+
+    def make_context(self, text: str) -> PipelineContext:
+        ctx = PipelineContext()
+        ctx.set_raw_input(b"test", "resume.pdf")
+        ctx.set_parsed_text(text)
+        ctx.extract_pii()
+        return ctx
+
+    async def test_prefilter_skips_llm_identity_check(self, orchestrator):
+        ctx = self.make_context("성명: 홍길동\n010-1234-5678\nhong@example.com\n" + "경력 " * 50)
+
+        identity, analysis = await orchestrator._stage_identity_and_analysis(ctx, "phase_1")
+
+        assert identity["should_reject"] is False
+        assert analysis == {"success": True}
+        orchestrator._stage_identity_check.assert_not_awaited()
+        assert ctx.stage_results.results["identity_check"].output["skipped"] is True
+
+    async def test_ambiguous_contacts_run_identity_check(self, orchestrator):
+        ctx = self.make_context("홍길동 010-1234-5678\n김철수 010-9876-5432\n" + "경력 " * 50)
+
+        await orchestrator._stage_identity_and_analysis(ctx, "phase_1")
+
+        orchestrator._stage_identity_check.assert_awaited_once()
+        orchestrator._stage_analysis.assert_awaited_once()
+
+    async def test_prefilter_disabled(self, orchestrator):
+        ctx = self.make_context("성명: 홍길동\n010-1234-5678\n" + "경력 " * 50)
+
+        from config import get_settings
+        with patch.object(get_settings(), "USE_IDENTITY_PREFILTER", False):
+            await orchestrator._stage_identity_and_analysis(ctx, "phase_1")
+
+        orchestrator._stage_identity_check.assert_awaited_once()
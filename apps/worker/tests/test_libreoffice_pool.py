@@ -0,0 +1,200 @@
+"""
+Unit Tests: LibreOffice Instance Pool
+
+테스트 대상: utils/libreoffice_pool.py, utils/subprocess_utils.run_libreoffice_convert
+- 인스턴스 재사용 / N회 변환 후 재기동
+- 크래시 후 재기동
+- 변환 타임아웃 시 인스턴스 종료
+- 대기열 상한 (backpressure)
+- 풀 사용 불가 시 cold start 폴백
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from utils import libreoffice_pool
+from utils.libreoffice_pool import LibreOfficePool, PoolUnavailableError
+from utils.subprocess_utils import SubprocessResult, run_libreoffice_convert
+
+
+class FakeInstance:
+    """soffice 없이 동작하는 테스트용 인스턴스"""
+
+    def __init__(self, index, delay=0.0, fail_start=False):
+        self.index = index
+        self.delay = delay
+        self.fail_start = fail_start
+        self.running = False
+        self.killed = False
+        self.process = None
+        self.conversions = 0
+        self.starts = 0
+        self.converted = []
+        self._cancel = threading.Event()
+
+    def is_running(self):
+        return self.running
+
+    def is_healthy(self):
+        return self.running
+
+    def start(self):
+        if self.fail_start:
+            raise PoolUnavailableError("cannot start")
+        self.starts += 1
+        self.running = True
+        self.killed = False
+        self.process = object()
+        self.conversions = 0
+        self._cancel.clear()
+
+    def convert(self, input_path, output_path, output_format):
+        if self.delay and self._cancel.wait(self.delay):
+            raise RuntimeError("disposed")
+        self.conversions += 1
+        self.converted.append(output_path)
+
+    def kill(self):
+        self.killed = True
+        self.running = False
+        self._cancel.set()
+
+    def stop(self):
+        self.running = False
+
+
+def _make_pool(size=1, delay=0.0, fail_start=False, **kwargs):
+    kwargs.setdefault("health_interval", 0)
+    with patch.object(
+        LibreOfficePool,
+        "_create_instance",
+        lambda self, i: FakeInstance(i, delay=delay, fail_start=fail_start),
+    ):
+        return LibreOfficePool(size=size, soffice_cmd="soffice", **kwargs)
+
+
+class TestLibreOfficePool:
+    """상주 인스턴스 관리 테스트"""
+
+    def test_reuses_started_instance(self, tmp_path):
+        pool = _make_pool()
+        for _ in range(3):
+            result = pool.convert(str(tmp_path / "resume.hwp"), str(tmp_path), "pdf")
+            assert result.success
+
+        instance = pool._instances[0]
+        assert instance.starts == 1
+        assert instance.converted[0] == str(tmp_path / "resume.pdf")
+        assert pool.stats["conversions"] == 3
+
+    def test_recycles_after_n_conversions(self, tmp_path):
+        pool = _make_pool(recycle_after=2)
+        for _ in range(5):
+            assert pool.convert(str(tmp_path / "a.doc"), str(tmp_path), "docx").success
+
+        assert pool._instances[0].starts == 3
+
+    def test_restarts_crashed_instance(self, tmp_path):
+        pool = _make_pool()
+        assert pool.convert(str(tmp_path / "a.hwp"), str(tmp_path), "pdf").success
+
+        pool._instances[0].running = False  # soffice 크래시
+        assert pool.convert(str(tmp_path / "a.hwp"), str(tmp_path), "pdf").success
+        assert pool._instances[0].starts == 2
+        assert pool.stats["restarts"] == 1
+
+    def test_timeout_kills_instance(self, tmp_path):
+        pool = _make_pool(delay=5)
+        result = pool.convert(str(tmp_path / "a.hwp"), str(tmp_path), "pdf", timeout=0.05)
+
+        assert not result.success
+        assert result.timed_out
+        assert pool.stats["timeouts"] == 1
+        assert not pool._instances[0].is_running()
+
+    def test_rejects_when_queue_full(self, tmp_path):
+        pool = _make_pool(delay=0.3, max_queue=1, queue_timeout=5)
+        results = []
+
+        def convert():
+            results.append(pool.convert(str(tmp_path / "a.hwp"), str(tmp_path), "pdf"))
+
+        threads = [threading.Thread(target=convert) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.05)
+        for thread in threads:
+            thread.join()
+
+        assert sum(r.success for r in results) == 2
+        rejected = [r for r in results if not r.success]
+        assert len(rejected) == 1
+        assert "queue full" in rejected[0].error_message
+
+    def test_start_failure_raises_unavailable(self, tmp_path):
+        pool = _make_pool(fail_start=True)
+        with pytest.raises(PoolUnavailableError):
+            pool.convert(str(tmp_path / "a.hwp"), str(tmp_path), "pdf")
+        # 인스턴스는 풀에 반납되어 다음 요청에서 다시 기동 시도
+        assert pool._idle.qsize() == 1
+
+
+class TestRunLibreOfficeConvert:
+    """run_libreoffice_convert 풀/cold start 선택 테스트"""
+
+    def test_uses_pool_when_available(self, tmp_path):
+        pool = _make_pool()
+        with patch.object(libreoffice_pool, "get_libreoffice_pool", return_value=pool), \
+                patch("utils.subprocess_utils._run_libreoffice_cold_start") as cold_start:
+            result = run_libreoffice_convert(str(tmp_path / "a.hwp"), str(tmp_path))
+
+        assert result.success
+        cold_start.assert_not_called()
+
+    def test_falls_back_to_cold_start(self, tmp_path):
+        pool = _make_pool(fail_start=True)
+        cold = SubprocessResult(success=True, stdout="", stderr="", return_code=0, timed_out=False)
+        with patch.object(libreoffice_pool, "get_libreoffice_pool", return_value=pool), \
+                patch("utils.subprocess_utils._run_libreoffice_cold_start", return_value=cold) as cold_start:
+            result = run_libreoffice_convert(str(tmp_path / "a.hwp"), str(tmp_path))
+
+        assert result is cold
+        cold_start.assert_called_once()
+
+    def test_cold_start_when_pool_disabled(self, tmp_path):
+        cold = SubprocessResult(success=True, stdout="", stderr="", return_code=0, timed_out=False)
+        with patch.object(libreoffice_pool, "get_libreoffice_pool", return_value=None), \
+                patch("utils.subprocess_utils._run_libreoffice_cold_start", return_value=cold) as cold_start:
+            run_libreoffice_convert(str(tmp_path / "a.hwp"), str(tmp_path))
+
+        cold_start.assert_called_once()
+
+
+class TestGetLibreOfficePool:
+    """장수 프로세스 허용 여부 테스트"""
+
+    def test_disabled_in_forked_work_horse(self, monkeypatch):
+        # fork 모드 RQ work-horse: enable_libreoffice_pool()이 호출되지 않음
+        monkeypatch.delenv(libreoffice_pool.POOL_PROCESS_ENV, raising=False)
+        monkeypatch.setattr(libreoffice_pool, "uno", object())
+
+        with patch.object(libreoffice_pool, "LibreOfficePool") as pool_cls:
+            assert libreoffice_pool.get_libreoffice_pool() is None
+
+        pool_cls.assert_not_called()
+
+    def test_enabled_in_long_lived_process(self, monkeypatch):
+        # 테스트 후 원래 값으로 복원되도록 monkeypatch로 먼저 등록
+        monkeypatch.setenv(libreoffice_pool.POOL_PROCESS_ENV, "0")
+        monkeypatch.setattr(libreoffice_pool, "uno", object())
+        monkeypatch.setattr(libreoffice_pool, "_pool", None)
+        libreoffice_pool.enable_libreoffice_pool()
+
+        with patch.object(libreoffice_pool, "LibreOfficePool") as pool_cls:
+            pool_cls.return_value.available = True
+            assert libreoffice_pool.get_libreoffice_pool() is pool_cls.return_value
+
+        pool_cls.assert_called_once()
@@ -0,0 +1,234 @@
+"""
+Unit Tests: LLM Rate Governor
+
+테스트 대상: services/llm_governor.py
+- 동시성 한도 및 대기 시간 메트릭
+- AIMD (429 시 한도 절반 + 쿨다운, 성공 시 증가)
+- 응답 헤더 기반 한도 추적 (remaining 0 → reset까지 차단)
+- Job 간 라운드 로빈 공정 큐
+- 분당 요청 예산
+- 장수 프로세스에서만 사용 (fork된 RQ work-horse에서는 미사용)
+"""
+
+import asyncio
+
+import pytest
+
+from services import llm_governor
+from services.llm_governor import (
+    LLMRateGovernor,
+    parse_reset_seconds,
+    run_in_llm_job,
+    set_llm_job,
+)
+from services.llm_manager import LLMManager, LLMProvider
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+async def hold(governor: LLMRateGovernor, events: list, name: str, seconds: float = 0.02):
+    async with governor.slot(10):
+        events.append(name)
+        await asyncio.sleep(seconds)
+
+
+class TestConcurrency:
+    """동시성 한도 테스트"""
+
+    async def test_in_flight_never_exceeds_limit(self):
+        governor = LLMRateGovernor("openai:gpt-4o", max_concurrency=2)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with governor.slot(10):
+                peak = max(peak, governor.get_stats()["in_flight"])
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        stats = governor.get_stats()
+        assert peak == 2
+        assert stats["requests"] == 6
+        assert stats["in_flight"] == 0
+        assert stats["queued_requests"] == 4
+        assert stats["max_queue_wait_ms"] > 0
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        governor = LLMRateGovernor("openai:gpt-4o", max_concurrency=1)
+        events = []
+
+        first = asyncio.ensure_future(hold(governor, events, "first", 0.05))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(hold(governor, events, "second"))
+        await asyncio.sleep(0)
+        second.cancel()
+        await first
+
+        assert events == ["first"]
+        assert governor.get_stats()["queued"] == 0
+        assert governor.get_stats()["in_flight"] == 0
+
+
+class TestAIMD:
+    """429 대응 테스트"""
+
+    async def test_rate_limit_halves_limit_and_blocks(self):
+        governor = LLMRateGovernor("openai:gpt-4o", max_concurrency=8, cooldown_seconds=0.05)
+
+        with pytest.raises(RateLimitError):
+            async with governor.slot(10):
+                raise RateLimitError()
+
+        assert governor.get_stats()["limit"] == 4
+        assert governor.get_stats()["rate_limited"] == 1
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with governor.slot(10) as slot:
+            pass
+        assert loop.time() - start >= 0.04
+        assert slot.queue_wait >= 0.04
+
+    async def test_simultaneous_429s_decrease_once(self):
+        governor = LLMRateGovernor("openai:gpt-4o", max_concurrency=8, cooldown_seconds=0.05)
+
+        async def fail():
+            async with governor.slot(10) as slot:
+                await asyncio.sleep(0.01)
+                slot.observe(429, {"retry-after-ms": "10"})
+
+        await asyncio.gather(*(fail() for _ in range(4)))
+
+        assert governor.get_stats()["limit"] == 4
+        assert governor.get_stats()["rate_limited"] == 4
+
+    async def test_success_grows_limit_back(self):
+        governor = LLMRateGovernor("openai:gpt-4o", max_concurrency=4, cooldown_seconds=0.0)
+        governor.limit = 1.0
+
+        for _ in range(10):
+            async with governor.slot(10):
+                pass
+
+        # 1 → 2 → 2.5 → 2.9 → ... 상한(4)에서 멈춤
+        assert governor.get_stats()["limit"] == 4
+        assert governor.limit == 4.0
+
+
+class TestHeaders:
+    """응답 헤더 기반 한도 추적 테스트"""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("1s", 1.0), ("6m0s", 360.0), ("20ms", 0.02), ("1h2m3.5s", 3723.5), ("3", 3.0), ("bogus", None),
+    ])
+    def test_parse_reset_seconds(self, value, expected):
+        assert parse_reset_seconds(value) == expected
+
+    async def test_headers_tracked_and_exhausted_budget_blocks(self):
+        governor = LLMRateGovernor("openai:gpt-4o", max_concurrency=4)
+
+        async with governor.slot(10) as slot:
+            slot.observe(200, {
+                "x-ratelimit-limit-requests": "500",
+                "x-ratelimit-limit-tokens": "30000",
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-remaining-tokens": "29000",
+                "x-ratelimit-reset-requests": "50ms",
+            })
+
+        stats = governor.get_stats()
+        assert stats["requests_per_minute"] == 500
+        assert stats["tokens_per_minute"] == 30000
+        assert stats["remaining_requests"] == 0
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with governor.slot(10):
+            pass
+        assert loop.time() - start >= 0.04
+
+    async def test_anthropic_headers(self):
+        governor = LLMRateGovernor("claude:sonnet", max_concurrency=4)
+
+        async with governor.slot(10) as slot:
+            slot.observe(200, {
+                "anthropic-ratelimit-requests-limit": "50",
+                "anthropic-ratelimit-tokens-remaining": "12000",
+            })
+
+        assert governor.get_stats()["requests_per_minute"] == 50
+        assert governor.get_stats()["remaining_tokens"] == 12000
+
+
+class TestFairness:
+    """Job 간 공정 큐 테스트"""
+
+    async def test_jobs_served_round_robin(self):
+        governor = LLMRateGovernor("gemini:flash", max_concurrency=1)
+        events = []
+
+        async def blocker():
+            async with governor.slot(10):
+                await asyncio.sleep(0.02)
+
+        async def job(job_id: str, calls: int):
+            set_llm_job(job_id)
+            await asyncio.gather(*(hold(governor, events, job_id, 0.001) for _ in range(calls)))
+
+        first = asyncio.ensure_future(blocker())
+        await asyncio.sleep(0)
+        # job A가 먼저 5건을 쌓아도 B의 요청이 뒤로 밀리지 않음
+        await asyncio.gather(job("A", 5), run_in_llm_job("B", job("B", 2)))
+        await first
+
+        assert events[:4] == ["A", "B", "A", "B"]
+
+
+class TestBudget:
+    """분당 요청 예산 테스트"""
+
+    async def test_requests_per_minute_budget_queues(self):
+        governor = LLMRateGovernor("openai:gpt-4o", max_concurrency=8, requests_per_minute=2)
+
+        async with governor.slot(10):
+            pass
+        async with governor.slot(10):
+            pass
+
+        third = asyncio.ensure_future(hold(governor, [], "third"))
+        await asyncio.sleep(0.05)
+
+        assert not third.done()
+        assert governor.get_stats()["queued"] == 1
+        third.cancel()
+
+
+class TestProcessScope:
+    """장수 프로세스 한정 테스트"""
+
+    def make_manager(self):
+        manager = LLMManager.__new__(LLMManager)
+        manager.use_governor = True
+        manager._governors = {}
+        return manager
+
+    async def test_slot_bypassed_in_forked_work_horse(self, monkeypatch):
+        monkeypatch.setattr(llm_governor, "_process_enabled", False)
+        manager = self.make_manager()
+
+        async with manager._llm_slot(LLMProvider.OPENAI, "gpt-4o", "prompt", 100) as slot:
+            assert slot is None
+        assert manager._governors == {}
+        assert manager.get_governor_stats()["enabled"] is False
+
+    async def test_slot_used_after_enable(self, monkeypatch):
+        monkeypatch.setattr(llm_governor, "_process_enabled", False)
+        llm_governor.enable_llm_governor()
+        manager = self.make_manager()
+
+        async with manager._llm_slot(LLMProvider.OPENAI, "gpt-4o", "prompt", 100) as slot:
+            assert slot is not None
+        assert manager.get_governor_stats()["governors"][0]["requests"] == 1
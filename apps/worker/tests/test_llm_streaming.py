@@ -0,0 +1,200 @@
+"""
+Unit Tests: Streaming Structured Output
+
+테스트 대상:
+- utils/streaming_json.py StreamingJSONFieldParser (최상위 필드 점진 파싱)
+- services/llm_manager.py call_with_structured_output_stream (핵심 필드 조기 전달)
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services import llm_governor
+from services.llm_manager import LLMManager, LLMProvider
+from utils.streaming_json import StreamingJSONFieldParser
+
+
+EARLY_FIELDS = ["name", "phone", "email", "exp_years", "last_company"]
+
+RESUME = {
+    "name": "홍길동",
+    "phone": "010-1234-5678",
+    "email": "hong@example.com",
+    "exp_years": 7.5,
+    "last_company": "ABC \"테크\", Inc.",
+    "careers": [
+        {"company": "ABC", "description": "결제 {시스템} [설계]", "is_current": True},
+        {"company": "DEF", "description": "백엔드, 운영", "is_current": False},
+    ],
+    "skills": ["Python", "Kafka"],
+}
+
+
+def split(text: str, size: int):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestStreamingJSONFieldParser:
+    """점진 파싱 테스트"""
+
+    @pytest.mark.parametrize("size", [1, 3, 17, 10000])
+    def test_fields_match_full_parse(self, size):
+        raw = json.dumps(RESUME, ensure_ascii=False, indent=2)
+        parser = StreamingJSONFieldParser()
+
+        completed = []
+        for chunk in split(raw, size):
+            completed += parser.feed(chunk)
+
+        assert parser.fields == RESUME
+        assert [key for key, _ in completed] == list(RESUME)
+
+    def test_scalar_fields_complete_before_careers_stream(self):
+        raw = json.dumps(RESUME, ensure_ascii=False)
+        cut = raw.index('"careers"') + len('"careers": [{"company": "A')
+        parser = StreamingJSONFieldParser()
+
+        parser.feed(raw[:cut])
+
+        assert {k: parser.fields[k] for k in EARLY_FIELDS} == {k: RESUME[k] for k in EARLY_FIELDS}
+        assert "careers" not in parser.fields
+        assert parser.streaming_container == "careers"
+
+    def test_incomplete_value_not_emitted(self):
+        parser = StreamingJSONFieldParser()
+
+        assert parser.feed('{"name": "홍길') == []
+        assert parser.feed('동", "exp_years": 1') == [("name", "홍길동")]
+        assert parser.feed("2}") == [("exp_years", 12)]
+
+
+class FakeStream:
+    """OpenAI AsyncStream 대역 (delta 조각 + 마지막 usage 청크)"""
+
+    def __init__(self, deltas):
+        self.chunks = [
+            SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(content=d))])
+            for d in deltas
+        ]
+        self.chunks.append(SimpleNamespace(
+            usage=SimpleNamespace(prompt_tokens=100, completion_tokens=50, total_tokens=150),
+            choices=[],
+        ))
+        self.consumed = 0
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
+@pytest.fixture(autouse=True)
+def governor_process(monkeypatch):
+    # 거버너는 장수 프로세스에서만 사용 (enable_llm_governor)
+    monkeypatch.setattr(llm_governor, "_process_enabled", True)
+
+
+def make_manager(deltas) -> LLMManager:
+    manager = LLMManager.__new__(LLMManager)
+    manager.models = {LLMProvider.OPENAI: "gpt-4o"}
+    manager.use_governor = True
+    manager._governors = {}
+    manager.use_prompt_caching = True
+    manager.openai_client = MagicMock()
+    manager.openai_client.chat.completions.create = AsyncMock(return_value=FakeStream(deltas))
+    return manager
+
+
+class TestStructuredOutputStream:
+    """LLMManager 스트리밍 호출 테스트"""
+
+    async def test_early_fields_sent_once_before_completion(self):
+        raw = json.dumps(RESUME, ensure_ascii=False)
+        deltas = split(raw, 5)
+        manager = make_manager(deltas)
+        stream = manager.openai_client.chat.completions.create.return_value
+
+        seen = []
+
+        def on_early_fields(fields):
+            seen.append((fields, stream.consumed))
+
+        response = await manager.call_with_structured_output_stream(
+            provider=LLMProvider.OPENAI,
+            messages=[{"role": "user", "content": "resume"}],
+            json_schema={"name": "resume"},
+            early_fields=EARLY_FIELDS,
+            on_early_fields=on_early_fields,
+        )
+
+        assert response.success
+        assert response.content == RESUME
+        assert response.raw_response == raw
+        assert response.usage == {
+            "prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150, "cached_tokens": 0,
+        }
+        assert [fields for fields, _ in seen] == [{k: RESUME[k] for k in EARLY_FIELDS}]
+        # 콜백 시점: careers 배열 수신 전 (스트림 중간)
+        assert seen[0][1] <= raw.index('"careers"') // 5 + 2
+
+        kwargs = manager.openai_client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["stream_options"] == {"include_usage": True}
+        # 스트림 전체가 거버너 슬롯 안에서 소비됨
+        governor = manager.get_governor_stats()["governors"][0]
+        assert governor["name"] == "openai:gpt-4o"
+        assert (governor["requests"], governor["in_flight"]) == (1, 0)
+
+    async def test_missing_early_field_sent_when_arrays_start(self):
+        data = {k: v for k, v in RESUME.items() if k != "email"}
+        manager = make_manager(split(json.dumps(data, ensure_ascii=False), 7))
+        on_early_fields = AsyncMock()
+
+        response = await manager.call_with_structured_output_stream(
+            provider=LLMProvider.OPENAI,
+            messages=[],
+            json_schema={"name": "resume"},
+            early_fields=EARLY_FIELDS,
+            on_early_fields=on_early_fields,
+        )
+
+        assert response.content == data
+        on_early_fields.assert_awaited_once()
+        assert set(on_early_fields.call_args.args[0]) == {"name", "phone", "exp_years", "last_company"}
+
+    async def test_callback_error_does_not_break_stream(self):
+        manager = make_manager(split(json.dumps(RESUME, ensure_ascii=False), 11))
+
+        response = await manager.call_with_structured_output_stream(
+            provider=LLMProvider.OPENAI,
+            messages=[],
+            json_schema={"name": "resume"},
+            early_fields=EARLY_FIELDS,
+            on_early_fields=MagicMock(side_effect=RuntimeError("db down")),
+        )
+
+        assert response.success
+        assert response.content == RESUME
+
+    async def test_truncated_stream_returns_parse_error(self):
+        raw = json.dumps(RESUME, ensure_ascii=False)
+        manager = make_manager(split(raw[:len(raw) // 2], 9))
+        on_early_fields = MagicMock()
+
+        response = await manager.call_with_structured_output_stream(
+            provider=LLMProvider.OPENAI,
+            messages=[],
+            json_schema={"name": "resume"},
+            early_fields=EARLY_FIELDS,
+            on_early_fields=on_early_fields,
+        )
+
+        assert not response.success
+        assert "JSON parse error" in response.error
+        on_early_fields.assert_called_once()
@@ -9,13 +9,14 @@ import pytest
 import sys
 import time
 import importlib.util
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 
 # Load metrics_service directly without going through services package
 spec = importlib.util.spec_from_file_location(
     "metrics_service",
-    "D:\\srchd\\apps\\worker\\services\\metrics_service.py"
+    Path(__file__).resolve().parent.parent / "services" / "metrics_service.py"
 )
 metrics_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(metrics_module)
@@ -174,6 +175,30 @@ class TestMetricsCollector:
         assert recent[0]["llm_tokens_output"] == 500
         assert recent[0]["llm_cost_usd"] > 0
 
+    def test_record_validation_batch(self, collector):
+        """배치 LLM 검증 절감량 기록"""
+        collector.start_pipeline("pipe-1", "job-1", "user-1")
+
+        collector.record_validation_batch(
+            pipeline_id="pipe-1",
+            llm_calls=2,
+            calls_saved=5,
+            tokens_saved=4000,
+            latency_ms=1200,
+        )
+
+        collector.complete_pipeline("pipe-1", success=True)
+
+        recent = collector.get_recent(1)
+        assert recent[0]["validation_llm_calls"] == 2
+        assert recent[0]["validation_calls_saved"] == 5
+        assert recent[0]["validation_tokens_saved"] == 4000
+
+        aggregated = collector.get_aggregated().to_dict()
+        assert aggregated["validation_batches"] == 1
+        assert aggregated["validation_tokens_saved"] == 4000
+        assert aggregated["validation_avg_latency_ms"] == 1200
+
     def test_llm_cost_calculation(self, collector):
         """LLM 비용 계산"""
         # OpenAI GPT-4o: $2.50/1M input, $10.00/1M output
@@ -0,0 +1,101 @@
+"""
+Unit Tests: Parse Service
+
+테스트 대상: services/parse_service.py
+- 파일 타입 분류 및 설정 파싱
+- 파일 타입별 동시 파싱 상한
+- 타임아웃 시 PARSE_TIMEOUT 반환
+- 프로세스 풀 워커에서 파싱
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import services.parse_service as parse_service_module
+from services.parse_service import (
+    ParsedFile,
+    ParseService,
+    _parse_type_limits,
+    get_file_category,
+)
+
+
+class TestFileCategory:
+    """파일 타입 분류 테스트"""
+
+    @pytest.mark.parametrize("filename,expected", [
+        ("resume.hwp", "hwp"),
+        ("resume.HWPX", "hwp"),
+        ("resume.pdf", "pdf"),
+        ("resume.doc", "docx"),
+        ("resume.docx", "docx"),
+        ("resume.txt", "other"),
+        ("", "other"),
+    ])
+    def test_category(self, filename, expected):
+        assert get_file_category(filename) == expected
+
+    def test_parse_type_limits(self):
+        assert _parse_type_limits("hwp=2, pdf=4,bad,docx=x", int) == {"hwp": 2, "pdf": 4}
+        assert _parse_type_limits("pdf=1.5", float) == {"pdf": 1.5}
+
+
+class TestParseServiceThreadMode:
+    """스레드 모드 동시성/타임아웃 테스트"""
+
+    def test_per_type_concurrency_cap(self, monkeypatch):
+        running = {"pdf": 0, "hwp": 0}
+        peak = {"pdf": 0, "hwp": 0}
+        lock = threading.Lock()
+
+        def fake_parse(file_bytes, filename):
+            category = get_file_category(filename)
+            with lock:
+                running[category] += 1
+                peak[category] = max(peak[category], running[category])
+            time.sleep(0.05)
+            with lock:
+                running[category] -= 1
+            return ParsedFile(success=True, text="ok", file_type=category)
+
+        monkeypatch.setattr(parse_service_module, "parse_file_bytes", fake_parse)
+        service = ParseService(use_process_pool=False, concurrency={"pdf": 1, "hwp": 2}, timeouts={})
+
+        async def main():
+            files = [f"{i}.pdf" for i in range(3)] + [f"{i}.hwp" for i in range(4)]
+            return await asyncio.gather(*(service.parse(b"", name) for name in files))
+
+        results = asyncio.run(main())
+
+        assert all(r.success for r in results)
+        assert peak == {"pdf": 1, "hwp": 2}
+
+    def test_timeout_returns_parse_timeout(self, monkeypatch):
+        def slow_parse(file_bytes, filename):
+            time.sleep(0.3)
+            return ParsedFile(success=True, text="late")
+
+        monkeypatch.setattr(parse_service_module, "parse_file_bytes", slow_parse)
+        service = ParseService(use_process_pool=False, concurrency={}, timeouts={"pdf": 0.05})
+
+        result = asyncio.run(service.parse(b"", "resume.pdf"))
+
+        assert result.success is False
+        assert result.error_code == "PARSE_TIMEOUT"
+
+
+class TestParseServiceProcessPool:
+    """프로세스 풀 파싱 테스트"""
+
+    def test_rejected_file_parsed_in_worker_process(self):
+        service = ParseService(max_workers=1, use_process_pool=True, concurrency={}, timeouts={})
+        try:
+            result = asyncio.run(service.parse(b"not a resume", "resume.txt"))
+        finally:
+            service.shutdown()
+
+        assert result.success is False
+        assert result.error_code == "FILE_REJECTED"
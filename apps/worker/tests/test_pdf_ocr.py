@@ -0,0 +1,130 @@
+"""
+Unit Tests: PDF OCR Stage
+
+테스트 대상: utils/pdf_parser.py (PDFParser._perform_ocr)
+- OCR 대상 페이지만 한 페이지씩 래스터화
+- 페이지 크기 기반 적응형 DPI
+- 병렬 OCR + 메모리 상한
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utils import pdf_parser
+from utils.pdf_parser import PDFParser, _MemoryBudget
+
+A4 = (595, 842)
+A3 = (842, 1191)
+
+
+class FakeOCR:
+    """pdftoppm / tesseract 없이 래스터화·OCR 호출을 기록"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.rasterized = []
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def convert_from_path(self, path, dpi, first_page, last_page, grayscale):
+        assert first_page == last_page
+        self.rasterized.append((first_page - 1, dpi))
+        image = MagicMock()
+        image.page_idx = first_page - 1
+        return [image]
+
+    def image_to_string(self, image, lang, config):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return f"page {image.page_idx} text"
+
+
+@pytest.fixture
+def fake_ocr():
+    fake = FakeOCR(delay=0.05)
+    tesseract = MagicMock()
+    tesseract.image_to_string = fake.image_to_string
+    with patch.object(pdf_parser, "convert_from_path", fake.convert_from_path), \
+            patch.object(pdf_parser, "pytesseract", tesseract):
+        yield fake
+
+
+class TestPerformOCR:
+    """OCR 단계 테스트"""
+
+    def test_rasterizes_only_requested_pages(self, fake_ocr):
+        parser = PDFParser()
+        parser.ocr_workers = 2
+
+        result = parser._perform_ocr(b"%PDF", [1, 7], {1: A4, 7: A4})
+
+        assert result == {1: "page 1 text", 7: "page 7 text"}
+        assert sorted(page for page, _ in fake_ocr.rasterized) == [1, 7]
+
+    def test_runs_pages_in_parallel(self, fake_ocr):
+        parser = PDFParser()
+        parser.ocr_workers = 4
+        parser.ocr_memory_limit = 1024 ** 3
+
+        parser._perform_ocr(b"%PDF", list(range(8)), {i: A4 for i in range(8)})
+
+        assert fake_ocr.peak == 4
+
+    def test_memory_limit_bounds_parallelism(self, fake_ocr):
+        parser = PDFParser()
+        parser.ocr_workers = 4
+        # A4 300dpi 그레이스케일 ≈ 8.7MB → 상한 10MB면 한 번에 한 페이지
+        parser.ocr_memory_limit = 10 * 1024 * 1024
+
+        result = parser._perform_ocr(b"%PDF", list(range(4)), {i: A4 for i in range(4)})
+
+        assert len(result) == 4
+        assert fake_ocr.peak == 1
+
+    def test_missing_dependencies_returns_empty(self):
+        with patch.object(pdf_parser, "convert_from_path", None):
+            assert PDFParser()._perform_ocr(b"%PDF", [0]) == {}
+
+
+class TestAdaptiveDPI:
+    """페이지 크기 기반 DPI 테스트"""
+
+    def test_a4_uses_max_dpi(self):
+        parser = PDFParser()
+        assert parser._ocr_dpi(A4) == parser.ocr_max_dpi
+
+    def test_large_page_lowers_dpi(self):
+        parser = PDFParser()
+        dpi = parser._ocr_dpi(A3)
+        assert parser.ocr_min_dpi <= dpi < parser.ocr_max_dpi
+
+        width_px = A3[0] / 72 * dpi
+        height_px = A3[1] / 72 * dpi
+        assert width_px * height_px <= parser.ocr_max_page_pixels
+
+    def test_huge_page_clamped_to_min_dpi(self):
+        parser = PDFParser()
+        assert parser._ocr_dpi((72 * 100, 72 * 100)) == parser.ocr_min_dpi
+
+    def test_unknown_size_uses_max_dpi(self):
+        parser = PDFParser()
+        assert parser._ocr_dpi(None) == parser.ocr_max_dpi
+
+
+class TestMemoryBudget:
+    """메모리 상한 테스트"""
+
+    def test_oversized_item_runs_alone(self):
+        budget = _MemoryBudget(100)
+        budget.acquire(500)
+        assert budget.used == 500
+        budget.release(500)
+        assert budget.used == 0
@@ -0,0 +1,223 @@
+"""
+Unit Tests: Prompt Caching
+
+테스트 대상:
+- utils/prompt_layout.py (정적 프리픽스 우선 메시지 조립)
+- services/llm_manager.py 프로바이더별 캐싱 인자 / cached content / 캐시 토큰 사용량
+- services/prompt_cache_registry.py cached content 이름 프로세스 간 공유
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import fakeredis
+
+from services.llm_manager import LLMManager, LLMProvider
+from services.prompt_cache_registry import PromptCacheRegistry
+from utils.prompt_layout import build_cacheable_messages, prefix_cache_key, split_static_prefix
+
+
+STATIC = ["지침\n", "  스키마 " * 600, "응답 형식"]
+
+
+def make_manager() -> LLMManager:
+    manager = LLMManager.__new__(LLMManager)
+    manager.models = {LLMProvider.OPENAI: "gpt-4o", LLMProvider.GEMINI: "gemini-2.0-flash"}
+    manager.use_governor = False
+    manager._governors = {}
+    manager.use_prompt_caching = True
+    manager._gemini_caches = {}
+    manager._gemini_cache_pending = {}
+    return manager
+
+
+class TestPromptLayout:
+    """메시지 조립 테스트"""
+
+    def test_static_prefix_is_byte_stable_across_documents(self):
+        first = build_cacheable_messages(STATIC, "이력서 A")
+        second = build_cacheable_messages([part.strip() for part in STATIC], "이력서 B 전혀 다른 내용")
+
+        assert first[0] == second[0]
+        assert first[0]["role"] == "system"
+        assert first[1] == {"role": "user", "content": "이력서 A"}
+
+    def test_split_static_prefix(self):
+        messages = build_cacheable_messages(STATIC, "본문")
+
+        static_prefix, rest = split_static_prefix(messages)
+
+        assert static_prefix == messages[0]["content"]
+        assert rest == [messages[1]]
+        assert split_static_prefix([{"role": "user", "content": "x"}]) == ("", [{"role": "user", "content": "x"}])
+
+
+class TestProviderCaching:
+    """프로바이더별 캐싱 인자 테스트"""
+
+    def test_openai_prompt_cache_key_follows_prefix(self):
+        manager = make_manager()
+        messages = build_cacheable_messages(STATIC, "본문")
+
+        kwargs = manager._openai_cache_kwargs(messages)
+
+        assert kwargs == {"extra_body": {"prompt_cache_key": prefix_cache_key(messages[0]["content"])}}
+        assert manager._openai_cache_kwargs(build_cacheable_messages(STATIC, "다른 본문")) == kwargs
+
+        manager.use_prompt_caching = False
+        assert manager._openai_cache_kwargs(messages) == {}
+
+    def test_claude_system_block_has_cache_control(self):
+        manager = make_manager()
+
+        assert manager._claude_system("지침") == [
+            {"type": "text", "text": "지침", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert manager._claude_system("") is None
+
+    async def test_openai_call_reports_cached_tokens(self):
+        manager = make_manager()
+        manager.openai_client = MagicMock()
+        manager.openai_client.chat.completions.create = AsyncMock(return_value=SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"name": "홍길동"}'))],
+            usage=SimpleNamespace(
+                prompt_tokens=2000, completion_tokens=100, total_tokens=2100,
+                prompt_tokens_details=SimpleNamespace(cached_tokens=1536),
+            ),
+        ))
+
+        response = await manager.call_json(
+            provider=LLMProvider.OPENAI,
+            messages=build_cacheable_messages(STATIC, "본문"),
+        )
+
+        assert response.usage["cached_tokens"] == 1536
+        assert "prompt_cache_key" in manager.openai_client.chat.completions.create.call_args.kwargs["extra_body"]
+
+
+class TestUsage:
+    """캐시 토큰 사용량 테스트"""
+
+    def test_claude_usage_includes_cache_tokens_in_prompt(self):
+        usage = LLMManager._claude_usage(SimpleNamespace(
+            input_tokens=300, output_tokens=200, cache_read_input_tokens=4000, cache_creation_input_tokens=0,
+        ))
+
+        assert usage == {
+            "prompt_tokens": 4300, "completion_tokens": 200, "total_tokens": 4500,
+            "cached_tokens": 4000, "cache_write_tokens": 0,
+        }
+
+    def test_gemini_usage(self):
+        usage = LLMManager._gemini_usage(SimpleNamespace(
+            prompt_token_count=5000, candidates_token_count=300, total_token_count=5300,
+            cached_content_token_count=4096,
+        ))
+
+        assert usage["cached_tokens"] == 4096
+        assert LLMManager._gemini_usage(None) == {}
+
+
+class TestGeminiCachedContent:
+    """Gemini cached content 테스트"""
+
+    async def test_prefix_cached_once_and_reused(self):
+        manager = make_manager()
+        manager.gemini_client = MagicMock()
+
+        async def create(**kwargs):
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(name="cachedContents/abc")
+
+        manager.gemini_client.aio.caches.create = AsyncMock(side_effect=create)
+        messages = build_cacheable_messages(STATIC, "본문")
+
+        results = await asyncio.gather(*(manager._gemini_prompt("gemini-2.0-flash", messages) for _ in range(3)))
+
+        assert manager.gemini_client.aio.caches.create.await_count == 1
+        config = manager.gemini_client.aio.caches.create.call_args.kwargs["config"]
+        assert config.system_instruction == messages[0]["content"]
+        for prompt, cache_name in results:
+            assert cache_name == "cachedContents/abc"
+            assert prompt == "User: 본문"
+
+    async def test_create_failure_remembered_and_full_prompt_sent(self):
+        manager = make_manager()
+        manager.gemini_client = MagicMock()
+        manager.gemini_client.aio.caches.create = AsyncMock(side_effect=RuntimeError("too few tokens"))
+        messages = build_cacheable_messages(STATIC, "본문")
+
+        for _ in range(2):
+            prompt, cache_name = await manager._gemini_prompt("gemini-2.0-flash", messages)
+            assert cache_name is None
+            assert prompt.startswith("System: ")
+
+        assert manager.gemini_client.aio.caches.create.await_count == 1
+
+    async def test_short_prefix_not_cached(self):
+        manager = make_manager()
+        manager.gemini_client = MagicMock()
+        manager.gemini_client.aio.caches.create = AsyncMock()
+
+        prompt, cache_name = await manager._gemini_prompt(
+            "gemini-2.0-flash", build_cacheable_messages(["짧은 지침"], "본문")
+        )
+
+        assert cache_name is None
+        manager.gemini_client.aio.caches.create.assert_not_awaited()
+
+
+class TestSharedGeminiCache:
+    """fork된 work-horse 간 cached content 재사용 테스트"""
+
+    @staticmethod
+    def make_process(redis) -> LLMManager:
+        # Job마다 새 work-horse: 프로세스 메모리 캐시는 비어 있고 Redis만 공유
+        manager = make_manager()
+        manager.gemini_cache_registry = PromptCacheRegistry(redis=redis)
+        manager.gemini_client = MagicMock()
+        manager.gemini_client.aio.caches.create = AsyncMock(
+            return_value=SimpleNamespace(name="cachedContents/abc")
+        )
+        return manager
+
+    async def test_second_process_reuses_cache(self):
+        redis = fakeredis.FakeRedis()
+        messages = build_cacheable_messages(STATIC, "본문")
+        first, second = self.make_process(redis), self.make_process(redis)
+
+        _, first_name = await first._gemini_prompt("gemini-2.0-flash", messages)
+        prompt, second_name = await second._gemini_prompt("gemini-2.0-flash", messages)
+
+        assert first_name == second_name == "cachedContents/abc"
+        assert prompt == "User: 본문"
+        first.gemini_client.aio.caches.create.assert_awaited_once()
+        second.gemini_client.aio.caches.create.assert_not_awaited()
+        key = f"rai:gemini_prompt_cache:gemini-2.0-flash:{prefix_cache_key(messages[0]['content'])}"
+        assert 0 < redis.ttl(key) <= 3600
+
+    async def test_create_failure_shared(self):
+        redis = fakeredis.FakeRedis()
+        messages = build_cacheable_messages(STATIC, "본문")
+        first, second = self.make_process(redis), self.make_process(redis)
+        first.gemini_client.aio.caches.create.side_effect = RuntimeError("too few tokens")
+
+        await first._gemini_prompt("gemini-2.0-flash", messages)
+        prompt, cache_name = await second._gemini_prompt("gemini-2.0-flash", messages)
+
+        assert cache_name is None
+        assert prompt.startswith("System: ")
+        second.gemini_client.aio.caches.create.assert_not_awaited()
+
+    async def test_no_duplicate_create_while_other_process_creating(self):
+        redis = fakeredis.FakeRedis()
+        messages = build_cacheable_messages(STATIC, "본문")
+        creating = PromptCacheRegistry(redis=redis)
+        assert creating.claim(f"gemini-2.0-flash:{prefix_cache_key(messages[0]['content'])}")
+
+        manager = self.make_process(redis)
+        _, cache_name = await manager._gemini_prompt("gemini-2.0-flash", messages)
+
+        assert cache_name is None
+        manager.gemini_client.aio.caches.create.assert_not_awaited()
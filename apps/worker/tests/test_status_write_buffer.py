@@ -0,0 +1,169 @@
+"""
+Unit Tests: Status Write Buffer
+
+테스트 대상: services/status_write_buffer.py
+- 같은 행의 연속 비종료 갱신 병합 (나중 값 우선)
+- 같은 payload 행들을 한 요청으로 묶음
+- 종료 상태 즉시 플러시 + 실패 반환
+- 백그라운드 주기 플러시
+- DatabaseService 연동 (직접 status 쓰기 전 플러시)
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from services.status_write_buffer import StatusWriteBuffer
+
+
+class FakeTable:
+    """PostgREST update 대체: (table, payload, row_ids) 기록"""
+
+    def __init__(self, fail_on=None):
+        self.writes = []
+        self.fail_on = fail_on
+        self.lock = threading.Lock()
+
+    def write(self, table, data, row_ids):
+        if self.fail_on and self.fail_on in row_ids:
+            raise RuntimeError("PostgREST 503")
+        with self.lock:
+            self.writes.append((table, dict(data), sorted(row_ids)))
+
+
+class TestCoalescing:
+    """병합/배치 테스트"""
+
+    def test_successive_updates_coalesce_into_one_write(self):
+        api = FakeTable()
+        buffer = StatusWriteBuffer(api.write, interval_ms=10_000)
+
+        assert buffer.put("candidates", "c1", {"status": "processing"})
+        assert buffer.put("candidates", "c1", {"status": "parsed", "quick_extracted": {"name": "홍길동"}})
+        assert buffer.put("candidates", "c1", {"status": "analyzed", "quick_extracted": {"name": "홍길동", "email": "h@x.com"}})
+        assert api.writes == []
+
+        buffer.flush()
+
+        assert api.writes == [(
+            "candidates",
+            {"status": "analyzed", "quick_extracted": {"name": "홍길동", "email": "h@x.com"}},
+            ["c1"],
+        )]
+        stats = buffer.get_stats()
+        assert stats["coalesced"] == 2
+        assert stats["requests_saved"] == 2
+
+    def test_rows_with_same_payload_share_one_request(self):
+        api = FakeTable()
+        buffer = StatusWriteBuffer(api.write, interval_ms=10_000)
+
+        for job_id in ("j1", "j2", "j3"):
+            buffer.put("processing_jobs", job_id, {"status": "processing"})
+        buffer.put("processing_jobs", "j4", {"status": "processing", "candidate_id": "c4"})
+
+        buffer.flush()
+
+        assert api.writes == [
+            ("processing_jobs", {"status": "processing"}, ["j1", "j2", "j3"]),
+            ("processing_jobs", {"status": "processing", "candidate_id": "c4"}, ["j4"]),
+        ]
+        assert buffer.get_stats()["avg_rows_per_request"] == 2.0
+
+
+class TestTerminalFlush:
+    """종료 상태 테스트"""
+
+    def test_terminal_update_flushes_everything_before_returning(self):
+        api = FakeTable()
+        buffer = StatusWriteBuffer(api.write, interval_ms=10_000)
+
+        buffer.put("candidates", "c1", {"status": "analyzed"})
+        buffer.put("processing_jobs", "j1", {"status": "processing"})
+        assert buffer.put("processing_jobs", "j1", {"status": "completed", "chunk_count": 3}, terminal=True)
+
+        assert api.writes == [
+            ("candidates", {"status": "analyzed"}, ["c1"]),
+            ("processing_jobs", {"status": "completed", "chunk_count": 3}, ["j1"]),
+        ]
+        assert buffer.get_stats()["pending"] == 0
+
+    def test_terminal_failure_reported_to_caller(self):
+        api = FakeTable(fail_on="j1")
+        buffer = StatusWriteBuffer(api.write, interval_ms=10_000)
+
+        assert buffer.put("processing_jobs", "j1", {"status": "failed"}, terminal=True) is False
+        assert buffer.get_stats()["failed_requests"] == 1
+
+    def test_background_flush_never_overwrites_terminal_state(self):
+        api = FakeTable()
+        buffer = StatusWriteBuffer(api.write, interval_ms=20)
+
+        buffer.put("processing_jobs", "j1", {"status": "processing"})
+        buffer.put("processing_jobs", "j1", {"status": "completed"}, terminal=True)
+        time.sleep(0.1)
+
+        assert [data["status"] for _, data, _ in api.writes] == ["completed"]
+
+
+class TestBackgroundFlush:
+    """주기 플러시 테스트"""
+
+    def test_pending_updates_sent_after_interval(self):
+        api = FakeTable()
+        buffer = StatusWriteBuffer(api.write, interval_ms=20)
+
+        buffer.put("processing_jobs", "j1", {"status": "processing"})
+        buffer.put("processing_jobs", "j2", {"status": "processing"})
+
+        deadline = time.time() + 2
+        while not api.writes and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert api.writes == [("processing_jobs", {"status": "processing"}, ["j1", "j2"])]
+
+
+class TestDatabaseServiceIntegration:
+    """DatabaseService 연동 테스트"""
+
+    def make_service(self):
+        from services.database_service import DatabaseService
+
+        service = DatabaseService.__new__(DatabaseService)
+        service.client = MagicMock()
+        service.status_buffer = StatusWriteBuffer(service._write_status_rows, interval_ms=10_000)
+        return service
+
+    def test_non_terminal_status_is_buffered(self):
+        service = self.make_service()
+
+        assert service.update_job_status("j1", "processing")
+        assert service.update_candidate_status("c1", "parsed", quick_extracted={"name": "홍길동"})
+
+        service.client.table.assert_not_called()
+        assert service.get_status_buffer_stats()["pending"] == 2
+
+    def test_terminal_status_writes_batched_update(self):
+        service = self.make_service()
+
+        service.update_job_status("j1", "processing")
+        service.update_job_status("j2", "processing")
+        assert service.update_job_status("j3", "failed", error_code="PARSE_FAILED")
+
+        update = service.client.table.return_value.update
+        payloads = [call.args[0] for call in update.call_args_list]
+        assert {"status": "processing"} in payloads
+        assert {"status": "failed", "error_code": "PARSE_FAILED"} in payloads
+        update.return_value.in_.assert_called_once_with("id", ["j1", "j2"])
+        update.return_value.eq.assert_called_once_with("id", "j3")
+
+    def test_direct_status_write_flushes_buffer_first(self):
+        service = self.make_service()
+        service.update_candidate_status("c1", "parsed")
+
+        service.update_candidate_analyzed("c1")
+
+        update = service.client.table.return_value.update
+        assert update.call_args_list[0].args[0]["status"] == "parsed"
+        assert update.call_args_list[-1].args[0]["status"] == "analyzed"
+        assert service.get_status_buffer_stats()["pending"] == 0
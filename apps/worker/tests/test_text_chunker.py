@@ -0,0 +1,133 @@
+"""
+Unit Tests: Semantic Text Chunker
+
+테스트 대상: utils/text_chunker.py
+- 작은 섹션 패킹
+- 큰 섹션의 줄/문장 경계 분할 및 조각 사이 최소 오버랩
+- 원본 위치(start_pos / end_pos) 정확성
+- 경계 없는 텍스트의 문자 윈도우 fallback
+- 짧은 청크 병합
+"""
+
+import pytest
+
+from utils.text_chunker import SemanticChunker
+
+
+def count_tokens(text: str) -> int:
+    return len(text.split())
+
+
+def make_chunker(**kwargs) -> SemanticChunker:
+    params = dict(count_tokens=count_tokens, target_tokens=60, max_chars=400, overlap_tokens=10)
+    params.update(kwargs)
+    return SemanticChunker(**params)
+
+
+def resume(career_lines: int = 3) -> str:
+    lines = ["홍길동", "hong@example.com", "", "경력사항"]
+    lines += [f"- 프로젝트 {i} 에서 결제 시스템 백엔드를 설계하고 운영했습니다." for i in range(career_lines)]
+    lines += ["", "학력사항", "서울대학교 컴퓨터공학과 (2010 - 2014)"]
+    return "\n".join(lines)
+
+
+class TestPacking:
+    """작은 섹션 패킹 테스트"""
+
+    def test_small_sections_packed_into_one_chunk(self):
+        text = resume(career_lines=2)
+        chunks = make_chunker().chunk(text)
+
+        assert len(chunks) == 1
+        assert chunks[0].text == text.strip()
+        assert chunks[0].section_labels[0] == "profile"
+        assert len(chunks[0].section_labels) >= 2
+        assert not chunks[0].is_split
+
+    def test_empty_text(self):
+        assert make_chunker().chunk("") == []
+        assert make_chunker().chunk("  \n ") == []
+
+
+class TestSectionSplit:
+    """큰 섹션 분할 테스트"""
+
+    def test_large_section_split_on_line_boundaries(self):
+        text = resume(career_lines=30)
+        chunks = make_chunker().chunk(text)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.tokens <= 60 or len(chunk.text) <= 400
+            assert text[chunk.start_pos:chunk.end_pos] == chunk.text
+            # 줄 중간에서 끊기지 않음
+            assert chunk.start_pos == 0 or text[chunk.start_pos - 1] in "\n"
+            assert chunk.end_pos == len(text) or text[chunk.end_pos] == "\n"
+
+    def test_overlap_only_between_split_pieces(self):
+        text = resume(career_lines=30)
+        chunks = make_chunker(overlap_tokens=10).chunk(text)
+
+        split = [c for c in chunks if c.is_split]
+        assert split and any(c.overlap_chars > 0 for c in split)
+        for prev, chunk in zip(chunks, chunks[1:]):
+            if chunk.overlap_chars:
+                assert prev.end_pos - chunk.start_pos == chunk.overlap_chars
+                assert count_tokens(text[chunk.start_pos:prev.end_pos]) <= 10
+            else:
+                assert chunk.start_pos >= prev.end_pos
+
+    def test_no_overlap_when_disabled(self):
+        chunks = make_chunker(overlap_tokens=0).chunk(resume(career_lines=30))
+
+        assert all(c.overlap_chars == 0 for c in chunks)
+        for prev, chunk in zip(chunks, chunks[1:]):
+            assert chunk.start_pos >= prev.end_pos
+
+    def test_long_line_split_on_sentences(self):
+        sentence = "결제 시스템 백엔드를 설계하고 대규모 트래픽을 안정적으로 운영했습니다."
+        text = " ".join([sentence] * 20)
+        chunks = make_chunker(overlap_tokens=0).chunk(text)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.text.endswith("다.")
+            assert text[chunk.start_pos:chunk.end_pos] == chunk.text
+
+
+class TestWindowFallback:
+    """경계 없는 텍스트 테스트"""
+
+    def test_boundaryless_text_uses_char_window(self):
+        text = "가" * 1000
+        chunks = make_chunker(window_overlap_chars=100).chunk(text)
+
+        assert [(c.start_pos, c.end_pos) for c in chunks] == [(0, 400), (300, 700), (600, 1000)]
+        assert [c.overlap_chars for c in chunks] == [0, 100, 100]
+        assert all(c.is_split for c in chunks)
+
+
+class TestMergeShort:
+    """짧은 청크 병합 테스트"""
+
+    @pytest.mark.parametrize("min_chars", [0, 80])
+    def test_short_tail_merged_into_previous(self, min_chars):
+        text = "\n".join(["word " * 50] * 3 + ["tail"])
+        chunks = make_chunker(target_tokens=50, overlap_tokens=0, min_chars=min_chars).chunk(text)
+
+        if min_chars:
+            assert chunks[-1].text.endswith("tail")
+            assert all(len(c.text) >= min_chars for c in chunks)
+        else:
+            assert chunks[-1].text == "tail"
+        assert chunks[-1].end_pos == len(text)
+
+    def test_consecutive_short_chunks_never_exceed_max_chars(self):
+        # 짧은 청크가 연달아 이전 청크에 붙어도 max_chars를 넘지 않아야 함
+        text = "\n".join(["word " * 10] * 12)
+        chunker = make_chunker(target_tokens=10, max_chars=120, overlap_tokens=0, min_chars=60)
+        chunks = chunker.chunk(text)
+
+        assert len(chunks) > 1
+        assert all(len(c.text) <= chunker.max_chars for c in chunks)
+        assert chunks[-1].end_pos == len(text.rstrip())
@@ -679,6 +679,157 @@ class TestCrossValidationEngineAsync:
             assert len(result.providers_used) == 1
 
 
+class TestBatchedLLMValidation:
+    """배치 LLM 검증 테스트"""
+
+    @pytest.fixture
+    def ctx(self):
+        """테스트용 PipelineContext"""
+        ctx = PipelineContext()
+        ctx.set_raw_input(b"test content", "test_resume.pdf")
+        ctx.set_parsed_text("경력 5년 개발자입니다. Python, Java 사용. 현재 ABC 회사 선임개발자로 재직 중.")
+        ctx.extract_pii()
+        return ctx
+
+    ANALYZED = {
+        "exp_years": 5,
+        "current_company": "ABC",
+        "skills": ["Python", "Java"],
+    }
+
+    def make_wrapper(self, batch_content, use_batched_validation=True):
+        """배치 응답(batch_content)을 반환하는 LLM Manager로 래퍼 생성"""
+        class MockProvider:
+            value = "openai"
+
+        llm = MagicMock()
+        llm.get_available_providers.return_value = [MockProvider()]
+        llm.call_with_structured_output = AsyncMock(return_value=MagicMock(
+            success=True,
+            content=batch_content,
+            usage={"total_tokens": 900},
+        ))
+        llm.call_json = AsyncMock(return_value=MagicMock(
+            success=True,
+            content={"is_valid": True, "confidence": 0.95, "found_in_text": True, "reasoning": "재검증"},
+        ))
+
+        with patch('orchestrator.validation_wrapper.get_validation_agent'), \
+             patch('orchestrator.validation_wrapper.get_llm_manager', return_value=llm), \
+             patch('orchestrator.validation_wrapper.get_feature_flags') as mock_flags:
+            mock_flags.return_value = MagicMock(
+                use_batched_validation=use_batched_validation,
+                use_evidence_tracking=False,
+            )
+            from orchestrator.validation_wrapper import ValidationAgentWrapper
+            return ValidationAgentWrapper(), llm
+
+    @staticmethod
+    def verdict(field_name, confidence=0.9, **overrides):
+        verdict = {
+            "field_name": field_name,
+            "is_valid": True,
+            "confidence": confidence,
+            "found_in_text": True,
+            "reasoning": "텍스트에서 확인됨",
+        }
+        verdict.update(overrides)
+        return verdict
+
+    async def test_single_call_for_all_fields(self, ctx):
+        """모든 판정이 명확하면 배치 호출 1회로 끝남"""
+        wrapper, llm = self.make_wrapper({"verdicts": [
+            self.verdict("exp_years"),
+            self.verdict("current_company", confidence=0.2, is_valid=False, suggested_correction="ABC 회사"),
+            self.verdict("skills"),
+        ]})
+        collector = MagicMock()
+
+        with patch('orchestrator.validation_wrapper._get_metrics_collector', return_value=collector):
+            validations, corrections, providers = await wrapper._run_llm_validations(
+                ctx, self.ANALYZED, ctx.parsed_data.raw_text
+            )
+
+        llm.call_with_structured_output.assert_awaited_once()
+        llm.call_json.assert_not_awaited()
+        assert {v.field_name for v in validations} == set(self.ANALYZED)
+        assert corrections[0]["field"] == "current_company"
+        assert corrections[0]["corrected"] == "ABC 회사"
+        assert providers == ["openai"]
+
+        # 원본 텍스트 발췌는 프롬프트에 한 번만 포함
+        kwargs = llm.call_with_structured_output.call_args.kwargs
+        assert kwargs["messages"][1]["content"].count("경력 5년 개발자입니다") == 1
+        assert kwargs["json_schema"]["schema"]["properties"]["verdicts"]["items"]["properties"]["field_name"]["enum"] == list(self.ANALYZED)
+
+        metrics = collector.record_validation_batch.call_args.kwargs
+        assert metrics["pipeline_id"] == ctx.metadata.pipeline_id
+        assert metrics["llm_calls"] == 1
+        assert metrics["calls_saved"] == 2
+        assert metrics["tokens_saved"] > 0
+
+    async def test_ambiguous_and_missing_verdicts_fall_back(self, ctx):
+        """모호하거나 누락된 판정만 필드별 호출로 재검증"""
+        wrapper, llm = self.make_wrapper({"verdicts": [
+            self.verdict("exp_years"),
+            self.verdict("current_company", confidence=0.5),
+        ]})
+        collector = MagicMock()
+
+        with patch('orchestrator.validation_wrapper._get_metrics_collector', return_value=collector):
+            validations, _, _ = await wrapper._run_llm_validations(
+                ctx, self.ANALYZED, ctx.parsed_data.raw_text
+            )
+
+        assert llm.call_json.await_count == 2
+        by_field = {v.field_name: v for v in validations}
+        assert by_field["exp_years"].reasoning == "텍스트에서 확인됨"
+        assert by_field["current_company"].reasoning == "재검증"
+        assert by_field["skills"].reasoning == "재검증"
+
+        metrics = collector.record_validation_batch.call_args.kwargs
+        assert metrics["llm_calls"] == 3
+        assert metrics["calls_saved"] == 0
+
+    async def test_failed_batch_falls_back_to_all_fields(self, ctx):
+        """배치 응답 파싱 실패 시 전체 필드를 필드별로 검증"""
+        wrapper, llm = self.make_wrapper(None)
+        llm.call_with_structured_output.return_value.success = False
+
+        with patch('orchestrator.validation_wrapper._get_metrics_collector', return_value=None):
+            validations, _, _ = await wrapper._run_llm_validations(
+                ctx, self.ANALYZED, ctx.parsed_data.raw_text
+            )
+
+        assert llm.call_json.await_count == 3
+        assert len(validations) == 3
+
+    def test_static_prefix_shared_across_documents(self):
+        """지침/응답 형식은 문서와 무관한 system 프리픽스 (프롬프트 캐싱)"""
+        wrapper, _ = self.make_wrapper({"verdicts": []})
+
+        first = wrapper._build_batch_messages(list(self.ANALYZED.items()), "이력서 A")
+        second = wrapper._build_batch_messages([("exp_years", 3)], "이력서 B")
+
+        assert first[0] == second[0]
+        assert "verdicts" in first[0]["content"]
+        assert "이력서 A" not in first[0]["content"]
+        assert wrapper._build_field_messages("skills", ["Go"], "A")[0] == \
+            wrapper._build_field_messages("exp_years", 5, "B")[0]
+
+    async def test_batching_disabled_uses_per_field_calls(self, ctx):
+        """플래그 off 시 기존 필드별 검증"""
+        wrapper, llm = self.make_wrapper({"verdicts": []}, use_batched_validation=False)
+
+        validations, _, _ = await wrapper._run_llm_validations(
+            ctx, self.ANALYZED, ctx.parsed_data.raw_text
+        )
+
+        llm.call_with_structured_output.assert_not_awaited()
+        assert llm.call_json.await_count == 3
+        assert len(validations) == 3
+
+
 class TestValidationWrapperResult:
     """ValidationWrapperResult 테스트"""
 
@@ -0,0 +1,66 @@
+"""
+Unit Tests: Vector Codec
+
+테스트 대상: utils/vector_codec.py
+- base64 / bytes / 리스트 → float32 배열
+- pgvector 텍스트 리터럴 (float32 무손실 왕복)
+- base64 직렬화 왕복
+"""
+
+import base64
+import json
+
+import numpy as np
+
+from utils.vector_codec import as_float32, to_base64, to_pgvector
+
+
+def _vector(n=1536, seed=0):
+    return (np.random.default_rng(seed).standard_normal(n) / 30).astype(np.float32)
+
+
+class TestAsFloat32:
+    """float32 변환 테스트"""
+
+    def test_decodes_openai_base64(self):
+        vector = _vector()
+        encoded = base64.b64encode(vector.tobytes()).decode()
+
+        decoded = as_float32(encoded)
+
+        assert decoded.dtype == np.float32
+        assert np.array_equal(decoded, vector)
+
+    def test_converts_float_list(self):
+        decoded = as_float32([0.5, -0.25])
+
+        assert decoded.dtype == np.float32
+        assert decoded.tolist() == [0.5, -0.25]
+
+    def test_none_passthrough(self):
+        assert as_float32(None) is None
+        assert to_pgvector(None) is None
+        assert to_base64(None) is None
+
+
+class TestSerialization:
+    """직렬화 테스트"""
+
+    def test_pgvector_literal_roundtrips_exactly(self):
+        vector = _vector()
+        vector[0] = 1e-6
+
+        literal = to_pgvector(vector)
+
+        assert literal.startswith("[") and literal.endswith("]")
+        assert np.array_equal(np.array(json.loads(literal), dtype=np.float32), vector)
+
+    def test_pgvector_literal_smaller_than_json_list(self):
+        vector = _vector()
+
+        assert len(to_pgvector(vector)) < 0.7 * len(json.dumps(vector.tolist()))
+
+    def test_base64_roundtrip(self):
+        vector = _vector()
+
+        assert np.array_equal(as_float32(to_base64(vector)), vector)
@@ -28,6 +28,7 @@ from .education_parser import (
     determine_graduation_status,
     determine_degree_level,
 )
+from .async_runtime import AsyncRuntime, get_async_runtime, run_sync
 
 __all__ = [
     # Subprocess
@@ -66,4 +67,8 @@ __all__ = [
     "DegreeLevel",
     "determine_graduation_status",
     "determine_degree_level",
+    # Async Runtime
+    "AsyncRuntime",
+    "get_async_runtime",
+    "run_sync",
 ]
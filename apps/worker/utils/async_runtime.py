@@ -0,0 +1,179 @@
+"""
+Async Runtime - 워커 프로세스당 1개의 영구 이벤트 루프
+
+RQ Job 함수는 동기 환경이라 기존에는 단계마다 asyncio.run()을 호출했습니다.
+asyncio.run()은 매번 새 루프를 만들고 닫기 때문에 AsyncOpenAI/AsyncAnthropic이
+보유한 HTTP keep-alive 커넥션 풀이 버려지고, 이력서 1건당 TLS 핸드셰이크가
+여러 번 발생합니다.
+
+AsyncRuntime은 데몬 스레드에서 하나의 이벤트 루프를 계속 실행하고,
+동기 코드에서 run_sync(coro)로 코루틴을 제출합니다.
+- 같은 프로세스 내 모든 단계/작업이 같은 루프 → 커넥션 풀 재사용
+- fork 감지: RQ work-horse 등 자식 프로세스에서는 루프를 새로 생성
+- 타임아웃/인터럽트(RQ JobTimeoutException 포함) 시 코루틴 취소
+
+Usage:
+    from utils.async_runtime import run_sync
+
+    result = run_sync(analyst.analyze(resume_text=text))
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+class AsyncRuntime:
+    """
+    프로세스 단위 영구 이벤트 루프
+
+    루프는 첫 사용 시 생성되며, 프로세스 종료 시(atexit) 정리됩니다.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._atexit_registered = False
+
+    @property
+    def is_running(self) -> bool:
+        """현재 프로세스에서 루프가 실행 중인지 여부"""
+        return (
+            self._loop is not None
+            and self._pid == os.getpid()
+            and self._thread is not None
+            and self._thread.is_alive()
+        )
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """영구 이벤트 루프 반환 (없거나 fork 이후면 새로 생성)"""
+        if self.is_running:
+            return self._loop
+
+        with self._lock:
+            if self.is_running:
+                return self._loop
+
+            if self._loop is not None and self._pid != os.getpid():
+                # fork된 자식 프로세스: 부모의 루프 스레드는 복제되지 않음
+                logger.debug("[AsyncRuntime] Fork detected - creating new event loop")
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run_loop():
+                asyncio.set_event_loop(loop)
+                ready.set()
+                loop.run_forever()
+
+            thread = threading.Thread(target=_run_loop, name="rai-async-runtime", daemon=True)
+            thread.start()
+            ready.wait()
+
+            self._loop = loop
+            self._thread = thread
+            self._pid = os.getpid()
+
+            if not self._atexit_registered:
+                atexit.register(self.shutdown)
+                self._atexit_registered = True
+
+            logger.info(f"[AsyncRuntime] Persistent event loop started (pid={self._pid})")
+            return loop
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        코루틴을 영구 루프에서 실행하고 결과를 동기적으로 반환
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Raises:
+            TimeoutError: timeout 초과 시 (코루틴은 취소됨)
+            RuntimeError: 루프 스레드 내부에서 호출한 경우 (데드락 방지)
+        """
+        loop = self.get_loop()
+
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("run_sync() cannot be called from the runtime event loop thread")
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Coroutine did not complete within {timeout}s")
+        except BaseException:
+            # RQ JobTimeoutException / KeyboardInterrupt 등: 백그라운드 코루틴도 취소
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """남은 태스크를 취소하고 루프 종료"""
+        with self._lock:
+            if not self.is_running:
+                return
+
+            loop = self._loop
+
+            async def _cancel_pending():
+                tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await loop.shutdown_asyncgens()
+
+            try:
+                asyncio.run_coroutine_threadsafe(_cancel_pending(), loop).result(timeout)
+            except Exception as e:
+                logger.warning(f"[AsyncRuntime] Error while cancelling pending tasks: {e}")
+
+            loop.call_soon_threadsafe(loop.stop)
+            self._thread.join(timeout)
+            loop.close()
+
+            self._loop = None
+            self._thread = None
+            self._pid = None
+            logger.info("[AsyncRuntime] Event loop stopped")
+
+
+# 싱글톤 인스턴스
+_async_runtime: Optional[AsyncRuntime] = None
+
+
+def get_async_runtime() -> AsyncRuntime:
+    """AsyncRuntime 싱글톤 인스턴스 반환"""
+    global _async_runtime
+    if _async_runtime is None:
+        _async_runtime = AsyncRuntime()
+    return _async_runtime
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """
+    동기 코드(RQ Job 등)에서 코루틴 실행
+
+    USE_PERSISTENT_EVENT_LOOP가 꺼져 있으면 기존처럼 asyncio.run()을 사용합니다.
+    """
+    if not settings.USE_PERSISTENT_EVENT_LOOP:
+        if timeout is not None:
+            return asyncio.run(asyncio.wait_for(coro, timeout))
+        return asyncio.run(coro)
+
+    return get_async_runtime().run(coro, timeout)
@@ -8,12 +8,13 @@ HWP 파일 파서 - Fallback 전략 포함
 
 import io
 import os
+import re
 import tempfile
 import zipfile
 import struct
 import zlib
 import logging
-from typing import Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 from enum import Enum
 from dataclasses import dataclass
 
@@ -34,6 +35,11 @@ try:
 except ImportError:
     pdfplumber = None
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -189,17 +195,20 @@ class HWPParser:
         ole = olefile.OleFileIO(io.BytesIO(file_bytes))
 
         try:
+            compressed = self._is_body_compressed(ole)
+
             if ole.exists('BodyText'):
-                body_streams = [
-                    entry for entry in ole.listdir()
-                    if entry[0] == 'BodyText'
-                ]
+                # Section0, Section1, ..., Section10 순서 (문자열 정렬 시 Section10이 Section2 앞에 옴)
+                body_streams = sorted(
+                    (entry for entry in ole.listdir() if entry[0] == 'BodyText'),
+                    key=_section_sort_key,
+                )
 
                 for stream_path in body_streams:
                     stream_name = '/'.join(stream_path)
                     try:
                         data = ole.openstream(stream_name).read()
-                        text = self._decompress_hwp_body(data)
+                        text = self._decompress_hwp_body(data, compressed)
                         if text:
                             texts.append(text)
                     except Exception as e:
@@ -216,58 +225,38 @@ class HWPParser:
 
         return '\n'.join(texts), page_count
 
-    def _decompress_hwp_body(self, data: bytes) -> str:
-        """HWP 본문 압축 해제 및 텍스트 추출"""
+    @staticmethod
+    def _is_body_compressed(ole) -> Optional[bool]:
+        """FileHeader 속성 비트 0 (본문 압축 여부), 읽을 수 없으면 None"""
         try:
-            # zlib 압축 해제 시도
-            decompressed = zlib.decompress(data, -15)
-        except zlib.error:
-            # 압축되지 않은 데이터
-            decompressed = data
-
-        # 유니코드 텍스트 추출
-        text_parts = []
-        i = 0
+            if not ole.exists('FileHeader'):
+                return None
+            header = ole.openstream('FileHeader').read()
+            if len(header) < 40:
+                return None
+            return bool(struct.unpack_from('<I', header, 36)[0] & 0x1)
+        except Exception:
+            return None
+
+    def _decompress_hwp_body(self, data: bytes, compressed: Optional[bool] = None) -> str:
+        """
+        HWP 본문(BodyText/SectionN) 압축 해제 및 텍스트 추출
 
-        while i < len(decompressed) - 1:
-            # HWP는 UTF-16LE로 텍스트 저장
+        Args:
+            data: 섹션 스트림 바이트
+            compressed: FileHeader 압축 플래그 (None이면 압축 해제를 시도해보고 판단)
+        """
+        if compressed is False:
+            decompressed = data
+        else:
             try:
-                char_code = struct.unpack('<H', decompressed[i:i+2])[0]
-
-                # 제어 문자 건너뛰기
-                if char_code < 32 and char_code not in [9, 10, 13]:  # 탭, 개행 허용
-                    i += 2
-                    continue
-
-                # 특수 제어 코드 처리
-                if char_code == 0:
-                    i += 2
-                    continue
-                elif char_code == 1:  # 필드 시작
-                    i += 2
-                    continue
-                elif char_code == 2:  # 섹션 정의
-                    i += 2
-                    continue
-                elif char_code == 10 or char_code == 13:  # 개행
-                    text_parts.append('\n')
-                    i += 2
-                    continue
-                elif char_code == 9:  # 탭
-                    text_parts.append('\t')
-                    i += 2
-                    continue
-                elif 32 <= char_code < 0xD800 or 0xE000 <= char_code < 0xFFFF:
-                    # 일반 유니코드 문자
-                    text_parts.append(chr(char_code))
-                    i += 2
-                else:
-                    i += 2
+                # zlib 압축 해제 시도 (raw deflate)
+                decompressed = zlib.decompress(data, -15)
+            except zlib.error:
+                # 압축되지 않은 데이터
+                decompressed = data
 
-            except struct.error:
-                i += 1
-
-        return ''.join(text_parts)
+        return extract_para_text(decompressed)
 
     def _parse_via_libreoffice(self, file_bytes: bytes, filename: str) -> Tuple[str, int]:
         """
@@ -487,3 +476,157 @@ class HWPParser:
             ParseMethod.HANCOM_API: "한컴 API",
             ParseMethod.FAILED: "파싱 실패"
         }.get(method, "알 수 없음")
+
+
+# ─────────────────────────────────────────────────
+# HWP 5.0 레코드 구조 (BodyText/SectionN)
+# ─────────────────────────────────────────────────
+# 레코드 헤더 (32bit LE): TagID 10bit | Level 10bit | Size 12bit
+# Size == 0xFFF 이면 뒤따르는 4바이트가 실제 크기
+HWPTAG_BEGIN = 0x010
+HWPTAG_PARA_TEXT = HWPTAG_BEGIN + 51
+
+# PARA_TEXT 안의 제어 문자 (WCHAR < 32)
+# - 문자 컨트롤: 1 WCHAR
+# - 인라인/확장 컨트롤: 코드 + 부가 정보 = 8 WCHAR (16바이트)
+_EXTENDED_CONTROL_CODES = frozenset({1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23})
+_CONTROL_EXTENT_WCHARS = 8
+_CONTROL_REPLACEMENTS = {
+    9: '\t',    # 탭 (인라인 컨트롤)
+    10: '\n',   # 줄 바꿈
+    13: '\n',   # 문단 끝
+    24: '-',    # 하이픈
+    30: ' ',    # 묶음 빈칸
+    31: ' ',    # 고정폭 빈칸
+}
+
+
+def _section_sort_key(entry) -> Tuple[int, str]:
+    name = entry[-1]
+    digits = name[len('Section'):] if name.startswith('Section') else ''
+    return (int(digits) if digits.isdigit() else 1 << 30, name)
+
+
+def iter_hwp_records(data: bytes) -> Iterator[Tuple[int, int, int]]:
+    """
+    HWP 레코드 순회
+
+    Yields:
+        (tag_id, payload_offset, payload_size)
+        잘린 마지막 레코드는 남은 바이트만큼만 반환합니다.
+    """
+    offset = 0
+    end = len(data)
+    unpack_from = struct.unpack_from
+
+    while offset + 4 <= end:
+        header = unpack_from('<I', data, offset)[0]
+        offset += 4
+        tag_id = header & 0x3FF
+        size = (header >> 20) & 0xFFF
+
+        if size == 0xFFF:
+            if offset + 4 > end:
+                return
+            size = unpack_from('<I', data, offset)[0]
+            offset += 4
+
+        yield tag_id, offset, min(size, end - offset)
+        offset += size
+
+
+def _find_control_positions(payload: bytes) -> List[int]:
+    """payload에서 WCHAR 값이 32 미만인 위치(WCHAR 인덱스) 목록"""
+    count = len(payload) // 2
+    if np is not None:
+        wchars = np.frombuffer(payload, dtype='<u2', count=count)
+        return np.flatnonzero(wchars < 32).tolist()
+
+    # NumPy 없음: 짝수 오프셋의 (<0x20, 0x00) 바이트쌍 검색 (겹치는 매치 포함)
+    return [
+        m.start() // 2
+        for m in _CONTROL_BYTES_PATTERN.finditer(payload, 0, count * 2)
+        if m.start() % 2 == 0
+    ]
+
+
+_CONTROL_BYTES_PATTERN = re.compile(rb'(?=[\x00-\x1f]\x00)')
+
+
+def _decode_wchar_buffer(buf: bytes, record_ends: List[int]) -> str:
+    """
+    연결된 PARA_TEXT 페이로드 버퍼 디코딩
+
+    제어 문자 위치는 버퍼 전체에서 한 번에 찾고, 제어 문자 사이의 일반 텍스트는
+    구간 단위로 UTF-16LE 디코딩합니다. 인라인/확장 컨트롤(표, 그림, 필드 등)은
+    8 WCHAR 전체를 건너뛰되 레코드 경계를 넘지 않습니다.
+
+    Args:
+        buf: PARA_TEXT 페이로드를 이어 붙인 바이트 (각 페이로드는 짝수 길이)
+        record_ends: 각 레코드 끝 위치 (WCHAR 인덱스, 누적)
+    """
+    controls = _find_control_positions(buf)
+    total = len(buf) // 2
+    if not controls:
+        return buf.decode('utf-16-le', errors='ignore')
+
+    parts = []
+    cursor = 0  # 다음 텍스트 구간 시작 (WCHAR 인덱스)
+    record_index = 0
+    record_end = record_ends[0]
+
+    for pos in controls:
+        while pos >= record_end:
+            record_index += 1
+            record_end = record_ends[record_index]
+
+        if pos < cursor:
+            # 앞선 확장 컨트롤의 부가 정보 영역 안 → 무시
+            continue
+
+        if pos > cursor:
+            parts.append(buf[cursor * 2:pos * 2].decode('utf-16-le', errors='ignore'))
+
+        code = buf[pos * 2]
+        replacement = _CONTROL_REPLACEMENTS.get(code)
+        if replacement:
+            parts.append(replacement)
+
+        if code in _EXTENDED_CONTROL_CODES:
+            cursor = min(pos + _CONTROL_EXTENT_WCHARS, record_end)
+        else:
+            cursor = pos + 1
+
+    if cursor < total:
+        parts.append(buf[cursor * 2:].decode('utf-16-le', errors='ignore'))
+
+    return ''.join(parts)
+
+
+def decode_para_text(payload: bytes) -> str:
+    """HWPTAG_PARA_TEXT 페이로드 1개 → 텍스트"""
+    payload = payload[:len(payload) & ~1]
+    if not payload:
+        return ''
+    return _decode_wchar_buffer(payload, [len(payload) // 2])
+
+
+def extract_para_text(data: bytes) -> str:
+    """
+    압축 해제된 섹션 스트림에서 HWPTAG_PARA_TEXT 레코드만 디코딩
+
+    레코드마다 디코딩하지 않고 PARA_TEXT 페이로드를 모아 한 번에 처리합니다.
+    """
+    payloads = []
+    record_ends = []
+    total = 0
+    for tag_id, offset, size in iter_hwp_records(data):
+        size &= ~1  # WCHAR 정렬 유지
+        if tag_id == HWPTAG_PARA_TEXT and size:
+            payloads.append(data[offset:offset + size])
+            total += size // 2
+            record_ends.append(total)
+
+    if not payloads:
+        return ''
+    return _decode_wchar_buffer(b''.join(payloads), record_ends)
@@ -0,0 +1,456 @@
+"""
+LibreOffice 상주 인스턴스 풀
+
+변환마다 soffice를 새로 띄우면 프로필 초기화 + UNO 기동에 수 초가 걸립니다.
+headless soffice를 로컬 소켓(UNO urp)으로 띄워 두고 변환 요청을 재사용합니다.
+
+- 인스턴스별 전용 프로필 디렉토리 / 포트 (동시 실행 시 프로필 잠금 충돌 방지)
+- 헬스 체크: 유휴 인스턴스를 주기적으로 확인하고 죽었으면 재기동
+- N회 변환 후 재기동 (LibreOffice 메모리 누수 대응)
+- 변환 타임아웃 시 인스턴스 강제 종료 후 재기동
+- 대기열 상한 + 대기 타임아웃 (backpressure)
+
+상주 인스턴스는 장수 프로세스에서만 사용합니다 (enable_libreoffice_pool 호출:
+FastAPI, async 워커, SimpleWorker(WORKER_REUSE_PROCESS)). 기본 RQ Worker는 Job마다
+work-horse를 fork하고 os._exit로 끝내므로 종료 처리가 실행되지 않아 soffice 프로세스와
+프로필 디렉토리가 남고, 다음 Job에서 재사용도 되지 않기 때문입니다.
+
+pyuno를 import할 수 없거나 인스턴스를 띄울 수 없으면 호출 측
+(run_libreoffice_convert)이 기존 cold-start 변환으로 폴백합니다.
+"""
+
+import os
+import sys
+import time
+import queue
+import shutil
+import socket
+import logging
+import tempfile
+import threading
+import subprocess
+from multiprocessing import util as mp_util
+from pathlib import Path
+from typing import List, Optional
+
+from config import get_settings
+from .subprocess_utils import SubprocessResult, _find_soffice, _kill_process_tree
+
+logger = logging.getLogger(__name__)
+
+
+try:
+    import uno
+except ImportError:
+    uno = None
+
+# 상주 풀 허용 표시 (환경 변수라 spawn된 파싱 프로세스 풀 워커에도 상속됨)
+POOL_PROCESS_ENV = "RAI_LIBREOFFICE_POOL_PROCESS"
+
+# 출력 형식 → 문서 종류별 export 필터
+_EXPORT_FILTERS = {
+    "pdf": {
+        "writer": "writer_pdf_Export",
+        "calc": "calc_pdf_Export",
+        "impress": "impress_pdf_Export",
+    },
+    "docx": {
+        "writer": "MS Word 2007 XML",
+    },
+}
+
+
+class PoolUnavailableError(RuntimeError):
+    """풀 인스턴스를 사용할 수 없음 (호출 측에서 cold-start 폴백)"""
+
+
+def _find_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _props(**kwargs) -> tuple:
+    """UNO PropertyValue 튜플 생성"""
+    values = []
+    for name, value in kwargs.items():
+        prop = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+        prop.Name = name
+        prop.Value = value
+        values.append(prop)
+    return tuple(values)
+
+
+def _document_kind(document) -> str:
+    if document.supportsService("com.sun.star.sheet.SpreadsheetDocument"):
+        return "calc"
+    if document.supportsService("com.sun.star.presentation.PresentationDocument"):
+        return "impress"
+    return "writer"
+
+
+class LibreOfficeInstance:
+    """소켓으로 변환 요청을 받는 상주 headless soffice 1개"""
+
+    def __init__(self, soffice_cmd: str, index: int, startup_timeout: float):
+        self.soffice_cmd = soffice_cmd
+        self.index = index
+        self.startup_timeout = startup_timeout
+        self.port: Optional[int] = None
+        self.profile_dir: Optional[str] = None
+        self.process: Optional[subprocess.Popen] = None
+        self.desktop = None
+        self.conversions = 0
+        self.killed = False
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.poll() is None and self.desktop is not None
+
+    def start(self):
+        """soffice 기동 후 UNO 연결이 될 때까지 대기"""
+        self.stop()
+        self.port = _find_free_port()
+        self.profile_dir = tempfile.mkdtemp(prefix=f"rai-soffice-{os.getpid()}-{self.index}-")
+        self.conversions = 0
+        self.killed = False
+
+        cmd = [
+            self.soffice_cmd,
+            '--headless',
+            '--invisible',
+            '--nologo',
+            '--nodefault',
+            '--norestore',
+            '--nocrashreport',
+            '--nofirststartwizard',
+            f'-env:UserInstallation={Path(self.profile_dir).as_uri()}',
+            f'--accept=socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext',
+        ]
+        self.process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=sys.platform != 'win32',
+        )
+
+        deadline = time.monotonic() + self.startup_timeout
+        last_error = None
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                last_error = f"soffice exited with code {self.process.returncode}"
+                break
+            try:
+                self.desktop = self._connect()
+                logger.info(
+                    f"[LibreOfficePool] Instance {self.index} started "
+                    f"(pid={self.process.pid}, port={self.port})"
+                )
+                return
+            except Exception as e:
+                last_error = str(e)
+                time.sleep(0.25)
+
+        self.stop()
+        raise PoolUnavailableError(f"soffice instance {self.index} failed to start: {last_error}")
+
+    def _connect(self):
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        context = resolver.resolve(
+            f"uno:socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext"
+        )
+        return context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+
+    def is_healthy(self) -> bool:
+        """프로세스 생존 + UNO 호출 응답 확인"""
+        if not self.is_running():
+            return False
+        try:
+            self.desktop.getComponents()
+            return True
+        except Exception:
+            return False
+
+    def convert(self, input_path: str, output_path: str, output_format: str):
+        """문서를 열어 output_format으로 저장 (실패 시 예외)"""
+        document = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(input_path)),
+            "_blank",
+            0,
+            _props(Hidden=True, ReadOnly=True),
+        )
+        if document is None:
+            raise RuntimeError("LibreOffice could not open the document")
+
+        try:
+            filters = _EXPORT_FILTERS[output_format]
+            kind = _document_kind(document)
+            if kind not in filters:
+                raise RuntimeError(f"Cannot export {kind} document to {output_format}")
+            document.storeToURL(
+                uno.systemPathToFileUrl(os.path.abspath(output_path)),
+                _props(FilterName=filters[kind], Overwrite=True),
+            )
+        finally:
+            try:
+                document.close(True)
+            except Exception:
+                pass
+            self.conversions += 1
+
+    def kill(self):
+        """변환 타임아웃 watchdog용 강제 종료 (진행 중인 UNO 호출은 예외로 끝남)"""
+        self.killed = True
+        if self.process is not None:
+            _kill_process_tree(self.process)
+
+    def stop(self):
+        if self.process is not None:
+            _kill_process_tree(self.process)
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+        self.process = None
+        self.desktop = None
+        self.profile_dir = None
+
+
+class LibreOfficePool:
+    """
+    상주 LibreOffice 인스턴스 풀 (프로세스당 1개)
+
+    인스턴스는 처음 사용할 때 기동되며, 이후 반납/헬스 체크 시
+    죽었거나 변환 횟수가 recycle_after에 도달한 인스턴스를 재기동합니다.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        recycle_after: int = 200,
+        max_queue: int = 8,
+        queue_timeout: float = 60.0,
+        startup_timeout: float = 30.0,
+        health_interval: float = 30.0,
+        soffice_cmd: Optional[str] = None,
+    ):
+        self.size = max(1, size)
+        self.recycle_after = recycle_after
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.startup_timeout = startup_timeout
+        self.health_interval = health_interval
+        self.soffice_cmd = soffice_cmd or _find_soffice()
+
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._closed = False
+        self._stop_event = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+
+        self._instances: List[LibreOfficeInstance] = [self._create_instance(i) for i in range(self.size)]
+        self._idle: "queue.Queue[LibreOfficeInstance]" = queue.Queue()
+        for instance in self._instances:
+            self._idle.put(instance)
+
+        self.stats = {"conversions": 0, "restarts": 0, "timeouts": 0, "rejected": 0}
+
+        # 프로세스 종료 시 soffice 정리 (spawn 워커는 atexit 대신 multiprocessing finalizer 실행)
+        mp_util.Finalize(self, self.shutdown, exitpriority=10)
+
+    def _create_instance(self, index: int) -> LibreOfficeInstance:
+        return LibreOfficeInstance(self.soffice_cmd, index, self.startup_timeout)
+
+    @property
+    def available(self) -> bool:
+        return uno is not None and bool(self.soffice_cmd) and not self._closed
+
+    def supports(self, output_format: str) -> bool:
+        return output_format in _EXPORT_FILTERS
+
+    # ─────────────────────────────────────────────────
+    # 인스턴스 관리
+    # ─────────────────────────────────────────────────
+
+    def _restart(self, instance: LibreOfficeInstance):
+        if instance.process is not None:
+            self.stats["restarts"] += 1
+        instance.start()
+
+    def _release(self, instance: LibreOfficeInstance):
+        """반납: 죽었거나 재활용 시점이면 정리 (재기동은 다음 획득 시)"""
+        if instance.killed or not instance.is_running():
+            instance.stop()
+        elif self.recycle_after and instance.conversions >= self.recycle_after:
+            logger.info(
+                f"[LibreOfficePool] Recycling instance {instance.index} "
+                f"after {instance.conversions} conversions"
+            )
+            instance.stop()
+        self._idle.put(instance)
+
+    def _ensure_health_thread(self):
+        if self.health_interval <= 0 or self._health_thread is not None:
+            return
+        with self._lock:
+            if self._health_thread is None:
+                self._health_thread = threading.Thread(
+                    target=self._health_loop, name="libreoffice-pool-health", daemon=True
+                )
+                self._health_thread.start()
+
+    def _health_loop(self):
+        while not self._stop_event.wait(self.health_interval):
+            self.check_health()
+
+    def check_health(self):
+        """유휴 인스턴스 헬스 체크: 응답 없는 인스턴스 재기동"""
+        for _ in range(self.size):
+            try:
+                instance = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                if instance.process is not None and not instance.is_healthy():
+                    logger.warning(f"[LibreOfficePool] Instance {instance.index} unhealthy, restarting")
+                    self._restart(instance)
+            except Exception as e:
+                logger.warning(f"[LibreOfficePool] Health restart failed: {e}")
+                instance.stop()
+            finally:
+                self._idle.put(instance)
+
+    # ─────────────────────────────────────────────────
+    # 변환
+    # ─────────────────────────────────────────────────
+
+    def convert(
+        self,
+        input_path: str,
+        output_dir: str,
+        output_format: str = "pdf",
+        timeout: float = 120,
+    ) -> SubprocessResult:
+        """
+        상주 인스턴스로 변환 (출력 파일명은 soffice --convert-to와 동일)
+
+        대기열이 가득 찼거나 queue_timeout 내에 인스턴스를 얻지 못하면 실패를 반환합니다.
+        인스턴스를 기동할 수 없으면 PoolUnavailableError를 던집니다.
+        """
+        with self._lock:
+            if self._waiting >= self.max_queue:
+                self.stats["rejected"] += 1
+                return _failure(f"LibreOffice pool queue full ({self._waiting} waiting)")
+            self._waiting += 1
+
+        try:
+            instance = self._idle.get(timeout=self.queue_timeout)
+        except queue.Empty:
+            self.stats["rejected"] += 1
+            return _failure(
+                f"No LibreOffice instance available within {self.queue_timeout}s",
+                timed_out=True,
+            )
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+        self._ensure_health_thread()
+        try:
+            if not instance.is_running():
+                self._restart(instance)
+
+            base_name = os.path.splitext(os.path.basename(input_path))[0]
+            output_path = os.path.join(output_dir, f"{base_name}.{output_format}")
+
+            watchdog = threading.Timer(timeout, instance.kill)
+            watchdog.daemon = True
+            watchdog.start()
+            try:
+                instance.convert(input_path, output_path, output_format)
+            except Exception as e:
+                if instance.killed:
+                    self.stats["timeouts"] += 1
+                    logger.warning(f"[LibreOfficePool] Conversion timed out after {timeout}s, instance killed")
+                    return _failure(f"Process timed out after {timeout} seconds", timed_out=True)
+                return _failure(f"LibreOffice conversion failed: {e}")
+            finally:
+                watchdog.cancel()
+
+            self.stats["conversions"] += 1
+            return SubprocessResult(
+                success=True, stdout="", stderr="", return_code=0, timed_out=False
+            )
+        finally:
+            self._release(instance)
+
+    def shutdown(self):
+        """모든 인스턴스 종료 (포크된 자식에서는 부모 인스턴스를 건드리지 않음)"""
+        if self._closed or os.getpid() != self._pid:
+            return
+        self._closed = True
+        self._stop_event.set()
+        for instance in self._instances:
+            instance.stop()
+
+
+def _failure(message: str, timed_out: bool = False) -> SubprocessResult:
+    return SubprocessResult(
+        success=False,
+        stdout="",
+        stderr="",
+        return_code=None,
+        timed_out=timed_out,
+        error_message=message,
+    )
+
+
+# 싱글톤 인스턴스 (프로세스별)
+_pool: Optional[LibreOfficePool] = None
+_pool_lock = threading.Lock()
+
+
+def enable_libreoffice_pool():
+    """
+    현재 프로세스(및 이후 spawn되는 자식)에서 상주 풀 사용 허용
+
+    Job이 끝나도 살아 있는 장수 프로세스의 진입점에서만 호출합니다
+    (FastAPI lifespan, async 워커, SimpleWorker). fork 모드 RQ Worker에서는 호출하지 않습니다.
+    """
+    os.environ[POOL_PROCESS_ENV] = "1"
+
+
+def shutdown_libreoffice_pool():
+    """현재 프로세스의 상주 인스턴스 종료 (장수 프로세스 종료 시)"""
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+
+
+def get_libreoffice_pool() -> Optional[LibreOfficePool]:
+    """
+    LibreOfficePool 싱글톤 반환
+
+    USE_LIBREOFFICE_POOL이 꺼져 있거나, enable_libreoffice_pool()로 허용되지 않은
+    프로세스(fork된 RQ work-horse 등)이거나, pyuno/soffice가 없으면 None.
+    fork된 자식 프로세스는 부모의 UNO 연결을 쓸 수 없으므로 새 풀을 만듭니다.
+    """
+    global _pool
+    settings = get_settings()
+    if not settings.USE_LIBREOFFICE_POOL or uno is None:
+        return None
+    if os.environ.get(POOL_PROCESS_ENV) != "1":
+        return None
+
+    with _pool_lock:
+        if _pool is None or _pool._pid != os.getpid():
+            _pool = LibreOfficePool(
+                size=settings.LIBREOFFICE_POOL_SIZE,
+                recycle_after=settings.LIBREOFFICE_RECYCLE_AFTER,
+                max_queue=settings.LIBREOFFICE_POOL_MAX_QUEUE,
+                queue_timeout=settings.LIBREOFFICE_QUEUE_TIMEOUT_SECONDS,
+                startup_timeout=settings.LIBREOFFICE_STARTUP_TIMEOUT_SECONDS,
+                health_interval=settings.LIBREOFFICE_HEALTH_CHECK_INTERVAL_SECONDS,
+            )
+    return _pool if _pool.available else None
@@ -4,22 +4,35 @@ PDF 파일 파서
 pdfplumber를 사용한 텍스트 추출 + OCR 지원:
 - 일반 PDF: pdfplumber로 텍스트 추출
 - 스캔 PDF: pytesseract OCR로 텍스트 추출
+
+OCR 단계:
+- OCR이 필요한 페이지만 한 페이지씩 래스터화 (사이 페이지는 변환하지 않음)
+- 페이지 크기 기반 적응형 DPI (페이지당 픽셀 수 상한)
+- 여러 페이지의 tesseract 프로세스를 병렬 실행
+- 동시에 메모리에 올라가는 페이지 이미지 총량 상한
 """
 
 import io
+import math
+import os
+import tempfile
+import threading
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from config import get_settings
+
 try:
     import pdfplumber
 except ImportError:
     pdfplumber = None
 
 try:
-    from pdf2image import convert_from_bytes
+    from pdf2image import convert_from_path
 except ImportError:
-    convert_from_bytes = None
+    convert_from_path = None
 
 try:
     import pytesseract
@@ -41,6 +54,32 @@ class PDFParseResult:
     error_message: Optional[str] = None
 
 
+class _MemoryBudget:
+    """
+    동시에 메모리에 올라가는 페이지 이미지 바이트 상한
+
+    단일 페이지가 상한보다 크더라도 다른 페이지가 없으면 진행합니다 (교착 방지).
+    """
+
+    def __init__(self, limit_bytes: int):
+        self.limit = limit_bytes
+        self.used = 0
+        self.peak = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, amount: int):
+        with self._cond:
+            while self.used > 0 and self.used + amount > self.limit:
+                self._cond.wait()
+            self.used += amount
+            self.peak = max(self.peak, self.used)
+
+    def release(self, amount: int):
+        with self._cond:
+            self.used -= amount
+            self._cond.notify_all()
+
+
 class PDFParser:
     """PDF 파일 파서 (pdfplumber + OCR)"""
 
@@ -50,9 +89,22 @@ class PDFParser:
     # OCR 언어 설정
     OCR_LANG = "kor+eng"
 
+    # OCR 래스터화: 그레이스케일 (픽셀당 1바이트)
+    OCR_BYTES_PER_PIXEL = 1
+
+    # PDF 포인트 단위 (1인치 = 72pt)
+    POINTS_PER_INCH = 72
+
     def __init__(self):
         self._check_dependencies()
 
+        settings = get_settings()
+        self.ocr_workers = settings.OCR_MAX_WORKERS or max(1, min(4, (os.cpu_count() or 2) // 2))
+        self.ocr_min_dpi = settings.OCR_MIN_DPI
+        self.ocr_max_dpi = settings.OCR_MAX_DPI
+        self.ocr_max_page_pixels = settings.OCR_MAX_PAGE_PIXELS
+        self.ocr_memory_limit = settings.OCR_MEMORY_LIMIT_MB * 1024 * 1024
+
     def _check_dependencies(self):
         """의존성 체크"""
         if pdfplumber is None:
@@ -79,9 +131,11 @@ class PDFParser:
                 page_count = len(pdf.pages)
                 texts = []
                 ocr_pages = []  # OCR이 필요한 페이지 인덱스
+                page_sizes = {}  # 페이지 인덱스 → (width, height) pt
 
                 # 1차: pdfplumber로 텍스트 추출
                 for i, page in enumerate(pdf.pages):
+                    page_sizes[i] = (page.width, page.height)
                     try:
                         text = page.extract_text() or ""
                         texts.append(text)
@@ -102,7 +156,7 @@ class PDFParser:
                     # 전체 텍스트가 예상보다 30% 미만이면 OCR 시도
                     logger.info(f"Attempting OCR for {len(ocr_pages)} pages with insufficient text")
 
-                    ocr_result = self._perform_ocr(file_bytes, ocr_pages)
+                    ocr_result = self._perform_ocr(file_bytes, ocr_pages, page_sizes)
 
                     if ocr_result:
                         # OCR 결과와 기존 텍스트 병합
@@ -157,55 +211,134 @@ class PDFParser:
                 error_message=f"PDF_PARSE_ERROR: {str(e)}"
             )
 
-    def _perform_ocr(self, file_bytes: bytes, page_indices: list[int]) -> dict[int, str]:
+    def _perform_ocr(
+        self,
+        file_bytes: bytes,
+        page_indices: List[int],
+        page_sizes: Optional[Dict[int, Tuple[float, float]]] = None,
+    ) -> Dict[int, str]:
         """
-        OCR 수행
+        OCR 수행 (페이지 단위 래스터화 + 병렬 tesseract)
+
+        각 페이지는 래스터화 → OCR → 이미지 해제 순으로 처리되며,
+        동시에 올라가는 이미지 총량은 ocr_memory_limit으로 제한됩니다.
+        pytesseract는 페이지마다 tesseract 프로세스를 실행하므로 스레드로 병렬화합니다.
 
         Args:
             file_bytes: PDF 바이트
             page_indices: OCR을 수행할 페이지 인덱스 목록
+            page_sizes: 페이지 인덱스별 (width, height) 포인트 (없으면 A4 가정)
 
         Returns:
             {페이지 인덱스: 추출된 텍스트} 딕셔너리
         """
-        if convert_from_bytes is None or pytesseract is None:
+        if convert_from_path is None or pytesseract is None:
             logger.warning("OCR dependencies not installed (pdf2image, pytesseract)")
             return {}
 
-        try:
-            # PDF를 이미지로 변환
-            images = convert_from_bytes(
-                file_bytes,
-                dpi=300,  # 고해상도
-                first_page=min(page_indices) + 1 if page_indices else 1,
-                last_page=max(page_indices) + 1 if page_indices else None
-            )
+        if not page_indices:
+            return {}
 
-            results = {}
-            offset = min(page_indices) if page_indices else 0
+        page_sizes = page_sizes or {}
+        budget = _MemoryBudget(self.ocr_memory_limit)
+        workers = min(self.ocr_workers, len(page_indices))
 
-            for i, page_idx in enumerate(page_indices):
-                if i < len(images):
-                    try:
-                        # OCR 수행
-                        text = pytesseract.image_to_string(
-                            images[i],
-                            lang=self.OCR_LANG,
-                            config='--psm 1'  # 자동 페이지 세그멘테이션
-                        )
-                        results[page_idx] = text
-                        logger.debug(f"OCR completed for page {page_idx + 1}: {len(text)} chars")
+        # tesseract 내부 OpenMP 스레드와 페이지 병렬 실행이 코어를 과점유하지 않도록 제한
+        if workers > 1:
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
 
-                    except Exception as e:
-                        logger.warning(f"OCR failed for page {page_idx + 1}: {e}")
-                        results[page_idx] = ""
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                # pdftoppm은 파일 경로를 받으므로 한 번만 저장 (페이지마다 bytes 복사 방지)
+                pdf_path = os.path.join(temp_dir, "document.pdf")
+                with open(pdf_path, 'wb') as f:
+                    f.write(file_bytes)
+
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr") as executor:
+                    futures = {
+                        page_idx: executor.submit(
+                            self._ocr_page,
+                            pdf_path,
+                            page_idx,
+                            page_sizes.get(page_idx),
+                            budget,
+                        )
+                        for page_idx in page_indices
+                    }
+                    results = {page_idx: future.result() for page_idx, future in futures.items()}
 
+            logger.info(
+                f"OCR completed for {len(page_indices)} pages "
+                f"(workers={workers}, peak_image_mb={budget.peak / 1024 / 1024:.1f})"
+            )
             return results
 
         except Exception as e:
             logger.error(f"OCR process failed: {e}")
             return {}
 
+    def _ocr_dpi(self, page_size: Optional[Tuple[float, float]]) -> int:
+        """
+        페이지 크기 기반 DPI
+
+        A4/Letter는 ocr_max_dpi, 큰 페이지는 픽셀 수가 ocr_max_page_pixels를 넘지 않도록 낮춤
+        """
+        if not page_size or page_size[0] <= 0 or page_size[1] <= 0:
+            return self.ocr_max_dpi
+
+        width_in = page_size[0] / self.POINTS_PER_INCH
+        height_in = page_size[1] / self.POINTS_PER_INCH
+        dpi = int(math.sqrt(self.ocr_max_page_pixels / (width_in * height_in)))
+        return max(self.ocr_min_dpi, min(self.ocr_max_dpi, dpi))
+
+    def _estimate_image_bytes(self, page_size: Optional[Tuple[float, float]], dpi: int) -> int:
+        width, height = page_size if page_size else (595, 842)  # A4
+        pixels = (width / self.POINTS_PER_INCH * dpi) * (height / self.POINTS_PER_INCH * dpi)
+        return int(pixels * self.OCR_BYTES_PER_PIXEL)
+
+    def _ocr_page(
+        self,
+        pdf_path: str,
+        page_idx: int,
+        page_size: Optional[Tuple[float, float]],
+        budget: _MemoryBudget,
+    ) -> str:
+        """단일 페이지 래스터화 + OCR (실패 시 빈 문자열)"""
+        dpi = self._ocr_dpi(page_size)
+        image_bytes = self._estimate_image_bytes(page_size, dpi)
+
+        budget.acquire(image_bytes)
+        try:
+            images = convert_from_path(
+                pdf_path,
+                dpi=dpi,
+                first_page=page_idx + 1,
+                last_page=page_idx + 1,
+                grayscale=True,
+            )
+            if not images:
+                return ""
+
+            image = images[0]
+            try:
+                text = pytesseract.image_to_string(
+                    image,
+                    lang=self.OCR_LANG,
+                    config='--psm 1'  # 자동 페이지 세그멘테이션
+                )
+            finally:
+                image.close()
+
+            logger.debug(f"OCR completed for page {page_idx + 1} ({dpi} dpi): {len(text)} chars")
+            return text
+
+        except Exception as e:
+            logger.warning(f"OCR failed for page {page_idx + 1}: {e}")
+            return ""
+
+        finally:
+            budget.release(image_bytes)
+
     def is_encrypted(self, file_bytes: bytes) -> bool:
         """PDF 암호화 여부 체크"""
         if pdfplumber is None:
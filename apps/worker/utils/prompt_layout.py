@@ -0,0 +1,62 @@
+"""
+Prompt Layout - 프롬프트 캐싱을 위한 정적 프리픽스 우선 메시지 조립
+
+프로바이더 프롬프트 캐시는 요청 앞부분이 바이트 단위로 같을 때만 적중합니다.
+- OpenAI: 1024 토큰 이상 동일 프리픽스 자동 캐싱 (prompt_cache_key로 라우팅 고정)
+- Anthropic: system 블록에 cache_control 지정
+- Gemini: system_instruction을 cached content로 생성 후 재사용
+
+규칙:
+1. 정적 콘텐츠(지침, 스키마, few-shot 예시, 응답 형식)는 선두 system 메시지에만 둡니다.
+   문서별 값(파일명, 이력서 텍스트, 검증 대상 값)이나 날짜를 섞지 않습니다.
+2. 문서별 콘텐츠는 그 뒤 user 메시지에 둡니다.
+3. 정적 파트는 양끝 공백을 정리한 뒤 고정 구분자로 이어 붙여 바이트 고정을 보장합니다.
+
+LLMManager는 선두 system 메시지(들)를 캐시 가능한 프리픽스로 취급합니다.
+"""
+
+import hashlib
+from typing import Dict, List, Sequence, Tuple
+
+PART_SEPARATOR = "\n\n"
+
+
+def build_static_prefix(static_parts: Sequence[str]) -> str:
+    """정적 파트를 바이트 고정 프리픽스로 결합 (빈 파트 제외)"""
+    return PART_SEPARATOR.join(part.strip() for part in static_parts if part and part.strip())
+
+
+def build_cacheable_messages(static_parts: Sequence[str], dynamic: str) -> List[Dict[str, str]]:
+    """
+    정적 프리픽스(system) + 문서별 콘텐츠(user) 메시지 생성
+
+    Args:
+        static_parts: 문서와 무관한 지침/스키마/예시/응답 형식
+        dynamic: 문서별 콘텐츠
+
+    Returns:
+        [{"role": "system", ...}, {"role": "user", ...}]
+    """
+    return [
+        {"role": "system", "content": build_static_prefix(static_parts)},
+        {"role": "user", "content": dynamic},
+    ]
+
+
+def split_static_prefix(messages: List[Dict[str, str]]) -> Tuple[str, List[Dict[str, str]]]:
+    """
+    선두 system 메시지(캐시 가능 프리픽스)와 나머지 메시지 분리
+
+    Returns:
+        (정적 프리픽스, 나머지 메시지)
+    """
+    index = 0
+    while index < len(messages) and messages[index].get("role") == "system":
+        index += 1
+    static_prefix = PART_SEPARATOR.join(str(m.get("content", "")) for m in messages[:index])
+    return static_prefix, list(messages[index:])
+
+
+def prefix_cache_key(static_prefix: str) -> str:
+    """정적 프리픽스 식별 키 (OpenAI prompt_cache_key / Gemini 캐시 조회용)"""
+    return hashlib.sha256(static_prefix.encode("utf-8")).hexdigest()[:32]
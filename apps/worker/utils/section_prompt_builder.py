@@ -0,0 +1,352 @@
+"""
+Section Prompt Builder - SemanticIR 기반 LLM 입력 텍스트 구성
+
+AnalystAgent가 원문 전체를 프롬프트에 넣으면 긴 이력서(경력기술서 + 자기소개서 +
+페이지마다 반복되는 머리글/바닥글 + 개인정보 동의문)에서 추출에 쓰이지 않는 텍스트가
+프롬프트 토큰의 상당 부분을 차지합니다.
+
+처리 순서 (원문 순서 유지):
+1. 보일러플레이트 제거
+   - 페이지 번호 줄
+   - 페이지 경계(페이지 첫/끝 줄, 페이지 번호 줄 주변)에서 3회 이상 반복되는 머리글/바닥글
+     (첫 등장만 유지, 날짜 줄은 제외). 본문 중간의 반복 줄(직함 등)은 대상 아님,
+     career/projects 섹션에서는 페이지 번호 바로 옆 줄만 대상
+   - 개인정보 수집·이용 동의 문단, "위 기재 사항은 사실과 틀림없음" 서약 문구
+2. 섹션 중복 제거: 공백 정규화 후 앞선 섹션과 같거나 포함되는 섹션 제외
+   (PDF 텍스트 레이어 중복, 요약/상세 이중 기재)
+3. 라벨별 토큰 예산 (LABEL_TOKEN_BUDGETS): 같은 라벨 섹션 합계가 예산을 넘으면
+   나머지 줄은 생략하되 기간(날짜) 줄은 유지 → 경력 연수 계산용 타임라인 보존.
+   자기소개서/지원동기는 summary로 분류되어 작은 예산이 적용됩니다.
+   profile(헤더 이전 텍스트 포함)은 자르지 않습니다 (name/phone/email 보호).
+
+헤더가 감지되지 않은 문서는 1단계만 적용합니다.
+"""
+
+import re
+import logging
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from schemas.canonical_labels import CanonicalLabel
+from utils.section_separator import SemanticIR, get_section_separator
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+# 프롬프트 구성 규칙 버전 (분석 캐시 키에 포함)
+PROMPT_BUILDER_VERSION = "section-v2"
+
+# 라벨별 토큰 예산 (None / 미등록 라벨: 제한 없음, profile은 항상 제한 없음)
+LABEL_TOKEN_BUDGETS: Dict[str, Optional[int]] = {
+    CanonicalLabel.PROFILE: None,
+    CanonicalLabel.CAREER: 8000,
+    CanonicalLabel.PROJECTS: 4000,
+    CanonicalLabel.EDUCATION: 800,
+    CanonicalLabel.SKILLS: 800,
+    CanonicalLabel.SUMMARY: 800,
+    CanonicalLabel.STRENGTHS: 500,
+    CanonicalLabel.CERTIFICATIONS: 500,
+    CanonicalLabel.AWARDS: 400,
+    CanonicalLabel.LANGUAGES: 300,
+}
+
+# 섹션 경계로 인정할 헤더 최대 길이
+HEADER_MAX_CHARS = 20
+# 반복 머리글/바닥글 판정
+REPEAT_MIN_COUNT = 3
+REPEAT_MIN_LETTERS = 4
+# 페이지 경계로부터의 거리 (비어 있지 않은 줄 수, 1 = 문서 첫/끝 줄 또는 페이지 번호 바로 옆)
+PAGE_EDGE_LINES = 2
+# 경력/프로젝트 본문은 반복 직함·회사명이 흔하므로 페이지 번호 바로 옆 줄만 허용
+BODY_PAGE_EDGE_LINES = 1
+BODY_LABELS = {CanonicalLabel.CAREER, CanonicalLabel.PROJECTS}
+# 서약/동의 문구 줄 최대 길이 (긴 자기소개 문장 속 "동의합니다"는 유지)
+CERTIFY_MAX_CHARS = 120
+# 중복 섹션 판정 최소 길이 (짧은 섹션은 우연히 겹칠 수 있음)
+DEDUPE_MIN_CHARS = 40
+
+OMITTED_MARKER = "(…중략…)"
+
+_PAGE_NUMBER = re.compile(
+    r'^(?:[-–—\s]*\d{1,3}\s*(?:/\s*\d{1,3})?[-–—\s]*|(?:page|p\.)\s*\d{1,3}(?:\s*(?:/|of)\s*\d{1,3})?|\d{1,3}\s*페이지)$',
+    re.IGNORECASE,
+)
+_DATE = re.compile(r'(?:19|20)\d{2}\s*[.\-/년]')
+_CONSENT_TITLE = re.compile(
+    r'개인\s*정보.{0,15}(?:수집|이용|제공|활용).{0,15}동의|privacy\s+(?:policy|consent)'
+    r'|consent\s+to\s+(?:the\s+)?(?:collection|use)',
+    re.IGNORECASE,
+)
+_CERTIFY_LINE = re.compile(
+    r'(?:위|상기)\s*(?:의\s*)?(?:기재|기록|내용|사항).{0,20}(?:사실|틀림|다름)'
+    r'|I\s+hereby\s+(?:certify|declare)|동의합니다|동의함',
+    re.IGNORECASE,
+)
+_TRAILING_PAGE_NUMBER = re.compile(
+    r'(?:\s*[-–—|]\s*\d{1,3}\s*[-–—]?|\s+\d{1,3}\s*/\s*\d{1,3}|\s*(?:page|p\.)\s*\d{1,3}(?:\s*(?:/|of)\s*\d{1,3})?)$',
+    re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r'\s+')
+_BLANK_LINES = re.compile(r'\n\s*\n(?:\s*\n)+')
+
+
+@dataclass
+class SectionPrompt:
+    """LLM 입력용으로 정리된 이력서 텍스트"""
+    text: str
+    original_tokens: int
+    prompt_tokens: int
+    dropped_lines: int = 0
+    duplicate_sections: int = 0
+    truncated_labels: List[str] = field(default_factory=list)
+
+    @property
+    def reduction(self) -> float:
+        if not self.original_tokens:
+            return 0.0
+        return 1 - self.prompt_tokens / self.original_tokens
+
+
+def _estimate_tokens(text: str) -> int:
+    """tiktoken 없을 때: 한글/영문 혼합 추정 (EmbeddingService와 동일)"""
+    korean_chars = sum(1 for c in text if '가' <= c <= '힣')
+    return int(korean_chars * 2.5 + (len(text) - korean_chars) / 4)
+
+
+class SectionPromptBuilder:
+    """
+    SemanticIR → LLM 입력 텍스트
+
+    Args:
+        count_tokens: 토큰 수 계산 함수 (기본: tiktoken cl100k_base, 없으면 추정)
+        budgets: 라벨별 토큰 예산 (기본: LABEL_TOKEN_BUDGETS)
+    """
+
+    def __init__(
+        self,
+        count_tokens: Optional[Callable[[str], int]] = None,
+        budgets: Optional[Dict[str, Optional[int]]] = None,
+    ):
+        self._count_tokens = count_tokens or self._default_counter()
+        self.budgets = LABEL_TOKEN_BUDGETS if budgets is None else budgets
+        self.separator = get_section_separator()
+
+    @staticmethod
+    def _default_counter() -> Callable[[str], int]:
+        if TIKTOKEN_AVAILABLE:
+            try:
+                encoding = tiktoken.get_encoding("cl100k_base")
+                return lambda text: len(encoding.encode(text))
+            except Exception as e:
+                logger.warning(f"[SectionPromptBuilder] tiktoken 인코더 초기화 실패, 추정 모드 사용: {e}")
+        return _estimate_tokens
+
+    def build(self, text: str, ir: Optional[SemanticIR] = None) -> SectionPrompt:
+        """원문 + SemanticIR → 정리된 텍스트"""
+        if not text or not text.strip():
+            return SectionPrompt(text=text or "", original_tokens=0, prompt_tokens=0)
+
+        ir = ir if ir is not None else self.separator.separate(text)
+        sections = self._sections(text, ir)
+        has_headers = sections[0][0] != CanonicalLabel.UNKNOWN
+
+        edges = self._page_edge_distances(text.split('\n'))
+        repeated = self._repeated_lines(text, edges)
+        seen_repeated: Set[str] = set()
+        seen_bodies: List[str] = []
+        used_tokens: Counter = Counter()
+
+        result = SectionPrompt(text="", original_tokens=self._count_tokens(text), prompt_tokens=0)
+        parts: List[str] = []
+
+        for label, start, end, has_title in sections:
+            edge_limit = BODY_PAGE_EDGE_LINES if label in BODY_LABELS else PAGE_EDGE_LINES
+            line_edges = edges[text.count('\n', 0, start):]
+            lines, dropped = self._clean_lines(
+                text[start:end], repeated, seen_repeated, keep_first=has_title,
+                edges=line_edges, edge_limit=edge_limit,
+            )
+            result.dropped_lines += dropped
+            if not any(line.strip() for line in lines):
+                continue
+
+            body = _WHITESPACE.sub(" ", " ".join(lines[1:] if has_title else lines)).strip()
+            if len(body) >= DEDUPE_MIN_CHARS and any(body in prev for prev in seen_bodies):
+                result.duplicate_sections += 1
+                continue
+            seen_bodies.append(body)
+
+            budget = self.budgets.get(label) if has_headers and label != CanonicalLabel.PROFILE else None
+            if budget is not None:
+                title = lines[:1] if has_title else []
+                body_lines, tokens, truncated = self._fit_budget(lines[len(title):], budget - used_tokens[label])
+                lines = title + body_lines
+                used_tokens[label] += tokens
+                if truncated and label not in result.truncated_labels:
+                    result.truncated_labels.append(label)
+
+            parts.append(_BLANK_LINES.sub("\n\n", "\n".join(lines)).strip())
+
+        result.text = "\n\n".join(p for p in parts if p)
+        result.prompt_tokens = self._count_tokens(result.text)
+        return result
+
+    # ─────────────────────────────────────────────────
+    # 섹션 분리
+    # ─────────────────────────────────────────────────
+
+    def _sections(self, text: str, ir: SemanticIR) -> List[Tuple[str, int, int, bool]]:
+        """(label, start, end, 헤더 포함 여부) - 원본 전체를 빈틈없이 덮음"""
+        # 긴 "헤더"는 키워드가 포함된 번호 매김 본문 줄 → 이전 섹션의 연속으로 취급
+        starts = sorted({
+            b.start_pos: b.normalized_label for b in ir.blocks
+            if b.raw_title != "(Preamble)" and len(b.raw_title) <= HEADER_MAX_CHARS
+        }.items())
+        if not starts:
+            return [(CanonicalLabel.UNKNOWN, 0, len(text), False)]
+
+        sections = [(CanonicalLabel.PROFILE, 0, starts[0][0], False)] if starts[0][0] > 0 else []
+        for i, (start, label) in enumerate(starts):
+            end = starts[i + 1][0] if i + 1 < len(starts) else len(text)
+            sections.append((label, start, end, True))
+        return sections
+
+    # ─────────────────────────────────────────────────
+    # 보일러플레이트
+    # ─────────────────────────────────────────────────
+
+    @staticmethod
+    def _repeat_key(line: str) -> Optional[str]:
+        """반복 머리글/바닥글 비교 키 (끝의 페이지 번호 무시). 날짜 줄 / 짧은 줄은 대상 아님"""
+        stripped = line.strip()
+        if not stripped or _DATE.search(stripped):
+            return None
+        if sum(1 for c in stripped if c.isalpha()) < REPEAT_MIN_LETTERS:
+            return None
+        return _WHITESPACE.sub(" ", _TRAILING_PAGE_NUMBER.sub("", stripped)).lower()
+
+    @staticmethod
+    def _page_edge_distances(lines: List[str]) -> List[Optional[int]]:
+        """
+        줄별 가장 가까운 페이지 경계까지의 거리 (비어 있지 않은 줄 수, 빈 줄은 None)
+
+        경계: 문서 시작/끝, 페이지 번호 줄. 문서 첫/끝 줄과 페이지 번호 바로 옆 줄이 1입니다.
+        """
+        content = [i for i, line in enumerate(lines) if line.strip()]
+        # 비어 있지 않은 줄 순번 기준 경계 위치 (문서 시작/끝은 가상의 줄)
+        markers = [-1, len(content)]
+        markers += [n for n, i in enumerate(content) if _PAGE_NUMBER.match(lines[i].strip())]
+        markers.sort()
+
+        distances: List[Optional[int]] = [None] * len(lines)
+        for n, i in enumerate(content):
+            pos = bisect_left(markers, n)
+            distances[i] = min(abs(n - markers[k]) for k in (pos - 1, pos) if 0 <= k < len(markers))
+        return distances
+
+    def _repeated_lines(self, text: str, edges: List[Optional[int]]) -> Set[str]:
+        """페이지 경계 근처에서 REPEAT_MIN_COUNT회 이상 반복되는 줄의 비교 키"""
+        counts = Counter(
+            key for line, edge in zip(text.split('\n'), edges)
+            if edge is not None and edge <= PAGE_EDGE_LINES
+            for key in [self._repeat_key(line)] if key
+        )
+        return {key for key, count in counts.items() if count >= REPEAT_MIN_COUNT}
+
+    def _clean_lines(
+        self,
+        section: str,
+        repeated: Set[str],
+        seen_repeated: Set[str],
+        keep_first: bool = False,
+        edges: Optional[List[Optional[int]]] = None,
+        edge_limit: int = PAGE_EDGE_LINES,
+    ) -> Tuple[List[str], int]:
+        """
+        보일러플레이트 줄 제거 → (남은 줄, 제거한 줄 수)
+
+        keep_first: 섹션 헤더 줄 유지
+        edges: 섹션 첫 줄부터의 페이지 경계 거리 (_page_edge_distances), edge_limit 이내 줄만
+        반복 머리글/바닥글로 제거
+        """
+        kept: List[str] = []
+        dropped = 0
+        in_consent = False
+
+        for i, line in enumerate(section.split('\n')):
+            stripped = line.strip()
+            if i == 0 and keep_first:
+                kept.append(line)
+                continue
+            if not stripped:
+                in_consent = False
+                kept.append(line)
+                continue
+
+            if in_consent or _CONSENT_TITLE.search(stripped):
+                # 동의 문단은 빈 줄까지 제거
+                in_consent = True
+                dropped += 1
+                continue
+
+            if _PAGE_NUMBER.match(stripped) or (
+                len(stripped) <= CERTIFY_MAX_CHARS and _CERTIFY_LINE.search(stripped)
+            ):
+                dropped += 1
+                continue
+
+            edge = edges[i] if edges is not None and i < len(edges) else None
+            key = self._repeat_key(stripped) if edge is not None and edge <= edge_limit else None
+            if key in repeated:
+                if key in seen_repeated:
+                    dropped += 1
+                    continue
+                seen_repeated.add(key)
+
+            kept.append(line)
+        return kept, dropped
+
+    # ─────────────────────────────────────────────────
+    # 예산
+    # ─────────────────────────────────────────────────
+
+    def _fit_budget(self, lines: List[str], budget: int) -> Tuple[List[str], int, bool]:
+        """예산 이내 줄 + 예산 초과 후 기간(날짜) 줄 → (줄, 사용 토큰, 생략 여부)"""
+        kept: List[str] = []
+        used = 0
+        omitted = False
+
+        for line in lines:
+            tokens = self._count_tokens(line)
+            if not omitted and used + tokens <= budget:
+                kept.append(line)
+                used += tokens
+                continue
+
+            if line.strip() and _DATE.search(line):
+                kept.append(line)
+                used += tokens
+            elif line.strip() and (not kept or kept[-1] != OMITTED_MARKER):
+                kept.append(OMITTED_MARKER)
+            omitted = omitted or bool(line.strip())
+
+        return kept, used, omitted
+
+
+# Singleton
+_builder: Optional[SectionPromptBuilder] = None
+
+
+def get_section_prompt_builder() -> SectionPromptBuilder:
+    global _builder
+    if _builder is None:
+        _builder = SectionPromptBuilder()
+    return _builder
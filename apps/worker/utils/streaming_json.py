@@ -0,0 +1,120 @@
+"""
+Streaming JSON - Incremental Top-level Field Parser
+
+LLM 스트리밍 응답(JSON 객체)을 토큰 단위로 받아 최상위 필드가 완성되는 즉시 반환.
+전체 응답을 기다리지 않고 name/phone/email 등 앞쪽 필드를 먼저 사용할 수 있게 한다.
+"""
+
+import json
+import logging
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingJSONFieldParser:
+    """
+    최상위 JSON 객체의 필드를 점진적으로 파싱
+
+    - feed()로 받은 조각을 이어 붙이며 한 번만 스캔 (O(n))
+    - 최상위 값이 끝나는 시점(',' 또는 '}')에 해당 필드를 json.loads
+    - 배열/객체 값은 통째로 완성된 뒤에만 반환 (부분 값은 반환하지 않음)
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.fields: dict = {}
+        # 현재 스트리밍 중인 최상위 배열/객체 필드명 (예: "careers")
+        self.streaming_container: Optional[str] = None
+
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._key: Optional[str] = None
+        self._expect_value = False
+        self._value_start = -1
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        스트림 조각 추가
+
+        Returns:
+            이번 조각에서 완성된 최상위 필드 [(key, value), ...]
+        """
+        if not chunk:
+            return []
+
+        self.buffer += chunk
+        completed: List[Tuple[str, Any]] = []
+
+        buffer = self.buffer
+        for i in range(self._pos, len(buffer)):
+            ch = buffer[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and not self._expect_value:
+                        self._key = self._decode_key(buffer[self._string_start:i + 1])
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+                self._mark_value_start(i)
+            elif ch in "{[":
+                if self._depth == 1 and self._expect_value:
+                    self._mark_value_start(i)
+                    self.streaming_container = self._key
+                self._depth += 1
+            elif ch in "}]":
+                if self._depth == 1 and ch == "}":
+                    self._complete_value(i, completed)
+                self._depth -= 1
+                if self._depth == 1:
+                    self.streaming_container = None
+            elif self._depth == 1:
+                if ch == ":":
+                    self._expect_value = True
+                    self._value_start = -1
+                elif ch == ",":
+                    self._complete_value(i, completed)
+                elif not ch.isspace():
+                    self._mark_value_start(i)
+
+        self._pos = len(buffer)
+        return completed
+
+    def _mark_value_start(self, index: int) -> None:
+        if self._depth == 1 and self._expect_value and self._value_start < 0:
+            self._value_start = index
+
+    def _complete_value(self, end: int, completed: List[Tuple[str, Any]]) -> None:
+        if not self._expect_value or self._key is None or self._value_start < 0:
+            return
+
+        raw_value = self.buffer[self._value_start:end].strip()
+        try:
+            value = json.loads(raw_value)
+        except json.JSONDecodeError:
+            logger.debug(f"[StreamingJSON] 필드 '{self._key}' 파싱 실패: {raw_value[:80]}")
+        else:
+            self.fields[self._key] = value
+            completed.append((self._key, value))
+
+        self._key = None
+        self._expect_value = False
+        self._value_start = -1
+
+    @staticmethod
+    def _decode_key(raw: str) -> Optional[str]:
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return None
@@ -217,19 +217,44 @@ def run_libreoffice_convert(
     output_dir: str,
     output_format: str = "pdf",
     timeout: int = LIBREOFFICE_TIMEOUT,
+    use_pool: bool = True,
 ) -> SubprocessResult:
     """
     LibreOffice 변환 실행 (강화된 타임아웃)
 
+    상주 인스턴스 풀(utils.libreoffice_pool)을 사용할 수 있으면 풀로 변환하고,
+    풀이 꺼져 있거나 인스턴스를 띄울 수 없으면 soffice를 새로 실행합니다 (cold start).
+
     Args:
         input_path: 입력 파일 경로
         output_dir: 출력 디렉토리
         output_format: 출력 형식 (pdf, docx 등)
         timeout: 타임아웃 (초)
+        use_pool: False면 항상 cold start
 
     Returns:
         SubprocessResult
     """
+    if use_pool:
+        from .libreoffice_pool import PoolUnavailableError, get_libreoffice_pool
+
+        pool = get_libreoffice_pool()
+        if pool is not None and pool.supports(output_format):
+            try:
+                return pool.convert(input_path, output_dir, output_format, timeout=timeout)
+            except PoolUnavailableError as e:
+                logger.warning(f"LibreOffice pool unavailable, falling back to cold start: {e}")
+
+    return _run_libreoffice_cold_start(input_path, output_dir, output_format, timeout)
+
+
+def _run_libreoffice_cold_start(
+    input_path: str,
+    output_dir: str,
+    output_format: str,
+    timeout: int,
+) -> SubprocessResult:
+    """soffice --convert-to 1회 실행 (변환마다 새 프로세스)"""
     # soffice 경로 탐지
     soffice_cmd = _find_soffice()
     if not soffice_cmd:
@@ -0,0 +1,305 @@
+"""
+Semantic Text Chunker - 섹션/문장 경계 기반 원본 텍스트 청킹
+
+고정 문자 슬라이딩 윈도우(1500/2000자, 300/500자 오버랩)는 최대 33%의 중복 텍스트를
+임베딩/저장하고 문장과 섹션을 중간에서 자릅니다.
+
+전략:
+1. SectionSeparator 블록 경계로 섹션 분리 (헤더 이전 텍스트는 profile)
+2. 섹션이 목표 크기 이하이면 통째로, 인접한 작은 섹션끼리는 하나의 청크로 패킹
+3. 목표 크기를 넘는 섹션만 줄 → 문장 경계로 나눠 패킹하고,
+   분할된 조각 사이에만 마지막 줄/문장을 오버랩 (최대 overlap_tokens)
+4. 경계가 없는 긴 텍스트(줄바꿈/문장부호 없음)는 문자 윈도우로 분할
+
+크기 제한은 토큰(tiktoken, 없으면 추정)과 문자 수를 함께 적용합니다.
+청크 content는 원본 텍스트의 연속 구간이므로 start_pos / end_pos가 정확합니다.
+"""
+
+import re
+import logging
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from schemas.canonical_labels import CanonicalLabel
+from utils.section_separator import SectionSeparator, get_section_separator
+
+logger = logging.getLogger(__name__)
+
+# 문장 경계: 종결 부호 뒤 공백
+_SENTENCE_END = re.compile(r'(?<=[.!?。？！])\s+')
+
+
+@dataclass
+class TextChunk:
+    """원본 텍스트의 연속 구간"""
+    text: str
+    start_pos: int
+    end_pos: int
+    section_labels: List[str]
+    tokens: int
+    is_split: bool = False       # 섹션이 여러 청크로 분할된 경우
+    overlap_chars: int = 0       # 이전 청크와 겹치는 문자 수
+
+
+@dataclass
+class _Unit:
+    start: int
+    end: int
+    tokens: int
+
+
+class SemanticChunker:
+    """
+    섹션/문장 경계 기반 청커
+
+    Args:
+        count_tokens: 토큰 수 계산 함수 (EmbeddingService._count_tokens)
+        target_tokens: 청크 목표 최대 토큰 수
+        max_chars: 청크 최대 문자 수
+        overlap_tokens: 분할된 섹션 조각 사이 오버랩 최대 토큰 수
+        min_chars: 최소 청크 길이 (미만이면 이전 청크에 병합)
+        window_overlap_chars: 경계 없는 텍스트의 문자 윈도우 오버랩
+    """
+
+    def __init__(
+        self,
+        count_tokens: Callable[[str], int],
+        target_tokens: int,
+        max_chars: int,
+        overlap_tokens: int = 0,
+        min_chars: int = 0,
+        window_overlap_chars: int = 0,
+        separator: Optional[SectionSeparator] = None,
+    ):
+        self._count_tokens = count_tokens
+        self.target_tokens = target_tokens
+        self.max_chars = max_chars
+        self.overlap_tokens = overlap_tokens
+        self.min_chars = min_chars
+        self.window_overlap_chars = min(window_overlap_chars, max_chars // 2)
+        self.separator = separator or get_section_separator()
+
+    def chunk(self, text: str) -> List[TextChunk]:
+        """텍스트 → 청크 목록 (원본 순서)"""
+        if not text or not text.strip():
+            return []
+
+        chunks: List[TextChunk] = []
+        pending: List[Tuple[str, int, int, int]] = []  # 패킹 중인 섹션 (label, start, end, tokens)
+        tail: Optional[TextChunk] = None  # pending 앞에 놓인 분할 섹션의 마지막 조각
+
+        def flush_pending():
+            nonlocal tail
+            if tail is not None and not pending:
+                chunks.append(tail)
+            elif pending:
+                start, end = pending[0][1], pending[-1][2]
+                labels = [p[0] for p in pending]
+                if tail is not None:
+                    start, labels = tail.start_pos, tail.section_labels + labels
+                chunk = self._make_chunk(text, start, end, labels, is_split=tail is not None)
+                chunk.overlap_chars = tail.overlap_chars if tail is not None else 0
+                chunks.append(chunk)
+            pending.clear()
+            tail = None
+
+        for label, start, end in self._sections(text):
+            start, end = self._strip(text, start, end)
+            if start >= end:
+                continue
+
+            tokens = self._count_tokens(text[start:end])
+            if self._fits(tokens, end - start):
+                # 현재 패킹 중인 청크에 합칠 수 있으면 합침
+                if pending or tail is not None:
+                    merged_start = tail.start_pos if tail is not None else pending[0][1]
+                    merged_tokens = sum(p[3] for p in pending) + tokens + (tail.tokens if tail else 0)
+                    if not self._fits(merged_tokens, end - merged_start):
+                        flush_pending()
+                pending.append((label, start, end, tokens))
+                continue
+
+            # 목표 크기를 넘는 섹션: 단독으로 분할, 마지막 조각은 뒤따르는 작은 섹션과 패킹
+            flush_pending()
+            pieces = self._split_section(text, label, start, end)
+            chunks.extend(pieces[:-1])
+            tail = pieces[-1] if pieces else None
+
+        flush_pending()
+        return self._merge_short(text, chunks)
+
+    # ─────────────────────────────────────────────────
+    # 섹션 / 단위 분리
+    # ─────────────────────────────────────────────────
+
+    def _sections(self, text: str) -> List[Tuple[str, int, int]]:
+        """(label, start, end) 목록 - 원본 텍스트 전체를 빈틈없이 덮음"""
+        ir = self.separator.separate(text)
+        starts = sorted({b.start_pos: b.normalized_label for b in ir.blocks if b.start_pos > 0}.items())
+
+        sections = []
+        prev_start, prev_label = 0, CanonicalLabel.PROFILE if starts else CanonicalLabel.UNKNOWN
+        for start, label in starts:
+            sections.append((prev_label, prev_start, start))
+            prev_start, prev_label = start, label
+        sections.append((prev_label, prev_start, len(text)))
+        return sections
+
+    def _units(self, text: str, start: int, end: int) -> List[_Unit]:
+        """섹션 → 줄 단위 (긴 줄은 문장, 긴 문장은 문자 윈도우)"""
+        units: List[_Unit] = []
+        pos = start
+        for line in text[start:end].split('\n'):
+            line_start, line_end = self._strip(text, pos, pos + len(line))
+            pos += len(line) + 1
+            if line_start >= line_end:
+                continue
+
+            tokens = self._count_tokens(text[line_start:line_end])
+            if self._fits(tokens, line_end - line_start):
+                units.append(_Unit(line_start, line_end, tokens))
+                continue
+
+            for sent_start, sent_end in self._sentences(text, line_start, line_end):
+                tokens = self._count_tokens(text[sent_start:sent_end])
+                if self._fits(tokens, sent_end - sent_start):
+                    units.append(_Unit(sent_start, sent_end, tokens))
+                else:
+                    units.append(_Unit(sent_start, sent_end, -1))  # 문자 윈도우 대상
+        return units
+
+    def _sentences(self, text: str, start: int, end: int) -> List[Tuple[int, int]]:
+        spans = []
+        pos = start
+        for match in _SENTENCE_END.finditer(text, start, end):
+            spans.append((pos, match.start()))
+            pos = match.end()
+        spans.append((pos, end))
+        return [(s, e) for s, e in spans if e > s]
+
+    # ─────────────────────────────────────────────────
+    # 분할
+    # ─────────────────────────────────────────────────
+
+    def _split_section(self, text: str, label: str, start: int, end: int) -> List[TextChunk]:
+        """목표 크기를 넘는 섹션을 줄/문장 단위로 패킹 (조각 사이 최소 오버랩)"""
+        pieces: List[TextChunk] = []
+        current: List[_Unit] = []
+        overlap_end: Optional[int] = None  # current 중 이전 조각과 겹치는 구간의 끝
+
+        def emit():
+            if not current:
+                return
+            chunk = self._make_chunk(text, current[0].start, current[-1].end, [label], is_split=True)
+            if overlap_end is not None:
+                chunk.overlap_chars = overlap_end - current[0].start
+            pieces.append(chunk)
+
+        for unit in self._units(text, start, end):
+            if unit.tokens < 0:
+                emit()
+                current, overlap_end = [], None
+                pieces.extend(self._window(text, label, unit.start, unit.end))
+                continue
+
+            if current and not self._fits_units(current + [unit]):
+                emit()
+                carry = self._carry_over(current)
+                current = carry if self._fits_units(carry + [unit]) else []
+                overlap_end = current[-1].end if current else None
+            current.append(unit)
+
+        emit()
+        return pieces
+
+    def _carry_over(self, units: List[_Unit]) -> List[_Unit]:
+        """다음 조각 앞에 반복할 마지막 단위들 (overlap_tokens 이내, 첫 단위 제외)"""
+        carry: List[_Unit] = []
+        tokens = 0
+        for unit in reversed(units[1:]):
+            if tokens + unit.tokens > self.overlap_tokens:
+                break
+            carry.insert(0, unit)
+            tokens += unit.tokens
+        return carry
+
+    def _window(self, text: str, label: str, start: int, end: int) -> List[TextChunk]:
+        """경계 없는 텍스트 → 고정 문자 윈도우"""
+        pieces = []
+        stride = self.max_chars - self.window_overlap_chars
+        for window_start in range(start, end, stride):
+            window_end = min(window_start + self.max_chars, end)
+            chunk = self._make_chunk(text, window_start, window_end, [label], is_split=True)
+            if pieces:
+                chunk.overlap_chars = max(0, pieces[-1].end_pos - window_start)
+            pieces.append(chunk)
+            if window_end >= end:
+                break
+        return pieces
+
+    def _merge_short(self, text: str, chunks: List[TextChunk]) -> List[TextChunk]:
+        """
+        min_chars 미만 청크를 이전 청크에 병합 (첫 청크면 다음 청크에)
+
+        병합 결과가 max_chars를 넘으면 병합하지 않음 (연쇄 병합으로 상한을 넘지 않도록)
+        """
+        merged: List[TextChunk] = []
+        for chunk in chunks:
+            if (
+                merged
+                and len(chunk.text.strip()) < self.min_chars
+                and chunk.start_pos >= merged[-1].start_pos
+                and max(merged[-1].end_pos, chunk.end_pos) - merged[-1].start_pos <= self.max_chars
+            ):
+                prev = merged[-1]
+                labels = prev.section_labels + [l for l in chunk.section_labels if l not in prev.section_labels]
+                merged[-1] = self._make_chunk(
+                    text, prev.start_pos, max(prev.end_pos, chunk.end_pos), labels,
+                    is_split=prev.is_split or chunk.is_split,
+                )
+                merged[-1].overlap_chars = prev.overlap_chars
+            else:
+                merged.append(chunk)
+
+        if (
+            len(merged) > 1
+            and len(merged[0].text.strip()) < self.min_chars
+            and merged[1].end_pos - merged[0].start_pos <= self.max_chars
+        ):
+            first, second = merged[0], merged[1]
+            labels = first.section_labels + [l for l in second.section_labels if l not in first.section_labels]
+            merged[:2] = [self._make_chunk(
+                text, first.start_pos, second.end_pos, labels, is_split=first.is_split or second.is_split
+            )]
+        return merged
+
+    # ─────────────────────────────────────────────────
+    # 헬퍼
+    # ─────────────────────────────────────────────────
+
+    def _fits(self, tokens: int, chars: int) -> bool:
+        return tokens <= self.target_tokens and chars <= self.max_chars
+
+    def _fits_units(self, units: List[_Unit]) -> bool:
+        return self._fits(sum(u.tokens for u in units), units[-1].end - units[0].start)
+
+    def _make_chunk(
+        self, text: str, start: int, end: int, labels: List[str], is_split: bool = False
+    ) -> TextChunk:
+        content = text[start:end]
+        return TextChunk(
+            text=content,
+            start_pos=start,
+            end_pos=end,
+            section_labels=list(dict.fromkeys(labels)),
+            tokens=self._count_tokens(content),
+            is_split=is_split,
+        )
+
+    @staticmethod
+    def _strip(text: str, start: int, end: int) -> Tuple[int, int]:
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return start, end
@@ -0,0 +1,60 @@
+"""
+Vector Codec - 임베딩 벡터 표현 / 직렬화
+
+임베딩은 OpenAI 응답(encoding_format="base64")부터 DB 저장 직전까지
+float32 NumPy 배열로 유지합니다.
+- List[float] 1536개: Python float 객체 → 청크당 약 50KB
+- float32 배열: 6KB (+ 배열 헤더)
+
+직렬화:
+- pgvector 텍스트 리터럴 "[0.0123,-0.0456,...]" (float32 왕복 가능한 최소 자릿수)
+  → JSON float 리스트 대비 PostgREST 요청 크기 약 40% 감소
+- base64 (체크포인트 등 JSON 저장용, 무손실)
+"""
+
+import base64
+from typing import Any, Optional, Sequence, Union
+
+import numpy as np
+
+EmbeddingVector = np.ndarray
+
+
+def as_float32(value: Union[str, bytes, Sequence[float], np.ndarray, None]) -> Optional[np.ndarray]:
+    """
+    임베딩 값을 float32 배열로 변환
+
+    Args:
+        value: base64 문자열 (encoding_format="base64" 응답), raw bytes,
+               float 시퀀스 또는 배열
+
+    Returns:
+        1차원 float32 배열 (None 입력 시 None)
+    """
+    if value is None:
+        return None
+    if isinstance(value, np.ndarray):
+        return value if value.dtype == np.float32 else value.astype(np.float32)
+    if isinstance(value, str):
+        value = base64.b64decode(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # frombuffer 결과는 읽기 전용 → 복사하지 않고 그대로 사용
+        return np.frombuffer(value, dtype="<f4")
+    return np.asarray(value, dtype=np.float32)
+
+
+def to_pgvector(vector: Any) -> Optional[str]:
+    """float32 벡터 → pgvector 텍스트 리터럴"""
+    array = as_float32(vector)
+    if array is None:
+        return None
+    # np.float32의 str()은 float32로 정확히 왕복되는 최단 표현 (예: 0.0123, 1e-06)
+    return "[" + ",".join(map(str, array)) + "]"
+
+
+def to_base64(vector: Any) -> Optional[str]:
+    """float32 벡터 → base64 문자열 (little-endian, 무손실)"""
+    array = as_float32(vector)
+    if array is None:
+        return None
+    return base64.b64encode(array.astype("<f4", copy=False).tobytes()).decode("ascii")
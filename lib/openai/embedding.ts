@@ -1,6 +1,6 @@
 /**
  * OpenAI Embedding Service
- * text-embedding-3-small 모델 사용 (1536 차원)
+ * text-embedding-3-small 모델 사용 (EMBEDDING_MODEL로 변경 가능, 기본 1536 차원, EMBEDDING_DIMENSIONS로 축소 가능)
  * 
  * P0 안정성 개선: Timeout, Retry
  * P1+P2 복원력/관측성: Circuit Breaker, Metrics, Alerts
@@ -31,8 +31,10 @@ function getOpenAIClient(): OpenAI {
 }
 
 // 임베딩 설정
-const EMBEDDING_MODEL = "text-embedding-3-small";
-const EMBEDDING_DIMENSION = 1536;
+// 워커(apps/worker config.EMBEDDING_MODEL / EMBEDDING_DIMENSIONS)와 같은 모델·차원이어야 검색 벡터가 호환됨
+const EMBEDDING_MODEL = process.env.EMBEDDING_MODEL || "text-embedding-3-small";
+// DB vector(N) 컬럼 차원과도 일치해야 함
+const EMBEDDING_DIMENSION = Number(process.env.EMBEDDING_DIMENSIONS) || 1536;
 /** P2 Fix: 5초 → 8초 (OpenAI 콜드스타트, 네트워크 지연 고려) */
 const EMBEDDING_TIMEOUT_MS = 8000;
 const MAX_RETRIES = 2;
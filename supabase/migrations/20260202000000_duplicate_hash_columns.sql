@@ -0,0 +1,105 @@
+-- Migration: Indexed Duplicate Detection
+-- Date: 2026-02-02
+-- Purpose: check_duplicate Waterfall(1~4순위)를 인덱스 조회 1회로 처리
+--
+-- 변경 사항:
+-- - candidates.name_phone_hash (이름 + 전화번호 앞4자리 SHA-256) 컬럼 추가
+-- - candidates.name_birth_hash (이름 + 생년 SHA-256) 컬럼 추가
+-- - (user_id, *_hash) WHERE is_latest 부분 인덱스
+-- - find_duplicate_candidate RPC: 4개 티어를 우선순위대로 1회 조회
+--
+-- 해시는 Worker(DatabaseService._create_name_phone_hash / _create_name_birth_hash)에서 계산합니다.
+-- 기존 데이터는 apps/worker/scripts/backfill_duplicate_hashes.py로 채웁니다.
+
+-- ═══════════════════════════════════════════════════════
+-- 1. 해시 컬럼 추가
+-- ═══════════════════════════════════════════════════════
+
+ALTER TABLE candidates
+ADD COLUMN IF NOT EXISTS name_phone_hash TEXT,
+ADD COLUMN IF NOT EXISTS name_birth_hash TEXT;
+
+COMMENT ON COLUMN candidates.name_phone_hash IS
+'중복 체크 3순위: sha256(정규화된 이름 + ":" + 전화번호 앞4자리)';
+COMMENT ON COLUMN candidates.name_birth_hash IS
+'중복 체크 4순위: sha256(정규화된 이름 + ":" + 생년)';
+
+
+-- ═══════════════════════════════════════════════════════
+-- 2. 부분 인덱스 (user_id 범위 + 최신 버전만)
+-- 용도: 저장 시 중복 체크 (후보자 수와 무관한 인덱스 조회)
+-- ═══════════════════════════════════════════════════════
+
+CREATE INDEX IF NOT EXISTS idx_candidates_user_phone_hash_latest
+ON candidates (user_id, phone_hash)
+WHERE is_latest = true AND phone_hash IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_candidates_user_email_hash_latest
+ON candidates (user_id, email_hash)
+WHERE is_latest = true AND email_hash IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_candidates_user_name_phone_hash_latest
+ON candidates (user_id, name_phone_hash)
+WHERE is_latest = true AND name_phone_hash IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_candidates_user_name_birth_hash_latest
+ON candidates (user_id, name_birth_hash)
+WHERE is_latest = true AND name_birth_hash IS NOT NULL;
+
+
+-- ═══════════════════════════════════════════════════════
+-- 3. find_duplicate_candidate RPC
+-- 우선순위: phone_hash > email_hash > name_phone_hash > name_birth_hash
+-- NULL 파라미터의 티어는 건너뜀 (각 티어는 LIMIT 1 인덱스 조회)
+-- ═══════════════════════════════════════════════════════
+
+CREATE OR REPLACE FUNCTION find_duplicate_candidate(
+    p_user_id UUID,
+    p_phone_hash TEXT DEFAULT NULL,
+    p_email_hash TEXT DEFAULT NULL,
+    p_name_phone_hash TEXT DEFAULT NULL,
+    p_name_birth_hash TEXT DEFAULT NULL
+)
+RETURNS TABLE (
+    candidate_id UUID,
+    candidate_name TEXT,
+    match_type TEXT
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT t.id, t.name, t.match_type
+    FROM (
+        (SELECT c.id, c.name::TEXT AS name, 'phone_hash'::TEXT AS match_type, 1 AS priority
+         FROM candidates c
+         WHERE p_phone_hash IS NOT NULL
+           AND c.user_id = p_user_id AND c.is_latest = true AND c.phone_hash = p_phone_hash
+         LIMIT 1)
+        UNION ALL
+        (SELECT c.id, c.name::TEXT, 'email_hash'::TEXT, 2
+         FROM candidates c
+         WHERE p_email_hash IS NOT NULL
+           AND c.user_id = p_user_id AND c.is_latest = true AND c.email_hash = p_email_hash
+         LIMIT 1)
+        UNION ALL
+        (SELECT c.id, c.name::TEXT, 'name_phone'::TEXT, 3
+         FROM candidates c
+         WHERE p_name_phone_hash IS NOT NULL
+           AND c.user_id = p_user_id AND c.is_latest = true AND c.name_phone_hash = p_name_phone_hash
+         LIMIT 1)
+        UNION ALL
+        (SELECT c.id, c.name::TEXT, 'name_birth'::TEXT, 4
+         FROM candidates c
+         WHERE p_name_birth_hash IS NOT NULL
+           AND c.user_id = p_user_id AND c.is_latest = true AND c.name_birth_hash = p_name_birth_hash
+         LIMIT 1)
+    ) t
+    ORDER BY t.priority
+    LIMIT 1;
+END;
+$$ LANGUAGE plpgsql STABLE SECURITY DEFINER SET search_path = public;
+
+COMMENT ON FUNCTION find_duplicate_candidate IS
+'저장 시 중복 후보자 Waterfall 체크 (전화 해시 > 이메일 해시 > 이름+전화 앞4자리 > 이름+생년)';
+
+GRANT EXECUTE ON FUNCTION find_duplicate_candidate(UUID, TEXT, TEXT, TEXT, TEXT) TO service_role;
+REVOKE EXECUTE ON FUNCTION find_duplicate_candidate(UUID, TEXT, TEXT, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,273 @@
+-- Migration: Incremental Candidate Auto-Matching
+-- Date: 2026-02-02
+-- Purpose: 이력서 저장 후 자동 매칭을 O(positions × candidates) → O(positions)로 축소
+--
+-- 기존: 저장마다 활성 Position별로 save_position_matches 호출
+--       (Position마다 사용자 전체 후보자 재채점 + 'matched' 행 전체 삭제/재삽입)
+-- 변경: save_candidate_position_matches - 새 후보자 1명만 모든 활성 Position과 채점하고
+--       해당 후보자의 매칭 행만 upsert
+--
+-- 점수 공식은 match_candidates_to_position과 동일합니다 (동의어 매칭 포함).
+-- Position별 상위 p_limit명 유지: 'matched' 행이 가득 찬 경우 최저 점수보다 높을 때만
+-- 삽입하고 최저 점수 행을 제거합니다.
+-- 전체 재매칭(save_position_matches)은 유지보수 작업으로 계속 사용합니다
+-- (apps/worker/scripts/rematch_positions.py).
+
+-- ═══════════════════════════════════════════════════════
+-- 1. 인덱스
+-- 용도: Position별 'matched' 행 수 / 최저 점수 조회
+-- ═══════════════════════════════════════════════════════
+
+CREATE INDEX IF NOT EXISTS idx_position_candidates_position_matched_score
+ON position_candidates (position_id, overall_score)
+WHERE stage = 'matched';
+
+CREATE INDEX IF NOT EXISTS idx_positions_user_open
+ON positions (user_id)
+WHERE status = 'open';
+
+
+-- ═══════════════════════════════════════════════════════
+-- 2. score_candidate_against_positions: 후보자 1명 × 사용자의 활성 Position
+-- ═══════════════════════════════════════════════════════
+
+CREATE OR REPLACE FUNCTION score_candidate_against_positions(
+    p_candidate_id UUID,
+    p_user_id UUID
+)
+RETURNS TABLE (
+    position_id UUID,
+    overall_score FLOAT,
+    skill_score FLOAT,
+    experience_score FLOAT,
+    education_score FLOAT,
+    semantic_score FLOAT,
+    matched_skills TEXT[],
+    missing_skills TEXT[],
+    synonym_matches JSONB
+) AS $$
+BEGIN
+    RETURN QUERY
+    WITH
+    cand AS (
+        SELECT c.id, c.skills, c.exp_years, c.education_level
+        FROM candidates c
+        WHERE c.id = p_candidate_id
+          AND c.user_id = p_user_id
+          AND c.status = 'completed'
+          AND c.is_latest = true
+    ),
+    -- 후보자 스킬의 canonical 형태 (Position마다 재계산하지 않도록 1회)
+    cand_skills AS (
+        SELECT cs.skill, get_canonical_skill(cs.skill) AS canonical
+        FROM cand, unnest(cand.skills) AS cs(skill)
+    ),
+    open_positions AS (
+        SELECT p.*
+        FROM positions p
+        WHERE p.user_id = p_user_id
+          AND p.status = 'open'
+          AND EXISTS (SELECT 1 FROM cand)
+    ),
+    required AS (
+        SELECT op.id AS pid, rs.skill AS original_skill, get_canonical_skill(rs.skill) AS canonical
+        FROM open_positions op, unnest(op.required_skills) AS rs(skill)
+    ),
+    skill_details AS (
+        SELECT
+            op.id AS pid,
+            COALESCE(array_length(op.required_skills, 1), 0) AS required_count,
+            ARRAY(
+                SELECT DISTINCT r.original_skill FROM required r
+                WHERE r.pid = op.id
+                  AND EXISTS (SELECT 1 FROM cand_skills cs WHERE cs.canonical = r.canonical)
+            ) AS matched,
+            ARRAY(
+                SELECT DISTINCT r.original_skill FROM required r
+                WHERE r.pid = op.id
+                  AND NOT EXISTS (SELECT 1 FROM cand_skills cs WHERE cs.canonical = r.canonical)
+            ) AS missing,
+            COALESCE(
+                (
+                    SELECT jsonb_agg(
+                        jsonb_build_object(
+                            'candidate_skill', cs.skill,
+                            'matched_to', r.original_skill,
+                            'is_synonym', cs.skill <> r.original_skill
+                        )
+                    )
+                    FROM cand_skills cs
+                    INNER JOIN required r ON r.pid = op.id AND r.canonical = cs.canonical
+                ),
+                '[]'::JSONB
+            ) AS syn_matches
+        FROM open_positions op
+    ),
+    scores AS (
+        SELECT
+            op.id AS pid,
+            sd.matched,
+            sd.missing,
+            sd.syn_matches,
+            CASE
+                WHEN sd.required_count = 0 THEN 1.0
+                ELSE COALESCE(array_length(sd.matched, 1), 0)::FLOAT / sd.required_count
+            END AS s_score,
+            CASE
+                WHEN cand.exp_years < op.min_exp_years THEN
+                    GREATEST(0.3, 1.0 - (op.min_exp_years - cand.exp_years) * 0.15)
+                WHEN op.max_exp_years IS NOT NULL AND cand.exp_years > op.max_exp_years THEN
+                    GREATEST(0.7, 1.0 - (cand.exp_years - op.max_exp_years) * 0.05)
+                ELSE 1.0
+            END AS e_score,
+            CASE
+                WHEN op.required_education_level IS NULL THEN 1.0
+                WHEN cand.education_level = op.required_education_level THEN 1.0
+                WHEN cand.education_level IN ('master', 'doctorate') AND op.required_education_level = 'bachelor' THEN 1.0
+                WHEN cand.education_level = 'doctorate' AND op.required_education_level = 'master' THEN 1.0
+                WHEN cand.education_level = 'bachelor' AND op.required_education_level IN ('master', 'doctorate') THEN 0.7
+                ELSE 0.5
+            END AS edu_score,
+            (
+                SELECT MAX(1 - (cc.embedding <=> op.embedding))
+                FROM candidate_chunks cc
+                WHERE cc.candidate_id = p_candidate_id
+                  AND cc.chunk_type = 'summary'
+                  AND op.embedding IS NOT NULL
+            ) AS sem_score
+        FROM open_positions op
+        JOIN skill_details sd ON sd.pid = op.id
+        CROSS JOIN cand
+    )
+    SELECT
+        s.pid,
+        (s.s_score * 0.40 + s.e_score * 0.25 + s.edu_score * 0.15 + COALESCE(s.sem_score, 0.5) * 0.20)::FLOAT,
+        s.s_score::FLOAT,
+        s.e_score::FLOAT,
+        s.edu_score::FLOAT,
+        COALESCE(s.sem_score, 0.5)::FLOAT,
+        s.matched,
+        s.missing,
+        s.syn_matches
+    FROM scores s;
+END;
+$$ LANGUAGE plpgsql STABLE SECURITY DEFINER;
+
+
+-- ═══════════════════════════════════════════════════════
+-- 3. save_candidate_position_matches: 후보자 1명의 매칭 행만 upsert
+-- ═══════════════════════════════════════════════════════
+
+CREATE OR REPLACE FUNCTION save_candidate_position_matches(
+    p_candidate_id UUID,
+    p_user_id UUID,
+    p_limit INTEGER DEFAULT 100,
+    p_min_score FLOAT DEFAULT 0.3
+)
+RETURNS TABLE (
+    total_positions INTEGER,
+    matched_positions INTEGER
+) AS $$
+DECLARE
+    v_total INTEGER := 0;
+    v_matched INTEGER := 0;
+    v_match RECORD;
+    v_count INTEGER;
+    v_min_score FLOAT;
+    v_stage TEXT;
+BEGIN
+    FOR v_match IN
+        SELECT * FROM score_candidate_against_positions(p_candidate_id, p_user_id)
+    LOOP
+        v_total := v_total + 1;
+
+        IF v_match.overall_score < p_min_score THEN
+            -- 재분석으로 점수가 떨어진 경우 기존 'matched' 행 제거 (진행중인 단계는 유지)
+            DELETE FROM position_candidates pc
+            WHERE pc.position_id = v_match.position_id
+              AND pc.candidate_id = p_candidate_id
+              AND pc.stage = 'matched';
+            CONTINUE;
+        END IF;
+
+        -- Position별 상위 p_limit명 유지
+        SELECT COUNT(*), MIN(pc.overall_score) INTO v_count, v_min_score
+        FROM position_candidates pc
+        WHERE pc.position_id = v_match.position_id
+          AND pc.stage = 'matched'
+          AND pc.candidate_id <> p_candidate_id;
+
+        IF v_count >= p_limit AND v_match.overall_score <= v_min_score THEN
+            DELETE FROM position_candidates pc
+            WHERE pc.position_id = v_match.position_id
+              AND pc.candidate_id = p_candidate_id
+              AND pc.stage = 'matched';
+            CONTINUE;
+        END IF;
+
+        INSERT INTO position_candidates (
+            position_id,
+            candidate_id,
+            overall_score,
+            skill_score,
+            experience_score,
+            education_score,
+            semantic_score,
+            matched_skills,
+            missing_skills,
+            synonym_matches,
+            stage
+        ) VALUES (
+            v_match.position_id,
+            p_candidate_id,
+            v_match.overall_score,
+            v_match.skill_score,
+            v_match.experience_score,
+            v_match.education_score,
+            v_match.semantic_score,
+            v_match.matched_skills,
+            v_match.missing_skills,
+            v_match.synonym_matches,
+            'matched'
+        )
+        ON CONFLICT (position_id, candidate_id)
+        DO UPDATE SET
+            overall_score = EXCLUDED.overall_score,
+            skill_score = EXCLUDED.skill_score,
+            experience_score = EXCLUDED.experience_score,
+            education_score = EXCLUDED.education_score,
+            semantic_score = EXCLUDED.semantic_score,
+            matched_skills = EXCLUDED.matched_skills,
+            missing_skills = EXCLUDED.missing_skills,
+            synonym_matches = EXCLUDED.synonym_matches,
+            matched_at = NOW()
+        RETURNING stage INTO v_stage;
+
+        -- 상한 초과 시 최저 점수 'matched' 행 1개 제거 (진행중인 단계의 행은 슬롯을 차지하지 않음)
+        IF v_count >= p_limit AND v_stage = 'matched' THEN
+            DELETE FROM position_candidates pc
+            WHERE pc.id = (
+                SELECT pc2.id FROM position_candidates pc2
+                WHERE pc2.position_id = v_match.position_id
+                  AND pc2.stage = 'matched'
+                  AND pc2.candidate_id <> p_candidate_id
+                ORDER BY pc2.overall_score ASC
+                LIMIT 1
+            );
+        END IF;
+
+        v_matched := v_matched + 1;
+    END LOOP;
+
+    total_positions := v_total;
+    matched_positions := v_matched;
+    RETURN NEXT;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+GRANT EXECUTE ON FUNCTION score_candidate_against_positions(UUID, UUID) TO service_role;
+GRANT EXECUTE ON FUNCTION save_candidate_position_matches(UUID, UUID, INTEGER, FLOAT) TO service_role;
+
+COMMENT ON FUNCTION save_candidate_position_matches IS
+'새로 저장된 후보자 1명을 사용자의 모든 활성 Position과 채점하고 해당 후보자의 매칭 행만 upsert합니다.
+전체 재매칭은 save_position_matches (유지보수 작업)를 사용하세요.';